@@ -23,7 +23,7 @@
 # Import Gtk modules
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GObject, Gdk, GdkPixbuf
+from gi.repository import Gtk, Gdk, GdkPixbuf
 
 
 # Import other modules
@@ -1066,62 +1066,38 @@ class GenericConfigWin(Gtk.Window):
         #   children of that container
         # 'size_category' and 'duration_category' are arbitrary ranges of
         #   values, chosen for aesthetic reasons
+        # The statistics manager keeps a snapshot of the data for the
+        #   container (or for the whole database), so graphs can be drawn
+        #   quickly, even when there are many videos
         if isinstance(self, GenericEditWin):
-
-            if data_type == 'receive' or data_type == 'upload':
-
-                frequency_dict = self.edit_obj.compile_all_videos_by_frequency(
-                    data_type,
-                    time_unit_secs,
-                    {},
-                )
-
-            elif data_type == 'size':
-
-                frequency_dict = self.edit_obj.compile_all_videos_by_size(
-                    {},
-                )
-
-            elif data_type == 'duration':
-
-                frequency_dict = self.edit_obj.compile_all_videos_by_duration(
-                    {},
-                )
-
+            container_obj = self.edit_obj
         else:
+            container_obj = None
 
-            frequency_dict = {}
-
-            for dbid in self.app_obj.container_reg_dict.keys():
-
-                media_data_obj = self.app_obj.media_reg_dict[dbid]
-                # Ignore private (system) folders, because they contain
-                #   media.Video objects also stored in public folders
-                if not isinstance(media_data_obj, media.Folder) \
-                or not media_data_obj.priv_flag:
-
-                    if data_type == 'receive' or data_type == 'upload':
+        if data_type == 'receive' or data_type == 'upload':
 
-                        frequency_dict \
-                        = media_data_obj.compile_all_videos_by_frequency(
-                            data_type,
-                            time_unit_secs,
-                            frequency_dict,
-                        )
+            frequency_dict \
+            = self.app_obj.stats_manager_obj.compile_by_frequency(
+                container_obj,
+                data_type,
+                time_unit_secs,
+                {},
+            )
 
-                    elif data_type == 'size':
+        elif data_type == 'size':
 
-                        frequency_dict \
-                        = media_data_obj.compile_all_videos_by_size(
-                            frequency_dict,
-                        )
+            frequency_dict = self.app_obj.stats_manager_obj.compile_by_size(
+                container_obj,
+                {},
+            )
 
-                    elif data_type == 'duration':
+        elif data_type == 'duration':
 
-                        frequency_dict \
-                        = media_data_obj.compile_all_videos_by_duration(
-                            frequency_dict,
-                        )
+            frequency_dict \
+            = self.app_obj.stats_manager_obj.compile_by_duration(
+                container_obj,
+                {},
+            )
 
         # Compile two lists, with each index giving the x and y coordinates
         #   for the graph to be plotted
@@ -1154,7 +1130,8 @@ class GenericConfigWin(Gtk.Window):
 
             # NB If these labels are changed, when the corresponding literal
             #   values in media.GenericContainer.compile_all_videos_by_size()
-            #   and .compile_all_videos_by_duration() must be changed too
+            #   and .compile_all_videos_by_duration() (and in
+            #   stats.StatsSnapshot.count_by_range() ) must be changed too
             if data_type == 'size':
 
                 label_list = [
@@ -14968,11 +14945,7 @@ class VideoEditWin(GenericEditWin):
         self.edit_dict = {}
 
         # Redraw this media.Video in the Video Catalogue, if it's visible
-        GObject.timeout_add(
-            0,
-            self.app_obj.main_win_obj.video_catalogue_update_video,
-            self.edit_obj,
-        )
+        self.app_obj.schedule_catalogue_video(self.edit_obj)
 
 
 #   def retrieve_val():         # Inherited from GenericConfigWin
@@ -16783,6 +16756,7 @@ class VideoEditWin(GenericEditWin):
         """
 
         self.edit_obj.reset_comments()
+        self.app_obj.search_manager_obj.update_video(self.edit_obj)
         self.setup_comments_tab_update_list()
 
 
@@ -16802,6 +16776,7 @@ class VideoEditWin(GenericEditWin):
         """
 
         self.edit_obj.reset_video_descrip()
+        self.app_obj.search_manager_obj.update_video(self.edit_obj)
         textbuffer.set_text('')
 
 
@@ -17134,11 +17109,7 @@ class VideoEditWin(GenericEditWin):
                 self.app_obj.mark_video_downloaded(self.edit_obj, True)
 
             # Redraw the video in the Video Catalogue straight away
-            GObject.timeout_add(
-                0,
-                self.app_obj.main_win_obj.video_catalogue_update_video,
-                self.edit_obj,
-            )
+            self.app_obj.schedule_catalogue_video(self.edit_obj)
 
             # Reset this window by abusing the generic code
             self.reset_with_new_edit_obj(self.edit_obj)
@@ -17240,11 +17211,7 @@ class VideoEditWin(GenericEditWin):
                 )
 
             # Redraw the video in the Video Catalogue straight away
-            GObject.timeout_add(
-                0,
-                self.app_obj.main_win_obj.video_catalogue_update_video,
-                self.edit_obj,
-            )
+            self.app_obj.schedule_catalogue_video(self.edit_obj)
 
             # Reset this window by abusing the generic code
             self.reset_with_new_edit_obj(self.edit_obj)
@@ -17408,11 +17375,7 @@ class ChannelPlaylistEditWin(GenericEditWin):
         self.edit_dict = {}
 
         # Update this media.Channel/media.Playlist in the Video Index
-        GObject.timeout_add(
-            0,
-            self.app_obj.main_win_obj.video_index_update_row_text,
-            self.edit_obj,
-        )
+        self.app_obj.schedule_index_row_text(self.edit_obj)
 
 
 #   def retrieve_val():         # Inherited from GenericConfigWin
@@ -18457,11 +18420,7 @@ class FolderEditWin(GenericEditWin):
         self.edit_dict = {}
 
         # Update this media.Channel/media.Playlist in the Video Index
-        GObject.timeout_add(
-            0,
-            self.app_obj.main_win_obj.video_index_update_row_text,
-            self.edit_obj,
-        )
+        self.app_obj.schedule_index_row_text(self.edit_obj)
 
 
 
@@ -21263,6 +21222,26 @@ class SystemPrefWin(GenericPrefWin):
             self.on_moviepy_timeout_spinbutton_changed,
         )
 
+        self.add_label(grid,
+            _(
+            'Files checked (or converted) at the same time during a tidy' \
+            + ' operation',
+            ),
+            0, 10, 1, 1,
+        )
+
+        spinbutton2 = self.add_spinbutton(grid,
+            1,
+            self.app_obj.num_worker_max,
+            1,                  # Step
+            self.app_obj.tidy_worker_count,
+            1, 10, 1, 1,
+        )
+        spinbutton2.connect(
+            'value-changed',
+            self.on_tidy_worker_spinbutton_changed,
+        )
+
 
     def setup_files_tab(self):
 
@@ -21804,17 +21783,28 @@ class SystemPrefWin(GenericPrefWin):
             'always',
         )
 
+        checkbutton = self.add_checkbutton(grid,
+            _(
+            'Save the database in the background after an operation, so' \
+            + ' the main window doesn\'t freeze',
+            ),
+            self.app_obj.db_save_background_flag,
+            True,                   # Can be toggled by user
+            0, 6, grid_width, 1,
+        )
+        checkbutton.connect('toggled', self.on_db_save_background_toggled)
+
         if not self.app_obj.simple_prefs_flag:
 
             # Export preferences
             self.add_label(grid,
                 '<u>' + _('Export preferences') + '</u>',
-                0, 6, grid_width, 1,
+                0, 7, grid_width, 1,
             )
 
             label = self.add_label(grid,
                 _('Separator used in CSV exports'),
-                0, 7, 1, 1,
+                0, 8, 1, 1,
             )
             label.set_hexpand(False)
 
@@ -21822,7 +21812,7 @@ class SystemPrefWin(GenericPrefWin):
             combo = self.add_combo(grid,
                 ['|', ','],
                 self.app_obj.export_csv_separator,
-                1, 7, 1, 1,
+                1, 8, 1, 1,
             )
             combo.set_hexpand(False)
             combo.connect('changed', self.on_separator_combo_changed)
@@ -23266,6 +23256,17 @@ class SystemPrefWin(GenericPrefWin):
         )
         checkbutton12.connect('toggled', self.on_nickname_button_toggled)
 
+        checkbutton13 = self.add_checkbutton(grid,
+            _(
+            'Show all videos on a single page, drawing only the visible ones' \
+            + ' (not in grid mode)',
+            ),
+            self.app_obj.catalogue_virtual_flag,
+            True,                   # Can be toggled by user
+            0, 14, grid_width, 1,
+        )
+        checkbutton13.connect('toggled', self.on_virtual_button_toggled)
+
 
     def setup_windows_drag_tab(self, inner_notebook):
 
@@ -26323,6 +26324,25 @@ class SystemPrefWin(GenericPrefWin):
         )
         checkbutton10.connect('toggled', self.on_auto_delete_flag_toggled)
 
+        if not self.app_obj.simple_prefs_flag:
+
+            self.add_label(grid,
+                _('Clips downloaded at the same time (FFmpeg only)'),
+                0, 15, 1, 1,
+            )
+
+            spinbutton = self.add_spinbutton(grid,
+                1,
+                self.app_obj.num_worker_max,
+                1,                  # Step
+                self.app_obj.split_video_dl_job_count,
+                1, 15, 1, 1,
+            )
+            spinbutton.connect(
+                'value-changed',
+                self.on_split_dl_job_spinbutton_changed,
+            )
+
 
     def setup_operations_slices_tab(self, inner_notebook):
 
@@ -27464,6 +27484,29 @@ class SystemPrefWin(GenericPrefWin):
             entry2,
         )
 
+        # Process operation preferences
+        self.add_label(grid,
+            '<u>' + _('Process operation preferences') + '</u>',
+            0, 6, grid_width, 1,
+        )
+
+        self.add_label(grid,
+            _('Videos processed at the same time (0 - automatic)'),
+            0, 7, 1, 1,
+        )
+
+        spinbutton = self.add_spinbutton(grid,
+            0,
+            self.app_obj.num_worker_max,
+            1,                  # Step
+            self.app_obj.process_job_count,
+            1, 7, 1, 1,
+        )
+        spinbutton.connect(
+            'value-changed',
+            self.on_process_job_spinbutton_changed,
+        )
+
 
     def setup_downloader_streamlink_tab(self, inner_notebook):
 
@@ -29545,6 +29588,7 @@ class SystemPrefWin(GenericPrefWin):
                     update_count += 1
 
                 media_data_obj.reset_video_descrip()
+                self.app_obj.search_manager_obj.update_video(media_data_obj)
 
         # Confirm the result
         msg = _('Total videos:') + ' ' + str(video_count) + '\n\n' \
@@ -30843,6 +30887,26 @@ class SystemPrefWin(GenericPrefWin):
             self.try_switch_db(data_dir, button2)
 
 
+    def on_db_save_background_toggled(self, checkbutton):
+
+        """Called from callback in self.setup_files_backups_tab().
+
+        Enables/disables saving the database file in the background.
+
+        Args:
+
+            checkbutton (Gtk.CheckButton): The widget clicked
+
+        """
+
+        if checkbutton.get_active() \
+        and not self.app_obj.db_save_background_flag:
+            self.app_obj.set_db_save_background_flag(True)
+        elif not checkbutton.get_active() \
+        and self.app_obj.db_save_background_flag:
+            self.app_obj.set_db_save_background_flag(False)
+
+
     def on_delete_asap_button_toggled(self, radiobutton):
 
         """Called from callback in self.setup_files_delete_tab().
@@ -33971,6 +34035,22 @@ class SystemPrefWin(GenericPrefWin):
             self.app_obj.set_show_pretty_dates_flag(False)
 
 
+    def on_process_job_spinbutton_changed(self, spinbutton):
+
+        """Called from callback in self.setup_downloader_ffmpeg_tab().
+
+        Sets the number of videos processed at the same time, during a process
+        operation.
+
+        Args:
+
+            spinbutton (Gtk.SpinButton): The widget clicked
+
+        """
+
+        self.app_obj.set_process_job_count(spinbutton.get_value())
+
+
     def on_proxy_textview_changed(self, textbuffer):
 
         """Called from callback in self.setup_operations_proxies_tab().
@@ -34214,6 +34294,9 @@ class SystemPrefWin(GenericPrefWin):
 
                     success_count += 1
                     media_data_obj.reset_comments()
+                    self.app_obj.search_manager_obj.update_video(
+                        media_data_obj,
+                    )
 
 
         # Redraw the Video Catalogue, at its current page
@@ -35455,6 +35538,22 @@ class SystemPrefWin(GenericPrefWin):
         self.app_obj.set_sound_custom(model[tree_iter][0])
 
 
+    def on_split_dl_job_spinbutton_changed(self, spinbutton):
+
+        """Called from callback in self.setup_operations_clips_tab().
+
+        Sets the number of clips from the same video downloaded at the same
+        time.
+
+        Args:
+
+            spinbutton (Gtk.SpinButton): The widget clicked
+
+        """
+
+        self.app_obj.set_split_video_dl_job_count(spinbutton.get_value())
+
+
     def on_split_keyframe_flag_toggled(self, checkbutton):
 
         """Called from callback in self.setup_operations_clips_tab().
@@ -35904,6 +36003,21 @@ class SystemPrefWin(GenericPrefWin):
         )
 
 
+    def on_tidy_worker_spinbutton_changed(self, spinbutton):
+
+        """Called from callback in self.setup_general_modules_tab().
+
+        Sets the number of worker threads used during a tidy operation.
+
+        Args:
+
+            spinbutton (Gtk.SpinButton): The widget clicked
+
+        """
+
+        self.app_obj.set_tidy_worker_count(spinbutton.get_value())
+
+
     def on_twitch_live_button_toggled(self, checkbutton):
 
         """Called from callback in self.setup_operations_ignore_tab().
@@ -36067,6 +36181,26 @@ class SystemPrefWin(GenericPrefWin):
         self.app_obj.set_video_res_default(model[tree_iter][0])
 
 
+    def on_virtual_button_toggled(self, checkbutton):
+
+        """Called from callback in self.setup_windows_videos_tab().
+
+        Enables/disables virtual mode in the Video Catalogue.
+
+        Args:
+
+            checkbutton (Gtk.CheckButton): The widget clicked
+
+        """
+
+        if checkbutton.get_active() \
+        and not self.app_obj.catalogue_virtual_flag:
+            self.app_obj.set_catalogue_virtual_flag(True)
+        elif not checkbutton.get_active() \
+        and self.app_obj.catalogue_virtual_flag:
+            self.app_obj.set_catalogue_virtual_flag(False)
+
+
     def on_worker_button_toggled(self, checkbutton, alt_flag=False):
 
         """Called from callback in self.setup_operations_limits_tab().
@@ -1566,11 +1566,7 @@ class DownloadWorker(threading.Thread):
         and return_code == VideoDownloader.ERROR \
         and isinstance(media_data_obj, media.Video) \
         and app_obj.catalogue_mode_type != 'simple':
-            GObject.timeout_add(
-                0,
-                app_obj.main_win_obj.video_catalogue_update_video,
-                media_data_obj,
-            )
+            app_obj.schedule_catalogue_video(media_data_obj)
 
         # Call the destructor function of VideoDownloader object
         self.downloader_obj.close()
@@ -1658,11 +1654,7 @@ class DownloadWorker(threading.Thread):
         if not self.download_item_obj.operation_classic_flag \
         and return_code == ClipDownloader.ERROR \
         and app_obj.catalogue_mode_type != 'simple':
-            GObject.timeout_add(
-                0,
-                app_obj.main_win_obj.video_catalogue_update_video,
-                media_data_obj,
-            )
+            app_obj.schedule_catalogue_video(media_data_obj)
 
         # Call the destructor function of ClipDownloader object
         self.downloader_obj.close()
@@ -1754,11 +1746,7 @@ class DownloadWorker(threading.Thread):
             and return_code == VideoDownloader.ERROR \
             and isinstance(media_data_obj, media.Video) \
             and app_obj.catalogue_mode_type != 'simple':
-                GObject.timeout_add(
-                    0,
-                    app_obj.main_win_obj.video_catalogue_update_video,
-                    media_data_obj,
-                )
+                app_obj.schedule_catalogue_video(media_data_obj)
 
             # Call the destructor function of VideoDownloader object
             self.downloader_obj.close()
@@ -1798,11 +1786,7 @@ class DownloadWorker(threading.Thread):
         if not self.download_item_obj.operation_classic_flag \
         and return_code == StreamDownloader.ERROR \
         and app_obj.catalogue_mode_type != 'simple':
-            GObject.timeout_add(
-                0,
-                app_obj.main_win_obj.video_catalogue_update_video,
-                media_data_obj,
-            )
+            app_obj.schedule_catalogue_video(media_data_obj)
 
         # Call the destructor function of StreamDownloader object
         self.downloader_obj.close()
@@ -4727,6 +4711,13 @@ class VideoDownloader(object):
             if duration is not None:
                 video_obj.set_duration(duration)
 
+            if upload_time is not None or duration is not None:
+                app_obj.stats_manager_obj.update_video(video_obj)
+
+            # The video's name, description and/or comments might change, so
+            #   it must be re-indexed before the next database search
+            app_obj.search_manager_obj.update_video(video_obj)
+
             if source is not None:
                 video_obj.set_source(source)
 
@@ -4793,7 +4784,7 @@ class VideoDownloader(object):
                 app_obj.fixed_missing_folder.sort_children(app_obj)
             if video_obj.new_flag:
                 app_obj.fixed_new_folder.sort_children(app_obj)
-            if video_obj in app_obj.fixed_recent_folder.child_list:
+            if app_obj.fixed_recent_folder.check_child(video_obj):
                 app_obj.fixed_recent_folder.sort_children(app_obj)
             if video_obj.waiting_flag:
                 app_obj.fixed_waiting_folder.sort_children(app_obj)
@@ -4864,6 +4855,13 @@ class VideoDownloader(object):
             if not video_obj.duration and duration is not None:
                 video_obj.set_duration(duration)
 
+            if upload_time is not None or duration is not None:
+                app_obj.stats_manager_obj.update_video(video_obj)
+
+            # The video's name, description and/or comments might change, so
+            #   it must be re-indexed before the next database search
+            app_obj.search_manager_obj.update_video(video_obj)
+
             if not video_obj.source and source is not None:
                 video_obj.set_source(source)
 
@@ -5120,11 +5118,7 @@ class VideoDownloader(object):
         else:
 
             # Otherwise, just update the Video Catalogue
-            GObject.timeout_add(
-                0,
-                app_obj.main_win_obj.video_catalogue_update_video,
-                video_obj,
-            )
+            app_obj.schedule_catalogue_video(video_obj)
 
         # For simulated downloads, self.do_download() has not displayed
         #   anything in the Output tab/terminal window/downloader log; so do
@@ -6400,11 +6394,7 @@ class VideoDownloader(object):
                     True,
                 )
 
-                GObject.timeout_add(
-                    0,
-                    app_obj.main_win_obj.video_catalogue_update_video,
-                    video_obj,
-                )
+                app_obj.schedule_catalogue_video(video_obj)
 
 
     def read_child_process(self):
@@ -6815,11 +6805,7 @@ class VideoDownloader(object):
                     True,
                 )
 
-                GObject.timeout_add(
-                    0,
-                    app_obj.main_win_obj.video_catalogue_update_video,
-                    new_obj,
-                )
+                app_obj.schedule_catalogue_video(new_obj)
 
             elif isinstance(
                 self.download_item_obj.media_data_obj,
@@ -6839,9 +6825,7 @@ class VideoDownloader(object):
                         data,
                     )
 
-                GObject.timeout_add(
-                    0,
-                    app_obj.main_win_obj.video_catalogue_update_video,
+                app_obj.schedule_catalogue_video(
                     self.download_item_obj.media_data_obj,
                 )
 
@@ -7192,6 +7176,11 @@ class ClipDownloader(object):
         # Used for self.dl_type = 'downloader':
         self.downloader_path_list = []
 
+        # Used for self.dl_type = 'ffmpeg', when several clips are downloaded
+        #   at the same time: a list of downloads.ClipDownloadJob objects whose
+        #   child processes are currently running
+        self.job_list = []
+
         # Dictionary of clip titles used during this operation (i.e. when
         #   splitting a video into clips), used to re-name duplicates
         # Not used when removing video slices
@@ -7887,6 +7876,18 @@ class ClipDownloader(object):
         # Set the download type
         self.dl_type = 'ffmpeg'
 
+        # Download several clips at the same time, if allowed
+        job_count = min(app_obj.split_video_dl_job_count, len(stamp_list))
+        if job_count > 1:
+
+            return self.do_download_clips_with_ffmpeg_multi(
+                orig_video_obj,
+                stamp_list,
+                dest_obj,
+                dest_dir,
+                job_count,
+            )
+
         # Download the clips, one at a time
         list_size = len(stamp_list)
         for i in range(list_size):
@@ -8036,37 +8037,242 @@ class ClipDownloader(object):
                     clip_title
                 )
 
-        # If at least one clip was extracted...
-        if self.video_total:
+        # Update the database and the main window
+        self.finish_clips_with_ffmpeg(orig_video_obj, dest_dir)
 
-            # ...then the number of video downloads must be incremented
-            self.download_manager_obj.register_video('clip')
+        # Pass the result back to the parent downloads.DownloadWorker object
+        return self.return_code
 
-            # Delete the original video, if required, and if it's not inside a
-            #   channel/playlist
-            # (Don't bother trying to delete a 'dummy' media.Video object, for
-            #   download operations launched from the Classic Mode tab)
-            if app_obj.split_video_auto_delete_flag \
-            and not isinstance(orig_video_obj.parent_obj, media.Channel) \
-            and not isinstance(orig_video_obj.parent_obj, media.Playlist) \
-            and not orig_video_obj.dummy_flag:
 
-                app_obj.delete_video(
+    def do_download_clips_with_ffmpeg_multi(self, orig_video_obj, stamp_list,
+    dest_obj, dest_dir, job_count):
+
+        """Called by self.do_download_clips_with_ffmpeg().
+
+        Downloads video clips using FFmpeg, several at a time. Each clip is
+        downloaded by its own child process, and no more than 'job_count' of
+        them run at the same time.
+
+        Clips are confirmed in their original order, regardless of the order
+        in which their child processes finish.
+
+        Args:
+
+            orig_video_obj (media.Video): The video whose clips are being
+                downloaded
+
+            stamp_list (list): List in groups of three, in the form
+                [start_timestamp, stop_timestamp, clip_title]
+
+            dest_obj (media.Folder): The actual folder to which video clips are
+                downloaded
+
+            dest_dir (str): Path to the destination folder
+
+            job_count (int): The maximum number of clips to download at the
+                same time
+
+        Return values:
+
+            The final return code, a value in the range 0-5 (as described
+                above)
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 7864 do_download_clips_with_ffmpeg_multi')
+
+        # Import the main application (for convenience)
+        app_obj = self.download_manager_obj.app_obj
+
+        if self.download_manager_obj.custom_dl_obj is not None:
+            divert_mode = self.download_manager_obj.custom_dl_obj.divert_mode
+        else:
+            divert_mode = None
+
+        # Prepare a system command for each clip, in the original order. Clip
+        #   titles must be set before any child process starts, so that
+        #   duplicates are renamed in the same way as when clips are
+        #   downloaded one at a time
+        # List of tuples in the form (clip_num, clip_title, cmd_list). Each
+        #   ClipDownloadJob (and the threads used by its PipeReaders) is not
+        #   created until its child process is about to start
+        list_size = len(stamp_list)
+        waiting_list = []
+        for i in range(list_size):
+
+            start_stamp, stop_stamp, clip_title \
+            = ttutils.clip_extract_data(stamp_list, i)
+
+            clip_title = ttutils.clip_prepare_title(
+                app_obj,
+                orig_video_obj,
+                self.clip_title_dict,
+                clip_title,
+                i + 1,
+                list_size,
+            )
+
+            self.clip_title_dict[clip_title] = None
+
+            cmd_list = ttutils.generate_ffmpeg_split_system_cmd(
+                app_obj,
+                orig_video_obj,
+                self.download_worker_obj.options_list.copy(),
+                dest_dir,
+                clip_title,
+                start_stamp,
+                stop_stamp,
+                self.download_manager_obj.custom_dl_obj,
+                divert_mode,
+                self.dl_classic_flag,
+            )
+
+            waiting_list.append( (i + 1, clip_title, cmd_list) )
+
+        # Clips are confirmed in the original order. The number of the next
+        #   clip to confirm...
+        confirm_num = 1
+        # ...and the jobs which have finished, but have not been confirmed
+        #   yet, in the form
+        #       finish_dict[clip_num] = job_obj
+        finish_dict = {}
+
+        # (After a call to self.stop_soon(), no new child processes are
+        #   started, but those already running are allowed to finish, and
+        #   their clips are confirmed)
+        while (self.job_list or (waiting_list and not self.stop_soon_flag)) \
+        and self.return_code == self.OK:
+
+            # Start new child processes, until the limit is reached
+            while waiting_list \
+            and len(self.job_list) < job_count \
+            and not self.stop_soon_flag:
+
+                job_obj = ClipDownloadJob(*waiting_list.pop(0))
+
+                # Display the system command in the Output tab (if required)...
+                display_cmd \
+                = ttutils.prepare_system_cmd_for_display(job_obj.cmd_list)
+                if app_obj.ytdl_output_system_cmd_flag:
+                    app_obj.main_win_obj.output_tab_write_system_cmd(
+                        self.download_worker_obj.worker_id,
+                        display_cmd,
+                    )
+
+                # ...and the terminal (if required)
+                if app_obj.ytdl_write_system_cmd_flag:
+                    print(display_cmd)
+
+                # ...and the downloader log (if required)
+                if app_obj.ytdl_log_system_cmd_flag:
+                    app_obj.write_downloader_log(display_cmd)
+
+                app_obj.main_win_obj.output_tab_write_stdout(
+                    self.download_worker_obj.worker_id,
+                    '[' + __main__.__packagename__ + '] Downloading clip ' \
+                    + str(job_obj.clip_num) + '/' + str(list_size),
+                )
+
+                # Create a new child process, and set up the job's PipeReader
+                #   objects to read from it
+                self.create_child_process(job_obj.cmd_list, job_obj)
+                if job_obj.child_process is None:
+
+                    self.set_return_code(self.ERROR)
+                    app_obj.main_win_obj.output_tab_write_stderr(
+                        self.download_worker_obj.worker_id,
+                        _('FAILED: Clip download did not start'),
+                    )
+
+                    job_obj.close()
+                    break
+
+                job_obj.stdout_reader.attach_fh(job_obj.child_process.stdout)
+                job_obj.stderr_reader.attach_fh(job_obj.child_process.stderr)
+                self.job_list.append(job_obj)
+
+                self.download_worker_obj.data_callback({
+                    'playlist_index': job_obj.clip_num,
+                    'playlist_size': list_size,
+                    'status': formats.ACTIVE_STAGE_DOWNLOAD,
+                    'filename': job_obj.clip_title,
+                    'clip_flag': True,
+                })
+
+            # Pause a moment between each iteration of the loop (we don't want
+            #   to hog system resources)
+            time.sleep(self.sleep_time)
+
+            # Read from each child process STDOUT and STDERR, and deal with any
+            #   child processes that have finished
+            for job_obj in self.job_list.copy():
+
+                while self.read_child_process(job_obj):
+                    pass
+
+                if job_obj.child_process.poll() is None:
+                    continue
+
+                # (Once the PipeReader objects have been joined, anything left
+                #   in the queue can be read)
+                job_obj.close()
+                while self.read_child_process(job_obj):
+                    pass
+
+                self.job_list.remove(job_obj)
+                finish_dict[job_obj.clip_num] = job_obj
+
+                if job_obj.child_process.returncode > 0:
+                    self.set_return_code(self.ERROR)
+                    app_obj.main_win_obj.output_tab_write_stderr(
+                        self.download_worker_obj.worker_id,
+                            _(
+                            'FAILED: Child process exited with non-zero' \
+                            + ' code: {}',
+                            ).format(job_obj.child_process.returncode),
+                    )
+
+            # Deal with confirmed downloads, in the original order
+            while confirm_num in finish_dict \
+            and self.return_code == self.OK:
+
+                self.confirm_video_clip_job(
+                    finish_dict.pop(confirm_num),
+                    dest_obj,
+                    dest_dir,
                     orig_video_obj,
-                    True,           # Delete all files
-                    True,           # Don't update Video Index yet
-                    True,           # Don't update Video Catalogue yet
                 )
 
-            # Open the destination directory, if required to do so
-            if dest_dir is not None \
-            and app_obj.split_video_auto_open_flag:
-                ttutils.open_file(app_obj, dest_dir)
+                confirm_num += 1
 
-        # Pass a dictionary of values to downloads.DownloadWorker, confirming
-        #   the result of the job. The values are passed on to the main
-        #   window
-        self.last_data_callback()
+        # After an error, or after being stopped, any remaining child processes
+        #   are no longer required
+        for job_obj in self.job_list:
+            self.kill_child_process(job_obj.child_process)
+            job_obj.close()
+
+        self.job_list = []
+
+        # Clips which finished before the error (or while waiting for an
+        #   earlier clip to finish) have already been downloaded, so confirm
+        #   them, rather than leaving their files orphaned in the destination
+        #   directory
+        for clip_num in sorted(finish_dict):
+            self.confirm_video_clip_job(
+                finish_dict[clip_num],
+                dest_obj,
+                dest_dir,
+                orig_video_obj,
+            )
+
+        # After a call to self.stop_soon(), any clips not yet started won't be
+        #   downloaded
+        if waiting_list and self.return_code == self.OK:
+            self.set_return_code(self.STOPPED)
+
+        # Update the database and the main window
+        self.finish_clips_with_ffmpeg(orig_video_obj, dest_dir)
 
         # Pass the result back to the parent downloads.DownloadWorker object
         return self.return_code
@@ -8334,6 +8540,7 @@ class ClipDownloader(object):
                 fallback_name = _('Video') + ' ' + str(orig_video_obj.dbid)
                 orig_video_obj.set_name(fallback_name)
                 orig_video_obj.set_nickname(fallback_name)
+                app_obj.search_manager_obj.update_video(orig_video_obj)
                 orig_video_obj.set_file(fallback_name, file_ext)
 
             # If there is more than one clip, they must be concatenated to
@@ -8532,12 +8739,17 @@ class ClipDownloader(object):
             # Add the clip to Tartube's database
             if self.dl_type == 'ffmpeg':
 
+                # (When several clips are downloaded at the same time, the
+                #   calling function specifies the path)
+                if clip_path is None:
+                    clip_path = self.dl_path
+
                 clip_video_obj = ttutils.clip_add_to_db(
                     app_obj,
                     dest_obj,
                     orig_video_obj,
                     clip_title,
-                    self.dl_path,
+                    clip_path,
                 )
 
             elif self.dl_type == 'chapters' or self.dl_type == 'downloader':
@@ -8601,6 +8813,41 @@ class ClipDownloader(object):
             self.stop_now_flag = True
 
 
+    def confirm_video_clip_job(self, job_obj, dest_obj, dest_dir,
+    orig_video_obj):
+
+        """Called by self.do_download_clips_with_ffmpeg_multi().
+
+        When several clips are downloaded at the same time, confirms a clip
+        whose child process has finished (if the clip was downloaded
+        successfully).
+
+        Args:
+
+            job_obj (downloads.ClipDownloadJob): The job which downloaded the
+                clip
+
+            dest_obj, dest_dir, orig_video_obj: Passed on to
+                self.confirm_video_clip()
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 8805 confirm_video_clip_job')
+
+        if job_obj.child_process.returncode == 0 \
+        and job_obj.dl_path is not None \
+        and job_obj.dl_confirm_flag:
+
+            self.confirm_video_clip(
+                dest_obj,
+                dest_dir,
+                orig_video_obj,
+                job_obj.clip_title,
+                job_obj.dl_path,
+            )
+
+
     def confirm_video_remove_slices(self, orig_video_obj, output_path):
 
         """Called by self.do_download_remove_slices().
@@ -8680,7 +8927,7 @@ class ClipDownloader(object):
             orig_video_obj.reset_slices()
 
 
-    def create_child_process(self, cmd_list):
+    def create_child_process(self, cmd_list, job_obj=None):
 
         """Called by self.do_download_clips() shortly after the call to
         ttutils.generate_ffmpeg_split_system_cmd(), etc.
@@ -8696,6 +8943,11 @@ class ClipDownloader(object):
 
             cmd_list (list): Python list that contains the command to execute
 
+            job_obj (downloads.ClipDownloadJob or None): When several clips
+                are downloaded at the same time, the job which stores the new
+                child process. If None, the child process is stored in
+                self.child_process
+
         """
 
         if DEBUG_FUNC_FLAG:
@@ -8721,7 +8973,7 @@ class ClipDownloader(object):
             preexec = os.setsid
 
         try:
-            self.child_process = subprocess.Popen(
+            child_process = subprocess.Popen(
                 cmd_list,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -8734,6 +8986,12 @@ class ClipDownloader(object):
             #   as the code in self.do_download_clips() will notice the child
             #   process didn't start, and set its own error message)
             self.set_return_code(self.ERROR)
+            return
+
+        if job_obj is None:
+            self.child_process = child_process
+        else:
+            job_obj.child_process = child_process
 
 
     def create_temp_dir_for_chapters(self, orig_video_obj):
@@ -8839,7 +9097,7 @@ class ClipDownloader(object):
             return None
 
 
-    def extract_stdout_data(self, stdout):
+    def extract_stdout_data(self, stdout, job_obj=None):
 
         """Called by self.read_child_process().
 
@@ -8855,6 +9113,10 @@ class ClipDownloader(object):
             stdout (str): String that contains a line from the child process
                 STDOUT (i.e. a message from youtube-dl)
 
+            job_obj (downloads.ClipDownloadJob or None): When several clips
+                are downloaded at the same time, the job whose child process
+                produced the output
+
         """
 
         if DEBUG_FUNC_FLAG:
@@ -8867,25 +9129,30 @@ class ClipDownloader(object):
         #   self.do_download_remove_slices()
         if self.dl_type == 'ffmpeg' or self.dl_type == 'slices':
 
+            # (A downloads.ClipDownloadJob stores its own detection variables,
+            #   using the same IVs as this object)
+            if job_obj is None:
+                job_obj = self
+
             # Check for a media file being downloaded
             match = re.search(r'^\[download\] Destination\:\s(.*)$', stdout)
             if match:
 
-                self.dl_path = match.group(1)
+                job_obj.dl_path = match.group(1)
                 return
 
             match = re.search(r'^\[ffmpeg\] Destination\:\s(.*)$', stdout)
             if match:
 
-                self.dl_path = match.group(1)
-                self.dl_confirm_flag = True
+                job_obj.dl_path = match.group(1)
+                job_obj.dl_confirm_flag = True
                 return
 
             # Check for completion of a media file download
             match = re.search(r'^\[download\] 100% of .* in', stdout)
             if match:
 
-                self.dl_confirm_flag = True
+                job_obj.dl_confirm_flag = True
                 return
 
             # Check for confirmation of post-processing
@@ -8895,8 +9162,8 @@ class ClipDownloader(object):
             )
             if match:
 
-                self.dl_path = match.group(1)
-                self.dl_confirm_flag = True
+                job_obj.dl_path = match.group(1)
+                job_obj.dl_confirm_flag = True
 
                 return
 
@@ -8937,6 +9204,63 @@ class ClipDownloader(object):
                 self.downloader_path_list.append(match.group(1))
 
 
+    def finish_clips_with_ffmpeg(self, orig_video_obj, dest_dir):
+
+        """Called by self.do_download_clips_with_ffmpeg() and
+        .do_download_clips_with_ffmpeg_multi().
+
+        After the clips have been downloaded, registers them with the download
+        manager, deletes the original video and opens the destination
+        directory (if required), and updates the main window.
+
+        Args:
+
+            orig_video_obj (media.Video): The video whose clips were
+                downloaded
+
+            dest_dir (str): Path to the destination folder
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 8733 finish_clips_with_ffmpeg')
+
+        # Import the main application (for convenience)
+        app_obj = self.download_manager_obj.app_obj
+
+        # If at least one clip was extracted...
+        if self.video_total:
+
+            # ...then the number of video downloads must be incremented
+            self.download_manager_obj.register_video('clip')
+
+            # Delete the original video, if required, and if it's not inside a
+            #   channel/playlist
+            # (Don't bother trying to delete a 'dummy' media.Video object, for
+            #   download operations launched from the Classic Mode tab)
+            if app_obj.split_video_auto_delete_flag \
+            and not isinstance(orig_video_obj.parent_obj, media.Channel) \
+            and not isinstance(orig_video_obj.parent_obj, media.Playlist) \
+            and not orig_video_obj.dummy_flag:
+
+                app_obj.delete_video(
+                    orig_video_obj,
+                    True,           # Delete all files
+                    True,           # Don't update Video Index yet
+                    True,           # Don't update Video Catalogue yet
+                )
+
+            # Open the destination directory, if required to do so
+            if dest_dir is not None \
+            and app_obj.split_video_auto_open_flag:
+                ttutils.open_file(app_obj, dest_dir)
+
+        # Pass a dictionary of values to downloads.DownloadWorker, confirming
+        #   the result of the job. The values are passed on to the main
+        #   window
+        self.last_data_callback()
+
+
     def is_child_process_alive(self):
 
         """Called by self.do_download_clips(), .do_download_remove_slices and
@@ -9001,6 +9325,45 @@ class ClipDownloader(object):
             return False
 
 
+    def kill_child_process(self, child_process):
+
+        """Called by self.do_download_clips_with_ffmpeg_multi() and
+        .stop().
+
+        Terminates a child process, if it is still running.
+
+        Args:
+
+            child_process (subprocess.Popen): The child process to terminate
+
+        Return values:
+
+            True if the child process was terminated, False if it had already
+                finished
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 8800 kill_child_process')
+
+        if child_process is None or child_process.poll() is not None:
+            return False
+
+        if os.name == 'nt':
+            # os.killpg is not available on MS Windows (see
+            #   https://bugs.python.org/issue5115 )
+            child_process.kill()
+
+            # When we kill the child process on MS Windows the return code
+            #   gets set to 1, so we want to reset the return code back to 0
+            child_process.returncode = 0
+
+        else:
+            os.killpg(child_process.pid, signal.SIGKILL)
+
+        return True
+
+
     def last_data_callback(self):
 
         """Called by self.read_child_process().
@@ -9248,13 +9611,19 @@ class ClipDownloader(object):
                         )
 
 
-    def read_child_process(self):
+    def read_child_process(self, job_obj=None):
 
         """Called by self.do_download_clips() and
         self.do_download_remove_slices().
 
         Reads from the child process STDOUT and STDERR, in the correct order.
 
+        Args:
+
+            job_obj (downloads.ClipDownloadJob or None): When several clips
+                are downloaded at the same time, the job whose child process
+                should be read. If None, self.child_process is read
+
         Return values:
 
             True if either STDOUT or STDERR were read, None if both queues were
@@ -9265,9 +9634,14 @@ class ClipDownloader(object):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('dld 9052 read_child_process')
 
+        if job_obj is None:
+            read_queue = self.queue
+        else:
+            read_queue = job_obj.queue
+
         # mini_list is in the form [time, pipe_type, data]
         try:
-            mini_list = self.queue.get_nowait()
+            mini_list = read_queue.get_nowait()
 
         except:
             # Nothing left to read
@@ -9302,7 +9676,7 @@ class ClipDownloader(object):
             data = re.sub(r'[\r]+', '', data)
 
             # Extract output from STDOUT
-            self.extract_stdout_data(data)
+            self.extract_stdout_data(data, job_obj)
 
             # Show output in the Output tab (if required)
             if app_obj.ytdl_output_stdout_flag:
@@ -9347,7 +9721,7 @@ class ClipDownloader(object):
                 self.last_data_callback()
                 self.set_return_code(self.STALLED)
 
-                self.queue.task_done()
+                read_queue.task_done()
                 return None
 
             # Show output in the Output tab (if required)
@@ -9371,7 +9745,7 @@ class ClipDownloader(object):
                 app_obj.write_downloader_log(data)
 
         # Either (or both) of STDOUT and STDERR were non-empty
-        self.queue.task_done()
+        read_queue.task_done()
         return True
 
 
@@ -9411,23 +9785,15 @@ class ClipDownloader(object):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('dld 9198 stop')
 
-        if self.is_child_process_alive():
-
-            if os.name == 'nt':
-                # os.killpg is not available on MS Windows (see
-                #   https://bugs.python.org/issue5115 )
-                self.child_process.kill()
-
-                # When we kill the child process on MS Windows the return code
-                #   gets set to 1, so we want to reset the return code back to
-                #   0
-                self.child_process.returncode = 0
-
-            else:
-                os.killpg(self.child_process.pid, signal.SIGKILL)
-
+        if self.kill_child_process(self.child_process):
             self.set_return_code(self.STOPPED)
 
+        # (When several clips are downloaded at the same time, the child
+        #   processes are stored in downloads.ClipDownloadJob objects)
+        for job_obj in self.job_list.copy():
+            if self.kill_child_process(job_obj.child_process):
+                self.set_return_code(self.STOPPED)
+
 
     def stop_soon(self):
 
@@ -9444,6 +9810,91 @@ class ClipDownloader(object):
         self.stop_soon_flag = True
 
 
+class ClipDownloadJob(object):
+
+    """Called by
+    downloads.ClipDownloader.do_download_clips_with_ffmpeg_multi().
+
+    Python class to handle a single video clip, when several clips from the
+    same video are downloaded at the same time. Stores the child process, the
+    downloads.PipeReader objects that read from it, and the detection
+    variables that a ClipDownloader otherwise stores for itself.
+
+    Args:
+
+        clip_num (int): The clip's position in the original list of clips
+            (first clip is #1)
+
+        clip_title (str): The clip title, matching its filename
+
+        cmd_list (list): Python list that contains the system command to
+            execute
+
+    Warnings:
+
+        The calling function is responsible for calling the close() method
+        when it's finished with this object, in order for this object to
+        properly close down.
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, clip_num, clip_title, cmd_list):
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 9238 __init__')
+
+        # IV list - class objects
+        # -----------------------
+        # The child process created by
+        #   ClipDownloader.create_child_process()
+        self.child_process = None
+
+        # Read from the child process STDOUT and STDERR in an asynchronous way
+        #   by polling this queue.PriorityQueue object
+        self.queue = queue.PriorityQueue()
+        self.stdout_reader = PipeReader(self.queue, 'stdout')
+        self.stderr_reader = PipeReader(self.queue, 'stderr')
+
+
+        # IV list - other
+        # ---------------
+        # The clip's position in the original list of clips (first clip is #1)
+        self.clip_num = clip_num
+        # The clip title, matching its filename
+        self.clip_title = clip_title
+        # The system command to execute
+        self.cmd_list = cmd_list
+
+        # The file path currently being downloaded/processed, and a flag set
+        #   to True when youtube-dl/FFmpeg appears to have finished
+        #   downloading/post-processing the clip (both used in the same way
+        #   as the equivalent ClipDownloader IVs)
+        self.dl_path = None
+        self.dl_confirm_flag = False
+
+
+    # Public class methods
+
+
+    def close(self):
+
+        """Can be called by anything.
+
+        Destructor function for this object.
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('dld 9284 close')
+
+        # Tell the PipeReader objects to shut down, thus joining their threads
+        self.stdout_reader.join()
+        self.stderr_reader.join()
+
+
 class StreamDownloader(object):
 
     """Called by downloads.DownloadWorker.run_stream_downloader().
@@ -11763,6 +12214,7 @@ class MiniJSONFetcher(object):
                         json_dict['description'],
                         app_obj.main_win_obj.descrip_line_max_len,
                     )
+                    app_obj.search_manager_obj.update_video(self.video_obj)
 
         # STDERR (ignoring any empty error messages)
         elif data != '':
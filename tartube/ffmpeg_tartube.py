@@ -25,10 +25,19 @@
 
 
 # Import other modules
+from gi.repository import GdkPixbuf
+import copy
 import os
 import re
 import shutil
 import subprocess
+import threading
+
+try:
+    import PIL.Image
+    HAVE_PIL_FLAG = True
+except:
+    HAVE_PIL_FLAG = False
 
 
 # Import our modules
@@ -69,6 +78,49 @@ class FFmpegManager(object):
         self.app_obj = app_obj
 
 
+        # IV list - other
+        # ---------------
+        # Flag set to True if GdkPixbuf has a loader for .webp files, in which
+        #   case self.convert_webp() doesn't need to call FFmpeg (Pillow is
+        #   used instead, if it is installed)
+        self.pixbuf_webp_flag = False
+
+        # The capabilities of each FFmpeg binary that has been probed (see
+        #   self.get_capabilities() ), so that FFmpeg is only probed once.
+        #   Dictionary in the form
+        #       capability_dict[(full_path, mtime)] = mini_dict
+        #   ...where 'mini_dict' is in the form
+        #       mini_dict['encoder_set'] = set of encoder names
+        #       mini_dict['demuxer_set'] = set of demuxer names
+        #       mini_dict['muxer_set'] = set of muxer names
+        #       mini_dict['hwaccel_set'] = set of hardware acceleration methods
+        #   ...or None, if the binary could not be probed
+        self.capability_dict = {}
+        # The parts of each FFmpegOptionsManager's system command that don't
+        #   depend on the video being processed (see
+        #   self.get_options_template() ). Dictionary in the form
+        #       template_dict[options_manager_uid] = [options_dict, mini_dict]
+        #   ...where 'options_dict' is a copy of the FFmpegOptionsManager's
+        #   options when the template was compiled, and 'mini_dict' is the
+        #   return value of FFmpegOptionsManager.compile_options()
+        self.template_dict = {}
+        # Lock for self.capability_dict and self.template_dict, which can be
+        #   accessed by several threads at the same time
+        self.cache_lock = threading.Lock()
+
+
+        # Code
+        # ----
+        try:
+            for pixbuf_format in GdkPixbuf.Pixbuf.get_formats():
+                if pixbuf_format.get_name() == 'webp':
+                    self.pixbuf_webp_flag = True
+                    break
+
+        except:
+            pass
+
+
     # Public class methods
 
 
@@ -91,6 +143,9 @@ class FFmpegManager(object):
         has been adapted here, so that YouTube thumbnails can be converted and
         made visible in the main window again.
 
+        If Pillow (or a GdkPixbuf loader) can decode .webp files, the
+        conversion is performed without FFmpeg.
+
         Args:
 
             thumbnail_filename (str): Full path to the webp file to be
@@ -109,137 +164,403 @@ class FFmpegManager(object):
 
         """
 
+        return self.convert_webp_batch([ thumbnail_filename ], retain_flag)[0]
+
+
+    def convert_webp_batch(self, thumbnail_list, retain_flag=False):
+
+        """Called by self.convert_webp() and
+        tidy.TidyManager.convert_webp_all().
+
+        Batch version of self.convert_webp(). Thumbnails that can be decoded
+        by Pillow or GdkPixbuf are converted without FFmpeg. The remaining
+        thumbnails are converted by a single FFmpeg command; if that fails,
+        they are converted one at a time, so that a single broken thumbnail
+        doesn't cause the whole batch to fail.
+
+        Args:
+
+            thumbnail_list (list): Full paths to the webp files to be converted
+                to jpg
+
+        Optional args:
+
+            retain_flag (bool): True if the original files should be retained
+                after the conversion, regardless of the value of
+                mainapp.TartubeApp settings
+
+        Return values:
+
+            A list of values, one for each item in 'thumbnail_list', in the
+                same order. Each value is False if an attempted conversion
+                fails, or True otherwise (including when no conversion is
+                attempted)
+
+        """
+
+        result_list = [ True ] * len(thumbnail_list)
+
         # Sanity check
-        if not os.path.isfile(thumbnail_filename) \
-        or self.app_obj.ffmpeg_fail_flag:
-            return True
+        if self.app_obj.ffmpeg_fail_flag \
+        and not HAVE_PIL_FLAG \
+        and not self.pixbuf_webp_flag:
+            return result_list
 
         # Retain original thumbnails, if required
         if self.app_obj.ffmpeg_convert_webp_flag \
         and self.app_obj.ffmpeg_retain_webp_flag:
             retain_flag = True
 
-        # Correct extension for .webp files with the wrong extension
-        #   (youtube-dl #25687, #25717)
-        _, thumbnail_ext = os.path.splitext(thumbnail_filename)
-        if thumbnail_ext:
+        # Thumbnails which must be converted by FFmpeg, in the form
+        #   ffmpeg_dict[index] = path
+        ffmpeg_dict = {}
+        for i in range(len(thumbnail_list)):
 
-            # Remove the initial full stop
-            thumbnail_ext = thumbnail_ext[1:].lower()
+            thumbnail_filename = thumbnail_list[i]
+            if not os.path.isfile(thumbnail_filename):
+                continue
 
-            if thumbnail_ext != 'webp' and self.is_webp(thumbnail_filename):
+            thumbnail_filename, thumbnail_ext = self.correct_webp_extension(
+                thumbnail_filename,
+                retain_flag,
+            )
 
-                # .webp mislabelled as .jpg
-                thumbnail_webp_filename = self.replace_extension(
+            if thumbnail_filename is None:
+                result_list[i] = False
+
+            # Convert unsupported thumbnail formats to JPEG
+            #   (youtube-dl #25687, #25717)
+            elif thumbnail_ext not in ['jpg', 'png'] \
+            and not self.convert_webp_in_process(
+                thumbnail_filename,
+                retain_flag,
+            ):
+                if not self.app_obj.ffmpeg_fail_flag:
+                    ffmpeg_dict[i] = thumbnail_filename
+
+            # Procedure complete. Files have been created/renamed, so any
+            #   cached directory listing is no longer reliable
+            if thumbnail_filename is not None:
+                self.app_obj.file_manager_obj.reset_dir_listing(
                     thumbnail_filename,
-                    'webp',
                 )
 
-                if not retain_flag:
-                    try:
-                        os.rename(thumbnail_filename, thumbnail_webp_filename)
-                    except:
-                        return False
-                else:
-                    try:
-                        shutil.copyfile(
-                            thumbnail_filename,
-                            thumbnail_webp_filename,
-                        )
-                    except:
-                        return False
+        if len(ffmpeg_dict) > 1 \
+        and self.convert_webp_with_ffmpeg(
+            list(ffmpeg_dict.values()),
+            retain_flag,
+        ):
+            ffmpeg_dict = {}
 
-                thumbnail_filename = thumbnail_webp_filename
-                thumbnail_ext = 'webp'
+        for i in ffmpeg_dict:
+            if not self.convert_webp_with_ffmpeg(
+                [ ffmpeg_dict[i] ],
+                retain_flag,
+            ):
+                result_list[i] = False
 
-            elif thumbnail_ext == 'webp' and \
-            self.is_mislabelled_webp(thumbnail_filename):
+        return result_list
 
-                # .jpg mislabelled as .webp (Git #478)
-                thumbnail_jpg_filename = self.replace_extension(
-                    thumbnail_filename,
-                    'jpg',
+
+    def convert_webp_in_process(self, thumbnail_filename, retain_flag):
+
+        """Called by self.convert_webp_batch().
+
+        Converts a .webp thumbnail to .jpg without calling FFmpeg, using
+        Pillow (if installed) or GdkPixbuf (if a .webp loader is installed).
+        The modification time of the original file is preserved.
+
+        Args:
+
+            thumbnail_filename (str): Full path to the webp file to be
+                converted to jpg
+
+            retain_flag (bool): True if the original file should be retained
+                after the conversion
+
+        Return values:
+
+            True if the conversion succeeded, False if it failed or was not
+                attempted
+
+        """
+
+        if not HAVE_PIL_FLAG and not self.pixbuf_webp_flag:
+            return False
+
+        thumbnail_jpg_filename = self.replace_extension(
+            thumbnail_filename,
+            'jpg',
+        )
+
+        try:
+            mtime = os.stat(thumbnail_filename).st_mtime
+        except:
+            return False
+
+        success_flag = False
+        if HAVE_PIL_FLAG:
+
+            try:
+                with PIL.Image.open(thumbnail_filename) as image:
+                    image.convert('RGB').save(
+                        thumbnail_jpg_filename,
+                        'JPEG',
+                        quality=95,
+                    )
+
+                success_flag = True
+
+            except:
+                pass
+
+        if not success_flag and self.pixbuf_webp_flag:
+
+            try:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(thumbnail_filename)
+                pixbuf.savev(
+                    thumbnail_jpg_filename,
+                    'jpeg',
+                    ['quality'],
+                    ['95'],
                 )
 
-                if not retain_flag:
-                    try:
-                        os.rename(thumbnail_filename, thumbnail_jpg_filename)
-                    except:
-                        return False
-                else:
-                    try:
-                        shutil.copyfile(
-                            thumbnail_filename,
-                            thumbnail_jpg_filename,
-                        )
-                    except:
-                        return False
-
-                thumbnail_filename = thumbnail_jpg_filename
-                thumbnail_ext = 'jpg'
-
-        # Convert unsupported thumbnail formats to JPEG
-        #   (youtube-dl #25687, #25717)
-        if thumbnail_ext not in ['jpg', 'png']:
-
-            # NB: % is supposed to be escaped with %% but this does not work
-            #   for input files so working around with standard substitution
+                success_flag = True
+
+            except:
+                pass
+
+        if not success_flag:
+
+            # Don't leave a partial file behind
+            if os.path.isfile(thumbnail_jpg_filename):
+                self.app_obj.remove_file(thumbnail_jpg_filename)
+
+            return False
+
+        self.try_utime(thumbnail_jpg_filename, mtime, mtime)
+
+        if not retain_flag:
+
+            # The original .webp file is not retained
+            self.app_obj.remove_file(thumbnail_filename)
+
+        return True
+
+
+    def convert_webp_with_ffmpeg(self, thumbnail_list, retain_flag):
+
+        """Called by self.convert_webp_batch().
+
+        Converts one or more .webp thumbnails to .jpg using a single FFmpeg
+        command, with one output for each thumbnail. The modification time of
+        each original file is preserved.
+
+        Args:
+
+            thumbnail_list (list): Full paths to the webp files to be converted
+                to jpg
+
+            retain_flag (bool): True if the original files should be retained
+                after the conversion
+
+        Return values:
+
+            True if every thumbnail was converted, False if the conversion
+                failed (in which case the original files are restored)
+
+        """
+
+        # NB: % is supposed to be escaped with %% but this does not work for
+        #   input files so working around with standard substitution
+        # List of tuples in the form (original_path, escaped_path)
+        escaped_list = []
+        success_flag = True
+        for thumbnail_filename in thumbnail_list:
+
             escaped_thumbnail_filename = thumbnail_filename.replace('%', '#')
-            escaped_thumbnail_jpg_filename = self.replace_extension(
-                escaped_thumbnail_filename,
-                'jpg',
-            )
 
             # Handle special characters
             try:
                 os.rename(thumbnail_filename, escaped_thumbnail_filename)
+                escaped_list.append(
+                    (thumbnail_filename, escaped_thumbnail_filename),
+                )
+
             except:
-                return False
+                success_flag = False
+                break
+
+        if success_flag:
+
+            # Prepare the system command
+            input_cmd_list = []
+            output_cmd_list = []
+            for i in range(len(escaped_list)):
+
+                escaped_thumbnail_filename = escaped_list[i][1]
+
+                input_cmd_list.extend(
+                    [
+                        '-i',
+                        self._ffmpeg_filename_argument(
+                            escaped_thumbnail_filename,
+                        ),
+                    ],
+                )
+
+                output_cmd_list.extend(
+                    [
+                        '-map', str(i),
+                        '-bsf:v', 'mjpeg2jpeg',
+                        self._ffmpeg_filename_argument(
+                            self.replace_extension(
+                                escaped_thumbnail_filename,
+                                'jpg',
+                            ),
+                        ),
+                    ],
+                )
+
+            cmd_list = [self.get_executable(), '-y']
+            cmd_list += ['-loglevel', 'repeat+info']
+            cmd_list += input_cmd_list + output_cmd_list
 
             # Run FFmpeg to convert the thumbnail(s)
-            success_flag, msg = self.run_ffmpeg(
-                escaped_thumbnail_filename,
-                escaped_thumbnail_jpg_filename,
-                ['-bsf:v', 'mjpeg2jpeg'],
-            )
+            try:
+                p = subprocess.Popen(
+                    cmd_list,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    stdin=subprocess.PIPE,
+                )
 
-            if not success_flag:
+                p.communicate()
+                if p.returncode != 0:
+                    success_flag = False
+
+            except:
+                success_flag = False
+
+        if not success_flag:
+
+            # Conversion failed; most likely because FFmpeg is not installed
+            # Rename back to unescaped, and remove any partial output
+            for thumbnail_filename, escaped_thumbnail_filename in escaped_list:
+
+                escaped_thumbnail_jpg_filename = self.replace_extension(
+                    escaped_thumbnail_filename,
+                    'jpg',
+                )
+
+                if os.path.isfile(escaped_thumbnail_jpg_filename):
+                    self.app_obj.remove_file(escaped_thumbnail_jpg_filename)
 
-                # Conversion failed; most likely because FFmpeg is not
-                #   installed
-                # Rename back to unescaped
                 try:
                     os.rename(escaped_thumbnail_filename, thumbnail_filename)
                 except:
                     pass
 
-                return False
+            return False
+
+        # Conversion succeeded
+        for thumbnail_filename, escaped_thumbnail_filename in escaped_list:
 
-            else:
+            escaped_thumbnail_jpg_filename = self.replace_extension(
+                escaped_thumbnail_filename,
+                'jpg',
+            )
 
-                # Conversion succeeded
-                # Rename the (converted file) to unescaped for further
-                #   processing
-                thumbnail_jpg_filename = self.replace_extension(
-                    thumbnail_filename,
-                    'jpg',
+            # Preserve the original modification time
+            try:
+                mtime = os.stat(escaped_thumbnail_filename).st_mtime
+                self.try_utime(escaped_thumbnail_jpg_filename, mtime, mtime)
+            except:
+                pass
+
+            # Rename the (converted file) to unescaped for further processing
+            try:
+                os.rename(
+                    escaped_thumbnail_jpg_filename,
+                    self.replace_extension(thumbnail_filename, 'jpg'),
                 )
+            except:
+                success_flag = False
+
+            if not retain_flag:
+
+                # The original .webp file is not retained
+                self.app_obj.remove_file(escaped_thumbnail_filename)
+
+            else:
 
                 try:
-                    os.rename(
-                        escaped_thumbnail_jpg_filename,
-                        thumbnail_jpg_filename
-                    )
+                    os.rename(escaped_thumbnail_filename, thumbnail_filename)
                 except:
-                    return False
+                    pass
+
+        return success_flag
+
+
+    def correct_webp_extension(self, thumbnail_filename, retain_flag):
+
+        """Called by self.convert_webp_batch().
+
+        Corrects the extension for .webp files with the wrong extension
+        (youtube-dl #25687, #25717), and for .jpg files with the wrong
+        extension (Git #478).
+
+        Args:
+
+            thumbnail_filename (str): Full path to the thumbnail
+
+            retain_flag (bool): True if the original file should be retained,
+                in which case the file is copied rather than renamed
+
+        Return values:
+
+            A list in the form (path, ext), where 'path' is the full path to
+                the (possibly renamed) thumbnail, and 'ext' is its file
+                extension (without the initial full stop). If a file can't be
+                renamed, 'path' is None
+
+        """
+
+        _, thumbnail_ext = os.path.splitext(thumbnail_filename)
+        if thumbnail_ext:
+
+            # Remove the initial full stop
+            thumbnail_ext = thumbnail_ext[1:].lower()
+
+            if thumbnail_ext != 'webp' and self.is_webp(thumbnail_filename):
+
+                # .webp mislabelled as .jpg
+                new_ext = 'webp'
+
+            elif thumbnail_ext == 'webp' and \
+            self.is_mislabelled_webp(thumbnail_filename):
+
+                # .jpg mislabelled as .webp (Git #478)
+                new_ext = 'jpg'
+
+            else:
+
+                return [ thumbnail_filename, thumbnail_ext ]
+
+            new_filename = self.replace_extension(thumbnail_filename, new_ext)
 
+            try:
                 if not retain_flag:
+                    os.rename(thumbnail_filename, new_filename)
+                else:
+                    shutil.copyfile(thumbnail_filename, new_filename)
 
-                    # The original .webp file is not retained
-                    self.app_obj.remove_file(escaped_thumbnail_filename)
+            except:
+                return [ None, None ]
 
-        # Procedure complete
-        return True
+            return [ new_filename, new_ext ]
+
+        return [ thumbnail_filename, thumbnail_ext ]
 
 
     def _ffmpeg_filename_argument(self, path):
@@ -289,9 +610,153 @@ class FFmpegManager(object):
             return 'ffmpeg'
 
 
+    def get_capabilities(self):
+
+        """Called by self.has_encoder(), .has_demuxer() and .has_hwaccel().
+
+        Returns the capabilities of the current FFmpeg binary. The binary is
+        only probed once; the result is cached, using the binary's full path
+        and modification time (so a replaced binary is probed again).
+
+        Return values:
+
+            A dictionary in the form described in the comments in
+                self.__init__(), or None if the binary could not be found or
+                probed
+
+        """
+
+        full_path = shutil.which(self.get_executable())
+        if full_path is None:
+            return None
+
+        try:
+            mtime = os.stat(full_path).st_mtime
+        except:
+            return None
+
+        with self.cache_lock:
+
+            key = (full_path, mtime)
+            if not key in self.capability_dict:
+                self.capability_dict[key] = self.probe_capabilities(full_path)
+
+            return self.capability_dict[key]
+
+
+    def get_options_template(self, options_obj):
+
+        """Called by FFmpegOptionsManager.get_system_cmd().
+
+        Returns the parts of an FFmpegOptionsManager's system command that
+        don't depend on the video being processed. They are compiled once, and
+        compiled again only when the FFmpegOptionsManager's options change.
+
+        Args:
+
+            options_obj (ffmpeg_tartube.FFmpegOptionsManager): The object
+                whose system command is being generated
+
+        Return values:
+
+            The return value of FFmpegOptionsManager.compile_options()
+
+        """
+
+        with self.cache_lock:
+
+            if options_obj.uid in self.template_dict:
+
+                options_dict, mini_dict = self.template_dict[options_obj.uid]
+                if options_dict == options_obj.options_dict:
+                    return mini_dict
+
+            mini_dict = options_obj.compile_options(options_obj.options_dict)
+            self.template_dict[options_obj.uid] = [
+                copy.deepcopy(options_obj.options_dict),
+                mini_dict,
+            ]
+
+            return mini_dict
+
+
+    def has_demuxer(self, name):
+
+        """Can be called by anything.
+
+        Checks whether the current FFmpeg binary supports a demuxer.
+
+        Args:
+
+            name (str): The demuxer name, e.g. 'concat'
+
+        Return values:
+
+            False if the demuxer is not supported, True if it is supported (or
+                if FFmpeg could not be probed, in which case we can't tell)
+
+        """
+
+        mini_dict = self.get_capabilities()
+        if mini_dict is None:
+            return True
+        else:
+            return name in mini_dict['demuxer_set']
+
+
+    def has_encoder(self, name):
+
+        """Can be called by anything.
+
+        Checks whether the current FFmpeg binary supports an encoder.
+
+        Args:
+
+            name (str): The encoder name, e.g. 'h264_nvenc'
+
+        Return values:
+
+            False if the encoder is not supported, True if it is supported (or
+                if FFmpeg could not be probed, in which case we can't tell)
+
+        """
+
+        mini_dict = self.get_capabilities()
+        if mini_dict is None:
+            return True
+        else:
+            return name in mini_dict['encoder_set']
+
+
+    def has_hwaccel(self, name):
+
+        """Can be called by anything.
+
+        Checks whether the current FFmpeg binary supports a hardware
+        acceleration method.
+
+        Args:
+
+            name (str): The method, e.g. 'vaapi'. The value 'auto' is always
+                supported
+
+        Return values:
+
+            False if the method is not supported, True if it is supported (or
+                if FFmpeg could not be probed, in which case we can't tell)
+
+        """
+
+        mini_dict = self.get_capabilities()
+        if mini_dict is None or name == 'auto':
+            return True
+        else:
+            return name in mini_dict['hwaccel_set']
+
+
     def is_webp(self, path):
 
-        """Called by self.convert_webp() and
+        """Called by self.correct_webp_extension() and
         ttutils.find_thumbnail_webp_intact_or_broken().
 
         Adapted from youtube-dl/youtube-dl/postprocessor/embedthumbnail.py.
@@ -314,7 +779,7 @@ class FFmpegManager(object):
 
     def is_mislabelled_webp(self, path):
 
-        """Called by self.convert_webp() and
+        """Called by self.correct_webp_extension() and
         ttutils.find_thumbnail_webp_intact_or_broken().
 
         Adapted from self.is_webp().
@@ -334,9 +799,84 @@ class FFmpegManager(object):
         return data[0:3] == b'\xff\xd8\xff'
 
 
+    def probe_capabilities(self, full_path):
+
+        """Called by self.get_capabilities().
+
+        Runs the FFmpeg binary to find the encoders, demuxers, muxers and
+        hardware acceleration methods it supports.
+
+        Args:
+
+            full_path (str): The full path to the FFmpeg binary
+
+        Return values:
+
+            A dictionary in the form described in the comments in
+                self.__init__(), or None if the binary could not be probed
+
+        """
+
+        mini_dict = {}
+        for option, key in [
+            ['-encoders', 'encoder_set'],
+            ['-demuxers', 'demuxer_set'],
+            ['-muxers', 'muxer_set'],
+            ['-hwaccels', 'hwaccel_set'],
+        ]:
+            try:
+                p = subprocess.Popen(
+                    [full_path, '-hide_banner', option],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    stdin=subprocess.PIPE,
+                )
+
+                stdout, stderr = p.communicate()
+
+            except:
+                return None
+
+            if p.returncode != 0:
+                return None
+
+            name_set = set()
+            header_flag = True
+            for line in stdout.decode(ttutils.get_encoding(), 'replace') \
+            .splitlines():
+
+                # Encoders, demuxers and muxers are listed after a line of
+                #   hyphens, in the form ' V..... libx264  Description'
+                #   (demuxers and muxers can have several comma-separated
+                #   names). Hardware acceleration methods are listed one per
+                #   line, after a header line
+                if option == '-hwaccels':
+
+                    if header_flag:
+                        header_flag = False
+                    elif line.strip() != '':
+                        name_set.add(line.strip())
+
+                elif header_flag:
+
+                    if re.search(r'^\s*\-\-', line):
+                        header_flag = False
+
+                else:
+
+                    item_list = line.split()
+                    if len(item_list) >= 2:
+                        for name in item_list[1].split(','):
+                            name_set.add(name)
+
+            mini_dict[key] = name_set
+
+        return mini_dict
+
+
     def replace_extension(self, path, ext, expected_real_ext=None):
 
-        """Called by self.convert_webp().
+        """Called by self.convert_webp_in_process(), etc.
 
         Adapted from youtube-dl/youtube-dl/utils.py.
 
@@ -369,8 +909,7 @@ class FFmpegManager(object):
 
     def run_ffmpeg(self, input_path, out_path, opt_list, test_flag=False):
 
-        """Can be called by anything (currently called only by
-        self.convert_webp() ).
+        """Can be called by anything.
 
         Adapted from youtube-dl/youtube-dl/postprocessor/ffmpeg.py.
 
@@ -532,6 +1071,105 @@ class FFmpegManager(object):
             return [ self.try_utime(source_path, mod_time, mod_time), '' ]
 
 
+    def get_slice_removal_cmd(self, source_path, output_path, clip_list,
+    list_path, copy_flag):
+
+        """Called by process.ProcessManager.slice_video().
+
+        Not adapted from youtube-dl.
+
+        Prepares a single FFmpeg system command which removes video slices from
+        a video, reading the source file once and writing the output file
+        once (instead of extracting each clip to be kept, and then
+        concatenating them).
+
+        If 'copy_flag' is True, the clips to be kept are listed in a file for
+        FFmpeg's concat demuxer, and are copied without re-encoding. Each cut
+        is moved to the nearest keyframe, so a small part of a slice might not
+        be removed.
+
+        Otherwise, the clips to be kept are chosen by FFmpeg's select and
+        aselect filters, and the video is re-encoded (so the cuts are exact).
+
+        Args:
+
+            source_path (str): The full path to the source file
+
+            output_path (str): The full path to the output file
+
+            clip_list (list): The clips to be kept, in the form returned by
+                ttutils.convert_slices_to_clips(): a list of groups of two,
+                [start_time, stop_time], in seconds. 'stop_time' can be None
+                to signify the end of the video
+
+            list_path (str): The full path to the file that lists the clips
+                for the concat demuxer (created by this function, if
+                'copy_flag' is True)
+
+            copy_flag (bool): True to copy the clips, False to re-encode them
+
+        Return values:
+
+            The FFmpeg system command, as a list
+
+        """
+
+        cmd_list = [ self.get_executable() ]
+
+        if copy_flag:
+
+            # (In the list file, single quotes must be escaped)
+            quoted_path = source_path.replace('\'', '\'\\\'\'')
+
+            line_list = []
+            for start_time, stop_time in clip_list:
+
+                line_list.append('file \'' + quoted_path + '\'')
+                line_list.append('inpoint ' + str(start_time))
+                if stop_time is not None:
+                    line_list.append('outpoint ' + str(stop_time))
+
+            with open(list_path, 'w') as fh:
+                fh.write('\n'.join(line_list) + '\n')
+
+            cmd_list.extend(
+                [
+                    '-safe', '0',
+                    '-f', 'concat',
+                    '-i', list_path,
+                    '-map', '0',
+                    '-c', 'copy',
+                ],
+            )
+
+        else:
+
+            expr_list = []
+            for start_time, stop_time in clip_list:
+
+                if stop_time is None:
+                    expr_list.append('gte(t,' + str(start_time) + ')')
+                else:
+                    expr_list.append(
+                        'between(t,' + str(start_time) + ',' + str(stop_time) \
+                        + ')',
+                    )
+
+            expr = '+'.join(expr_list)
+
+            cmd_list.extend(
+                [
+                    '-i', source_path,
+                    '-vf', 'select=\'' + expr + '\',setpts=N/FRAME_RATE/TB',
+                    '-af', 'aselect=\'' + expr + '\',asetpts=N/SR/TB',
+                ],
+            )
+
+        cmd_list.append(output_path)
+
+        return cmd_list
+
+
     def try_utime(self, path, atime, mtime):
 
         """Called by self.run_ffmpeg_multiple_files().
@@ -748,6 +1386,115 @@ class FFmpegOptionsManager(object):
         self.options_dict = other_options_manager_obj.options_dict.copy()
 
 
+    def compile_options(self, options_dict):
+
+        """Called by self.get_system_cmd() and
+        FFmpegManager.get_options_template().
+
+        Compiles the parts of the system command that depend only on the
+        FFmpeg options (and not on the video being processed), so that they
+        can be re-used when many videos are processed.
+
+        Args:
+
+            options_dict (dict): The FFmpeg options to use (usually
+                self.options_dict)
+
+        Return values:
+
+            A dictionary in the form
+
+                mini_dict['extra_cmd_list'] = List of options specified by
+                    'extra_cmd_string'
+                mini_dict['h264_list'] = List of options for the H.264 output
+                    mode (excluding the encoder, preset and hardware
+                    acceleration options). An empty list in any other output
+                    mode
+
+        """
+
+        tuning_list = []
+        h264_list = []
+
+        # (Shortcuts to values retrieved several times)
+        input_mode = options_dict['input_mode']
+        limit_buffer = options_dict['limit_buffer']
+        limit_mbps = options_dict['limit_mbps']
+        rate_factor = options_dict['rate_factor']
+
+        # The 'extra_cmd_string' item must be processed, and split into
+        #   a list of separate items, preserving everything inside quotes as a
+        #   single item (just as we do for youtube-dl download options)
+        extra_cmd_string = options_dict['extra_cmd_string']
+        if extra_cmd_string != '':
+            extra_cmd_list = ttutils.parse_options(extra_cmd_string)
+        else:
+            extra_cmd_list = []
+
+        # H.264 (the options are only used in that output mode)
+        if options_dict['output_mode'] == 'h264':
+
+            if options_dict['tuning_film_flag']:
+                tuning_list.append('film')
+            if options_dict['tuning_animation_flag']:
+                tuning_list.append('animation')
+            if options_dict['tuning_grain_flag']:
+                tuning_list.append('grain')
+            if options_dict['tuning_still_image_flag']:
+                tuning_list.append('stillimage')
+            if options_dict['tuning_fast_decode_flag']:
+                tuning_list.append('fastdecode')
+            if options_dict['tuning_zero_latency_flag']:
+                tuning_list.append('zerolatency')
+
+            if tuning_list:
+                h264_list.append('-tune')
+                h264_list.append(','.join(tuning_list))
+
+            if options_dict['fast_start_flag']:
+                h264_list.append('-movflags')
+                h264_list.append('faststart')
+
+            if input_mode == 'video' and options_dict['audio_flag']:
+                h264_list.append('-c:a')
+                h264_list.append('aac')
+                h264_list.append('-b:a')
+                h264_list.append(
+                    str(options_dict['audio_bitrate']) + 'k',
+                )
+
+            if options_dict['profile_flag'] and rate_factor != 0:
+                h264_list.append('-profile:v')
+                h264_list.append('baseline')
+                h264_list.append('-level')
+                h264_list.append('3.0')
+
+            if options_dict['limit_flag']:
+                h264_list.append('-maxrate')
+                h264_list.append(str(limit_mbps) + 'M')
+                h264_list.append('-bufsize')
+                h264_list.append(str(limit_mbps * limit_buffer) + 'M')
+
+            if options_dict['seek_flag']:
+
+                # In the original code, this was marked:
+                #   Inserts an I-frame every 15 frames
+                h264_list.append('-x264-params')
+                h264_list.append('keyint=15')
+
+            # In the original code, this was marked:
+            #   Preserves the frame timestamps of VFR videos
+            h264_list.append('-vsync')
+            h264_list.append('2')
+            h264_list.append('-enc_time_base')
+            h264_list.append('-1')
+
+        return {
+            'extra_cmd_list': extra_cmd_list,
+            'h264_list': h264_list,
+        }
+
+
     def reset_options(self):
 
         """Called by self.__init__().
@@ -862,7 +1609,6 @@ class FFmpegOptionsManager(object):
         """
 
         opt_list = []
-        tuning_list = []
         return_list = []
 
         # When called from the edit window (config.FFmpegOptionsEditWin), any
@@ -877,19 +1623,18 @@ class FFmpegOptionsManager(object):
         # (Shortcuts to values retrieved several times)
         bitrate = options_dict['bitrate']
         input_mode = options_dict['input_mode']
-        limit_buffer = options_dict['limit_buffer']
-        limit_mbps = options_dict['limit_mbps']
         output_mode = options_dict['output_mode']
         rate_factor = options_dict['rate_factor']
 
-        # The 'extra_cmd_string' item must be processed, and split into
-        #   a list of separate items, preserving everything inside quotes as a
-        #   single item (just as we do for youtube-dl download options)
-        extra_cmd_string = options_dict['extra_cmd_string']
-        if extra_cmd_string != '':
-            extra_cmd_list = ttutils.parse_options(extra_cmd_string)
+        # The parts of the system command that don't depend on the video are
+        #   compiled once, and then re-used (unless there are unapplied
+        #   changes in the edit window)
+        if edit_dict:
+            mini_dict = self.compile_options(options_dict)
         else:
-            extra_cmd_list = []
+            mini_dict = app_obj.ffmpeg_manager_obj.get_options_template(self)
+
+        extra_cmd_list = mini_dict['extra_cmd_list']
 
         # FFmpeg binary
         binary = app_obj.ffmpeg_manager_obj.get_executable()
@@ -1080,72 +1825,38 @@ class FFmpegOptionsManager(object):
         # H.264
         if output_mode == 'h264':
 
+            # If FFmpeg doesn't support the GPU encoder or the hardware
+            #   acceleration method, use the software equivalents instead
+            #   (but not for the specimen system command shown in the edit
+            #   window)
+            encoder = options_dict['gpu_encoding']
+            hw_accel = options_dict['hw_accel']
+            if video_obj is not None:
+
+                ffmpeg_manager_obj = app_obj.ffmpeg_manager_obj
+                if not ffmpeg_manager_obj.has_encoder(encoder):
+                    if re.search(r'^hevc_', encoder):
+                        encoder = 'libx265'
+                    else:
+                        encoder = 'libx264'
+
+                if hw_accel != 'none' \
+                and not ffmpeg_manager_obj.has_hwaccel(hw_accel):
+                    hw_accel = 'none'
+
             # In the original code, this was marked:
             #   Only necessary if the output filename does not end with .mp4
             opt_list.append('-c:v')
-            opt_list.append(options_dict['gpu_encoding'])
+            opt_list.append(encoder)
 
             opt_list.append('-preset')
             opt_list.append(options_dict['patience_preset'])
 
-            if options_dict['hw_accel'] != 'none':
+            if hw_accel != 'none':
                 opt_list.append('-hwaccel')
-                opt_list.append(options_dict['hw_accel'])
-
-            if options_dict['tuning_film_flag']:
-                tuning_list.append('film')
-            if options_dict['tuning_animation_flag']:
-                tuning_list.append('animation')
-            if options_dict['tuning_grain_flag']:
-                tuning_list.append('grain')
-            if options_dict['tuning_still_image_flag']:
-                tuning_list.append('stillimage')
-            if options_dict['tuning_fast_decode_flag']:
-                tuning_list.append('fastdecode')
-            if options_dict['tuning_zero_latency_flag']:
-                tuning_list.append('zerolatency')
+                opt_list.append(hw_accel)
 
-            if tuning_list:
-                opt_list.append('-tune')
-                opt_list.append(','.join(tuning_list))
-
-            if options_dict['fast_start_flag']:
-                opt_list.append('-movflags')
-                opt_list.append('faststart')
-
-            if input_mode == 'video' and options_dict['audio_flag']:
-                opt_list.append('-c:a')
-                opt_list.append('aac')
-                opt_list.append('-b:a')
-                opt_list.append(
-                    str(options_dict['audio_bitrate']) + 'k',
-                )
-
-            if options_dict['profile_flag'] and rate_factor != 0:
-                opt_list.append('-profile:v')
-                opt_list.append('baseline')
-                opt_list.append('-level')
-                opt_list.append('3.0')
-
-            if options_dict['limit_flag']:
-                opt_list.append('-maxrate')
-                opt_list.append(str(limit_mbps) + 'M')
-                opt_list.append('-bufsize')
-                opt_list.append((str(limit_mbps) * str(limit_buffer)) + 'M')
-
-            if options_dict['seek_flag']:
-
-                # In the original code, this was marked:
-                #   Inserts an I-frame every 15 frames
-                opt_list.append('-x264-params')
-                opt_list.append('keyint=15')
-
-            # In the original code, this was marked:
-            #   Preserves the frame timestamps of VFR videos
-            opt_list.append('-vsync')
-            opt_list.append('2')
-            opt_list.append('-enc_time_base')
-            opt_list.append('-1')
+            opt_list.extend(mini_dict['h264_list'])
 
             if options_dict['quality_mode'] == 'crf':
 
@@ -1301,3 +2012,83 @@ class FFmpegOptionsManager(object):
             return source_thumb_path, output_path, return_list
         else:
             return source_video_path, output_path, return_list
+
+
+    def get_split_system_cmd(self, app_obj, video_obj, clip_list, clip_dir,
+    copy_flag=False):
+
+        """Called by process.ProcessManager.split_video().
+
+        Modified version of self.get_system_cmd(), for splitting a video into
+        several clips with a single FFmpeg command (so the source file is only
+        read once). Each clip is a separate output of the same command.
+
+        Args:
+
+            app_obj (mainapp.TartubeApp): The main application
+
+            video_obj (media.Video): The video to split
+
+            clip_list (list): A list of clips, each one a list in the form
+                [start_point, stop_point, clip_title]. 'stop_point' can be
+                None, in which case the clip ends at the end of the video
+
+            clip_dir (str): The destination directory for the clips
+
+            copy_flag (bool): True if the clips should be extracted without
+                re-encoding them (faster, but the cuts are less accurate)
+
+        Return values:
+
+            Returns a tuple of three items:
+
+                - The full path to the source file
+                - A (python) list of full paths to the output files, one for
+                    each clip
+                - A (python) list of options comprising the complete system
+                    commmand
+
+            If the options specified by self.options_dict can't be applied to
+                several clips at once, returns the tuple (None, None, [])
+
+        """
+
+        source_path = None
+        output_list = []
+        return_list = []
+
+        for start_point, stop_point, clip_title in clip_list:
+
+            this_source_path, output_path, cmd_list = self.get_system_cmd(
+                app_obj,
+                video_obj,
+                start_point,
+                stop_point,
+                clip_title,
+                clip_dir,
+                { 'output_mode': 'split' },
+            )
+
+            # The command for a single clip is in the form
+            #   binary -i source_path -ss start [-to stop] output_path
+            # Anything else (for example, a command using only the options
+            #   specified by 'extra_cmd_string') can't be combined
+            if this_source_path is None \
+            or len(cmd_list) < 6 \
+            or cmd_list[1:3] != ['-i', this_source_path] \
+            or cmd_list[3] != '-ss' \
+            or cmd_list[-1] != output_path:
+                return None, None, []
+
+            if not return_list:
+                source_path = this_source_path
+                return_list.extend(cmd_list[0:3])
+
+            return_list.extend(cmd_list[3:-1])
+            if copy_flag:
+                return_list.extend(['-c', 'copy'])
+
+            return_list.append(output_path)
+            output_list.append(output_path)
+
+        return source_path, output_list, return_list
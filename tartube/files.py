@@ -25,10 +25,20 @@
 
 
 # Import other modules
-from gi.repository import GdkPixbuf
+from gi.repository import GObject, GdkPixbuf
+import collections
+import concurrent.futures
+import copyreg
+import hashlib
 import json
 import os
+import pickle
 import threading
+import time
+
+
+# Import our modules
+import ttutils
 
 
 # Classes
@@ -50,10 +60,154 @@ class FileManager(threading.Thread):
 
         super(FileManager, self).__init__()
 
+        # IV list - other
+        # ---------------
+        # Cache of directory listings, so that the code can check for the
+        #   existence of thumbnails and other sidecar files without calling
+        #   os.path.isfile() for each one (see files.DirListingCache)
+        self.dir_listing_obj = DirListingCache()
+
+        # Cache of scaled thumbnails, so that the Video Catalogue doesn't have
+        #   to load and scale the same thumbnail from disk, every time it is
+        #   redrawn. Only used by self.load_to_pixbuf_async()
+        # Ordered dictionary (the least recently-used pixbuf first) in the form
+        #   pixbuf_cache_dict[key] = pixbuf
+        # ...where 'key' is a tuple in the form
+        #   (full_path, mtime, width, height)
+        self.pixbuf_cache_dict = collections.OrderedDict()
+        # The total size of the pixbufs in the cache (in bytes)
+        self.pixbuf_cache_size = 0
+        # The maximum total size (in bytes). The least recently-used pixbufs
+        #   are discarded when the size is exceeded
+        self.pixbuf_cache_max_size = 64 * 1024 * 1024
+        # Pixbufs are loaded and scaled by a pool of worker threads, so that
+        #   the main window remains responsive. The number of workers
+        self.pixbuf_worker_count = 2
+        # The pool itself (a concurrent.futures.ThreadPoolExecutor), created
+        #   when first required
+        self.pixbuf_executor = None
+        # Dictionary of pixbufs currently being loaded by the workers, in the
+        #   form
+        #       pixbuf_pending_dict[key] = list_of_callbacks
+        # ...where 'key' is the same as above, and 'list_of_callbacks' is a
+        #   list of tuples in the form (callback_function, callback_args)
+        self.pixbuf_pending_dict = {}
+
+        # Persistent cache of scaled thumbnails, so that drawing a page of the
+        #   Video Catalogue reads only small files, rather than loading (and
+        #   scaling) each full-size thumbnail
+        # The full path to the cache directory (set by
+        #   mainapp.TartubeApp.update_data_dirs() ). Inside it, there is a
+        #   sub-directory for each thumbnail size, in the form 'WIDTHxHEIGHT',
+        #   and inside that, one .png file for each original thumbnail. Each
+        #   file's modification time matches the original's; if the two are
+        #   different, the cached file is out of date. If None, the cache is
+        #   not used
+        self.thumb_cache_dir = None
+        # The cache is also filled in bulk by a single worker thread, which
+        #   runs independently of the pool used by self.load_to_pixbuf_async()
+        #   (so that thumbnails visible in the Video Catalogue are never
+        #   waiting behind the bulk job). The worker (a
+        #   concurrent.futures.ThreadPoolExecutor), created when first
+        #   required
+        self.thumb_cache_executor = None
+        # Each call to self.fill_thumb_cache() that starts a new job
+        #   increments this number; a bulk job stops as soon as it sees that it
+        #   has been superseded
+        self.thumb_cache_job_id = 0
+        # A key describing the most recent bulk job, in the form
+        #   (frozenset_of_video_dbids, tuple_of_sizes)
+        # If the same job is requested again while it is running (or after it
+        #   has finished), no new job is started. None if there is no such job
+        #   (or if it was abandoned)
+        self.thumb_cache_job_key = None
+
 
     # Public class methods
 
 
+    def check_path(self, full_path):
+
+        """Can be called by anything.
+
+        Equivalent to os.path.isfile(), but uses the cached directory listing
+        (see files.DirListingCache.check_path() ).
+
+        Args:
+
+            full_path (str): The full path to the file
+
+        Return values:
+
+            True if the file exists, False if not
+
+        """
+
+        return self.dir_listing_obj.check_path(full_path)
+
+
+    def find_path_by_prefix(self, full_path):
+
+        """Can be called by anything.
+
+        Equivalent to calling glob.glob(full_path + '*'), but uses the cached
+        directory listing (see files.DirListingCache.find_path_by_prefix() ).
+
+        Args:
+
+            full_path (str): The full path to the file, without the characters
+                which may follow it
+
+        Return values:
+
+            A sorted list of full paths to matching files (may be an empty
+                list)
+
+        """
+
+        return self.dir_listing_obj.find_path_by_prefix(full_path)
+
+
+    def get_dir_listing(self, dir_path):
+
+        """Can be called by anything.
+
+        Returns a set of names of files in the specified directory (see
+        files.DirListingCache.get_listing() ).
+
+        Args:
+
+            dir_path (str): The full path to the directory
+
+        Return values:
+
+            A set of file names (an empty set if the directory doesn't exist or
+                can't be read)
+
+        """
+
+        return self.dir_listing_obj.get_listing(dir_path)
+
+
+    def reset_dir_listing(self, path=None):
+
+        """Can be called by anything. Called whenever Tartube itself creates,
+        moves or deletes a file.
+
+        Discards cached directory listings (see files.DirListingCache.reset()
+        ).
+
+        Args:
+
+            path (str or None): The full path to a file or directory. The
+                listings for both the directory (if it is one), and its parent
+                directory, are discarded. If None, all listings are discarded
+
+        """
+
+        self.dir_listing_obj.reset(path)
+
+
     def load_json(self, full_path):
 
         """Can be called by anything.
@@ -165,3 +319,1250 @@ class FileManager(threading.Thread):
             )
 
         return pixbuf
+
+
+    def load_to_pixbuf_async(self, full_path, width, height, callback,
+    *args):
+
+        """Called by mainwin.ComplexCatalogueItem.update_thumb_image() and
+        mainwin.GridCatalogueItem.update_thumb_image().
+
+        A modified version of self.load_to_pixbuf(). Must be called from the
+        main (Gtk) thread.
+
+        If a scaled copy of the thumbnail is in the cache, returns it
+        immediately. Otherwise returns None, and asks a worker thread to load
+        and scale the thumbnail; when it is ready, the callback function is
+        called (in the main thread) with the pixbuf (or None, if the file
+        could not be loaded) as its first argument, followed by 'args'.
+
+        Args:
+
+            full_path (str): The full path to the thumbnail file
+
+            width, height (int): The size to which the thumbnail is scaled
+
+            callback (function): The function to call, when the thumbnail is
+                ready
+
+            args (any): Any further arguments to pass to the callback
+                function
+
+        Return values:
+
+            A GdkPixbuf, or None if the calling code must wait for the callback
+                function to be called
+
+        """
+
+        try:
+            mtime = os.stat(full_path).st_mtime_ns
+        except:
+            return None
+
+        key = (full_path, mtime, width, height)
+        if key in self.pixbuf_cache_dict:
+
+            self.pixbuf_cache_dict.move_to_end(key)
+            return self.pixbuf_cache_dict[key]
+
+        if key in self.pixbuf_pending_dict:
+
+            # Already being loaded
+            self.pixbuf_pending_dict[key].append( (callback, args) )
+
+        else:
+
+            self.pixbuf_pending_dict[key] = [ (callback, args) ]
+
+            if self.pixbuf_executor is None:
+                self.pixbuf_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.pixbuf_worker_count,
+                )
+
+            self.pixbuf_executor.submit(self.load_to_pixbuf_worker, key)
+
+        return None
+
+
+    def load_to_pixbuf_worker(self, key):
+
+        """Called by self.load_to_pixbuf_async(), in a worker thread.
+
+        Loads and scales the thumbnail, then passes the result back to the
+        main thread.
+
+        Args:
+
+            key (tuple): A tuple in the form (full_path, mtime, width, height)
+
+        """
+
+        full_path, mtime, width, height = key
+
+        # Use the scaled copy in the persistent cache, if there is one;
+        #   otherwise load the original thumbnail, and add a scaled copy to the
+        #   cache
+        pixbuf = self.load_thumb_cache(full_path, mtime, width, height)
+        if pixbuf is None:
+
+            try:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                    full_path,
+                    width,
+                    height,
+                    False,
+                )
+
+            except:
+                pixbuf = None
+
+            if pixbuf is not None:
+                self.save_thumb_cache(full_path, mtime, width, height, pixbuf)
+
+        GObject.timeout_add(0, self.load_to_pixbuf_finished, key, pixbuf)
+
+
+    def load_to_pixbuf_finished(self, key, pixbuf):
+
+        """Called by self.load_to_pixbuf_worker(), in the main thread.
+
+        Adds the pixbuf to the cache (discarding the least recently-used
+        pixbufs, if the cache is full), then calls the callback functions.
+
+        Args:
+
+            key (tuple): A tuple in the form (full_path, mtime, width, height)
+
+            pixbuf (GdkPixbuf.Pixbuf or None): The loaded pixbuf, or None if
+                the file could not be loaded
+
+        Return values:
+
+            False, so that the timer is not repeated
+
+        """
+
+        if pixbuf is not None:
+
+            self.pixbuf_cache_dict[key] = pixbuf
+            self.pixbuf_cache_size += pixbuf.get_rowstride() \
+            * pixbuf.get_height()
+
+            while self.pixbuf_cache_size > self.pixbuf_cache_max_size \
+            and len(self.pixbuf_cache_dict) > 1:
+
+                old_key, old_pixbuf \
+                = self.pixbuf_cache_dict.popitem(last=False)
+                self.pixbuf_cache_size -= old_pixbuf.get_rowstride() \
+                * old_pixbuf.get_height()
+
+        if key in self.pixbuf_pending_dict:
+
+            for callback, args in self.pixbuf_pending_dict.pop(key):
+                callback(pixbuf, *args)
+
+        return False
+
+
+    def fill_thumb_cache(self, app_obj, video_list, size_list):
+
+        """Called by mainwin.MainWin.video_catalogue_redraw_all().
+
+        Starts a background job which adds a scaled copy of each video's
+        thumbnail to the persistent cache (if it's not already there), so that
+        later pages of the Video Catalogue can be drawn quickly. Any bulk job
+        already running is abandoned.
+
+        If the most recent job was for the same videos and sizes (for example,
+        because the Video Catalogue has been redrawn for the same container),
+        that job is either still running or has already finished, so nothing
+        is done.
+
+        Args:
+
+            app_obj (mainapp.TartubeApp): The main application
+
+            video_list (list): A list of media.Video objects, in the order in
+                which they should be processed
+
+            size_list (list): A list of thumbnail sizes, each one a list in the
+                form [width, height]
+
+        """
+
+        if self.thumb_cache_dir is None or not video_list or not size_list:
+            self.thumb_cache_job_id += 1
+            self.thumb_cache_job_key = None
+            return
+
+        key = (
+            frozenset(video_obj.dbid for video_obj in video_list),
+            tuple(tuple(mini_list) for mini_list in size_list),
+        )
+
+        if key == self.thumb_cache_job_key:
+            return
+
+        self.thumb_cache_job_id += 1
+        self.thumb_cache_job_key = key
+
+        if self.thumb_cache_executor is None:
+            self.thumb_cache_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1,
+            )
+
+        self.thumb_cache_executor.submit(
+            self.fill_thumb_cache_worker,
+            self.thumb_cache_job_id,
+            app_obj,
+            video_list.copy(),
+            [list(mini_list) for mini_list in size_list],
+        )
+
+
+    def fill_thumb_cache_worker(self, job_id, app_obj, video_list, size_list):
+
+        """Called by self.fill_thumb_cache(), in a worker thread.
+
+        Adds scaled copies of each video's thumbnail to the persistent cache.
+
+        Args:
+
+            job_id (int): The value of self.thumb_cache_job_id when the job
+                was started
+
+            app_obj, video_list, size_list: As for self.fill_thumb_cache()
+
+        """
+
+        for video_obj in video_list:
+
+            if job_id != self.thumb_cache_job_id:
+                # Superseded by a later job
+                return
+
+            path = ttutils.find_thumbnail(app_obj, video_obj, True)
+            if path is None:
+                continue
+
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except:
+                continue
+
+            for width, height in size_list:
+
+                cache_path = self.get_thumb_cache_path(path, width, height)
+                if cache_path is None:
+                    return
+
+                try:
+                    if os.stat(cache_path).st_mtime_ns == mtime:
+                        # Already cached
+                        continue
+
+                except:
+                    pass
+
+                # (Loaded and scaled in the same way as
+                #   self.load_to_pixbuf_worker(), which decodes the image at
+                #   the smaller size, rather than decoding the whole image and
+                #   then scaling it)
+                try:
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                        path,
+                        width,
+                        height,
+                        False,
+                    )
+
+                except:
+                    break
+
+                if pixbuf is not None:
+                    self.save_thumb_cache(path, mtime, width, height, pixbuf)
+
+
+    def get_thumb_cache_path(self, full_path, width, height):
+
+        """Can be called by anything.
+
+        Returns the path to the scaled copy of a thumbnail in the persistent
+        cache (which may not exist yet).
+
+        Args:
+
+            full_path (str): The full path to the original thumbnail file
+
+            width, height (int): The size of the scaled copy
+
+        Return values:
+
+            The full path to the cached file, or None if the cache is not in
+                use
+
+        """
+
+        cache_dir = self.thumb_cache_dir
+        if cache_dir is None:
+            return None
+
+        file_name = hashlib.sha1(
+            os.path.abspath(full_path).encode('utf-8', 'surrogateescape'),
+        ).hexdigest() + '.png'
+
+        return os.path.join(
+            cache_dir,
+            str(width) + 'x' + str(height),
+            file_name,
+        )
+
+
+    def load_thumb_cache(self, full_path, mtime, width, height):
+
+        """Called by self.load_to_pixbuf_worker(), in a worker thread.
+
+        Loads the scaled copy of a thumbnail from the persistent cache, if it
+        exists and is up to date.
+
+        Args:
+
+            full_path (str): The full path to the original thumbnail file
+
+            mtime (int): The original file's modification time (in
+                nanoseconds)
+
+            width, height (int): The size of the scaled copy
+
+        Return values:
+
+            A GdkPixbuf, or None if the cached file is missing, out of date or
+                can't be loaded
+
+        """
+
+        cache_path = self.get_thumb_cache_path(full_path, width, height)
+        if cache_path is None:
+            return None
+
+        try:
+            if os.stat(cache_path).st_mtime_ns != mtime:
+                return None
+
+            return GdkPixbuf.Pixbuf.new_from_file(cache_path)
+
+        except:
+            return None
+
+
+    def prune_thumb_cache(self, app_obj, video_list):
+
+        """Called by tidy.TidyManager.run().
+
+        The persistent cache is never emptied by anything else, so remove any
+        scaled copies whose original thumbnail no longer exists (for example,
+        because its video has been deleted), or whose original has been
+        replaced since the copy was made.
+
+        Args:
+
+            app_obj (mainapp.TartubeApp): The main application
+
+            video_list (list): A list of every media.Video object whose
+                thumbnail may be in the cache. Any other files in the cache
+                are removed
+
+        Return values:
+
+            The number of files removed
+
+        """
+
+        cache_dir = self.thumb_cache_dir
+        if cache_dir is None or not os.path.isdir(cache_dir):
+            return 0
+
+        # Compile a dictionary of cached file names which are still in use, in
+        #   the form
+        #       valid_dict[file_name] = mtime_of_original_thumbnail
+        valid_dict = {}
+        for video_obj in video_list:
+
+            path = ttutils.find_thumbnail(app_obj, video_obj, True)
+            if path is None:
+                continue
+
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except:
+                continue
+
+            # (The file name is the same for every size; see
+            #   self.get_thumb_cache_path() )
+            file_name = os.path.basename(
+                self.get_thumb_cache_path(path, 0, 0),
+            )
+
+            valid_dict[file_name] = mtime
+
+        removed_count = 0
+        for size_dir in os.listdir(cache_dir):
+
+            size_path = os.path.join(cache_dir, size_dir)
+            try:
+                entry_list = list(os.scandir(size_path))
+            except:
+                continue
+
+            for entry in entry_list:
+
+                # (Ignore temporary files, which might be in the process of
+                #   being written by self.save_thumb_cache() )
+                if not entry.is_file() or entry.name.endswith('.tmp'):
+                    continue
+
+                try:
+                    if valid_dict.get(entry.name) == entry.stat().st_mtime_ns:
+                        continue
+
+                    os.remove(entry.path)
+                    removed_count += 1
+
+                except:
+                    pass
+
+            # Remove the directory for this size, if it's now empty
+            try:
+                os.rmdir(size_path)
+            except:
+                pass
+
+        return removed_count
+
+
+    def save_thumb_cache(self, full_path, mtime, width, height, pixbuf):
+
+        """Called by self.load_to_pixbuf_worker() and
+        .fill_thumb_cache_worker(), in a worker thread.
+
+        Saves the scaled copy of a thumbnail in the persistent cache. Failures
+        are silently ignored (the cache is only an optimisation).
+
+        Args:
+
+            full_path (str): The full path to the original thumbnail file
+
+            mtime (int): The original file's modification time (in
+                nanoseconds)
+
+            width, height (int): The size of the scaled copy
+
+            pixbuf (GdkPixbuf.Pixbuf): The scaled copy
+
+        """
+
+        cache_path = self.get_thumb_cache_path(full_path, width, height)
+        if cache_path is None:
+            return
+
+        # (Write to a temporary file first, so that no thread ever sees a
+        #   partially-written file)
+        temp_path = cache_path + '.' + str(threading.get_ident()) + '.tmp'
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            pixbuf.savev(temp_path, 'png', [], [])
+            os.utime(temp_path, ns=(mtime, mtime))
+            os.replace(temp_path, cache_path)
+
+        except:
+            try:
+                os.remove(temp_path)
+            except:
+                pass
+
+
+    def set_thumb_cache_dir(self, path):
+
+        """Called by mainapp.TartubeApp.update_data_dirs() and
+        .restore_data_variables_after_switch().
+
+        Sets (or resets) the persistent thumbnail cache directory. Any bulk job
+        filling the old cache is abandoned.
+
+        Args:
+
+            path (str or None): The full path to the cache directory, or None
+                to stop using the cache
+
+        """
+
+        self.thumb_cache_dir = path
+        self.thumb_cache_job_id += 1
+        self.thumb_cache_job_key = None
+
+
+class DirListingCache(object):
+
+    """Called by FileManager.__init__().
+
+    Python class to cache directory listings, so that the code can check for
+    the existence of thumbnails and other sidecar files (of which there might
+    be many for each video) using a single call to os.scandir(), rather than a
+    separate call to os.path.isfile() for each possible file (which is slow on
+    network filesystems).
+
+    A listing is discarded when Tartube itself creates, moves or deletes a
+    file in the directory (see self.reset() ). Otherwise, the directory's
+    modification time is checked no more than once every few seconds (rather
+    than every time the listing is used), so that files created or deleted by
+    other processes (such as the downloader) are noticed soon enough.
+
+    The methods can be called by several threads at once.
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self):
+
+        # IV list - other
+        # ---------------
+        # Dictionary of directory listings, in the form
+        #   listing_dict[full_path_to_dir] = [
+        #       mtime, name_set, folded_set, check_time, stable_flag,
+        #   ]
+        # ...where 'mtime' is the directory's modification time (in
+        #   nanoseconds) when it was listed (None if it doesn't exist),
+        #   'name_set' is a set of the names of files in the directory (not
+        #   including sub-directories), 'folded_set' is the same set,
+        #   case-folded (so that files can be found on case-insensitive
+        #   filesystems; see self.check_path() ), 'check_time' is the time at
+        #   which the modification time was last checked, and 'stable_flag' is
+        #   False if the directory had been modified very recently when it was
+        #   listed (see below)
+        self.listing_dict = {}
+        # The maximum number of directories in the cache
+        self.listing_max = 256
+        # The time (in seconds) for which a listing is used, before the
+        #   directory's modification time is checked again
+        self.check_interval = 2
+        # Some filesystems record modification times only to the nearest
+        #   second (or two), so if the directory had been modified less than
+        #   this many seconds before it was listed, a later change might not
+        #   change its modification time. Such a directory is listed again
+        #   (rather than its modification time checked) when the check
+        #   interval has passed
+        self.min_age = 2
+
+
+    # Public class methods
+
+
+    def check_path(self, full_path):
+
+        """Called by FileManager.check_path().
+
+        Equivalent to os.path.isfile(), but uses the cached directory listing.
+
+        Args:
+
+            full_path (str): The full path to the file
+
+        Return values:
+
+            True if the file exists, False if not
+
+        """
+
+        dir_path, file_name = os.path.split(full_path)
+        mini_list = self.list_dir(dir_path)
+        if file_name in mini_list[1]:
+            return True
+
+        # On case-insensitive filesystems (MS Windows, and MacOS by default),
+        #   the file exists if its name differs only in case. Let the
+        #   filesystem decide, but only if there is a file whose name might
+        #   match
+        elif file_name.casefold() in mini_list[2]:
+            return os.path.isfile(full_path)
+
+        else:
+            return False
+
+
+    def find_path_by_prefix(self, full_path):
+
+        """Called by FileManager.find_path_by_prefix().
+
+        Equivalent to calling glob.glob(full_path + '*'), but uses the cached
+        directory listing. Matches only files, not directories.
+
+        Args:
+
+            full_path (str): The full path to the file, without the characters
+                which may follow it (for example, '/path/to/My Video.jpg',
+                which matches '/path/to/My Video.jpg?sqp=-XXX')
+
+        Return values:
+
+            A sorted list of full paths to matching files (may be an empty
+                list)
+
+        """
+
+        dir_path, prefix = os.path.split(full_path)
+        # (Compare names in the same way as glob.glob() does, which ignores
+        #   case on MS Windows)
+        prefix = os.path.normcase(prefix)
+
+        match_list = []
+        for file_name in self.get_listing(dir_path):
+            if os.path.normcase(file_name).startswith(prefix):
+                match_list.append(os.path.join(dir_path, file_name))
+
+        match_list.sort()
+        return match_list
+
+
+    def get_listing(self, dir_path):
+
+        """Called by FileManager.get_dir_listing() and
+        self.find_path_by_prefix().
+
+        Returns a set of names of files in the specified directory.
+
+        Args:
+
+            dir_path (str): The full path to the directory
+
+        Return values:
+
+            A set of file names (an empty set if the directory doesn't exist or
+                can't be read)
+
+        """
+
+        return self.list_dir(dir_path)[1]
+
+
+    def list_dir(self, dir_path):
+
+        """Called by self.check_path() and .get_listing().
+
+        Returns the cached listing for the specified directory, listing it
+        again if necessary.
+
+        Args:
+
+            dir_path (str): The full path to the directory
+
+        Return values:
+
+            A list in the form described in the comments in self.__init__()
+
+        """
+
+        check_time = time.time()
+
+        mini_list = self.listing_dict.get(dir_path)
+        if mini_list is not None \
+        and (check_time - mini_list[3]) < self.check_interval:
+            return mini_list
+
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+
+        except:
+            # (Directory doesn't exist. Remember that, too)
+            mtime = None
+
+        if mini_list is not None and mini_list[0] == mtime and mini_list[4]:
+            mini_list[3] = check_time
+            return mini_list
+
+        name_set = set()
+        if mtime is not None:
+
+            try:
+                with os.scandir(dir_path) as entry_iter:
+                    for entry in entry_iter:
+                        if entry.is_file():
+                            name_set.add(entry.name)
+
+            except:
+                mtime = None
+
+        mini_list = [
+            mtime,
+            name_set,
+            set(file_name.casefold() for file_name in name_set),
+            check_time,
+            mtime is None \
+            or (check_time - (mtime / 1_000_000_000)) > self.min_age,
+        ]
+
+        # Keep the cache to a reasonable size, discarding the oldest listings
+        #   first
+        # (Don't bother retrying, if the dictionary is modified by another
+        #   thread)
+        try:
+            while len(self.listing_dict) >= self.listing_max:
+                self.listing_dict.pop(next(iter(self.listing_dict)), None)
+
+        except:
+            pass
+
+        self.listing_dict[dir_path] = mini_list
+
+        return mini_list
+
+
+    def reset(self, path=None):
+
+        """Called by FileManager.reset_dir_listing().
+
+        Discards cached directory listings.
+
+        Args:
+
+            path (str or None): The full path to a file or directory. The
+                listings for both the directory (if it is one), and its parent
+                directory, are discarded. If None, all listings are discarded
+
+        """
+
+        if path is None:
+            self.listing_dict = {}
+
+        else:
+            path = os.path.abspath(path)
+            for dir_path in (path, os.path.dirname(path)):
+                self.listing_dict.pop(dir_path, None)
+
+
+class DatabaseSnapshot(object):
+
+    """Called by mainapp.TartubeApp.save_db().
+
+    Python class to take a consistent snapshot of the Tartube database in the
+    main thread, so that the (much slower) job of serialising it and writing
+    it to disk can be performed by a background thread, while the user (or a
+    download operation) goes on modifying the database.
+
+    Media data objects are not copied when the snapshot is taken (which would
+    take several seconds for a large database). Instead, the snapshot is
+    told about each media data object just before it is modified (see
+    self.notify_modify() ), and copies its IVs then. Media data objects that
+    have not been modified are copied by the background thread, as they are
+    written. Other objects (options objects and so on) are few, so their IVs
+    are copied when the snapshot is taken.
+
+    In either case, any lists, dictionaries and sets stored in an IV (and any
+    lists, dictionaries and sets they contain) are copied too. Objects stored
+    in them are not copied.
+
+    The file that is written is exactly the same as the one that would be
+    written by a call to pickle.dump(save_dict).
+
+    Args:
+
+        save_dict (dict): The dictionary of data to save, prepared by
+            mainapp.TartubeApp.save_db()
+
+        obj_list (list): A list of objects (options objects and so on) whose
+            IVs should be copied now
+
+        cow_type_list (list): A list of types (media.Video and so on) whose
+            IVs are copied only when they are about to be modified, or when
+            they are written. Objects of these types must call
+            self.notify_modify() before they are modified
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, save_dict, obj_list, cow_type_list):
+
+        # IV list - other
+        # ---------------
+        # The pickle protocol to use
+        self.protocol = pickle.DEFAULT_PROTOCOL
+        # Lock used by the main thread and the background thread, so that an
+        #   object is not copied by one thread while the other is modifying
+        #   or copying it
+        self.lock = threading.Lock()
+        # Flag set to True when the snapshot has been written, after which
+        #   calls to self.notify_modify() are ignored
+        self.finish_flag = False
+        # The types of value that must be copied, when they are stored in an
+        #   IV (or in another value that is copied)
+        self.container_type_set = set([dict, list, set, tuple])
+        # Set of the types of object copied only when they are about to be
+        #   modified, or when they are written
+        self.cow_type_set = set(cow_type_list)
+        # Set of the types of object for which the pickler must use the
+        #   copied IVs
+        self.type_set = set(self.cow_type_set)
+        # Dictionary of copied IVs, in the form
+        #   state_dict[id(object)] = [object, dictionary_of_ivs]
+        # The object itself is stored, so that it can't be destroyed (and its
+        #   ID re-used) before the snapshot is written. Once the object has
+        #   been written, 'dictionary_of_ivs' is None
+        self.state_dict = {}
+
+        # Code
+        # ----
+
+        # A copy of the dictionary of data to save
+        self.save_dict = self.copy_value(save_dict)
+
+        for obj in obj_list:
+
+            self.state_dict[id(obj)] = [obj, self.copy_obj(obj)]
+            self.type_set.add(type(obj))
+
+
+    # Public class methods
+
+
+    def copy_obj(self, obj):
+
+        """Called by self.__init__(), .notify_modify() and .reduce_obj().
+
+        Copies an object's IVs.
+
+        Args:
+
+            obj (any): The object to copy
+
+        Return values:
+
+            A dictionary of IVs, in the form returned by obj.__getstate__()
+
+        """
+
+        if hasattr(obj, '__getstate__'):
+            state = obj.__getstate__()
+            # (On Python 3.11+, the default implementation returns the
+            #   object's own dictionary, or None if it is empty)
+            if state is None or state is obj.__dict__:
+                state = obj.__dict__.copy()
+
+        else:
+            state = obj.__dict__.copy()
+
+        for key, value in state.items():
+            if type(value) in self.container_type_set:
+                state[key] = self.copy_value(value)
+
+        return state
+
+
+    def copy_value(self, value):
+
+        """Called by self.__init__() and .copy_obj(). Subsequently called by
+        this function recursively.
+
+        Copies a list, dictionary, set or tuple, and any lists, dictionaries,
+        sets and tuples it contains. Other values are not copied.
+
+        Args:
+
+            value (dict, list, set or tuple): The value to copy
+
+        Return values:
+
+            The copy
+
+        """
+
+        container_type_set = self.container_type_set
+
+        if type(value) is dict:
+
+            value = value.copy()
+            # (Most dictionaries, such as the media data registry, contain
+            #   nothing that must be copied; checking that is much quicker than
+            #   checking each value in turn)
+            if not container_type_set.isdisjoint(map(type, value.values())):
+                for key, this_value in value.items():
+                    if type(this_value) in container_type_set:
+                        value[key] = self.copy_value(this_value)
+
+            return value
+
+        elif type(value) is set:
+
+            # (Anything in a set is hashable, so needn't be copied)
+            return value.copy()
+
+        elif container_type_set.isdisjoint(map(type, value)):
+
+            # (A tuple that contains nothing to copy can be shared)
+            if type(value) is list:
+                return value.copy()
+            else:
+                return value
+
+        else:
+
+            return type(value)(
+                self.copy_value(item) \
+                if type(item) in container_type_set else item \
+                for item in value
+            )
+
+
+    def notify_modify(self, obj, iv_name):
+
+        """Called by media.notify_modify(), in the main thread, just before a
+        media data object is modified.
+
+        If the object has not been copied yet, copies it, so that the snapshot
+        is not affected by the modification.
+
+        Args:
+
+            obj (media.Video, media.Channel, media.Playlist, media.Folder):
+                The media data object about to be modified
+
+            iv_name (str): The name of the IV about to be modified (ignored)
+
+        """
+
+        if self.finish_flag or not type(obj) in self.cow_type_set:
+            return
+
+        with self.lock:
+            if not self.finish_flag and not id(obj) in self.state_dict:
+                self.state_dict[id(obj)] = [obj, self.copy_obj(obj)]
+
+
+    def reduce_obj(self, obj):
+
+        """Called by pickle.Pickler.dump(), during the call to self.write().
+
+        Tells the pickler how to serialise an object, using the IVs copied
+        when the snapshot was taken (or when the object was first modified
+        after that). Media data objects which have not been modified are
+        copied now.
+
+        Args:
+
+            obj (any): The object to serialise
+
+        Return values:
+
+            A tuple in the form described by the documentation for
+                object.__reduce__()
+
+        """
+
+        with self.lock:
+
+            mini_list = self.state_dict.get(id(obj))
+            if mini_list is not None:
+                state = mini_list[1]
+
+            elif type(obj) in self.cow_type_set:
+                state = self.copy_obj(obj)
+                mini_list = self.state_dict[id(obj)] = [obj, None]
+
+            else:
+                return obj.__reduce_ex__(self.protocol)
+
+            # (The copy is no longer needed, once it has been written)
+            mini_list[1] = None
+
+        return (copyreg.__newobj__, (type(obj),), state)
+
+
+    def write(self, fh):
+
+        """Called by mainapp.TartubeApp.save_db_write(), often in a background
+        thread.
+
+        Serialises the snapshot.
+
+        Args:
+
+            fh (file): The file handle to which the snapshot is written
+
+        """
+
+        pickler = pickle.Pickler(fh, self.protocol)
+        pickler.dispatch_table = copyreg.dispatch_table.copy()
+        for this_type in self.type_set:
+            pickler.dispatch_table[this_type] = self.reduce_obj
+
+        try:
+            pickler.dump(self.save_dict)
+
+        finally:
+            with self.lock:
+                self.finish_flag = True
+                self.state_dict = {}
+
+
+class HashCache(object):
+
+    """Called by tidy.TidyManager.find_duplicates().
+
+    Python class to store the hashes of video files, so that duplicate files
+    can be found without reading every file, every time.
+
+    Two hashes are stored for each file: a partial hash (of the file's size,
+    and the beginning and end of the file), and a hash of the whole file. The
+    latter is only computed when two files share the same partial hash.
+
+    Each hash is stored alongside the file's size and modification time; if
+    either has changed, the stored hashes are discarded. The cache is saved
+    in the data directory, so it doesn't need to be rebuilt every time.
+
+    Args:
+
+        path (str): The full path to the file in which the cache is saved
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, path):
+
+        # IV list - other
+        # ---------------
+        # The version of the cache file format. If the saved file uses a
+        #   different version, it is ignored (and the cache is rebuilt)
+        self.cache_version = 1
+        # The full path to the file in which the cache is saved
+        self.path = path
+        # Flag set to True when the cache has been modified since it was
+        #   loaded or saved
+        self.modified_flag = False
+        # The cache is used by several worker threads at the same time
+        self.cache_lock = threading.Lock()
+
+        # The number of bytes read from the beginning and end of each file,
+        #   when computing the partial hash
+        self.block_size = 64 * 1024
+        # The number of bytes read at a time, when computing the full hash
+        self.chunk_size = 1024 * 1024
+
+        # Dictionary of hashed files, in the form
+        #   cache_dict[full_path] = [size, mtime, partial_hash, full_hash]
+        # ...where 'partial_hash' and 'full_hash' are None if not computed yet
+        self.cache_dict = {}
+
+
+    # Public class methods
+
+
+    def get_hash(self, full_path, size, mtime, full_flag=False):
+
+        """Can be called by anything (often in a worker thread).
+
+        Returns the partial or full hash of a file, computing it if it is not
+        in the cache (or if the file has been modified).
+
+        Args:
+
+            full_path (str): The full path to the file
+
+            size (int): The file's size, in bytes
+
+            mtime (float): The file's modification time
+
+            full_flag (bool): True to return the hash of the whole file, False
+                to return the partial hash
+
+        Return values:
+
+            The hash (a string), or None if the file can't be read
+
+        """
+
+        with self.cache_lock:
+
+            entry_list = self.cache_dict.get(full_path)
+            if entry_list is None \
+            or entry_list[0] != size \
+            or entry_list[1] != mtime:
+                entry_list = [size, mtime, None, None]
+                self.cache_dict[full_path] = entry_list
+                self.modified_flag = True
+
+            if full_flag:
+                index = 3
+            else:
+                index = 2
+
+            if entry_list[index] is not None:
+                return entry_list[index]
+
+        try:
+            if full_flag or size <= self.block_size * 2:
+                hash_str = self.hash_file(full_path, size)
+            else:
+                hash_str = self.hash_file_partial(full_path, size)
+
+        except:
+            return None
+
+        with self.cache_lock:
+
+            entry_list[index] = hash_str
+            # (For small files, the partial hash is the hash of the whole file)
+            if size <= self.block_size * 2:
+                entry_list[2] = entry_list[3] = hash_str
+
+            self.modified_flag = True
+
+        return hash_str
+
+
+    def hash_file(self, full_path, size):
+
+        """Called by self.get_hash().
+
+        Computes the hash of a whole file.
+
+        Args:
+
+            full_path (str): The full path to the file
+
+            size (int): The file's size, in bytes
+
+        Return values:
+
+            The hash, as a string
+
+        """
+
+        hash_obj = hashlib.sha256(str(size).encode())
+        with open(full_path, 'rb') as fh:
+
+            while True:
+
+                data = fh.read(self.chunk_size)
+                if not data:
+                    break
+
+                hash_obj.update(data)
+
+        return hash_obj.hexdigest()
+
+
+    def hash_file_partial(self, full_path, size):
+
+        """Called by self.get_hash().
+
+        Computes the hash of the beginning and end of a file.
+
+        Args:
+
+            full_path (str): The full path to the file
+
+            size (int): The file's size, in bytes
+
+        Return values:
+
+            The hash, as a string
+
+        """
+
+        hash_obj = hashlib.sha256(str(size).encode())
+        with open(full_path, 'rb') as fh:
+
+            hash_obj.update(fh.read(self.block_size))
+            fh.seek(size - self.block_size)
+            hash_obj.update(fh.read(self.block_size))
+
+        return hash_obj.hexdigest()
+
+
+    def load(self):
+
+        """Called by tidy.TidyManager.find_duplicates().
+
+        Loads the cache from the data directory. If the file doesn't exist, or
+        can't be loaded, the cache starts empty.
+        """
+
+        self.cache_dict = {}
+        self.modified_flag = False
+
+        if not os.path.isfile(self.path):
+            return
+
+        try:
+            with open(self.path, 'rb') as fh:
+                load_dict = pickle.load(fh)
+
+        except:
+            return
+
+        if isinstance(load_dict, dict) \
+        and load_dict.get('cache_version') == self.cache_version:
+            self.cache_dict = load_dict['cache_dict']
+
+
+    def prune(self, path_set):
+
+        """Called by tidy.TidyManager.find_duplicates().
+
+        Removes from the cache any files that are not in the specified set
+        (for example, because they have been deleted).
+
+        Args:
+
+            path_set (set): A set of full paths to the files that should be
+                kept in the cache
+
+        """
+
+        with self.cache_lock:
+
+            for full_path in list(self.cache_dict.keys()):
+                if not full_path in path_set:
+                    del self.cache_dict[full_path]
+                    self.modified_flag = True
+
+
+    def save(self):
+
+        """Called by tidy.TidyManager.find_duplicates().
+
+        Saves the cache (if it has been modified).
+
+        Failure to save is not fatal, as the cache is simply rebuilt.
+        """
+
+        if not self.modified_flag:
+            return
+
+        save_dict = {
+            'cache_version': self.cache_version,
+            'cache_dict': self.cache_dict,
+        }
+
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as fh:
+                pickle.dump(save_dict, fh)
+
+            os.replace(temp_path, self.path)
+            self.modified_flag = False
+
+        except:
+            if os.path.isfile(temp_path):
+                try:
+                    os.remove(temp_path)
+                except:
+                    pass
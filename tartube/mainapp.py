@@ -65,6 +65,12 @@ try:
 except:
     HAVE_MATPLOTLIB_FLAG = False
 
+try:
+    import numpy
+    HAVE_NUMPY_FLAG = True
+except:
+    HAVE_NUMPY_FLAG = False
+
 try:
     import moviepy.editor
     HAVE_MOVIEPY_FLAG = True
@@ -112,6 +118,8 @@ import media
 import options
 import process
 import refresh
+import search
+import stats
 #import testing
 import tidy
 import ttutils
@@ -280,6 +288,13 @@ class TartubeApp(Gtk.Application):
         # The FFmpeg manager, for when Tartube needs to call FFmpeg directly.
         #   Most of the code has been adapted from youtube-dl
         self.ffmpeg_manager_obj = ffmpeg_tartube.FFmpegManager(self)
+        # The statistics manager, stats.StatsManager, for compiling the data
+        #   used to draw graphs
+        self.stats_manager_obj = stats.StatsManager(self)
+        # The search manager, search.SearchManager, for maintaining an index
+        #   of words in each video's name, description (etc), so that the
+        #   Video Catalogue can be filtered quickly
+        self.search_manager_obj = search.SearchManager(self)
         # The message dialogue manager, dialogue.DialogueManager, for showing
         #   message dialogue windows safely (i.e. without causing a Gtk crash)
         self.dialogue_manager_obj = None
@@ -474,6 +489,9 @@ class TartubeApp(Gtk.Application):
         self.catalogue_filter_author_flag = True
         self.catalogue_filter_descrip_flag = False
         self.catalogue_filter_comment_flag = False
+        # The most recent database search query (not saved in the config
+        #   file), or None if the database hasn't been searched yet
+        self.search_db_last_query = None
         # In the Video Catalogue, flag set to True if a frame should be drawn
         #   around each video, False if not
         self.catalogue_draw_frame_flag = True
@@ -696,6 +714,17 @@ class TartubeApp(Gtk.Application):
                 '.backups',
             ),
         )
+        # A hidden directory, used for storing scaled copies of thumbnails, so
+        #   that the Video Catalogue can be drawn quickly (see
+        #   files.FileManager.get_thumb_cache_path() )
+        self.thumb_cache_dir = os.path.abspath(
+            os.path.join(
+                os.path.expanduser('~'),
+                __main__.__packagename__ + '-data',
+                '.thumb_cache',
+            ),
+        )
+        self.file_manager_obj.set_thumb_cache_dir(self.thumb_cache_dir)
 
         # A temporary directory, deleted when Tartube starts and stops
         self.temp_dir = os.path.abspath(
@@ -856,6 +885,27 @@ class TartubeApp(Gtk.Application):
         #   again with this flag, set to False until the code has either
         #   loaded a database file, or wants to call .save_db to create one
         self.allow_db_save_flag = False
+        # Flag set to True if the database file should be written by a
+        #   background thread, whenever that is possible (for example, after a
+        #   download operation), so that the main window doesn't freeze while
+        #   a large database is being saved. A snapshot of the database is
+        #   taken in the main thread (see files.DatabaseSnapshot), so changes
+        #   made during the save are not written until the next one
+        self.db_save_background_flag = True
+        # The background thread (threading.Thread) currently writing the
+        #   database file, or None if no background save is in progress
+        self.db_save_thread_obj = None
+        # The snapshot (files.DatabaseSnapshot) being written by that thread,
+        #   or None if no background save is in progress
+        self.db_save_snapshot_obj = None
+        # The result of the background save, set by the thread just before it
+        #   finishes. A list containing a single item, the value returned by
+        #   self.save_db_write()
+        self.db_save_result_list = []
+        # Flag set to True if a background save is requested while another
+        #   is still in progress. When the first one finishes, the database is
+        #   saved again
+        self.db_save_again_flag = False
 
         # Flag set to True if the Classic Mode tab should be the visible one,
         #   when Tartube first starts (for the benefit of users who only want
@@ -1116,6 +1166,10 @@ class TartubeApp(Gtk.Application):
         # The timeout (in seconds) to apply. Must be an integer, 0 or above.
         #   If 0, the moviepy procedure is allowed to hang indefinitely
         self.refresh_moviepy_timeout = 10
+        # During a tidy operation, the number of worker threads used to check
+        #   videos for corruption and to convert .webp thumbnails (at the same
+        #   time). Must be an integer, 1 or above
+        self.tidy_worker_count = 2
 
         # Paths to the post-processor binaries. If not set, we assume that
         #   FFmpeg and/or AVConv are in the user's path. If one is set to any
@@ -1498,6 +1552,54 @@ class TartubeApp(Gtk.Application):
         #   key = media data object's unique .dbid
         #   value = the media data object itself
         self.container_reg_dict = {}
+        # Cache of paths returned by media.GenericContainer.get_actual_dir(),
+        #   which is called very often (for example, whenever the Video
+        #   Catalogue looks for a thumbnail). Dictionary in the form
+        #       key = a channel's/playlist's/folder's unique .dbid
+        #       value = the full path to its actual sub-directory
+        # The cache is emptied by a call to self.reset_media_dir_cache(),
+        #   whenever a container is renamed or moved, or when its external
+        #   directory or alternative download destination is changed
+        self.media_dir_cache_dict = {}
+        # The value of self.downloads_dir when the cache was last emptied. If
+        #   self.downloads_dir changes, the cache is emptied automatically
+        self.media_dir_cache_root = None
+        # Incremented every time the cache is emptied. Cached tooltips (see
+        #   media.GenericMedia.get_render_cache() ) include paths, so they use
+        #   this value to detect when they are out of date
+        self.media_dir_cache_version = 0
+
+        # Updates to rows in the Video Index, and to items in the Video
+        #   Catalogue, made when media data objects change (see
+        #   self.schedule_index_row_text() and similar functions), are
+        #   collected and applied in a single batch, so that each row/item is
+        #   redrawn only once
+        # Between calls to self.bulk_change_begin() and .bulk_change_commit(),
+        #   nothing is redrawn at all. The number of calls to
+        #   self.bulk_change_begin() not yet matched by a call to
+        #   self.bulk_change_commit() (so transactions can be nested)
+        self.bulk_change_level = 0
+        # Dictionaries of media data objects waiting to be redrawn, in the
+        #   form
+        #       key = media data object's unique .dbid
+        #       value = the media data object itself
+        # Video Index rows whose text must be updated...
+        self.bulk_change_text_dict = {}
+        # ...Video Index rows whose icon must be updated...
+        self.bulk_change_icon_dict = {}
+        # ...and videos whose Video Catalogue items must be updated
+        self.bulk_change_video_dict = {}
+        # Flag set to True when a call to self.bulk_change_flush() has been
+        #   scheduled, but has not happened yet
+        self.bulk_change_flush_flag = False
+        # If more videos than this are waiting to be updated in the Video
+        #   Catalogue, it is quicker to redraw the whole page
+        self.bulk_change_redraw_max = 50
+        # Media data objects may be modified by threads other than the main
+        #   one (for example, by refresh.RefreshManager), so access to the IVs
+        #   above is protected by a lock
+        self.bulk_change_lock = threading.Lock()
+
         # For backwards compatibility (versions before v2.4.117), a temporary
         #   copy of the old container dictionary in its old format
         # It is populated when the database is loaded, then the data is
@@ -2178,6 +2280,18 @@ class TartubeApp(Gtk.Application):
         #   splitting files. Does not apply to a video in a media.Channel or
         #   media.Playlist
         self.split_video_auto_delete_flag = False
+        # When downloading video clips using FFmpeg, the number of clips from
+        #   the same video that are downloaded at the same time (each one uses
+        #   its own child process)
+        self.split_video_dl_job_count = 1
+
+        # During a process operation, the number of videos processed by FFmpeg
+        #   at the same time (the CPUs are shared between them). If 1, videos
+        #   are processed one at a time, as in earlier versions of Tartube. If
+        #   0, the number is chosen automatically, depending on the number of
+        #   CPUs (see self.get_process_job_count() ). Splitting and slicing
+        #   videos are always performed one video at a time
+        self.process_job_count = 1
 
         # Flag set to True if downloads.VideoDownloader should contact the
         #   SponsorBlock server, when checking/downloading videos
@@ -2548,6 +2662,11 @@ class TartubeApp(Gtk.Application):
         #   struggles with a list of hundreds, or thousands, of videos)
         # The number of videos per page, or 0 to always use a single page
         self.catalogue_page_size = 50
+        # Flag set to True if the Video Catalogue should use virtual mode
+        #   instead (not when videos are arranged on a grid). All videos are
+        #   shown on a single page, but Gtk widgets are only created for the
+        #   visible videos, and re-used as the user scrolls
+        self.catalogue_virtual_flag = False
         # Flag set to True if the Video Catalogue toolbar should show an extra
         #   row, containing video filter options
         self.catalogue_show_filter_flag = False
@@ -2860,6 +2979,10 @@ class TartubeApp(Gtk.Application):
         )
         self.add_action(reset_container_menu_action)
 
+        search_db_menu_action = Gio.SimpleAction.new('search_db_menu', None)
+        search_db_menu_action.connect('activate', self.on_menu_search_db)
+        self.add_action(search_db_menu_action)
+
         export_db_menu_action = Gio.SimpleAction.new('export_db_menu', None)
         export_db_menu_action.connect('activate', self.on_menu_export_db)
         self.add_action(export_db_menu_action)
@@ -4886,6 +5009,9 @@ class TartubeApp(Gtk.Application):
             self.export_csv_separator = json_dict['export_csv_separator']
         if version >= 3014:
             self.db_backup_mode = json_dict['db_backup_mode']
+        if version >= 2005235 and 'db_save_background_flag' in json_dict:
+            self.db_save_background_flag \
+            = json_dict['db_save_background_flag']
 
         if version >= 2000029 \
         and 'show_classic_tab_on_startup_flag' in json_dict:
@@ -4995,6 +5121,8 @@ class TartubeApp(Gtk.Application):
             = json_dict['refresh_output_verbose_flag']
         if version >= 1003012 and 'refresh_moviepy_timeout' in json_dict:
             self.refresh_moviepy_timeout = json_dict['refresh_moviepy_timeout']
+        if version >= 2005235 and 'tidy_worker_count' in json_dict:
+            self.tidy_worker_count = json_dict['tidy_worker_count']
 
         if version >= 1002030 and 'disk_space_warn_flag' in json_dict:
             self.disk_space_warn_flag = json_dict['disk_space_warn_flag']
@@ -5373,6 +5501,11 @@ class TartubeApp(Gtk.Application):
             = json_dict['split_video_auto_open_flag']
             self.split_video_auto_delete_flag \
             = json_dict['split_video_auto_delete_flag']
+        if version >= 2005235 and 'process_job_count' in json_dict:
+            self.process_job_count = json_dict['process_job_count']
+        if version >= 2005235 and 'split_video_dl_job_count' in json_dict:
+            self.split_video_dl_job_count \
+            = json_dict['split_video_dl_job_count']
 
         if version >= 2003236 and 'sblock_fetch_flag' in json_dict:
             self.sblock_fetch_flag = json_dict['sblock_fetch_flag']
@@ -5516,6 +5649,8 @@ class TartubeApp(Gtk.Application):
             self.catalogue_mode_type = json_dict['catalogue_mode_type']
         if version >= 3023 and 'catalogue_page_size' in json_dict:
             self.catalogue_page_size = json_dict['catalogue_page_size']
+        if version >= 2005235 and 'catalogue_virtual_flag' in json_dict:
+            self.catalogue_virtual_flag = json_dict['catalogue_virtual_flag']
         if version >= 1004005 and 'catalogue_show_filter_flag' in json_dict:
             self.catalogue_show_filter_flag \
             = json_dict['catalogue_show_filter_flag']
@@ -6370,6 +6505,7 @@ class TartubeApp(Gtk.Application):
 
             'export_csv_separator': self.export_csv_separator,
             'db_backup_mode': self.db_backup_mode,
+            'db_save_background_flag': self.db_save_background_flag,
 
             'show_classic_tab_on_startup_flag': \
             self.show_classic_tab_on_startup_flag,
@@ -6434,6 +6570,7 @@ class TartubeApp(Gtk.Application):
             'refresh_output_videos_flag': self.refresh_output_videos_flag,
             'refresh_output_verbose_flag': self.refresh_output_verbose_flag,
             'refresh_moviepy_timeout': self.refresh_moviepy_timeout,
+            'tidy_worker_count': self.tidy_worker_count,
 
             'disk_space_warn_flag': self.disk_space_warn_flag,
             'disk_space_warn_limit': self.disk_space_warn_limit,
@@ -6580,7 +6717,9 @@ class TartubeApp(Gtk.Application):
             'split_video_force_keyframe_flag': \
             self.split_video_force_keyframe_flag,
             'split_video_auto_open_flag': self.split_video_auto_open_flag,
+            'process_job_count': self.process_job_count,
             'split_video_auto_delete_flag': self.split_video_auto_delete_flag,
+            'split_video_dl_job_count': self.split_video_dl_job_count,
 
             'sblock_fetch_flag': self.sblock_fetch_flag,
             'sblock_obfuscate_flag': self.sblock_obfuscate_flag,
@@ -6660,6 +6799,7 @@ class TartubeApp(Gtk.Application):
             'catalogue_mode': self.catalogue_mode,
             'catalogue_mode_type': self.catalogue_mode_type,
             'catalogue_page_size': self.catalogue_page_size,
+            'catalogue_virtual_flag': self.catalogue_virtual_flag,
             'catalogue_show_filter_flag': self.catalogue_show_filter_flag,
             'catalogue_use_regex_flag': self.catalogue_use_regex_flag,
 
@@ -6960,6 +7100,9 @@ class TartubeApp(Gtk.Application):
             self.classic_custom_dl_obj = load_dict['classic_custom_dl_obj']
         self.media_reg_count = load_dict['media_reg_count']
         self.media_reg_dict = load_dict['media_reg_dict']
+        self.stats_manager_obj.reset()
+        self.search_manager_obj.reset()
+        self.reset_media_dir_cache()
         if version >= 2004132:   # v2.4.132
             self.container_reg_dict = load_dict['container_reg_dict']
             self.old_container_reg_dict = {}
@@ -7043,6 +7186,8 @@ class TartubeApp(Gtk.Application):
 
         # Update the loaded data for this version of Tartube
         self.update_db(version)
+        # (The update might have changed some paths)
+        self.reset_media_dir_cache()
 
         # If the old directory structure is being used, the user might try to
         #   manually copy the contents of the /downloads directory into the
@@ -8749,14 +8894,15 @@ class TartubeApp(Gtk.Application):
             self.fix_broken_objs()
 
 
-    def save_db(self):
+    def save_db(self, background_flag=False):
 
         """Called by self.start(), .stop_continue(), .switch_db(),
         .fix_integrity_db(), .download_manager_finished(),
         .update_manager_finished(), .refresh_manager_finished(),
         .info_manager_finished(), .tidy_manager_finished(),
-        .move_container_to_top_continue(), .move_container_continue(),
-        .rename_container(), .on_menu_save_all() and .on_menu_save_db().
+        .process_manager_finished(), .move_container_to_top_continue(),
+        .move_container_continue(), .rename_container(), .on_menu_save_all()
+        and .on_menu_save_db().
 
         Saves the Tartube database file.
 
@@ -8764,9 +8910,21 @@ class TartubeApp(Gtk.Application):
         saving the database fails (so the user can correct a problem like a
         full hard drive, before trying again).
 
+        If a background save is requested (and allowed by settings), a
+        snapshot of the database is taken, and the file is written by a
+        background thread (see self.save_db_write() ). Any failure is reported
+        when the thread has finished.
+
+        Args:
+
+            background_flag (bool): True if the file can be written by a
+                background thread, False if it must be written before this
+                function returns
+
         Return values:
 
-            True on success, False on failure
+            True on success, False on failure. If the file is being written in
+                the background, True is returned immediately
 
         """
 
@@ -8779,6 +8937,19 @@ class TartubeApp(Gtk.Application):
         or not self.allow_db_save_flag:
             return False
 
+        if not self.db_save_background_flag:
+            background_flag = False
+
+        # If a background save is already in progress, either save again when
+        #   it has finished, or wait for it to finish now
+        if self.db_save_thread_obj is not None:
+
+            if background_flag:
+                self.db_save_again_flag = True
+                return True
+            else:
+                self.wait_db_save()
+
         # Prepare values
         local = ttutils.get_local_time()
         path = os.path.abspath(os.path.join(self.data_dir, self.db_file_name))
@@ -8788,12 +8959,6 @@ class TartubeApp(Gtk.Application):
                 __main__.__packagename__ + '_BU.db',
             ),
         )
-        temp_bu_path = os.path.abspath(
-            os.path.join(
-                self.backup_dir,
-                __main__.__packagename__ + '_TEMP_BU.db',
-            ),
-        )
 
         # Prepare a dictionary of data to save, using Python pickle
         save_dict = {
@@ -8854,26 +9019,6 @@ class TartubeApp(Gtk.Application):
             'catalogue_reverse_sort_flag': self.catalogue_reverse_sort_flag,
         }
 
-        # Back up any existing file
-        if os.path.isfile(path):
-            try:
-                shutil.copyfile(path, temp_bu_path)
-
-            except:
-#               self.disable_load_save()
-                self.disable_scheduled_dl()
-                self.file_error_dialogue(
-                    _('Failed to save the Tartube database file') \
-                    + '\n\n' \
-                    + _(
-                        '(Could not make a backup copy of the existing file)'
-                    ) \
-                    + '\n\n' \
-                    + _('File load/save has been disabled'),
-                )
-
-                return False
-
         # If there is no lock already in place (for example, because this is a
         #   new database file), then create a lockfile
         if not self.debug_ignore_lockfile_flag:
@@ -8915,49 +9060,144 @@ class TartubeApp(Gtk.Application):
 
                         return False
 
-        # Try to save the database file
-        try:
-            fh = open(path, 'wb')
-            pickle.dump(save_dict, fh)
-            fh.close()
+        # The search index is saved alongside the database, so that it
+        #   doesn't have to be rebuilt when Tartube next starts (None if it
+        #   doesn't need to be saved)
+        index_list = self.search_manager_obj.prepare_save_index()
+
+        # Write the file, in the background if required
+        if not background_flag:
+
+            return self.save_db_finished(
+                self.save_db_write(
+                    save_dict,
+                    local,
+                    path,
+                    bu_path,
+                    index_list=index_list,
+                ),
+            )
 
-        except:
+        else:
 
-#           self.disable_load_save()
-            self.disable_scheduled_dl()
+            # Take a snapshot of the database, so that the user can go on
+            #   modifying the database while the file is being written. Media
+            #   data objects are copied only when they are modified (or when
+            #   they are written), so the snapshot must be told about every
+            #   modification until the file has been written
+            snapshot_obj = files.DatabaseSnapshot(
+                save_dict,
+                self.save_db_list_objs(),
+                [media.Video, media.Channel, media.Playlist, media.Folder],
+            )
 
-            if os.path.isfile(temp_bu_path):
-                self.file_error_dialogue(
-                    _('Failed to save the Tartube database file') \
-                    + '\n\n' \
-                    + _('A backup of the previous file can be found at:') \
-                    + '\n\n   ' + temp_bu_path + '\n\n' \
-                    + _('File load/save has been disabled'),
-                )
+            self.db_save_snapshot_obj = snapshot_obj
+            media.modify_func_list.append(snapshot_obj.notify_modify)
 
-            else:
-                self.file_error_dialogue(
-                    _('Failed to save the Tartube database file') \
-                    + '\n\n' + _('File load/save has been disabled'),
-                )
+            self.db_save_thread_obj = threading.Thread(
+                target=self.save_db_write,
+                args=(snapshot_obj, local, path, bu_path, True, index_list),
+            )
 
-            return False
+            self.db_save_thread_obj.start()
+
+            return True
+
+
+    def save_db_list_objs(self):
+
+        """Called by self.save_db().
+
+        Compiles a list of objects saved in the database file, whose IVs are
+        copied when a snapshot of the database is taken. (Media data objects
+        are not included, as they are copied only when they are modified; see
+        files.DatabaseSnapshot.)
+
+        Return values:
+
+            The list of objects
 
-        # In the event that there was no database file to backup, then the
-        #   following code isn't necessary
-        if os.path.isfile(temp_bu_path):
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 8311 save_db_list_objs')
+
+        obj_list = list(self.options_reg_dict.values())
+        obj_list.extend(self.ffmpeg_reg_dict.values())
+        obj_list.extend(self.custom_dl_reg_dict.values())
+        obj_list.extend(self.scheduled_list)
+
+        for obj in [
+            self.general_options_obj,
+            self.classic_options_obj,
+            self.ffmpeg_options_obj,
+            self.general_custom_dl_obj,
+            self.classic_custom_dl_obj,
+        ]:
+            if obj is not None and not obj in obj_list:
+                obj_list.append(obj)
+
+        return obj_list
+
+
+    def save_db_write(self, save_obj, local, path, bu_path,
+    background_flag=False, index_list=None):
+
+        """Called by self.save_db(). If a background save was requested, called
+        in a background thread.
+
+        Writes the new database file to a temporary file, which then replaces
+        the existing database file, so a crash can never leave a half-written
+        database file behind.
+
+        Depending on settings, the existing database file is kept as a backup
+        file. The backup is made without copying the file, if possible (see
+        ttutils.link_file() ); otherwise the existing file is renamed, just
+        before the new one replaces it.
+
+        This function must not interact with the main window, nor modify any
+        IVs in the main application (besides self.db_save_result_list). Any
+        problems are reported by self.save_db_finished().
+
+        Args:
+
+            save_obj (dict or files.DatabaseSnapshot): The dictionary of data
+                to save, or a snapshot of it
+
+            local (datetime.datetime): The time at which the save began
 
-            # Make the backup file permanent, or not, depending on settings
-            if self.db_backup_mode == 'default':
-                self.remove_file(temp_bu_path)
+            path (str): Full path to the database file
 
-            elif self.db_backup_mode == 'single':
+            bu_path (str): Full path to the backup file used when
+                self.db_backup_mode is 'single'
 
-                ttutils.rename_file(self, temp_bu_path, bu_path)
+            background_flag (bool): True if this function has been called in a
+                background thread
+
+            index_list (list or None): The search index to save, if the
+                database file is saved (the value returned by
+                search.SearchManager.prepare_save_index() )
+
+        Return values:
+
+            The message to display in a dialogue window, or None if the file
+                was saved
+
+        """
+
+        error_msg = None
+
+        # Decide where the existing database file should be kept, if at all
+        backup_path = None
+        if os.path.isfile(path):
+
+            if self.db_backup_mode == 'single':
+
+                backup_path = bu_path
 
             elif self.db_backup_mode == 'daily':
 
-                daily_bu_path = os.path.abspath(
+                backup_path = os.path.abspath(
                     os.path.join(
                         self.backup_dir,
                         __main__.__packagename__ + '_BU_' \
@@ -8966,14 +9206,12 @@ class TartubeApp(Gtk.Application):
                 )
 
                 # Only make a new backup file once per day
-                if not os.path.isfile(daily_bu_path):
-                    ttutils.rename_file(self, temp_bu_path, daily_bu_path)
-                else:
-                    self.remove_file(temp_bu_path)
+                if os.path.isfile(backup_path):
+                    backup_path = None
 
             elif self.db_backup_mode == 'always':
 
-                always_bu_path = os.path.abspath(
+                backup_path = os.path.abspath(
                     os.path.join(
                         self.backup_dir,
                         __main__.__packagename__ + '_BU_' \
@@ -8981,7 +9219,159 @@ class TartubeApp(Gtk.Application):
                     ),
                 )
 
-                ttutils.rename_file(self, temp_bu_path, always_bu_path)
+        # Try to save the database file
+        write_path = path + '.tmp'
+        try:
+            with open(write_path, 'wb') as fh:
+
+                if isinstance(save_obj, files.DatabaseSnapshot):
+                    save_obj.write(fh)
+                else:
+                    pickle.dump(save_obj, fh)
+
+                fh.flush()
+                os.fsync(fh.fileno())
+
+        except:
+            error_msg = _('Failed to save the Tartube database file') \
+            + '\n\n' + _('File load/save has been disabled')
+
+        # Keep the existing file as a backup. If it can't be linked, it is
+        #   renamed instead, just before the new file takes its place
+        rename_flag = False
+        if error_msg is None and backup_path is not None:
+
+            if not ttutils.link_file(path, backup_path):
+                rename_flag = True
+
+        # Replace the existing file
+        if error_msg is None:
+
+            try:
+                if rename_flag:
+                    os.replace(path, backup_path)
+
+            except:
+                error_msg = _('Failed to save the Tartube database file') \
+                + '\n\n' \
+                + _('(Could not make a backup copy of the existing file)') \
+                + '\n\n' \
+                + _('File load/save has been disabled')
+
+        if error_msg is None:
+
+            try:
+                os.replace(write_path, path)
+
+            except:
+                error_msg = _('Failed to save the Tartube database file') \
+                + '\n\n' + _('File load/save has been disabled')
+
+                if rename_flag:
+                    error_msg += '\n\n' \
+                    + _('A backup of the previous file can be found at:') \
+                    + '\n\n   ' + backup_path
+
+        if error_msg is None:
+
+            # Make sure the rename itself survives a crash (not possible on
+            #   MS Windows)
+            if os.name != 'nt':
+
+                try:
+                    dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+
+                except:
+                    pass
+
+        elif os.path.isfile(write_path):
+
+            try:
+                os.remove(write_path)
+            except:
+                pass
+
+        # Save the search index too (failure to save it is not fatal)
+        if error_msg is None and index_list is not None:
+            self.search_manager_obj.save_index(index_list)
+
+        if not background_flag:
+            return error_msg
+
+        self.db_save_result_list = [error_msg]
+        GObject.timeout_add(
+            0,
+            self.save_db_background_finished,
+            threading.current_thread(),
+        )
+
+
+    def save_db_background_finished(self, thread_obj):
+
+        """Called by self.save_db_write(), in the main thread, after a
+        background save.
+
+        Args:
+
+            thread_obj (threading.Thread): The thread that wrote the file
+
+        Return values:
+
+            False, so that the timer is not repeated
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 8312 save_db_background_finished')
+
+        # (If self.wait_db_save() was called in the meantime, then the result
+        #   has already been processed)
+        if thread_obj is self.db_save_thread_obj:
+            self.wait_db_save()
+
+            # If another save was requested in the meantime, perform it now
+            if self.db_save_again_flag:
+                self.db_save_again_flag = False
+                self.save_db(True)
+
+        return False
+
+
+    def save_db_finished(self, error_msg):
+
+        """Called by self.save_db() and .wait_db_save().
+
+        After the database file has been written (or not), updates IVs and
+        reports any problems.
+
+        Args:
+
+            error_msg (str or None): The value returned by
+                self.save_db_write()
+
+        Return values:
+
+            True on success, False on failure
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 8313 save_db_finished')
+
+        self.file_manager_obj.reset_dir_listing(self.backup_dir)
+        self.file_manager_obj.reset_dir_listing(self.data_dir)
+
+        if error_msg is not None:
+
+#           self.disable_load_save()
+            self.disable_scheduled_dl()
+            self.file_error_dialogue(error_msg)
+
+            return False
 
         # Saving a database file, in order to create a new file, is much like
         #   loading one: main window widgets can now be sensitised
@@ -8994,6 +9384,37 @@ class TartubeApp(Gtk.Application):
         return True
 
 
+    def wait_db_save(self):
+
+        """Called by self.save_db(), .save_db_background_finished() and
+        .remove_db_lock_file().
+
+        If a background save is in progress, waits for it to finish, and then
+        reports any problems.
+
+        Return values:
+
+            True if there was no background save, or if it succeeded; False if
+                it failed
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 8314 wait_db_save')
+
+        if self.db_save_thread_obj is None:
+            return True
+
+        self.db_save_thread_obj.join()
+        self.db_save_thread_obj = None
+
+        # The snapshot no longer needs to know about modifications
+        media.modify_func_list.remove(self.db_save_snapshot_obj.notify_modify)
+        self.db_save_snapshot_obj = None
+
+        return self.save_db_finished(self.db_save_result_list[0])
+
+
     def switch_db(self, data_list):
 
         """Called by config.SystemPrefWin.try_switch_db().
@@ -9229,6 +9650,11 @@ class TartubeApp(Gtk.Application):
         self.temp_test_dir = self.backup_temp_test_dir
         self.data_dir_alt_list = self.backup_data_dir_alt_list.copy()
 
+        self.thumb_cache_dir = os.path.abspath(
+            os.path.join(self.data_dir, '.thumb_cache'),
+        )
+        self.file_manager_obj.set_thumb_cache_dir(self.thumb_cache_dir)
+
 
     def update_temporary_dirs_after_switch(self):
 
@@ -9448,6 +9874,9 @@ class TartubeApp(Gtk.Application):
         self.classic_custom_dl_obj = self.create_custom_dl_manager('classic')
         self.media_reg_count = 0
         self.media_reg_dict = {}
+        self.stats_manager_obj.reset()
+        self.search_manager_obj.reset()
+        self.reset_media_dir_cache()
         self.container_reg_dict = {}
         self.old_container_reg_dict = []
         self.container_top_level_list = []
@@ -9965,9 +10394,18 @@ class TartubeApp(Gtk.Application):
                     if child_obj.dbid in error_reg_dict:
                         remove_list.append(child_obj)
 
+                if remove_list:
+                    media.notify_modify(media_data_obj, 'child_list')
+
                 for child_obj in remove_list:
                     media_data_obj.child_list.remove(child_obj)
 
+                # (Also make sure that the set of child .dbids is consistent
+                #   with the list)
+                media_data_obj.child_dbid_set = set(
+                    child_obj.dbid for child_obj in media_data_obj.child_list
+                )
+
         # Recalculate counts for all channels/playlists/folders
         for dbid in self.container_reg_dict.keys():
             media_data_obj = self.media_reg_dict[dbid]
@@ -10037,7 +10475,7 @@ class TartubeApp(Gtk.Application):
         # Save the database file (unless load/save has been disabled very
         #   recently)
         if not self.disable_load_save_flag:
-            self.save_db()
+            self.save_db(True)
 
         # Redraw the Video Index and Video Catalogue
         self.main_win_obj.video_index_catalogue_reset()
@@ -10229,6 +10667,10 @@ class TartubeApp(Gtk.Application):
         self.backup_dir = os.path.abspath(
             os.path.join(self.data_dir, '.backups'),
         )
+        self.thumb_cache_dir = os.path.abspath(
+            os.path.join(self.data_dir, '.thumb_cache'),
+        )
+        self.file_manager_obj.set_thumb_cache_dir(self.thumb_cache_dir)
         self.temp_dir = os.path.abspath(os.path.join(self.data_dir, '.temp'))
         self.temp_dl_dir = os.path.abspath(
             os.path.join(self.data_dir, '.temp', 'downloads'),
@@ -11160,6 +11602,10 @@ class TartubeApp(Gtk.Application):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('app 10665 remove_db_lock_file')
 
+        # Don't remove the lockfile while the database file is still being
+        #   written
+        self.wait_db_save()
+
         if self.db_lock_file_path is not None:
 
             if os.path.isfile(self.db_lock_file_path):
@@ -11321,6 +11767,7 @@ class TartubeApp(Gtk.Application):
 
         try:
             os.remove(file_path)
+            self.file_manager_obj.reset_dir_listing(file_path)
             return True
 
         except:
@@ -11360,6 +11807,8 @@ class TartubeApp(Gtk.Application):
 
         try:
             shutil.move(old_path, new_path)
+            self.file_manager_obj.reset_dir_listing(old_path)
+            self.file_manager_obj.reset_dir_listing(new_path)
             return True
 
         except:
@@ -11733,6 +12182,30 @@ class TartubeApp(Gtk.Application):
         return return_list
 
 
+    def get_process_job_count(self):
+
+        """Called by process.ProcessManager.__init__().
+
+        Returns the number of videos that should be processed by FFmpeg at the
+        same time, during a process operation.
+
+        Return values:
+
+            The value of self.process_job_count or, if that value is 0, a
+                number based on the number of CPUs (so that each FFmpeg job
+                can use about four of them)
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 11259 get_process_job_count')
+
+        if self.process_job_count > 0:
+            return self.process_job_count
+        else:
+            return max(1, (os.cpu_count() or 1) // 4)
+
+
     def get_proxy(self):
 
         """Called by options.OptionsParser.build_proxy().
@@ -12221,16 +12694,8 @@ class TartubeApp(Gtk.Application):
                     self.fixed_recent_folder.del_child(child_obj)
 
             # Update the Video Index (and the Video Catalogue, if appropriate)
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                self.fixed_recent_folder,
-            )
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_recent_folder,
-            )
+            self.schedule_index_row_icon(self.fixed_recent_folder)
+            self.schedule_index_row_text(self.fixed_recent_folder)
 
             if self.main_win_obj.video_index_current_dbid \
             == self.fixed_recent_folder.dbid:
@@ -12428,7 +12893,7 @@ class TartubeApp(Gtk.Application):
         #   when launched from the Classic Mode tab)
         if not classic_mode_flag and self.operation_save_flag:
             self.save_config()
-            self.save_db()
+            self.save_db(True)
 
         # After a download operation, update the status icon in the system tray
         self.status_icon_obj.update_icon()
@@ -12912,7 +13377,7 @@ class TartubeApp(Gtk.Application):
 
             if self.operation_save_flag:
                 self.save_config()
-                self.save_db()
+                self.save_db(True)
 
             # During an update operation, certain widgets are modified and/or
             #   desensitised; restore them to their original state
@@ -13215,7 +13680,7 @@ class TartubeApp(Gtk.Application):
         # After a refresh operation, save files, if allowed
         if self.operation_save_flag:
             self.save_config()
-            self.save_db()
+            self.save_db(True)
 
         # Update the status icon in the system tray
         self.status_icon_obj.update_icon()
@@ -13444,7 +13909,7 @@ class TartubeApp(Gtk.Application):
         # After an info operation, save files, if allowed
         if self.operation_save_flag:
             self.save_config()
-            self.save_db()
+            self.save_db(True)
 
         # During an info operation, certain widgets are modified and/or
         #   desensitised; restore them to their original state
@@ -13620,6 +14085,9 @@ class TartubeApp(Gtk.Application):
                 convert_ext_flag: True if .unknown_video file extensions should
                     be converted to .mp4 (experimental; see Git #472)
 
+                find_dup_flag: True if downloaded video files with identical
+                    contents should be listed in the Output tab
+
         """
 
         if DEBUG_FUNC_FLAG:
@@ -13742,7 +14210,7 @@ class TartubeApp(Gtk.Application):
         # After a tidy operation, save files, if allowed
         if self.operation_save_flag:
             self.save_config()
-            self.save_db()
+            self.save_db(True)
 
         # Update the status icon in the system tray
         self.status_icon_obj.update_icon()
@@ -14152,7 +14620,7 @@ class TartubeApp(Gtk.Application):
         # After a process operation, save files, if allowed
         if self.operation_save_flag:
             self.save_config()
-            self.save_db()
+            self.save_db(True)
 
         # Update the status icon in the system tray
         self.status_icon_obj.update_icon()
@@ -14453,23 +14921,15 @@ class TartubeApp(Gtk.Application):
         #   there. (The code has to go here and not, say, in
         #   self.create_video_from_download(), because the latter is not
         #   always called)
-        if video_obj and not video_obj in self.fixed_recent_folder.child_list:
+        if video_obj and not self.fixed_recent_folder.check_child(video_obj):
 
             self.fixed_recent_folder.add_child(self, video_obj)
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_recent_folder,
-            )
+            self.schedule_index_row_text(self.fixed_recent_folder)
 
         # If the video's parent media data object (a channel, playlist or
         #   folder) is selected in the Video Index, update the Video Catalogue
         #   for the downloaded video
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_catalogue_update_video,
-            video_obj,
-        )
+        self.schedule_catalogue_video(video_obj)
 
         # Update the Results List
         self.main_win_obj.results_list_add_row(
@@ -14504,6 +14964,9 @@ class TartubeApp(Gtk.Application):
             ttutils.debug_time('app 13997 announce_video_clone')
 
         video_path = video_obj.get_actual_path(self)
+        # (The clone has just been written, so any cached listing of the
+        #   directory is out of date)
+        self.file_manager_obj.reset_dir_listing(video_path)
 
         # Only set the .name IV if the video is currently unnamed
         if video_obj.name == self.default_video_name:
@@ -14512,8 +14975,10 @@ class TartubeApp(Gtk.Application):
             #   from the JSON data in a moment)
             video_obj.set_nickname(video_obj.file_name)
 
-        # Set the file size
+        # Set the file size, and update any statistics snapshots containing
+        #   this video
         video_obj.set_file_size(os.path.getsize(video_path))
+        self.stats_manager_obj.update_video(video_obj)
 
         # If the JSON file was downloaded, we can extract video statistics from
         #   it
@@ -14657,6 +15122,11 @@ class TartubeApp(Gtk.Application):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('app 14151 update_video_when_file_found')
 
+        # The downloader has just written the video (and perhaps its thumbnail
+        #   and other sidecar files), so any cached listing of the directory
+        #   is out of date
+        self.file_manager_obj.reset_dir_listing(video_path)
+
         # Only set the .name IV if the video is currently unnamed
         # (N.B. The output template override, if applicable, is handled below)
         if video_obj.name == self.default_video_name:
@@ -14669,8 +15139,10 @@ class TartubeApp(Gtk.Application):
         if mkv_flag:
             video_obj.set_mkv()
 
-        # Set the file size
+        # Set the file size, and update any statistics snapshots containing
+        #   this video
         video_obj.set_file_size(os.path.getsize(video_path))
+        self.stats_manager_obj.update_video(video_obj)
 
         # If the JSON file was downloaded, we can extract video statistics from
         #   it
@@ -14689,6 +15161,9 @@ class TartubeApp(Gtk.Application):
         #   file was missing or didn't contain the right statistics), set them
         #   directly
         self.update_video_from_filesystem(video_obj, video_path)
+        # The video's name, description and/or comments might have changed, so
+        #   it must be re-indexed before the next database search
+        self.search_manager_obj.update_video(video_obj)
 
         # If FFmpeg is installed, convert .webp thumbnail files to .jpg
         thumb_path = ttutils.find_thumbnail_webp_intact_or_broken(
@@ -14790,6 +15265,9 @@ class TartubeApp(Gtk.Application):
             if 'duration' in json_dict:
                 video_obj.set_duration(json_dict['duration'])
 
+            # Update any statistics snapshots containing this video
+            self.stats_manager_obj.update_video(video_obj)
+
             if 'webpage_url' in json_dict:
                 # !!! DEBUG: yt-dlp Git #119: filter out the extraneous
                 #   characters at the end of the URL, if present
@@ -14854,6 +15332,10 @@ class TartubeApp(Gtk.Application):
         ) and 'comments' in json_dict:
             video_obj.set_comments(json_dict['comments'])
 
+        # The video's name, description and/or comments might have changed, so
+        #   it must be re-indexed before the next database search
+        self.search_manager_obj.update_video(video_obj)
+
         if (
             (mode == 'default' and self.video_timestamps_extract_json_flag)
             or mode == 'chapters'
@@ -14976,6 +15458,9 @@ class TartubeApp(Gtk.Application):
                     + video_obj.name + '\'',
                 )
 
+        # Update any statistics snapshots containing this video
+        self.stats_manager_obj.update_video(video_obj)
+
 
     def set_duration_from_moviepy(self, video_obj, video_path):
 
@@ -15009,6 +15494,11 @@ class TartubeApp(Gtk.Application):
                 + video_obj.name + '\'',
             )
 
+        # (The thread may outlive the call to self.join() in
+        #   self.update_video_from_filesystem(), so update any statistics
+        #   snapshots here, too)
+        self.stats_manager_obj.update_video(video_obj)
+
 
     def remove_db_metadata_files_after_download(self, temp_dict):
 
@@ -15444,27 +15934,15 @@ class TartubeApp(Gtk.Application):
 
         # Update the row in the Video Index for both the parent and private
         #   folder
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_index_update_row_text,
-            video_obj.parent_obj,
-        )
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_index_update_row_text,
-            self.fixed_all_folder,
-        )
+        self.schedule_index_row_text(video_obj.parent_obj)
+        self.schedule_index_row_text(self.fixed_all_folder)
 
         # If the video's parent is the one visible in the Video Catalogue (or
         #   if 'Unsorted Videos' or 'Temporary Videos', etc, is the one visible
         #   in the Video Catalogue), the new video itself won't be visible
         #   there yet
         # Make sure the video is visible, if appropriate
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_catalogue_update_video,
-            video_obj,
-        )
+        self.schedule_catalogue_video(video_obj)
 
         return video_obj
 
@@ -15901,12 +16379,13 @@ class TartubeApp(Gtk.Application):
         media_data_obj.parent_obj.del_child(media_data_obj)
         media_data_obj.set_parent_obj(None)
         self.container_top_level_list.append(media_data_obj.dbid)
+        self.reset_media_dir_cache()
 
         # Save the database (because, if the user terminates Tartube and then
         #   restarts it, then tries to perform a download operation, a load of
         #   Python error messages will be generated, complaining that
         #   directories don't exist)
-        self.save_db()
+        self.save_db(True)
 
         # Redraw the whole Video Index, which makes sure the moved container
         #   has an expanding arrow button
@@ -16138,11 +16617,13 @@ class TartubeApp(Gtk.Application):
             index = self.container_top_level_list.index(source_obj.dbid)
             del self.container_top_level_list[index]
 
+        self.reset_media_dir_cache()
+
         # Save the database (because, if the user terminates Tartube and then
         #   restarts it, then tries to perform a download operation, a load of
         #   Python error messages will be generated, complaining that
         #   directories don't exist)
-        self.save_db()
+        self.save_db(True)
 
         # Redraw the whole Video Index, which makes sure the moved container
         #   has an expanding arrow button
@@ -16779,11 +17260,7 @@ class TartubeApp(Gtk.Application):
 
                 if container_obj.dbid \
                 in self.main_win_obj.video_index_row_dict:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_index_update_row_text,
-                        container_obj,
-                    )
+                    self.schedule_index_row_text(container_obj)
 
         # Update a row in the Results List, if the video is visible there
         self.main_win_obj.results_list_update_row_on_delete(video_obj.dbid)
@@ -17092,6 +17569,7 @@ class TartubeApp(Gtk.Application):
             # (No reason why this check should fail, but let's play safe)
             if other_obj.master_dbid == media_data_obj.dbid:
                 other_obj.reset_master_dbid()
+                self.reset_media_dir_cache()
 
         # During the initial call to this function, delete the container
         #   object from the Video Index (which automatically resets the Video
@@ -17106,53 +17584,21 @@ class TartubeApp(Gtk.Application):
 
             # Also redraw the private folders in the Video Index, to show the
             #   correct number of downloaded/new videos, etc
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_all_folder,
-            )
+            self.schedule_index_row_text(self.fixed_all_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_bookmark_folder,
-            )
+            self.schedule_index_row_text(self.fixed_bookmark_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_fav_folder,
-            )
+            self.schedule_index_row_text(self.fixed_fav_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_live_folder,
-            )
+            self.schedule_index_row_text(self.fixed_live_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_missing_folder,
-            )
+            self.schedule_index_row_text(self.fixed_missing_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_new_folder,
-            )
+            self.schedule_index_row_text(self.fixed_new_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_recent_folder,
-            )
+            self.schedule_index_row_text(self.fixed_recent_folder)
 
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                self.fixed_waiting_folder,
-            )
+            self.schedule_index_row_text(self.fixed_waiting_folder)
 
         elif not recursive_flag and empty_flag:
 
@@ -17373,6 +17819,214 @@ class TartubeApp(Gtk.Application):
     # (Change media data object settings, updating all related things)
 
 
+    def bulk_change_begin(self):
+
+        """Can be called by anything, before making a large number of changes
+        to media data objects (for example, marking thousands of videos as
+        downloaded).
+
+        Until the matching call to self.bulk_change_commit(), rows in the
+        Video Index and items in the Video Catalogue are not redrawn; instead,
+        the changes are collected, so that each row/item is redrawn only once.
+
+        Calls to this function can be nested; the changes are applied after the
+        outermost call to self.bulk_change_commit().
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 16560 bulk_change_begin')
+
+        with self.bulk_change_lock:
+            self.bulk_change_level += 1
+
+
+    def bulk_change_commit(self, no_update_flag=False):
+
+        """Can be called by anything, after a call to self.bulk_change_begin().
+
+        Redraws every Video Index row and Video Catalogue item affected by
+        changes made since that call (unless this call is nested inside
+        another).
+
+        Args:
+
+            no_update_flag (bool): True if the calling code is about to redraw
+                the whole Video Index and Video Catalogue itself, in which case
+                the collected changes are discarded
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 16581 bulk_change_commit')
+
+        with self.bulk_change_lock:
+
+            if self.bulk_change_level > 0:
+                self.bulk_change_level -= 1
+
+            if self.bulk_change_level:
+                return
+
+            if no_update_flag:
+
+                self.bulk_change_text_dict = {}
+                self.bulk_change_icon_dict = {}
+                self.bulk_change_video_dict = {}
+
+            elif (
+                self.bulk_change_text_dict \
+                or self.bulk_change_icon_dict \
+                or self.bulk_change_video_dict
+            ) and not self.bulk_change_flush_flag:
+
+                self.bulk_change_flush_flag = True
+                GObject.timeout_add(0, self.bulk_change_flush)
+
+
+    def bulk_change_flush(self):
+
+        """Called by self.bulk_change_commit() and .bulk_change_schedule(),
+        via a call to GObject.timeout_add().
+
+        Redraws every Video Index row and Video Catalogue item that has been
+        marked as needing an update.
+
+        Return values:
+
+            False, so that the timer is not repeated
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 16621 bulk_change_flush')
+
+        with self.bulk_change_lock:
+
+            self.bulk_change_flush_flag = False
+            if self.bulk_change_level:
+                # A transaction has started; its final call to
+                #   self.bulk_change_commit() will schedule another flush
+                return False
+
+            text_list = list(self.bulk_change_text_dict.values())
+            icon_list = list(self.bulk_change_icon_dict.values())
+            video_list = list(self.bulk_change_video_dict.values())
+            self.bulk_change_text_dict = {}
+            self.bulk_change_icon_dict = {}
+            self.bulk_change_video_dict = {}
+
+        for media_data_obj in icon_list:
+            self.main_win_obj.video_index_update_row_icon(media_data_obj)
+
+        for media_data_obj in text_list:
+            self.main_win_obj.video_index_update_row_text(media_data_obj)
+
+        if len(video_list) > self.bulk_change_redraw_max:
+
+            # Quicker to redraw the current page than to update each video
+            #   separately
+            if self.main_win_obj.video_index_current_dbid is not None:
+                self.main_win_obj.video_catalogue_redraw_all(
+                    self.main_win_obj.video_index_current_dbid,
+                    self.main_win_obj.catalogue_toolbar_current_page,
+                    False,          # Don't reset scrollbars
+                    True,           # Don't cancel the filter, if applied
+                )
+
+        else:
+
+            for video_obj in video_list:
+                self.main_win_obj.video_catalogue_update_video(video_obj)
+
+        return False
+
+
+    def bulk_change_schedule(self, media_dict, media_data_obj):
+
+        """Called by self.schedule_index_row_text() and similar functions.
+
+        Marks a media data object as needing to be redrawn, and schedules a
+        call to self.bulk_change_flush(), if one isn't already scheduled (and
+        if self.bulk_change_begin() hasn't been called).
+
+        Args:
+
+            media_dict (dict): One of the dictionaries
+                self.bulk_change_text_dict, .bulk_change_icon_dict or
+                .bulk_change_video_dict
+
+            media_data_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The object to redraw
+
+        """
+
+        with self.bulk_change_lock:
+
+            media_dict[media_data_obj.dbid] = media_data_obj
+
+            if not self.bulk_change_level and not self.bulk_change_flush_flag:
+                self.bulk_change_flush_flag = True
+                GObject.timeout_add(0, self.bulk_change_flush)
+
+
+    def schedule_catalogue_video(self, video_obj):
+
+        """Can be called by anything, whenever a video has changed.
+
+        Updates the video's item in the Video Catalogue (if it is visible)
+        soon, via a call to mainwin.MainWin.video_catalogue_update_video().
+        Any number of calls for the same video, made at around the same time,
+        result in a single update.
+
+        Args:
+
+            video_obj (media.Video): The video to update
+
+        """
+
+        self.bulk_change_schedule(self.bulk_change_video_dict, video_obj)
+
+
+    def schedule_index_row_icon(self, media_data_obj):
+
+        """Can be called by anything, whenever a channel, playlist or folder
+        has changed.
+
+        Updates the icon in the object's Video Index row soon, via a call to
+        mainwin.MainWin.video_index_update_row_icon(). Any number of calls for
+        the same object, made at around the same time, result in a single
+        update.
+
+        Args:
+
+            media_data_obj (media.Channel, media.Playlist, media.Folder): The
+                object to update
+
+        """
+
+        self.bulk_change_schedule(self.bulk_change_icon_dict, media_data_obj)
+
+
+    def schedule_index_row_text(self, media_data_obj):
+
+        """Can be called by anything, whenever a channel, playlist or folder
+        (or the number of videos it contains) has changed.
+
+        Updates the text in the object's Video Index row soon, via a call to
+        mainwin.MainWin.video_index_update_row_text(). Any number of calls for
+        the same object, made at around the same time, result in a single
+        update.
+
+        Args:
+
+            media_data_obj (media.Channel, media.Playlist, media.Folder): The
+                object to update
+
+        """
+
+        self.bulk_change_schedule(self.bulk_change_text_dict, media_data_obj)
+
+
     def prepare_mark_video(self, data_list):
 
         """Called by self.mark_container_favourite(),
@@ -17417,87 +18071,93 @@ class TartubeApp(Gtk.Application):
         else:
             video_list = container_obj.child_list
 
-        # Take some shortcuts
-        for child_obj in video_list:
+        # The Video Index and Video Catalogue are redrawn at the end of this
+        #   function, so there's no need to update individual rows/items
+        self.bulk_change_begin()
 
-            if isinstance(child_obj, media.Video):
-
-                if action_type == 'bookmark':
-                    self.mark_video_bookmark(
-                        child_obj,
-                        action_flag,    # Mark video bookmarked
-                        True,           # Don't update the Video Index
-                        True,           # Don't update the Video Catalogue
-                        True,           # Don't sort the child list each time
-                    )
+        try:
+            # Take some shortcuts
+            for child_obj in video_list:
 
-                elif action_type == 'downloaded':
+                if isinstance(child_obj, media.Video):
 
-                    self.mark_video_downloaded(
-                        child_obj,
-                        action_flag,    # Mark video downloaded (or not)
-                        True,           # Video is not new
-                    )
-                    # .mark_video_downloaded() doesn't update the Video
-                    #   Catalogue (unlike for example .mark_video_favourite() )
-                    #   so we must do that manually
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        child_obj,
-                    )
+                    if action_type == 'bookmark':
+                        self.mark_video_bookmark(
+                            child_obj,
+                            action_flag,  # Mark video bookmarked
+                            True,         # Don't update the Video Index
+                            True,         # Don't update the Video Catalogue
+                            True,         # Don't sort the child list each time
+                        )
 
-                elif action_type == 'favourite':
+                    elif action_type == 'downloaded':
 
-                    self.mark_video_favourite(
-                        child_obj,
-                        action_flag,    # Mark video favourite (or not)
-                        True,           # Don't update the Video Index
-                        True,           # Don't update the Video Catalogue
-                        True,           # Don't sort the child list each time
-                    )
+                        self.mark_video_downloaded(
+                            child_obj,
+                            action_flag,  # Mark video downloaded (or not)
+                            True,         # Video is not new
+                        )
+                        # .mark_video_downloaded() doesn't update the Video
+                        #   Catalogue (unlike for example
+                        #   .mark_video_favourite() ) so we must do that
+                        #   manually
+                        self.schedule_catalogue_video(child_obj)
+
+                    elif action_type == 'favourite':
+
+                        self.mark_video_favourite(
+                            child_obj,
+                            action_flag,  # Mark video favourite (or not)
+                            True,         # Don't update the Video Index
+                            True,         # Don't update the Video Catalogue
+                            True,         # Don't sort the child list each time
+                        )
 
-                elif action_type == 'missing':
+                    elif action_type == 'missing':
 
-                    self.mark_video_missing(
-                        child_obj,
-                        action_flag,    # Mark video missing (or not)
-                        True,           # Don't update the Video Index
-                        True,           # Don't update the Video Catalogue
-                        True,           # Don't sort the child list each time
-                    )
+                        self.mark_video_missing(
+                            child_obj,
+                            action_flag,  # Mark video missing (or not)
+                            True,         # Don't update the Video Index
+                            True,         # Don't update the Video Catalogue
+                            True,         # Don't sort the child list each time
+                        )
 
-                elif action_type == 'new':
+                    elif action_type == 'new':
 
-                    self.mark_video_new(
-                        child_obj,
-                        action_flag,    # Mark video favourite (or not)
-                        True,           # Don't update the Video Index
-                        True,           # Don't update the Video Catalogue
-                        True,           # Don't sort the child list each time
-                    )
+                        self.mark_video_new(
+                            child_obj,
+                            action_flag,  # Mark video favourite (or not)
+                            True,         # Don't update the Video Index
+                            True,         # Don't update the Video Catalogue
+                            True,         # Don't sort the child list each time
+                        )
 
-                elif action_type == 'waiting':
+                    elif action_type == 'waiting':
 
-                    self.mark_video_waiting(
-                        child_obj,
-                        action_flag,    # Mark video waiting (or not)
-                        True,           # Don't update the Video Index
-                        True,           # Don't update the Video Catalogue
-                        True,           # Don't sort the child list each time
-                    )
+                        self.mark_video_waiting(
+                            child_obj,
+                            action_flag,  # Mark video waiting (or not)
+                            True,         # Don't update the Video Index
+                            True,         # Don't update the Video Catalogue
+                            True,         # Don't sort the child list each time
+                        )
 
-        # Now we can sort the system folder's child list...
-        if action_type == 'bookmark':
-            self.fixed_bookmark_folder.sort_children(self)
-        elif action_type == 'favourite':
-            self.fixed_fav_folder.sort_children(self)
-        elif action_type == 'missing':
-            self.fixed_missing_folder.sort_children(self)
-        elif action_type == 'new':
-            self.fixed_new_folder.sort_children(self)
-        elif action_type == 'waiting':
-            self.fixed_waiting_folder.sort_children(self)
+            # Now we can sort the system folder's child list...
+            if action_type == 'bookmark':
+                self.fixed_bookmark_folder.sort_children(self)
+            elif action_type == 'favourite':
+                self.fixed_fav_folder.sort_children(self)
+            elif action_type == 'missing':
+                self.fixed_missing_folder.sort_children(self)
+            elif action_type == 'new':
+                self.fixed_new_folder.sort_children(self)
+            elif action_type == 'waiting':
+                self.fixed_waiting_folder.sort_children(self)
+
+        finally:
+            # (Even if something went wrong, the transaction must end)
+            self.bulk_change_commit(True)
 
         # ...and then can redraw the Video Index and Video Catalogue,
         #   re-selecting the current selection, if any
@@ -17592,11 +18252,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_bookmark_count()
@@ -17609,7 +18265,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.dec_bookmark_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.dec_bookmark_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_bookmark_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.dec_bookmark_count()
@@ -17652,11 +18308,7 @@ class TartubeApp(Gtk.Application):
 
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.inc_bookmark_count()
@@ -17668,18 +18320,14 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.inc_bookmark_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.inc_bookmark_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_bookmark_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.inc_bookmark_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_video_downloaded(self, video_obj, dl_flag, not_new_flag=False):
@@ -17748,7 +18396,7 @@ class TartubeApp(Gtk.Application):
                 if video_obj.missing_flag:
                     self.fixed_missing_folder.dec_dl_count()
                     update_list.append(self.fixed_missing_folder)
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_dl_count()
                     update_list.append(self.fixed_recent_folder)
                 if video_obj.waiting_flag:
@@ -17778,6 +18426,8 @@ class TartubeApp(Gtk.Application):
 
                 # Update the video object's IVs
                 video_obj.set_dl_flag(True)
+                # (.set_dl_flag() may have set the receive time)
+                self.stats_manager_obj.update_video(video_obj)
                 # Update the parent container object
                 video_obj.parent_obj.inc_dl_count()
                 # Update private folders
@@ -17795,7 +18445,7 @@ class TartubeApp(Gtk.Application):
                 if video_obj.missing_flag:
                     self.fixed_missing_folder.inc_dl_count()
                     update_list.append(self.fixed_missing_folder)
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_dl_count()
                     update_list.append(self.fixed_recent_folder)
                 if video_obj.waiting_flag:
@@ -17815,11 +18465,7 @@ class TartubeApp(Gtk.Application):
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_video_favourite(self, video_obj, fav_flag, \
@@ -17911,11 +18557,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_fav_count()
@@ -17928,7 +18570,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.dec_fav_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.dec_fav_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_fav_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.dec_fav_count()
@@ -17966,11 +18608,7 @@ class TartubeApp(Gtk.Application):
 
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.inc_fav_count()
@@ -17982,18 +18620,14 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.inc_fav_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.inc_fav_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_fav_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.inc_fav_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_video_live(self, video_obj, live_mode, live_data_dict={}, \
@@ -18120,11 +18754,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_live_count()
@@ -18137,7 +18767,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.dec_live_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.dec_live_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_waiting_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.dec_waiting_count()
@@ -18216,11 +18846,7 @@ class TartubeApp(Gtk.Application):
 
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 if not convert_flag:
@@ -18233,18 +18859,14 @@ class TartubeApp(Gtk.Application):
                         self.fixed_missing_folder.inc_live_count()
                     if video_obj.new_flag:
                         self.fixed_new_folder.inc_live_count()
-                    if video_obj in self.fixed_recent_folder.child_list:
+                    if self.fixed_recent_folder.check_child(video_obj):
                         self.fixed_recent_folder.inc_live_count()
                     if video_obj.waiting_flag:
                         self.fixed_waiting_folder.inc_live_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
         # Changing a video's live mode almost always changes its position in
         #   the parent container's child list, so perform a resort
@@ -18341,11 +18963,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_missing_count()
@@ -18360,7 +18978,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.dec_missing_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.dec_missing_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_missing_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.dec_missing_count()
@@ -18404,11 +19022,7 @@ class TartubeApp(Gtk.Application):
 
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.inc_missing_count()
@@ -18420,18 +19034,14 @@ class TartubeApp(Gtk.Application):
                     self.fixed_live_folder.inc_missing_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.inc_missing_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_missing_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.inc_missing_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_video_new(self, video_obj, new_flag, no_update_index_flag=False,
@@ -18523,11 +19133,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_new_count()
@@ -18539,7 +19145,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_live_folder.dec_new_count()
                 if video_obj.missing_flag:
                     self.fixed_missing_folder.dec_new_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_new_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.dec_new_count()
@@ -18574,11 +19180,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_new_folder.inc_waiting_count()
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.inc_new_count()
@@ -18590,18 +19192,14 @@ class TartubeApp(Gtk.Application):
                     self.fixed_live_folder.inc_new_count()
                 if video_obj.missing_flag:
                     self.fixed_missing_folder.inc_new_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_new_count()
                 if video_obj.waiting_flag:
                     self.fixed_waiting_folder.inc_new_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_video_waiting(self, video_obj, waiting_flag, \
@@ -18693,11 +19291,7 @@ class TartubeApp(Gtk.Application):
                         )
 
                     else:
-                        GObject.timeout_add(
-                            0,
-                            self.main_win_obj.video_catalogue_update_video,
-                            video_obj,
-                        )
+                        self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.dec_waiting_count()
@@ -18712,7 +19306,7 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.dec_waiting_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.dec_waiting_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.dec_waiting_count()
 
         else:
@@ -18753,11 +19347,7 @@ class TartubeApp(Gtk.Application):
 
                 # Update the Video Catalogue, if that folder is the visible one
                 if not no_update_catalogue_flag:
-                    GObject.timeout_add(
-                        0,
-                        self.main_win_obj.video_catalogue_update_video,
-                        video_obj,
-                    )
+                    self.schedule_catalogue_video(video_obj)
 
                 # Update other private folders
                 self.fixed_all_folder.inc_waiting_count()
@@ -18771,16 +19361,12 @@ class TartubeApp(Gtk.Application):
                     self.fixed_missing_folder.inc_waiting_count()
                 if video_obj.new_flag:
                     self.fixed_new_folder.inc_waiting_count()
-                if video_obj in self.fixed_recent_folder.child_list:
+                if self.fixed_recent_folder.check_child(video_obj):
                     self.fixed_recent_folder.inc_waiting_count()
 
         # Update rows in the Video Index
         for container_obj in update_list:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                container_obj,
-            )
+            self.schedule_index_row_text(container_obj)
 
 
     def mark_folder_hidden(self, folder_obj, hidden_flag):
@@ -18962,16 +19548,8 @@ class TartubeApp(Gtk.Application):
                     other_obj.set_archive_flag(archive_flag)
 
         # In all cases, update the row on the Video Index
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_index_update_row_icon,
-            media_data_obj,
-        )
-        GObject.timeout_add(
-            0,
-            self.main_win_obj.video_index_update_row_text,
-            media_data_obj,
-        )
+        self.schedule_index_row_icon(media_data_obj)
+        self.schedule_index_row_text(media_data_obj)
         # If this container is the one visible in the Video Catalogue, redraw
         #   the Video Catalogue
         if self.main_win_obj.video_index_current_dbid == media_data_obj.dbid:
@@ -19037,30 +19615,25 @@ class TartubeApp(Gtk.Application):
         if not count:
 
             # Just update the row on the Video Index
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                media_data_obj,
-            )
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                media_data_obj,
-            )
+            self.schedule_index_row_icon(media_data_obj)
+            self.schedule_index_row_text(media_data_obj)
 
         elif count < self.main_win_obj.mark_video_lower_limit:
 
             # The procedure should be quick
-            for child_obj in video_list:
-                self.mark_video_downloaded(child_obj, dl_flag, True)
-                # .mark_video_downloaded() doesn't update the Video Catalogue
-                #   (unlike for example .mark_video_favourite() ), so we must
-                #   do that manually
-                GObject.timeout_add(
-                    0,
-                    self.main_win_obj.video_catalogue_update_video,
-                    child_obj,
-                )
+            self.bulk_change_begin()
+
+            try:
+                for child_obj in video_list:
+                    self.mark_video_downloaded(child_obj, dl_flag, True)
+                    # .mark_video_downloaded() doesn't update the Video
+                    #   Catalogue (unlike for example
+                    #   .mark_video_favourite() ), so we must do that manually
+                    self.schedule_catalogue_video(child_obj)
+
+            finally:
+                # (Even if something went wrong, the transaction must end)
+                self.bulk_change_commit()
 
         elif count < self.main_win_obj.mark_video_higher_limit:
 
@@ -19250,16 +19823,8 @@ class TartubeApp(Gtk.Application):
         if not count:
 
             # Just update the row on the Video Index
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                media_data_obj,
-            )
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                media_data_obj,
-            )
+            self.schedule_index_row_icon(media_data_obj)
+            self.schedule_index_row_text(media_data_obj)
 
         elif count < self.main_win_obj.mark_video_lower_limit:
 
@@ -19374,16 +19939,8 @@ class TartubeApp(Gtk.Application):
         if not count:
 
             # Just update the row on the Video Index
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                media_data_obj,
-            )
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                media_data_obj,
-            )
+            self.schedule_index_row_icon(media_data_obj)
+            self.schedule_index_row_text(media_data_obj)
 
         elif count < self.main_win_obj.mark_video_lower_limit:
 
@@ -19564,16 +20121,8 @@ class TartubeApp(Gtk.Application):
         if not count:
 
             # Just update the row on the Video Index
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                media_data_obj,
-            )
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_text,
-                media_data_obj,
-            )
+            self.schedule_index_row_icon(media_data_obj)
+            self.schedule_index_row_text(media_data_obj)
 
         elif count < self.main_win_obj.mark_video_lower_limit:
 
@@ -19746,13 +20295,16 @@ class TartubeApp(Gtk.Application):
             #   This call also updates the object's .nickname IV
             old_name = media_data_obj.name
             media_data_obj.set_name(new_name)
+            # (The paths used by this container and its descendants have
+            #   changed)
+            self.reset_media_dir_cache()
 
             # Reset the Video Index and the Video Catalogue (this prevents a
             #   lot of problems)
             self.main_win_obj.video_index_catalogue_reset()
 
             # Save the database file (since the filesystem itself has changed)
-            self.save_db()
+            self.save_db(True)
 
 
     def rename_container_silently(self, media_data_obj, new_name):
@@ -19828,6 +20380,8 @@ class TartubeApp(Gtk.Application):
         #   call also updates the object's .nickname IV
         old_name = media_data_obj.name
         media_data_obj.set_name(new_name)
+        # (The paths used by this container and its descendants have changed)
+        self.reset_media_dir_cache()
 
         return True
 
@@ -22514,17 +23068,9 @@ class TartubeApp(Gtk.Application):
 
         # Update the Video Index or Video Catalogue, as required
         if isinstance(media_data_obj, media.Video):
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_catalogue_update_video,
-                media_data_obj,
-            )
+            self.schedule_catalogue_video(media_data_obj)
         else:
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_index_update_row_icon,
-                media_data_obj,
-            )
+            self.schedule_index_row_icon(media_data_obj)
 
         # Update the list in any preference windows that are open
         for config_win_obj in self.main_win_obj.config_win_list:
@@ -22599,17 +23145,9 @@ class TartubeApp(Gtk.Application):
         if not no_update_flag:
 
             if isinstance(media_data_obj, media.Video):
-                GObject.timeout_add(
-                    0,
-                    self.main_win_obj.video_catalogue_update_video,
-                    media_data_obj,
-                )
+                self.schedule_catalogue_video(media_data_obj)
             else:
-                GObject.timeout_add(
-                    0,
-                    self.main_win_obj.video_index_update_row_icon,
-                    media_data_obj,
-                )
+                self.schedule_index_row_icon(media_data_obj)
 
         # Update the list in any preference windows that are open
         for config_win_obj in self.main_win_obj.config_win_list:
@@ -22658,17 +23196,9 @@ class TartubeApp(Gtk.Application):
 
             # Update the row in the Video Index or Video Catalogue
             if isinstance(media_data_obj, media.Video):
-                GObject.timeout_add(
-                    0,
-                    self.main_win_obj.video_catalogue_update_video,
-                    media_data_obj,
-                )
+                self.schedule_catalogue_video(media_data_obj)
             else:
-                GObject.timeout_add(
-                    0,
-                    self.main_win_obj.video_index_update_row_icon,
-                    media_data_obj,
-                )
+                self.schedule_index_row_icon(media_data_obj)
 
         # Destroy the options.OptionsManager object itself
         del self.options_reg_dict[options_obj.uid]
@@ -25330,9 +25860,17 @@ class TartubeApp(Gtk.Application):
 
             # Find the corresponding page in the Video Catalogue, and make it
             #   visible
-            self.main_win_obj.video_catalogue_show_date(
-                math.ceil(count / self.catalogue_page_size),
-            )
+            if self.main_win_obj.catalogue_virtual_list is not None:
+
+                # (In virtual mode there is only one page, so scroll to the
+                #   video instead)
+                self.main_win_obj.video_catalogue_show_date(1, count - 1)
+
+            else:
+
+                self.main_win_obj.video_catalogue_show_date(
+                    math.ceil(count / self.catalogue_page_size),
+                )
 
 
     def on_button_first_page(self, action, par):
@@ -26580,11 +27118,7 @@ class TartubeApp(Gtk.Application):
 
         # Update the Video Catalogue
         for video_obj in video_dict.values():
-            GObject.timeout_add(
-                0,
-                self.main_win_obj.video_catalogue_update_video,
-                video_obj,
-            )
+            self.schedule_catalogue_video(video_obj)
 
         # Show confirmation
         count = len(video_dict)
@@ -27477,13 +28011,13 @@ class TartubeApp(Gtk.Application):
 
         if not self.disable_load_save_flag:
             self.save_config()
-        if not self.disable_load_save_flag:
-            self.save_db()
 
-        # Show a dialogue window for confirmation (unless file load/save has
-        #   been disabled, in which case a dialogue has already appeared)
-        if not self.disable_load_save_flag:
+        # (The user expects the file to have been written, when the
+        #   confirmation appears, so don't save in the background)
+        if not self.disable_load_save_flag and self.save_db():
 
+            # Show a dialogue window for confirmation (if the save failed, a
+            #   dialogue has already appeared)
             self.dialogue_manager_obj.show_msg_dialogue(
                 _('All Tartube data has been saved'),
                 'info',
@@ -27508,12 +28042,12 @@ class TartubeApp(Gtk.Application):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('app 26333 on_menu_save_db')
 
-        self.save_db()
-
-        # Show a dialogue window for confirmation (unless file load/save has
-        #   been disabled, in which case a dialogue has already appeared)
-        if not self.disable_load_save_flag:
+        # (The user expects the file to have been written, when the
+        #   confirmation appears, so don't save in the background)
+        if self.save_db():
 
+            # Show a dialogue window for confirmation (if the save failed, a
+            #   dialogue has already appeared)
             self.dialogue_manager_obj.show_msg_dialogue(
                 _('Database saved'),
                 'info',
@@ -27521,6 +28055,42 @@ class TartubeApp(Gtk.Application):
             )
 
 
+    def on_menu_search_db(self, action, par):
+
+        """Called from a callback in self.do_startup().
+
+        Prompts the user for a search query, then shows every matching video
+        in the database in the Video Catalogue.
+
+        Args:
+
+            action (Gio.SimpleAction): Object generated by Gio
+
+            par (None): Ignored
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 26362 on_menu_search_db')
+
+        dialogue_win = mainwin.SearchDatabaseDialogue(
+            self.main_win_obj,
+            self.search_db_last_query,
+        )
+        response = dialogue_win.run()
+
+        # Retrieve user choices from the dialogue window, before destroying it
+        query_text = dialogue_win.entry.get_text()
+        dialogue_win.destroy()
+
+        if response == Gtk.ResponseType.OK \
+        and query_text is not None \
+        and query_text.strip() != '':
+
+            self.search_db_last_query = query_text
+            self.main_win_obj.video_catalogue_search_db(query_text)
+
+
     def on_menu_send_feedback(self, action, par):
 
         """Called from a callback in self.do_startup().
@@ -27882,6 +28452,7 @@ class TartubeApp(Gtk.Application):
                 'del_json_flag': dialogue_win.checkbutton15.get_active(),
                 'del_xml_flag': dialogue_win.checkbutton16.get_active(),
                 'convert_ext_flag': dialogue_win.checkbutton17.get_active(),
+                'find_dup_flag': dialogue_win.checkbutton18.get_active(),
             }
 
         # Now destroy the window
@@ -28588,6 +29159,23 @@ class TartubeApp(Gtk.Application):
             )
 
 
+    def set_catalogue_virtual_flag(self, flag):
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('app 27321 set_catalogue_virtual_flag')
+
+        if not flag:
+            self.catalogue_virtual_flag = False
+        else:
+            self.catalogue_virtual_flag = True
+
+        # Re-draw the Video Catalogue to implement the new setting
+        if self.main_win_obj.video_index_current_dbid is not None:
+            self.main_win_obj.video_catalogue_redraw_all(
+                self.main_win_obj.video_index_current_dbid,
+            )
+
+
     def set_catalogue_show_nickname_flag(self, flag):
 
         if DEBUG_FUNC_FLAG:
@@ -28821,6 +29409,14 @@ class TartubeApp(Gtk.Application):
         self.db_backup_mode = value
 
 
+    def set_db_save_background_flag(self, flag):
+
+        if not flag:
+            self.db_save_background_flag = False
+        else:
+            self.db_save_background_flag = True
+
+
     def set_delete_container_files_flag(self, flag):
 
         if not flag:
@@ -29458,6 +30054,21 @@ class TartubeApp(Gtk.Application):
             self.match_nickname_flag = True
 
 
+    def reset_media_dir_cache(self):
+
+        """Can be called by anything. Called whenever a channel, playlist or
+        folder is renamed or moved, or when its external directory or
+        alternative download destination is changed.
+
+        Empties the cache of paths used by
+        media.GenericContainer.get_actual_dir().
+        """
+
+        self.media_dir_cache_dict = {}
+        self.media_dir_cache_root = self.downloads_dir
+        self.media_dir_cache_version += 1
+
+
     def del_container_unavailable_dict(self, name):
 
         del self.container_unavailable_dict[name]
@@ -29680,6 +30291,12 @@ class TartubeApp(Gtk.Application):
         self.override_locale = None
 
 
+    def set_process_job_count(self, value):
+
+        if value >= 0:
+            self.process_job_count = int(value)
+
+
     def set_progress_list_hide_flag(self, flag):
 
         if DEBUG_FUNC_FLAG:
@@ -30095,6 +30712,12 @@ class TartubeApp(Gtk.Application):
         self.split_video_custom_title = value
 
 
+    def set_split_video_dl_job_count(self, value):
+
+        if value >= 1:
+            self.split_video_dl_job_count = int(value)
+
+
     def set_split_video_force_keyframe_flag(self, flag):
 
         if not flag:
@@ -30220,6 +30843,12 @@ class TartubeApp(Gtk.Application):
         self.thumb_size_custom = value
 
 
+    def set_tidy_worker_count(self, value):
+
+        if value >= 1:
+            self.tidy_worker_count = int(value)
+
+
     def set_toolbar_hide_flag(self, flag):
 
         if not flag:
@@ -130,6 +130,7 @@ class MainWin(Gtk.ApplicationWindow):
         self.add_playlist_menu_item = None      # Gtk.MenuItem
         self.add_folder_menu_item = None        # Gtk.MenuItem
         self.add_bulk_menu_item = None          # Gtk.MenuItem
+        self.search_db_menu_item = None         # Gtk.MenuItem
         self.export_db_menu_item = None         # Gtk.MenuItem
         self.import_db_menu_item = None         # Gtk.MenuItem
         self.import_yt_menu_item = None         # Gtk.MenuItem
@@ -212,6 +213,10 @@ class MainWin(Gtk.ApplicationWindow):
         self.catalogue_scrolled = None          # Gtk.ScrolledWindow
         self.catalogue_frame = None             # Gtk.Frame
         self.catalogue_listbox = None           # Gtk.ListBox
+        self.catalogue_virtual_vbox = None      # Gtk.VBox
+        self.catalogue_virtual_top_box = None   # Gtk.Box
+        self.catalogue_virtual_bottom_box = None
+                                                # Gtk.Box
         self.catalogue_grid = None              # Gtk.Grid
         self.catalogue_toolbar = None           # Gtk.Toolbar
         self.catalogue_page_entry = None        # Gtk.Entry
@@ -462,9 +467,22 @@ class MainWin(Gtk.ApplicationWindow):
         #   key = .dbid of the media data object
         #   value = Gtk.TreeRowReference
         self.video_index_row_dict = {}
+        # Rows are created only when they are first needed. Initially, only
+        #   top-level channels, playlists and folders have rows; any row whose
+        #   media data object has child channels/playlists/folders is given a
+        #   single placeholder child row (so that it can be expanded). When the
+        #   row is expanded, the placeholder is replaced by real rows (see
+        #   self.video_index_populate_children() )
+        # Dictionary of rows that still have a placeholder, in the form
+        #   key = .dbid of the media data object
+        #   value = Gtk.TreeRowReference for the placeholder row
+        self.video_index_placeholder_dict = {}
         # Dictionary keeping track of which rows have their markers activated
-        # A subset of key/value pairs in self.video_index_row_dict. Rows whose
-        #   markers are not activated are not in this dictionary
+        # Dictionary in the form
+        #   key = .dbid of the media data object
+        #   value = Gtk.TreeRowReference, or None if no row has been created
+        #       for the media data object yet
+        # Rows whose markers are not activated are not in this dictionary
         self.video_index_marker_dict = {}
         # A call to self.video_index_reset() redraws the Video Index, but calls
         #   to other functions repopulate it
@@ -520,6 +538,32 @@ class MainWin(Gtk.ApplicationWindow):
         # When the filter is applied, a list of video objects to show (may be
         #   an empty list)
         self.video_catalogue_filtered_list = []
+        # When the filter has been applied by a database search (see
+        #   self.video_catalogue_search_db() ), the videos are shown in the
+        #   order of their ranking, rather than the usual order. Dictionary
+        #   showing the position of each video in the search results, in the
+        #   form
+        #       video_catalogue_rank_dict[dbid] = position
+        #   (an empty dictionary at all other times)
+        self.video_catalogue_rank_dict = {}
+        # When the Video Catalogue is redrawn, it's not necessary to replace
+        #   every row/gridbox if the same channel/playlist/folder is still
+        #   visible, and if settings haven't changed. Instead, only rows/
+        #   gridboxes that have changed are updated
+        # The value returned by self.video_catalogue_get_draw_signature(),
+        #   when the Video Catalogue was last redrawn completely (None if it
+        #   has been reset since then)
+        self.video_catalogue_draw_signature = None
+        # Dictionary of values returned by
+        #   self.video_catalogue_get_video_signature(), the last time each
+        #   catalogue item's widgets were updated, so that they are only
+        #   updated again when something has changed
+        # Dictionary in the form
+        #   key = .dbid (of the catalogue item, matching the dbid of its
+        #       media.Video object)
+        #   value = the tuple returned by
+        #       self.video_catalogue_get_video_signature()
+        self.video_catalogue_signature_dict = {}
 
         # Dragging videos from the Video Catalogue into the Video Index
         #   requires some trickery. At the start of such a drag, this list is
@@ -565,6 +609,35 @@ class MainWin(Gtk.ApplicationWindow):
         # The number of pages currently in use (minimum 1, maximum 9999)
         self.catalogue_toolbar_last_page = 1
 
+        # In virtual mode (when mainapp.TartubeApp.catalogue_virtual_flag is
+        #   set, and videos are not arranged on a grid), all videos are shown
+        #   on a single page, but catalogue items are only created for videos
+        #   in (or near) the visible part of the Video Catalogue. As the user
+        #   scrolls, the same catalogue items are re-used for other videos,
+        #   and empty space above and below them stands in for everything
+        #   else
+        # The list of media.Video objects on the (single) page, in the order
+        #   in which they are displayed; None when virtual mode is not in use
+        self.catalogue_virtual_list = None
+        # The index in self.catalogue_virtual_list of the first video which
+        #   has a catalogue item, and the index just after the last one
+        self.catalogue_virtual_start = 0
+        self.catalogue_virtual_stop = 0
+        # The estimated height of each row (in pixels), used to set the size
+        #   of the empty space. The estimate is updated whenever the rows are
+        #   resized, and is applied the next time catalogue items are
+        #   re-used
+        self.catalogue_virtual_row_height = 50
+        self.catalogue_virtual_measured_height = None
+        # The number of extra catalogue items to create above and below the
+        #   visible part of the Video Catalogue, so that small movements of
+        #   the scrollbar don't require any changes
+        self.catalogue_virtual_margin = 10
+        # When the Video Catalogue should be scrolled to a particular video,
+        #   as soon as Gtk has resized it, the index of that video in
+        #   self.catalogue_virtual_list; otherwise None
+        self.catalogue_virtual_scroll_index = None
+
         # The horizontal size of the grid (the number of gridboxes that can
         #   fit on a single row of the grid). This value is set automatically
         #   as the available space changes (for example, when the user resizes
@@ -1534,6 +1607,12 @@ class MainWin(Gtk.ApplicationWindow):
             'app.reset_container_menu',
         )
 
+        self.search_db_menu_item = Gtk.MenuItem.new_with_mnemonic(
+            _('Searc_h database...'),
+        )
+        media_sub_menu.append(self.search_db_menu_item)
+        self.search_db_menu_item.set_action_name('app.search_db_menu')
+
         # Separator
         media_sub_menu.append(Gtk.SeparatorMenuItem())
 
@@ -5400,6 +5479,7 @@ class MainWin(Gtk.ApplicationWindow):
 
         self.add_bulk_menu_item.set_sensitive(sens_flag)
         self.reset_container_menu_item.set_sensitive(sens_flag)
+        self.search_db_menu_item.set_sensitive(sens_flag)
 
         self.export_db_menu_item.set_sensitive(sens_flag)
         self.import_db_menu_item.set_sensitive(sens_flag)
@@ -6264,9 +6344,16 @@ class MainWin(Gtk.ApplicationWindow):
         if self.video_index_no_sort_flag:
             return -1
 
-        # Get the media data objects on both rows
-        obj1 = self.app_obj.media_reg_dict[treestore.get_value(row_iter1, 0)]
-        obj2 = self.app_obj.media_reg_dict[treestore.get_value(row_iter2, 0)]
+        # Get the media data objects on both rows (placeholder rows, which
+        #   are never visible, have no media data object)
+        dbid1 = treestore.get_value(row_iter1, 0)
+        dbid2 = treestore.get_value(row_iter2, 0)
+        if not dbid1 in self.app_obj.media_reg_dict \
+        or not dbid2 in self.app_obj.media_reg_dict:
+            return 0
+
+        obj1 = self.app_obj.media_reg_dict[dbid1]
+        obj2 = self.app_obj.media_reg_dict[dbid2]
 
         # Perform the sort
         # Treat media.Channel and media.Playlist objects as the same type of
@@ -6349,6 +6436,15 @@ class MainWin(Gtk.ApplicationWindow):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('mwn 6250 video_catalogue_generic_auto_sort')
 
+        # (The results of a database search are shown in order of ranking)
+        rank_dict = self.video_catalogue_rank_dict
+        if row1.video_obj.dbid in rank_dict \
+        and row2.video_obj.dbid in rank_dict:
+            if rank_dict[row1.video_obj.dbid] < rank_dict[row2.video_obj.dbid]:
+                return -1
+            else:
+                return 1
+
         return self.app_obj.video_compare(row1.video_obj, row2.video_obj)
 
 
@@ -6379,6 +6475,16 @@ class MainWin(Gtk.ApplicationWindow):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('mwn 6280 video_catalogue_grid_auto_sort')
 
+        # (The results of a database search are shown in order of ranking)
+        rank_dict = self.video_catalogue_rank_dict
+        if gridbox1.video_obj.dbid in rank_dict \
+        and gridbox2.video_obj.dbid in rank_dict:
+            if rank_dict[gridbox1.video_obj.dbid] \
+            < rank_dict[gridbox2.video_obj.dbid]:
+                return -1
+            else:
+                return 1
+
         return self.app_obj.video_compare(
             gridbox1.video_obj,
             gridbox2.video_obj,
@@ -10019,6 +10125,7 @@ class MainWin(Gtk.ApplicationWindow):
         self.video_index_current_dbid = None
         if self.video_index_treeview:
             self.video_index_row_dict = {}
+            self.video_index_placeholder_dict = {}
             # (Temporarily move key/value pairs in the 'current' IV into an
             #   'old' one; the subsequent call to self.video_index_populate()
             #   restores them)
@@ -10056,6 +10163,12 @@ class MainWin(Gtk.ApplicationWindow):
             'button-press-event',
             self.on_video_index_right_click,
         )
+        # (Create rows for child channels/playlists/folders, when their parent
+        #   is first expanded)
+        self.video_index_treeview.connect(
+            'test-expand-row',
+            self.on_video_index_test_expand_row,
+        )
 
         # Setup up drag and drop. Drag and drop within the Video Index
         #   (dragging one channel/playlist/folder) is handled by spotting the
@@ -10217,16 +10330,24 @@ class MainWin(Gtk.ApplicationWindow):
         self.video_index_treeview.show_all()
 
         # Update IVs. The calls to self.video_index_setup_row() will already
-        #   have repopulated self.video_index_marker_dict
+        #   have repopulated self.video_index_marker_dict for top-level rows;
+        #   markers for any other rows are restored when those rows are
+        #   created
+        for dbid in self.video_index_old_marker_dict:
+            if dbid in self.app_obj.container_reg_dict:
+                self.video_index_marker_dict[dbid] = None
+
         self.video_index_old_marker_dict = {}
 
 
     def video_index_setup_row(self, media_data_obj, parent_pointer=None):
 
-        """Called by self.video_index_populate(). Subsequently called by this
-        function recursively.
+        """Called by self.video_index_populate() and
+        .video_index_populate_children().
 
-        Adds a row to the Video Index.
+        Adds a row to the Video Index. Rows for any child channels, playlists
+        and folders are not added until this row is expanded; in the meantime,
+        a placeholder row is added.
 
         Args:
 
@@ -10299,13 +10420,125 @@ class MainWin(Gtk.ApplicationWindow):
         if media_data_obj.dbid in self.video_index_old_marker_dict:
             del self.video_index_old_marker_dict[media_data_obj.dbid]
 
-        # Call this function recursively for any child objects that are
-        #   channels, playlists or folders (videos are not displayed in the
-        #   Video Index)
+        # If there are any child objects that are channels, playlists or
+        #   folders (videos are not displayed in the Video Index), add a
+        #   placeholder row, so that this row can be expanded
+        for child_obj in media_data_obj.child_list:
+
+            if not isinstance(child_obj, media.Video) \
+            and (
+                not isinstance(child_obj, media.Folder) \
+                or not child_obj.hidden_flag
+            ):
+                placeholder_pointer = self.video_index_treestore.append(
+                    new_pointer,
+                    [
+                        -1,
+                        '',
+                        '',
+                        None,
+                        False,
+                        '',
+                        Pango.Style.NORMAL,
+                        Pango.Weight.NORMAL,
+                        Pango.Underline.NONE,
+                        False,
+                    ],
+                )
+
+                self.video_index_placeholder_dict[media_data_obj.dbid] \
+                = Gtk.TreeRowReference.new(
+                    self.video_index_treestore,
+                    self.video_index_treestore.get_path(placeholder_pointer),
+                )
+
+                break
+
+
+    def video_index_populate_children(self, media_data_obj):
+
+        """Called by self.on_video_index_test_expand_row(),
+        .video_index_realise_row() and .video_index_add_row().
+
+        If the specified media data object's row in the Video Index still has a
+        placeholder child row, replaces it with rows for the media data
+        object's child channels, playlists and folders.
+
+        Args:
+
+            media_data_obj (media.Channel, media.Playlist, media.Folder): The
+                media data object whose row has been (or is about to be)
+                expanded
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 10106 video_index_populate_children')
+
+        if not media_data_obj.dbid in self.video_index_placeholder_dict \
+        or not media_data_obj.dbid in self.video_index_row_dict:
+            return
+
+        placeholder_ref \
+        = self.video_index_placeholder_dict.pop(media_data_obj.dbid)
+
+        parent_ref = self.video_index_row_dict[media_data_obj.dbid]
+        parent_pointer = self.video_index_treestore.get_iter(
+            parent_ref.get_path(),
+        )
+
         for child_obj in media_data_obj.child_list:
+            if not isinstance(child_obj, media.Video):
+                self.video_index_setup_row(child_obj, parent_pointer)
+
+        # (Remove the placeholder last, so that the parent row is never
+        #   without children, which would collapse it)
+        if placeholder_ref.valid():
+            self.video_index_treestore.remove(
+                self.video_index_treestore.get_iter(
+                    placeholder_ref.get_path(),
+                ),
+            )
+
+
+    def video_index_realise_row(self, media_data_obj):
+
+        """Can be called by anything.
+
+        Makes sure that the specified media data object has a row in the Video
+        Index, creating rows for its ancestors' children, if necessary (as if
+        the user had expanded the ancestors' rows).
+
+        Args:
+
+            media_data_obj (media.Channel, media.Playlist, media.Folder): The
+                media data object whose row is required
+
+        Return values:
+
+            The row's Gtk.TreeRowReference, or None if the media data object
+                can't be shown in the Video Index (for example, because it's
+                in a hidden folder)
 
-            if not(isinstance(child_obj, media.Video)):
-                self.video_index_setup_row(child_obj, new_pointer)
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 10162 video_index_realise_row')
+
+        if media_data_obj.dbid in self.video_index_row_dict:
+            return self.video_index_row_dict[media_data_obj.dbid]
+
+        parent_obj = media_data_obj.parent_obj
+        if parent_obj is None \
+        or self.video_index_realise_row(parent_obj) is None:
+            return None
+
+        self.video_index_populate_children(parent_obj)
+
+        if media_data_obj.dbid in self.video_index_row_dict:
+            return self.video_index_row_dict[media_data_obj.dbid]
+        else:
+            return None
 
 
     def video_index_add_row(self, media_data_obj, no_select_flag=False):
@@ -10331,93 +10564,42 @@ class MainWin(Gtk.ApplicationWindow):
         if media_data_obj.is_hidden():
             return
 
-        # Prepare the icon
-        pixbuf = self.video_index_get_icon(media_data_obj)
-        if not pixbuf:
-            return self.app_obj.system_error(
-                209,
-                'Video Index setup row request failed sanity check',
-            )
-
-        # Prepare the text style
-        style, weight, underline, strike \
-        = self.video_index_get_text_properties(media_data_obj)
-
-        # Prepare the marker
-        if not media_data_obj.dbid in self.video_index_marker_dict \
-        and not media_data_obj.dbid in self.video_index_old_marker_dict:
-            marker_flag = False
-        else:
-            marker_flag = True
-
-        # Add a row to the treeview
         if media_data_obj.parent_obj:
 
             # This media data object has a parent, so we add a row inside the
             #   parent's row
-
-            # Fetch the treeview reference to the parent media data object...
+            # If the parent's row has never been expanded, rows for its
+            #   children are created now (including a row for this media data
+            #   object, which has already been added to the parent)
             parent_ref \
-            = self.video_index_row_dict[media_data_obj.parent_obj.dbid]
-            # ...and add the new object inside its parent
-            tree_iter = self.video_index_treestore.get_iter(
-                parent_ref.get_path(),
-            )
+            = self.video_index_realise_row(media_data_obj.parent_obj)
+            if parent_ref is None:
+                return self.app_obj.system_error(
+                    209,
+                    'Video Index setup row request failed sanity check',
+                )
 
-            new_pointer = self.video_index_treestore.append(
-                tree_iter,
-                [
-                    media_data_obj.dbid,
-                    media_data_obj.name,
-                    media_data_obj.fetch_tooltip_text(
-                        self.app_obj,
-                        self.tooltip_max_len,
+            self.video_index_populate_children(media_data_obj.parent_obj)
+
+            if not media_data_obj.dbid in self.video_index_row_dict:
+                self.video_index_setup_row(
+                    media_data_obj,
+                    self.video_index_treestore.get_iter(
+                        parent_ref.get_path(),
                     ),
-                    pixbuf,
-                    marker_flag,
-                    self.video_index_get_text(media_data_obj),
-                    style,
-                    weight,
-                    underline,
-                    strike,
-                ],
-            )
+                )
 
-        else:
+        elif not media_data_obj.dbid in self.video_index_row_dict:
 
             # The media data object has no parent, so add a row to the
             #   treeview's top level
-            new_pointer = self.video_index_treestore.append(
-                None,
-                [
-                    media_data_obj.dbid,
-                    media_data_obj.name,
-                    media_data_obj.fetch_tooltip_text(
-                        self.app_obj,
-                        self.tooltip_max_len,
-                    ),
-                    pixbuf,
-                    marker_flag,
-                    self.video_index_get_text(media_data_obj),
-                    style,
-                    weight,
-                    underline,
-                    strike,
-                ],
-            )
+            self.video_index_setup_row(media_data_obj, None)
 
-        # Create a reference to the row, so we can find it later
-        tree_ref = Gtk.TreeRowReference.new(
-            self.video_index_treestore,
-            self.video_index_treestore.get_path(new_pointer),
-        )
+        if not media_data_obj.dbid in self.video_index_row_dict:
+            # (Error already shown)
+            return
 
-        # Update IVs
-        self.video_index_row_dict[media_data_obj.dbid] = tree_ref
-        if media_data_obj.dbid in self.video_index_marker_dict:
-            self.video_index_marker_dict[media_data_obj.dbid] = tree_ref
-        if media_data_obj.dbid in self.video_index_old_marker_dict:
-            del self.video_index_old_marker_dict[media_data_obj.dbid]
+        tree_ref = self.video_index_row_dict[media_data_obj.dbid]
 
         if media_data_obj.parent_obj:
 
@@ -10464,12 +10646,24 @@ class MainWin(Gtk.ApplicationWindow):
                 'Video Index delete row request failed sanity check',
             )
 
+        # If no row has been created for the media data object yet (because
+        #   its parent has never been expanded), there's no row to remove
+        if not media_data_obj.dbid in self.video_index_row_dict:
+
+            if media_data_obj.dbid in self.video_index_marker_dict:
+                del self.video_index_marker_dict[media_data_obj.dbid]
+
+            return
+
         # During this procedure, ignore any changes to the selected row (i.e.
         #   don't allow self.on_video_index_selection_changed() to redraw the
         #   catalogue)
         self.ignore_video_index_select_flag = True
 
-        # Remove the treeview row
+        # Remove the treeview row (and its placeholder child row, if any)
+        if media_data_obj.dbid in self.video_index_placeholder_dict:
+            del self.video_index_placeholder_dict[media_data_obj.dbid]
+
         tree_ref = self.video_index_row_dict[media_data_obj.dbid]
         tree_path = tree_ref.get_path()
         tree_iter = self.video_index_treestore.get_iter(tree_path)
@@ -10522,6 +10716,11 @@ class MainWin(Gtk.ApplicationWindow):
                 'Video Index select row request failed sanity check',
             )
 
+        # Make sure the row exists (it might not, if its parent has never been
+        #   expanded)
+        if self.video_index_realise_row(media_data_obj) is None:
+            return
+
         # Select the row, expanding the treeview path to make it visible, if
         #   necessary
         if media_data_obj.parent_obj:
@@ -10582,6 +10781,14 @@ class MainWin(Gtk.ApplicationWindow):
         and media_data_obj.hidden_flag:
             return
 
+        # If no row has been created for media_data_obj yet (because its
+        #   parent has never been expanded), then there's nothing to update;
+        #   the row will be up to date, when it is created
+        if not media_data_obj.dbid in self.video_index_row_dict \
+        and media_data_obj.dbid in self.app_obj.container_reg_dict \
+        and media_data_obj.parent_obj is not None:
+            return
+
         # !!! DEBUG Git #523
         try:
             # Update the treeview row
@@ -10637,6 +10844,14 @@ class MainWin(Gtk.ApplicationWindow):
         and media_data_obj.hidden_flag:
             return
 
+        # If no row has been created for media_data_obj yet (because its
+        #   parent has never been expanded), then there's nothing to update;
+        #   the row will be up to date, when it is created
+        if not media_data_obj.dbid in self.video_index_row_dict \
+        and media_data_obj.dbid in self.app_obj.container_reg_dict \
+        and media_data_obj.parent_obj is not None:
+            return
+
         # !!! DEBUG Git #523
         try:
             # Update the treeview row
@@ -10699,6 +10914,14 @@ class MainWin(Gtk.ApplicationWindow):
         and media_data_obj.hidden_flag:
             return
 
+        # If no row has been created for media_data_obj yet (because its
+        #   parent has never been expanded), then there's nothing to update;
+        #   the row will be up to date, when it is created
+        if not media_data_obj.dbid in self.video_index_row_dict \
+        and media_data_obj.dbid in self.app_obj.container_reg_dict \
+        and media_data_obj.parent_obj is not None:
+            return
+
         # !!! DEBUG Git #523
         try:
             # Update the treeview row
@@ -10752,6 +10975,17 @@ class MainWin(Gtk.ApplicationWindow):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('mwn 10538 video_index_get_icon')
 
+        # Use the cached icon name, if neither the media data object nor
+        #   anything else that affects the icon has changed
+        signature = (
+            self.app_obj.show_small_icons_in_index_flag,
+            media_data_obj.dbid in self.app_obj.container_unavailable_dict,
+        )
+
+        icon = media_data_obj.get_render_cache('index_icon', signature)
+        if icon is not None:
+            return self.pixbuf_dict.get(icon)
+
         icon = None
         if not self.app_obj.show_small_icons_in_index_flag:
 
@@ -10807,7 +11041,10 @@ class MainWin(Gtk.ApplicationWindow):
                     icon = 'folder_small'
 
         if icon is not None and icon in self.icon_dict:
+
+            media_data_obj.set_render_cache('index_icon', signature, icon)
             return self.pixbuf_dict[icon]
+
         else:
             # Invalid 'icon', or file not found
             return None
@@ -10835,6 +11072,18 @@ class MainWin(Gtk.ApplicationWindow):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('mwn 10621 video_index_get_text')
 
+        # Use the cached text, if neither the media data object (for example,
+        #   the number of videos it contains) nor the Video Index's own
+        #   settings have changed
+        signature = (
+            self.short_string_max_len,
+            self.app_obj.complex_index_flag,
+        )
+
+        text = media_data_obj.get_render_cache('index_text', signature)
+        if text is not None:
+            return text
+
         text = ttutils.shorten_string(
             media_data_obj.nickname,
             self.short_string_max_len,
@@ -10877,6 +11126,7 @@ class MainWin(Gtk.ApplicationWindow):
                 text += _('E:') + str(len(media_data_obj.error_list)) \
                 + ' ' + _('W:') + str(len(media_data_obj.warning_list))
 
+        media_data_obj.set_render_cache('index_text', signature, text)
         return text
 
 
@@ -10908,6 +11158,16 @@ class MainWin(Gtk.ApplicationWindow):
         if DEBUG_FUNC_FLAG:
             ttutils.debug_time('mwn 10694 video_index_get_text_properties')
 
+        # Use the cached properties, if nothing that affects them has changed
+        signature = (
+            self.app_obj.show_small_icons_in_index_flag,
+            media_data_obj.dbid in self.app_obj.container_unavailable_dict,
+        )
+
+        prop_tuple = media_data_obj.get_render_cache('index_props', signature)
+        if prop_tuple is not None:
+            return prop_tuple
+
         style = Pango.Style.NORMAL
         weight = Pango.Weight.NORMAL
         underline = Pango.Underline.NONE
@@ -10944,7 +11204,10 @@ class MainWin(Gtk.ApplicationWindow):
                 elif media_data_obj.dl_sim_flag:
                     style = Pango.Style.ITALIC
 
-        return style, weight, underline, strike
+        prop_tuple = (style, weight, underline, strike)
+        media_data_obj.set_render_cache('index_props', signature, prop_tuple)
+
+        return prop_tuple
 
 
     def video_index_set_marker(self, dbid=None):
@@ -10969,8 +11232,11 @@ class MainWin(Gtk.ApplicationWindow):
         container_list = []
         if dbid is None:
 
-            # Set all markers in the Video Index
-            container_list = list(self.video_index_row_dict.keys())
+            # Set all markers in the Video Index (including markers for rows
+            #   that haven't been created yet)
+            for this_dbid in self.app_obj.container_reg_dict.keys():
+                if not self.app_obj.media_reg_dict[this_dbid].is_hidden():
+                    container_list.append(this_dbid)
 
         else:
 
@@ -10989,14 +11255,21 @@ class MainWin(Gtk.ApplicationWindow):
                 or not media_data_obj.priv_flag
             ) and not media_data_obj.dl_disable_flag:
 
-                tree_ref = self.video_index_row_dict[this_dbid]
-                model = tree_ref.get_model()
-                tree_path = tree_ref.get_path()
-                tree_iter = model.get_iter(tree_path)
+                if not this_dbid in self.video_index_row_dict:
+
+                    # The marker is set when the row is created
+                    self.video_index_marker_dict[this_dbid] = None
 
-                model.set(tree_iter, 4, True)
+                else:
+
+                    tree_ref = self.video_index_row_dict[this_dbid]
+                    model = tree_ref.get_model()
+                    tree_path = tree_ref.get_path()
+                    tree_iter = model.get_iter(tree_path)
 
-                self.video_index_marker_dict[this_dbid] = tree_ref
+                    model.set(tree_iter, 4, True)
+
+                    self.video_index_marker_dict[this_dbid] = tree_ref
 
         if not old_size and self.video_index_marker_dict:
             # Update labels on the 'Check all' button, etc
@@ -11042,13 +11315,16 @@ class MainWin(Gtk.ApplicationWindow):
             #   folder
 
             # !!! DEBUG GIT #558
+            # (If no row has been created for the channel/playlist/folder yet,
+            #   there's no marker to reset in the treeview)
             try:
-                tree_ref = self.video_index_row_dict[dbid]
-                model = tree_ref.get_model()
-                tree_path = tree_ref.get_path()
-                tree_iter = model.get_iter(tree_path)
+                if self.video_index_marker_dict.get(dbid, True) is not None:
+                    tree_ref = self.video_index_row_dict[dbid]
+                    model = tree_ref.get_model()
+                    tree_path = tree_ref.get_path()
+                    tree_iter = model.get_iter(tree_path)
 
-                model.set(tree_iter, 4, False)
+                    model.set(tree_iter, 4, False)
 
             except:
                 return self.app_obj.system_error(
@@ -11090,8 +11366,18 @@ class MainWin(Gtk.ApplicationWindow):
         # Reset IVs (when called by anything)
         self.video_catalogue_dict = {}
         self.video_catalogue_temp_list = []
+        self.video_catalogue_draw_signature = None
+        self.video_catalogue_signature_dict = {}
         self.catalogue_listbox = None
+        self.catalogue_virtual_vbox = None
+        self.catalogue_virtual_top_box = None
+        self.catalogue_virtual_bottom_box = None
         self.catalogue_grid = None
+        self.catalogue_virtual_list = None
+        self.catalogue_virtual_start = 0
+        self.catalogue_virtual_stop = 0
+        self.catalogue_virtual_measured_height = None
+        self.catalogue_virtual_scroll_index = None
         self.catalogue_grid_expand_flag = False
         # (self.catalogue_grid_column_count is not set here)
         self.catalogue_grid_row_count = 1
@@ -11108,7 +11394,6 @@ class MainWin(Gtk.ApplicationWindow):
             )
 
             self.catalogue_listbox = Gtk.ListBox()
-            self.catalogue_scrolled.add(self.catalogue_listbox)
             self.catalogue_listbox.set_can_focus(False)
             self.catalogue_listbox.set_selection_mode(
                 Gtk.SelectionMode.MULTIPLE,
@@ -11126,6 +11411,60 @@ class MainWin(Gtk.ApplicationWindow):
                 False,
             )
 
+            if not self.app_obj.catalogue_virtual_flag:
+
+                self.catalogue_scrolled.add(self.catalogue_listbox)
+
+            else:
+
+                # In virtual mode, the listbox only contains rows near the
+                #   visible part of the Video Catalogue. Empty boxes above and
+                #   below it take up the space that the other rows would use
+                self.catalogue_virtual_list = []
+
+                self.catalogue_virtual_vbox = Gtk.Box(
+                    orientation=Gtk.Orientation.VERTICAL,
+                    spacing=0,
+                )
+                self.catalogue_scrolled.add(self.catalogue_virtual_vbox)
+
+                self.catalogue_virtual_top_box = Gtk.Box()
+                self.catalogue_virtual_vbox.pack_start(
+                    self.catalogue_virtual_top_box,
+                    False,
+                    False,
+                    0,
+                )
+
+                self.catalogue_virtual_vbox.pack_start(
+                    self.catalogue_listbox,
+                    False,
+                    False,
+                    0,
+                )
+
+                self.catalogue_virtual_bottom_box = Gtk.Box()
+                self.catalogue_virtual_vbox.pack_start(
+                    self.catalogue_virtual_bottom_box,
+                    False,
+                    False,
+                    0,
+                )
+
+                adjust = self.catalogue_scrolled.get_vadjustment()
+                adjust.connect(
+                    'value-changed',
+                    self.on_video_catalogue_virtual_scroll,
+                )
+                adjust.connect(
+                    'changed',
+                    self.on_video_catalogue_virtual_scroll,
+                )
+                self.catalogue_listbox.connect(
+                    'size-allocate',
+                    self.on_video_catalogue_virtual_size_allocate,
+                )
+
         else:
 
             # (No horizontal scrolling in grid mode)
@@ -11174,11 +11513,19 @@ class MainWin(Gtk.ApplicationWindow):
         drawn. If mainapp.TartubeApp.catalogue_page_size is set to zero, all
         videos are drawn on a single page.
 
+        In virtual mode (see the comments in self.__init__()), all videos are
+        on a single page, but catalogue items are only created for the videos
+        that are visible, or nearly visible. Those catalogue items are re-used
+        as the user scrolls, by self.video_catalogue_virtual_update().
+
         If a filter has been applied, only videos matching the search text
         are visible in the catalogue.
 
         This function clears the previous contents of the Gtk.ListBox/Gtk.Grid
-        and resets IVs.
+        and resets IVs. (If the same channel/playlist/folder is still visible,
+        and no settings have changed, then
+        self.video_catalogue_redraw_changes() is called instead, which updates
+        only the rows/gridboxes that have changed.)
 
         Then, it adds new rows to the Gtk.ListBox, or new gridboxes to the
         Gtk.Grid, and creates a new mainwin.SimpleCatalogueItem,
@@ -11241,9 +11588,25 @@ class MainWin(Gtk.ApplicationWindow):
         #   container's children every time the Video Catalogue is redrawn
         container_obj.sort_children(self.app_obj)
 
-        # Reset the previous contents of the Video Catalogue, if any, and reset
-        #   IVs
-        self.video_catalogue_reset()
+        # If the Video Catalogue is already showing this channel/playlist/
+        #   folder, and no settings have changed, then there's no need to
+        #   replace every row/gridbox
+        draw_signature = self.video_catalogue_get_draw_signature(dbid)
+        if draw_signature == self.video_catalogue_draw_signature \
+        and (
+            self.catalogue_listbox is not None \
+            or self.catalogue_grid is not None
+        ):
+            changes_flag = True
+
+        else:
+
+            changes_flag = False
+            # Reset the previous contents of the Video Catalogue, if any, and
+            #   reset IVs
+            self.video_catalogue_reset()
+            self.video_catalogue_draw_signature = draw_signature
+
         # Temporarily reset widgets in the Video Catalogue toolbar (in case
         #   something goes wrong, or in case drawing the page takes a long
         #   time)
@@ -11255,6 +11618,7 @@ class MainWin(Gtk.ApplicationWindow):
         if not no_cancel_filter_flag:
             self.video_catalogue_filtered_flag = False
             self.video_catalogue_filtered_list = []
+            self.video_catalogue_rank_dict = {}
 
         # The selected media data object has any number of child media data
         #   objects, but this function is only interested in those that are
@@ -11270,7 +11634,48 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             child_list = container_obj.get_visible_videos(self.app_obj)
 
-        for child_obj in child_list:
+        if changes_flag:
+
+            # Update only the rows/gridboxes that have changed
+            if self.catalogue_virtual_list is not None:
+                page_num = 1
+
+            video_count = self.video_catalogue_redraw_changes(
+                child_list,
+                page_num,
+            )
+
+            self.video_catalogue_toolbar_update(page_num, video_count)
+
+            if reset_scroll_flag:
+                self.catalogue_scrolled.get_vadjustment().set_value(0)
+
+            return
+
+        if self.catalogue_virtual_list is not None:
+
+            # In virtual mode, all videos are on a single page, but catalogue
+            #   items are only created for the visible ones
+            page_num = 1
+            self.catalogue_virtual_list = [
+                child_obj for child_obj in child_list \
+                if isinstance(child_obj, media.Video)
+            ]
+
+            video_count = len(self.catalogue_virtual_list)
+            self.catalogue_virtual_row_height \
+            = self.video_catalogue_virtual_default_height()
+            self.video_catalogue_virtual_update(True)
+
+            # (Catalogue items are created below for all videos in this list,
+            #   which in virtual mode is none of them)
+            draw_list = []
+
+        else:
+
+            draw_list = child_list
+
+        for child_obj in draw_list:
             if isinstance(child_obj, media.Video):
 
                 # (We need the number of child videos when we update widgets in
@@ -11313,7 +11718,7 @@ class MainWin(Gtk.ApplicationWindow):
                     # Populate the row with widgets...
                     catalogue_item_obj.draw_widgets(wrapper_obj)
                     # ...and give them their initial appearance
-                    catalogue_item_obj.update_widgets()
+                    self.video_catalogue_update_item(catalogue_item_obj, True)
 
                 else:
 
@@ -11338,7 +11743,7 @@ class MainWin(Gtk.ApplicationWindow):
                     # Populate the gridbox with widgets...
                     catalogue_item_obj.draw_widgets(wrapper_obj)
                     # ...and give them their initial appearance
-                    catalogue_item_obj.update_widgets()
+                    self.video_catalogue_update_item(catalogue_item_obj, True)
 
                     # Gridboxes could be made (un)expandable, depending on the
                     #   number of gridboxes now on the grid
@@ -11348,6 +11753,35 @@ class MainWin(Gtk.ApplicationWindow):
         #   videos
         self.video_catalogue_toolbar_update(page_num, video_count)
 
+        # Add scaled copies of the thumbnails for all videos (not just the
+        #   ones on this page) to the persistent cache, in the background, so
+        #   that other pages can be drawn quickly. Start with the videos on
+        #   this page, then the pages after it
+        if self.app_obj.catalogue_mode_type != 'simple':
+
+            if self.app_obj.catalogue_mode_type == 'complex':
+                thumb_size = 'tiny'
+            else:
+                thumb_size = self.app_obj.thumb_size_custom
+
+            video_list = [
+                child_obj for child_obj in child_list \
+                if isinstance(child_obj, media.Video)
+            ]
+
+            if self.catalogue_virtual_list is not None:
+                start = self.catalogue_virtual_start
+                video_list = video_list[start:] + video_list[:start]
+            elif page_size:
+                start = (page_num - 1) * page_size
+                video_list = video_list[start:] + video_list[:start]
+
+            self.app_obj.file_manager_obj.fill_thumb_cache(
+                self.app_obj,
+                video_list,
+                [ self.app_obj.thumb_size_dict[thumb_size] ],
+            )
+
         # In all cases, sensitise some of the toolbar buttons
         self.catalogue_scroll_up_button.set_sensitive(True)
         self.catalogue_scroll_down_button.set_sensitive(True)
@@ -11363,6 +11797,295 @@ class MainWin(Gtk.ApplicationWindow):
             self.catalogue_grid.show_all()
 
 
+    def video_catalogue_redraw_changes(self, child_list, page_num):
+
+        """Called by self.video_catalogue_redraw_all().
+
+        When the Video Catalogue is redrawn, but is still showing the same
+        channel, playlist or folder (for example, after the sort order
+        changes, or after a filter is applied), updates only the rows/
+        gridboxes that have changed, rather than replacing all of them.
+
+        Rows/gridboxes for videos that are no longer on the page are removed,
+        and new ones are created for videos that have been added to it. Rows/
+        gridboxes are then moved into the correct order. Widgets for the
+        remaining videos are only updated if the video itself has changed.
+
+        Args:
+
+            child_list (list): The channel, playlist or folder's visible child
+                objects (or the videos matching the filter, if applied)
+
+            page_num (int): The number of the page to be drawn
+
+        Return values:
+
+            The number of videos in 'child_list'
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 11175 video_catalogue_redraw_changes')
+
+        video_list = [
+            child_obj for child_obj in child_list \
+            if isinstance(child_obj, media.Video)
+        ]
+
+        video_count = len(video_list)
+
+        # In virtual mode, catalogue items only exist for visible videos, and
+        #   are handled by their own function
+        if self.catalogue_virtual_list is not None:
+
+            self.catalogue_virtual_list = video_list
+            self.video_catalogue_virtual_update(True)
+
+            return video_count
+
+        # Get the videos which should be visible on this page
+        page_size = self.app_obj.catalogue_page_size
+        if page_size:
+            page_list = video_list[
+                ((page_num - 1) * page_size):(page_num * page_size)
+            ]
+        else:
+            page_list = video_list
+
+        page_dict = {}
+        for video_obj in page_list:
+            page_dict[video_obj.dbid] = video_obj
+
+        # Remove any catalogue items for videos that are no longer on the page
+        for dbid in list(self.video_catalogue_dict.keys()):
+
+            if not dbid in page_dict:
+
+                catalogue_item_obj = self.video_catalogue_dict.pop(dbid)
+                self.video_catalogue_signature_dict.pop(dbid, None)
+
+                if self.app_obj.catalogue_mode_type != 'grid':
+                    self.catalogue_listbox.remove(
+                        catalogue_item_obj.catalogue_row,
+                    )
+                else:
+                    self.catalogue_grid.remove(
+                        catalogue_item_obj.catalogue_gridbox,
+                    )
+
+        # Add catalogue items for videos that are new to the page, and update
+        #   the remaining ones (but only if the video has changed)
+        for video_obj in page_list:
+
+            if video_obj.dbid in self.video_catalogue_dict:
+                self.video_catalogue_update_item(
+                    self.video_catalogue_dict[video_obj.dbid],
+                )
+            else:
+                self.video_catalogue_insert_video(video_obj)
+
+        # Move rows/gridboxes into the correct order
+        if self.app_obj.catalogue_mode_type != 'grid':
+
+            self.catalogue_listbox.invalidate_sort()
+            self.catalogue_listbox.show_all()
+
+        else:
+
+            # Only gridboxes whose position has changed are moved
+            self.catalogue_grid_row_count = 1
+            for index, video_obj in enumerate(page_list):
+
+                wrapper_obj \
+                = self.video_catalogue_dict[video_obj.dbid].catalogue_gridbox
+                y_pos = int(index / self.catalogue_grid_column_count)
+                x_pos = index % self.catalogue_grid_column_count
+
+                if wrapper_obj.x_pos != x_pos or wrapper_obj.y_pos != y_pos:
+
+                    self.catalogue_grid.remove(wrapper_obj)
+                    self.video_catalogue_grid_attach_gridbox(
+                        wrapper_obj,
+                        x_pos,
+                        y_pos,
+                    )
+
+                elif self.catalogue_grid_row_count < (y_pos + 1):
+
+                    self.catalogue_grid_row_count = y_pos + 1
+
+            # Gridboxes could be made (un)expandable, depending on the number
+            #   of gridboxes now on the grid
+            self.video_catalogue_grid_check_expand()
+            self.catalogue_grid.show_all()
+
+        return video_count
+
+
+    def video_catalogue_get_draw_signature(self, dbid):
+
+        """Called by self.video_catalogue_redraw_all().
+
+        Returns a tuple of values which affect how rows/gridboxes in the Video
+        Catalogue are drawn. If any of them have changed since the last
+        complete redraw, then the Video Catalogue must be redrawn completely
+        again.
+
+        Args:
+
+            dbid (int): The .dbid of the channel, playlist or folder to be
+                drawn
+
+        Return values:
+
+            The tuple described above
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 11176 video_catalogue_get_draw_signature')
+
+        app_obj = self.app_obj
+
+        return (
+            dbid,
+            app_obj.catalogue_mode,
+            app_obj.catalogue_mode_type,
+            app_obj.catalogue_virtual_flag,
+            app_obj.thumb_size_custom,
+            app_obj.catalogue_draw_frame_flag,
+            app_obj.catalogue_draw_icons_flag,
+            app_obj.catalogue_clickable_container_flag,
+            app_obj.livestream_use_colour_flag,
+            app_obj.livestream_simple_colour_flag,
+            str(app_obj.custom_bg_table),
+        )
+
+
+    def video_catalogue_get_video_signature(self, video_obj):
+
+        """Called by self.video_catalogue_update_item().
+
+        Returns a tuple of values which affect the widgets displayed for a
+        video in the Video Catalogue. If none of them have changed since the
+        widgets were last updated, there's no need to update them again.
+
+        Args:
+
+            video_obj (media.Video): The video to check
+
+        Return values:
+
+            The tuple described above
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 11177 video_catalogue_get_video_signature')
+
+        app_obj = self.app_obj
+        dbid = video_obj.dbid
+
+        if video_obj.parent_obj is not None \
+        and video_obj.parent_obj.dbid in app_obj.container_unavailable_dict:
+            unavailable_flag = True
+        else:
+            unavailable_flag = False
+
+        # A thumbnail might be downloaded (or deleted) without the video itself
+        #   changing. (The thumbnail is not visible in simple mode; the
+        #   directory listings used by ttutils.find_thumbnail() are cached, so
+        #   this is quick)
+        if app_obj.catalogue_mode_type != 'simple' and video_obj.file_name:
+            thumb_path = ttutils.find_thumbnail(app_obj, video_obj, True)
+        else:
+            thumb_path = None
+
+        return (
+            video_obj.name,
+            video_obj.nickname,
+            video_obj.file_name,
+            thumb_path,
+            video_obj.source,
+            video_obj.descrip,
+            video_obj.short,
+            video_obj.duration,
+            video_obj.file_size,
+            video_obj.upload_time,
+            video_obj.receive_time,
+            video_obj.dl_flag,
+            video_obj.dl_sim_flag,
+            video_obj.archive_flag,
+            video_obj.block_flag,
+            video_obj.bookmark_flag,
+            video_obj.fav_flag,
+            video_obj.missing_flag,
+            video_obj.new_flag,
+            video_obj.waiting_flag,
+            video_obj.split_flag,
+            video_obj.live_mode,
+            video_obj.live_debut_flag,
+            video_obj.live_msg,
+            video_obj.was_live_flag,
+            video_obj.options_obj is not None,
+            video_obj.parent_obj,
+            video_obj.orig_parent_obj,
+            len(video_obj.comment_list),
+            len(video_obj.error_list),
+            len(video_obj.warning_list),
+            len(video_obj.slice_list),
+            len(video_obj.stamp_list),
+            len(video_obj.subs_list),
+            unavailable_flag,
+            dbid in app_obj.media_reg_auto_alarm_dict,
+            dbid in app_obj.media_reg_auto_dl_start_dict,
+            dbid in app_obj.media_reg_auto_dl_stop_dict,
+            dbid in app_obj.media_reg_auto_notify_dict,
+            dbid in app_obj.media_reg_auto_open_dict,
+            app_obj.catalogue_sort_mode,
+            app_obj.catalogue_show_nickname_flag,
+            app_obj.show_pretty_dates_flag,
+            app_obj.show_tooltips_flag,
+            # ('Today' and 'yesterday' change at midnight)
+            datetime.date.today(),
+        )
+
+
+    def video_catalogue_update_item(self, catalogue_item_obj,
+    force_flag=False):
+
+        """Can be called by anything.
+
+        Updates the widgets for a catalogue item, but only if its video has
+        changed since the last update.
+
+        Args:
+
+            catalogue_item_obj (mainwin.SimpleCatalogueItem,
+                mainwin.ComplexCatalogueItem or mainwin.GridCatalogueItem): The
+                catalogue item to update
+
+            force_flag (bool): True if the widgets should be updated, even if
+                the video has not changed (for example, because the widgets
+                have just been created)
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 11178 video_catalogue_update_item')
+
+        signature = self.video_catalogue_get_video_signature(
+            catalogue_item_obj.video_obj,
+        )
+
+        if force_flag \
+        or self.video_catalogue_signature_dict.get(catalogue_item_obj.dbid) \
+        != signature:
+            catalogue_item_obj.update_widgets()
+            self.video_catalogue_signature_dict[catalogue_item_obj.dbid] \
+            = signature
+
+
     def video_catalogue_update_video(self, video_obj):
 
         """Can be called by anything.
@@ -11423,7 +12146,7 @@ class MainWin(Gtk.ApplicationWindow):
             ) or (
                 self.video_index_current_dbid \
                 == app_obj.fixed_recent_folder.dbid
-                and video_obj in app_obj.fixed_recent_folder.child_list
+                and app_obj.fixed_recent_folder.check_child(video_obj)
             ) or (
                 self.video_index_current_dbid \
                 == app_obj.fixed_waiting_folder.dbid \
@@ -11442,7 +12165,7 @@ class MainWin(Gtk.ApplicationWindow):
             # Update the catalogue item object, which updates the widgets in
             #   the Gtk.ListBox/Gtk.Grid
             catalogue_item_obj = self.video_catalogue_dict[video_obj.dbid]
-            catalogue_item_obj.update_widgets()
+            self.video_catalogue_update_item(catalogue_item_obj, True)
 
         # Now, deal with the video's position in the catalogue. If a catalogue
         #   item object already existed, its position may have changed
@@ -11494,6 +12217,16 @@ class MainWin(Gtk.ApplicationWindow):
 
         sibling_video_count = len(sibling_video_list)
 
+        # In virtual mode, there is only one page, and catalogue items are
+        #   re-used for whichever videos are now visible
+        if self.catalogue_virtual_list is not None:
+
+            self.catalogue_virtual_list = sibling_video_list
+            self.video_catalogue_toolbar_update(1, sibling_video_count)
+            self.video_catalogue_virtual_update(True)
+
+            return
+
         # Decide whether to move any catalogue items from this page and, if so,
         #   what (if anything) should be moved into their place
         # If a catalogue item was already visible for this video, then the
@@ -11548,6 +12281,7 @@ class MainWin(Gtk.ApplicationWindow):
                     )
 
                 del self.video_catalogue_dict[dbid]
+                self.video_catalogue_signature_dict.pop(dbid, None)
 
             # Add any new catalogue items for videos which should be
             #   visible, but aren't
@@ -11633,7 +12367,7 @@ class MainWin(Gtk.ApplicationWindow):
             # Populate the row with widgets...
             catalogue_item_obj.draw_widgets(wrapper_obj)
             # ...and give them their initial appearance
-            catalogue_item_obj.update_widgets()
+            self.video_catalogue_update_item(catalogue_item_obj, True)
 
         else:
 
@@ -11656,7 +12390,7 @@ class MainWin(Gtk.ApplicationWindow):
             # Populate the gridbox with widgets...
             catalogue_item_obj.draw_widgets(wrapper_obj)
             # ...and give them their initial appearance
-            catalogue_item_obj.update_widgets()
+            self.video_catalogue_update_item(catalogue_item_obj, True)
 
             # Gridboxes could be made (un)expandable, depending on the number
             #   of gridboxes now on the grid, and the number of columns allowed
@@ -11747,7 +12481,7 @@ class MainWin(Gtk.ApplicationWindow):
             or not video_obj.new_flag
         ) and (
             self.video_index_current_dbid != app_obj.fixed_recent_folder.dbid \
-            or video_obj in app_obj.fixed_recent_folder.child_list
+            or app_obj.fixed_recent_folder.check_child(video_obj)
         ) and (
             self.video_index_current_dbid \
             != app_obj.fixed_waiting_folder.dbid \
@@ -11755,6 +12489,22 @@ class MainWin(Gtk.ApplicationWindow):
         ):
             return
 
+        # In virtual mode, remove the video from the (single) page, and re-use
+        #   its catalogue item (if any) for another video
+        if self.catalogue_virtual_list is not None:
+
+            if video_obj in self.catalogue_virtual_list:
+                self.catalogue_virtual_list.remove(video_obj)
+
+            self.video_catalogue_toolbar_update(
+                1,
+                len(self.catalogue_virtual_list),
+            )
+
+            self.video_catalogue_virtual_update(True)
+
+            return
+
         # Does a mainwin.SimpleCatalogueItem, mainwin.ComplexCatalogueItem or
         #   mainwin.GridCatalogueItem object exist for this video?
         if video_obj.dbid in self.video_catalogue_dict:
@@ -11779,6 +12529,7 @@ class MainWin(Gtk.ApplicationWindow):
 
             # Update IVs
             del self.video_catalogue_dict[video_obj.dbid]
+            self.video_catalogue_signature_dict.pop(video_obj.dbid, None)
 
             # If the current page is not the last one, we can create a new
             #   catalogue item to replace the removed one
@@ -11822,11 +12573,7 @@ class MainWin(Gtk.ApplicationWindow):
 
                 # Create the new catalogue item
                 if insert_obj:
-                    GObject.timeout_add(
-                        0,
-                        self.video_catalogue_update_video,
-                        insert_obj,
-                    )
+                    self.app_obj.schedule_catalogue_video(insert_obj)
 
             else:
 
@@ -12577,6 +13324,199 @@ class MainWin(Gtk.ApplicationWindow):
                 )
 
 
+    def video_catalogue_virtual_default_height(self):
+
+        """Called by self.video_catalogue_redraw_all().
+
+        In virtual mode, returns an initial estimate of the height of each row
+        in the Video Catalogue, which is used until the real rows have been
+        measured.
+
+        Return values:
+
+            The estimated height, in pixels
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time(
+                'mwn 12165 video_catalogue_virtual_default_height',
+            )
+
+        if self.app_obj.catalogue_mode_type == 'simple':
+            return 50
+        else:
+            return self.app_obj.thumb_size_dict['tiny'][1] \
+            + (self.spacing_size * 4)
+
+
+    def video_catalogue_virtual_update(self, force_flag=False):
+
+        """Called by self.video_catalogue_redraw_all(),
+        .video_catalogue_update_video(), .video_catalogue_delete_video() and
+        .on_video_catalogue_virtual_scroll().
+
+        In virtual mode, makes sure that catalogue items exist for all videos
+        in the visible part of the Video Catalogue (plus a margin above and
+        below).
+
+        Catalogue items for videos that are no longer close to the visible
+        part are re-used, if possible, rather than creating new ones. The
+        empty space above and below the catalogue items is resized to match.
+
+        Args:
+
+            force_flag (bool): If False, nothing happens if catalogue items
+                already exist for all visible videos. If True, the catalogue
+                items are checked in any case (for example, because the list
+                of videos has changed)
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 12166 video_catalogue_virtual_update')
+
+        if self.catalogue_virtual_list is None \
+        or self.catalogue_listbox is None:
+            return
+
+        video_count = len(self.catalogue_virtual_list)
+        height = self.catalogue_virtual_row_height
+
+        # Find the range of videos that are visible. If the scrolled window
+        #   has not been drawn yet, use the size of the frame that contains it
+        adjust = self.catalogue_scrolled.get_vadjustment()
+        visible_size = adjust.get_page_size()
+        if visible_size <= 0:
+            visible_size = self.catalogue_frame.get_allocated_height()
+
+        first = min(int(adjust.get_value() / height), video_count)
+        last = min(first + int(visible_size / height) + 1, video_count)
+
+        if not force_flag \
+        and first >= self.catalogue_virtual_start \
+        and last <= self.catalogue_virtual_stop:
+            # Nothing to do
+            return
+
+        # Any measurement taken since the last call can now be applied
+        if self.catalogue_virtual_measured_height is not None \
+        and self.catalogue_virtual_measured_height != height:
+
+            height = self.catalogue_virtual_measured_height
+            self.catalogue_virtual_row_height = height
+
+            first = min(int(adjust.get_value() / height), video_count)
+            last = min(first + int(visible_size / height) + 1, video_count)
+
+        start = max(0, first - self.catalogue_virtual_margin)
+        stop = min(video_count, last + self.catalogue_virtual_margin)
+        self.catalogue_virtual_start = start
+        self.catalogue_virtual_stop = stop
+
+        draw_list = self.catalogue_virtual_list[start:stop]
+        draw_dict = {}
+        for video_obj in draw_list:
+            draw_dict[video_obj.dbid] = video_obj
+
+        # Catalogue items for videos which are no longer in range can be
+        #   re-used
+        spare_list = []
+        for dbid in list(self.video_catalogue_dict.keys()):
+            if not dbid in draw_dict:
+                spare_list.append(self.video_catalogue_dict.pop(dbid))
+                self.video_catalogue_signature_dict.pop(dbid, None)
+
+        for video_obj in draw_list:
+
+            if video_obj.dbid in self.video_catalogue_dict:
+
+                # (Only update widgets if the video has changed)
+                self.video_catalogue_update_item(
+                    self.video_catalogue_dict[video_obj.dbid],
+                )
+
+                continue
+
+            catalogue_item_obj = None
+            while spare_list and catalogue_item_obj is None:
+
+                spare_obj = spare_list.pop()
+                if spare_obj.set_video(video_obj):
+
+                    catalogue_item_obj = spare_obj
+                    # (The row now displays a different video, so it should
+                    #   not remain selected)
+                    self.catalogue_listbox.unselect_row(
+                        catalogue_item_obj.catalogue_row,
+                    )
+
+                else:
+
+                    self.catalogue_listbox.remove(spare_obj.catalogue_row)
+
+            if catalogue_item_obj is None:
+
+                # Nothing to re-use, so create a new catalogue item
+                if self.app_obj.catalogue_mode_type == 'simple':
+                    catalogue_item_obj = SimpleCatalogueItem(self, video_obj)
+                else:
+                    catalogue_item_obj = ComplexCatalogueItem(self, video_obj)
+
+                wrapper_obj = CatalogueRow(self, video_obj)
+                self.catalogue_listbox.add(wrapper_obj)
+                catalogue_item_obj.draw_widgets(wrapper_obj)
+
+            self.video_catalogue_dict[video_obj.dbid] = catalogue_item_obj
+            self.video_catalogue_update_item(catalogue_item_obj, True)
+
+        # Remove any catalogue items that weren't re-used
+        for spare_obj in spare_list:
+            self.catalogue_listbox.remove(spare_obj.catalogue_row)
+
+        # Resize the empty space above and below the catalogue items
+        self.catalogue_virtual_top_box.set_size_request(-1, start * height)
+        self.catalogue_virtual_bottom_box.set_size_request(
+            -1,
+            (video_count - stop) * height,
+        )
+
+        # Force the Gtk.ListBox to sort its rows, so that videos are displayed
+        #   in the correct order
+        self.catalogue_listbox.invalidate_sort()
+        self.catalogue_listbox.show_all()
+
+
+    def video_catalogue_virtual_scroll(self):
+
+        """Called by self.on_video_catalogue_virtual_size_allocate().
+
+        In virtual mode, scrolls the Video Catalogue to the video specified by
+        an earlier call to self.video_catalogue_show_date(), now that Gtk has
+        resized it.
+
+        Return values:
+
+            False, to stop this function being called again
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 12167 video_catalogue_virtual_scroll')
+
+        if self.catalogue_virtual_list is not None \
+        and self.catalogue_virtual_scroll_index is not None:
+
+            self.catalogue_scrolled.get_vadjustment().set_value(
+                self.catalogue_virtual_scroll_index \
+                * self.catalogue_virtual_row_height,
+            )
+
+        self.catalogue_virtual_scroll_index = None
+
+        return False
+
+
     def video_catalogue_toolbar_reset(self):
 
         """Called by self.video_catalogue_redraw_all().
@@ -12648,8 +13588,10 @@ class MainWin(Gtk.ApplicationWindow):
 
         self.catalogue_toolbar_current_page = page_num
 
-        # If the page size is 0, then all videos are drawn on one page
-        if not self.app_obj.catalogue_page_size:
+        # If the page size is 0, then all videos are drawn on one page (and
+        #   likewise in virtual mode)
+        if not self.app_obj.catalogue_page_size \
+        or self.catalogue_virtual_list is not None:
             self.catalogue_toolbar_last_page = page_num
         else:
             self.catalogue_toolbar_last_page \
@@ -12775,9 +13717,31 @@ class MainWin(Gtk.ApplicationWindow):
         regex_flag = self.app_obj.catalogue_use_regex_flag
         lower_text = search_text.lower()
 
+        # The search index tells us which videos might match, so that only
+        #   those videos need to be checked below (if the index can't be used
+        #   for this search text, every video is checked)
+        field_list = []
+        if self.app_obj.catalogue_filter_name_flag:
+            field_list.append('name')
+        if self.app_obj.catalogue_filter_author_flag:
+            field_list.append('author')
+        if self.app_obj.catalogue_filter_descrip_flag:
+            field_list.append('descrip')
+        if self.app_obj.catalogue_filter_comment_flag:
+            field_list.append('comment')
+
+        search_manager_obj = self.app_obj.search_manager_obj
+        search_manager_obj.sync_db()
+        match_set = search_manager_obj.find_videos(
+            search_text,
+            regex_flag,
+            field_list,
+        )
+
         for child_obj in parent_obj.child_list:
 
-            if isinstance(child_obj, media.Video):
+            if isinstance(child_obj, media.Video) \
+            and (match_set is None or child_obj.dbid in match_set):
 
                 if (
                     self.app_obj.catalogue_filter_name_flag \
@@ -12839,6 +13803,7 @@ class MainWin(Gtk.ApplicationWindow):
         # Set IVs...
         self.video_catalogue_filtered_flag = True
         self.video_catalogue_filtered_list = video_list.copy()
+        self.video_catalogue_rank_dict = {}
         # ...and redraw the Video Catalogue
         self.video_catalogue_redraw_all(
             self.video_index_current_dbid,
@@ -12872,6 +13837,7 @@ class MainWin(Gtk.ApplicationWindow):
         # Reset IVs...
         self.video_catalogue_filtered_flag = False
         self.video_catalogue_filtered_list = []
+        self.video_catalogue_rank_dict = {}
         # ...and redraw the Video Catalogue
         self.video_catalogue_redraw_all(self.video_index_current_dbid)
 
@@ -12882,7 +13848,77 @@ class MainWin(Gtk.ApplicationWindow):
         self.catalogue_blocked_button.set_sensitive(True)
 
 
-    def video_catalogue_show_date(self, page_num):
+    def video_catalogue_search_db(self, query_text):
+
+        """Called by mainapp.TartubeApp.on_menu_search_db().
+
+        Searches every video in the database (see
+        search.SearchManager.search_db() ), and shows the matching videos in
+        the Video Catalogue, as if a filter had been applied to the 'All
+        Videos' folder. The videos are shown in order of their ranking, split
+        into pages in the usual way.
+
+        Args:
+
+            query_text (str): The search query
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 12641 video_catalogue_search_db')
+
+        video_list = self.app_obj.search_manager_obj.search_db(query_text)
+        if video_list is None:
+
+            return self.app_obj.dialogue_manager_obj.show_msg_dialogue(
+                _('The search query is not valid'),
+                'error',
+                'ok',
+                None,                   # Parent window is main window
+            )
+
+        # Show the results in the 'All Videos' folder, selecting it in the
+        #   Video Index first, if necessary
+        all_obj = self.app_obj.fixed_all_folder
+        if self.video_index_current_dbid != all_obj.dbid \
+        and not all_obj.is_hidden():
+            self.video_index_select_row(all_obj)
+
+        if self.video_index_current_dbid != all_obj.dbid:
+
+            return self.app_obj.dialogue_manager_obj.show_msg_dialogue(
+                _(
+                    'Cannot show the search results, because the \'{0}\'' \
+                    + ' folder is hidden',
+                ).format(all_obj.name),
+                'error',
+                'ok',
+                None,                   # Parent window is main window
+            )
+
+        # Set IVs...
+        self.video_catalogue_filtered_flag = True
+        self.video_catalogue_filtered_list = video_list.copy()
+        self.video_catalogue_rank_dict = {}
+        for index, video_obj in enumerate(video_list):
+            self.video_catalogue_rank_dict[video_obj.dbid] = index
+
+        # ...and redraw the Video Catalogue
+        self.video_catalogue_redraw_all(
+            all_obj.dbid,
+            1,          # Display the first page
+            True,       # Reset scrollbars
+            True,       # Do not cancel the filter we've just applied
+        )
+
+        # Sensitise widgets, as appropriate
+        self.catalogue_cancel_filter_button.set_sensitive(True)
+        self.catalogue_downloaded_button.set_sensitive(False)
+        self.catalogue_undownloaded_button.set_sensitive(False)
+        self.catalogue_blocked_button.set_sensitive(False)
+
+
+    def video_catalogue_show_date(self, page_num, video_index=None):
 
         """Called by mainapp.TartubeApp.on_button_find_date().
 
@@ -12898,6 +13934,10 @@ class MainWin(Gtk.ApplicationWindow):
                 filtered out; we just show the first page containing videos
                 for the specified date)
 
+            video_index (int or None): In virtual mode, the position of the
+                first video for the specified date (the Video Catalogue is
+                scrolled to that position)
+
         """
 
         if DEBUG_FUNC_FLAG:
@@ -12924,6 +13964,12 @@ class MainWin(Gtk.ApplicationWindow):
             True,       # Do not cancel the filter, if one has been applied
         )
 
+        # In virtual mode, scroll to the video, as soon as Gtk has resized the
+        #   Video Catalogue
+        if self.catalogue_virtual_list is not None \
+        and video_index is not None:
+            self.catalogue_virtual_scroll_index = video_index
+
         # Sensitise widgets, as appropriate
         self.catalogue_find_date_button.set_sensitive(False)
         self.catalogue_cancel_date_button.set_sensitive(True)
@@ -13875,7 +14921,7 @@ class MainWin(Gtk.ApplicationWindow):
                 if video_obj.new_flag:
                     self.app_obj.fixed_new_folder.sort_children(self.app_obj)
 
-                if video_obj in self.app_obj.fixed_recent_folder.child_list:
+                if self.app_obj.fixed_recent_folder.check_child(video_obj):
                     self.app_obj.fixed_recent_folder.sort_children(
                         self.app_obj,
                     )
@@ -13886,11 +14932,7 @@ class MainWin(Gtk.ApplicationWindow):
                     )
 
                 # Update the video catalogue in the 'Videos' tab
-                GObject.timeout_add(
-                    0,
-                    self.video_catalogue_update_video,
-                    video_obj,
-                )
+                self.app_obj.schedule_catalogue_video(video_obj)
 
                 # Prepare icons
                 if isinstance(video_obj.parent_obj, media.Channel):
@@ -16821,16 +17863,8 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             media_data_obj.set_dl_no_db_flag(False)
 
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_icon,
-            media_data_obj,
-        )
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_text,
-            media_data_obj,
-        )
+        self.app_obj.schedule_index_row_icon(media_data_obj)
+        self.app_obj.schedule_index_row_text(media_data_obj)
 
 
     def on_video_index_dl_disable(self, menu_item, media_data_obj):
@@ -16862,16 +17896,8 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             media_data_obj.set_dl_disable_flag(False)
 
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_icon,
-            media_data_obj,
-        )
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_text,
-            media_data_obj,
-        )
+        self.app_obj.schedule_index_row_icon(media_data_obj)
+        self.app_obj.schedule_index_row_text(media_data_obj)
 
 
     def on_video_index_dl_sim(self, menu_item, media_data_obj):
@@ -16904,16 +17930,8 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             media_data_obj.set_dl_sim_flag(False)
 
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_icon,
-            media_data_obj,
-        )
-        GObject.timeout_add(
-            0,
-            self.video_index_update_row_text,
-            media_data_obj,
-        )
+        self.app_obj.schedule_index_row_icon(media_data_obj)
+        self.app_obj.schedule_index_row_text(media_data_obj)
 
 
     def on_video_index_download(self, menu_item, media_data_obj):
@@ -18082,6 +19100,41 @@ class MainWin(Gtk.ApplicationWindow):
                 )
 
 
+    def on_video_index_test_expand_row(self, treeview, tree_iter, tree_path):
+
+        """Called from callback in self.video_index_reset().
+
+        When a row in the Video Index is about to be expanded for the first
+        time, replaces its placeholder child row with rows for its child
+        channels, playlists and folders.
+
+        Args:
+
+            treeview (Gtk.TreeView): The Video Index's treeview
+
+            tree_iter (Gtk.TreeIter): Iter pointing at the row to be expanded
+
+            tree_path (Gtk.TreePath): Path to the row to be expanded
+
+        Return values:
+
+            False, so that the row is expanded
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 17703 on_video_index_test_expand_row')
+
+        dbid = self.video_index_sortmodel[tree_iter][0]
+        if dbid in self.video_index_placeholder_dict \
+        and dbid in self.app_obj.media_reg_dict:
+            self.video_index_populate_children(
+                self.app_obj.media_reg_dict[dbid],
+            )
+
+        return False
+
+
     def on_video_index_marker(self, menu_item, media_data_obj):
 
         """Called from a callback in self.video_index_popup_menu().
@@ -18321,11 +19374,7 @@ class MainWin(Gtk.ApplicationWindow):
             media_data_obj.set_nickname(nickname)
 
             # Update the name displayed in the Video Index
-            GObject.timeout_add(
-                0,
-                self.video_index_update_row_text,
-                media_data_obj,
-            )
+            self.app_obj.schedule_index_row_text(media_data_obj)
 
 
     def on_video_index_set_url(self, menu_item, media_data_obj):
@@ -18544,6 +19593,7 @@ class MainWin(Gtk.ApplicationWindow):
                 'del_json_flag': dialogue_win.checkbutton15.get_active(),
                 'del_xml_flag': dialogue_win.checkbutton16.get_active(),
                 'convert_ext_flag': dialogue_win.checkbutton17.get_active(),
+                'find_dup_flag': dialogue_win.checkbutton18.get_active(),
             }
 
         # Now destroy the window
@@ -19365,11 +20415,7 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             media_data_obj.set_dl_sim_flag(False)
 
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_fetch_formats(self, menu_item, media_data_obj):
@@ -19490,11 +20536,7 @@ class MainWin(Gtk.ApplicationWindow):
         self.app_obj.mark_video_live(media_data_obj, 0)
 
         # Update the catalogue item
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_finalise_livestream_multi(self, menu_item,
@@ -19596,11 +20638,7 @@ class MainWin(Gtk.ApplicationWindow):
                 self.app_obj.del_auto_dl_stop_dict(media_data_obj)
 
         # Update the catalogue item
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_mark_temp_dl(self, menu_item, media_data_obj):
@@ -19731,11 +20769,7 @@ class MainWin(Gtk.ApplicationWindow):
         )
 
         # Update the catalogue item
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_not_livestream_multi(self, menu_item,
@@ -21250,11 +22284,7 @@ class MainWin(Gtk.ApplicationWindow):
         else:
             media_data_obj.set_archive_flag(False)
 
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_toggle_archived_video_multi(self, menu_item,
@@ -21282,11 +22312,7 @@ class MainWin(Gtk.ApplicationWindow):
 
         for media_data_obj in media_data_list:
             media_data_obj.set_archive_flag(archived_flag)
-            GObject.timeout_add(
-                0,
-                self.video_catalogue_update_video,
-                media_data_obj,
-            )
+            self.app_obj.schedule_catalogue_video(media_data_obj)
 
         # Standard de-selection of everything in the Video Catalogue
         self.video_catalogue_unselect_all()
@@ -21376,11 +22402,7 @@ class MainWin(Gtk.ApplicationWindow):
         # .mark_video_downloaded() doesn't update the Video Catalogue (unlike
         #   for example .mark_video_favourite() ), so we must do that
         #   manually
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_toggle_downloaded_video_multi(self, menu_item,
@@ -21415,11 +22437,7 @@ class MainWin(Gtk.ApplicationWindow):
         # .mark_video_downloaded() doesn't update the Video Catalogue (unlike
         #   for example .mark_video_favourite() ), so we must do that
         #   manually
-        GObject.timeout_add(
-            0,
-            self.video_catalogue_update_video,
-            media_data_obj,
-        )
+        self.app_obj.schedule_catalogue_video(media_data_obj)
 
 
     def on_video_catalogue_toggle_favourite_video(self, menu_item, \
@@ -21643,6 +22661,69 @@ class MainWin(Gtk.ApplicationWindow):
         self.video_catalogue_unselect_all()
 
 
+    def on_video_catalogue_virtual_scroll(self, adjust):
+
+        """Called from callback in self.video_catalogue_reset().
+
+        In virtual mode, when the user scrolls the Video Catalogue (or when it
+        is resized), makes sure that catalogue items exist for all visible
+        videos.
+
+        Args:
+
+            adjust (Gtk.Adjustment): The scrolled window's vertical adjustment
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 20936 on_video_catalogue_virtual_scroll')
+
+        self.video_catalogue_virtual_update()
+
+
+    def on_video_catalogue_virtual_size_allocate(self, listbox, rect):
+
+        """Called from callback in self.video_catalogue_reset().
+
+        In virtual mode, when Gtk resizes the listbox, measures the average
+        height of its rows. The measurement is applied the next time
+        catalogue items are re-used (or immediately, if the estimate was a
+        long way out).
+
+        Args:
+
+            listbox (Gtk.ListBox): The clicked widget
+
+            rect (Gdk.Rectangle): Object describing the window's new size
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time(
+                'mwn 20937 on_video_catalogue_virtual_size_allocate',
+            )
+
+        if self.catalogue_virtual_list is None \
+        or not self.video_catalogue_dict:
+            return
+
+        self.catalogue_virtual_measured_height = max(
+            1,
+            int(rect.height / len(self.video_catalogue_dict)),
+        )
+
+        if abs(
+            self.catalogue_virtual_measured_height \
+            - self.catalogue_virtual_row_height
+        ) * 10 > self.catalogue_virtual_row_height:
+            GObject.timeout_add(0, self.video_catalogue_virtual_update, True)
+
+        # If self.video_catalogue_show_date() is waiting to scroll to a
+        #   particular video, it can do that now
+        if self.catalogue_virtual_scroll_index is not None:
+            GObject.timeout_add(0, self.video_catalogue_virtual_scroll)
+
+
     def on_video_catalogue_watch_hooktube(self, menu_item, media_data_obj):
 
         """Called from a callback in self.video_catalogue_popup_menu().
@@ -25161,6 +26242,34 @@ class SimpleCatalogueItem(object):
         self.update_video_stats()
 
 
+    def set_video(self, video_obj):
+
+        """Called by mainwin.MainWin.video_catalogue_virtual_update().
+
+        In virtual mode, re-uses this catalogue item (and its widgets) to
+        display a different video. The calling code should then call
+        self.update_widgets().
+
+        Args:
+
+            video_obj (media.Video): The video to display
+
+        Return values:
+
+            True if the catalogue item can be re-used, False if not
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 24522 set_video')
+
+        self.video_obj = video_obj
+        self.dbid = video_obj.dbid
+        self.catalogue_row.video_obj = video_obj
+
+        return True
+
+
     def update_background(self):
 
         """Calledy by self.draw_widgets() and .update_widgets().
@@ -25685,6 +26794,11 @@ class ComplexCatalogueItem(object):
         # Flag set to True when the marked labels box (self.marked_box) is
         #   visible, False when not
         self.marked_box_visible_flag = False
+        # The full path to the thumbnail most recently requested by
+        #   self.update_thumb_image(), if any. When a worker thread finishes
+        #   loading a thumbnail, it's only displayed if it's still the one
+        #   required
+        self.thumb_path = None
 
 
     # Public class methods
@@ -26124,6 +27238,48 @@ class ComplexCatalogueItem(object):
                 self.marked_box_visible_flag = True
 
 
+    def set_video(self, video_obj):
+
+        """Called by mainwin.MainWin.video_catalogue_virtual_update().
+
+        In virtual mode, re-uses this catalogue item (and its widgets) to
+        display a different video. The calling code should then call
+        self.update_widgets().
+
+        Args:
+
+            video_obj (media.Video): The video to display
+
+        Return values:
+
+            True if the catalogue item can be re-used, False if not (because
+                one row of widgets was not drawn for the old video, but is
+                needed for the new one, or vice-versa)
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 25449 set_video')
+
+        parent_obj = video_obj.parent_obj
+        if isinstance(parent_obj, media.Folder) \
+        and parent_obj.temp_flag:
+            no_temp_widgets_flag = True
+        else:
+            no_temp_widgets_flag = False
+
+        if no_temp_widgets_flag != self.no_temp_widgets_flag:
+            return False
+
+        self.video_obj = video_obj
+        self.dbid = video_obj.dbid
+        self.catalogue_row.video_obj = video_obj
+        # (The new video's full description is not visible yet)
+        self.expand_descrip_flag = False
+
+        return True
+
+
     def update_background(self):
 
         """Calledy by self.draw_widgets() and .update_widgets().
@@ -26214,6 +27370,7 @@ class ComplexCatalogueItem(object):
 
         # See if the video's thumbnail file has been downloaded
         thumb_flag = False
+        self.thumb_path = None
         if self.video_obj.file_name:
 
             # No way to know which image format is used by all websites for
@@ -26230,20 +27387,25 @@ class ComplexCatalogueItem(object):
             if path:
 
                 # Thumbnail file exists, so use it
+                # If the scaled thumbnail isn't already in the cache, it's
+                #   loaded by a worker thread; in the meantime, the default
+                #   thumbnail is visible
                 app_obj = self.main_win_obj.app_obj
                 mini_list = app_obj.thumb_size_dict['tiny']
-                # (Returns a tuple, who knows why)
-                arglist = app_obj.file_manager_obj.load_to_pixbuf(
+                self.thumb_path = path
+                pixbuf = app_obj.file_manager_obj.load_to_pixbuf_async(
                     path,
                     mini_list[0],       # width
                     mini_list[1],       # height
-                ),
+                    self.on_thumb_loaded,
+                    path,
+                )
 
-                if arglist[0]:
-                    self.thumb_image.set_from_pixbuf(arglist[0])
+                if pixbuf:
+                    self.thumb_image.set_from_pixbuf(pixbuf)
                     thumb_flag = True
 
-        # No thumbnail file found, so use a default file
+        # No thumbnail file found (or not loaded yet), so use a default file
         if not thumb_flag:
             if self.video_obj.fav_flag and self.video_obj.options_obj:
                 self.thumb_image.set_from_pixbuf(
@@ -28235,6 +29397,34 @@ class ComplexCatalogueItem(object):
         return True
 
 
+    def on_thumb_loaded(self, pixbuf, path):
+
+        """Called by files.FileManager.load_to_pixbuf_finished(), when a
+        thumbnail requested by self.update_thumb_image() has been loaded by a
+        worker thread.
+
+        (Also used by mainwin.GridCatalogueItem.)
+
+        Args:
+
+            pixbuf (GdkPixbuf.Pixbuf or None): The scaled thumbnail, or None
+                if it could not be loaded
+
+            path (str): The full path to the thumbnail file
+
+        """
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 27610 on_thumb_loaded')
+
+        # (Replace the default thumbnail, but only if the video still requires
+        #   this thumbnail)
+        if pixbuf is not None \
+        and self.thumb_image is not None \
+        and self.thumb_path == path:
+            self.thumb_image.set_from_pixbuf(pixbuf)
+
+
     def on_right_click_row(self, event_box, event):
 
         """Called from callback in self.draw_widgets().
@@ -28365,6 +29555,12 @@ class GridCatalogueItem(ComplexCatalogueItem):
         #   visible, False when not
         self.marked_box_visible_flag = False
 
+        # The full path to the thumbnail most recently requested by
+        #   self.update_thumb_image(), if any. When a worker thread finishes
+        #   loading a thumbnail, it's only displayed if it's still the one
+        #   required
+        self.thumb_path = None
+
         # We can't select widgets on a Gtk.Grid directly, so Tartube implements
         #   its own 'selection' mechanism
         self.selected_flag = False
@@ -28889,6 +30085,7 @@ class GridCatalogueItem(ComplexCatalogueItem):
 
         # See if the video's thumbnail file has been downloaded
         thumb_flag = False
+        self.thumb_path = None
         if self.video_obj.file_name:
 
             # No way to know which image format is used by all websites for
@@ -28905,20 +30102,25 @@ class GridCatalogueItem(ComplexCatalogueItem):
             if path:
 
                 # Thumbnail file exists, so use it
+                # If the scaled thumbnail isn't already in the cache, it's
+                #   loaded by a worker thread; in the meantime, the default
+                #   thumbnail is visible
                 mini_list = app_obj.thumb_size_dict[thumb_size]
-
-                # (Returns a tuple, who knows why)
-                arglist = app_obj.file_manager_obj.load_to_pixbuf(
+                self.thumb_path = path
+                pixbuf = app_obj.file_manager_obj.load_to_pixbuf_async(
                     path,
                     mini_list[0],       # width
                     mini_list[1],       # height
-                ),
+                    self.on_thumb_loaded,
+                    path,
+                )
 
-                if arglist[0]:
-                    self.thumb_image.set_from_pixbuf(arglist[0])
+                if pixbuf:
+                    self.thumb_image.set_from_pixbuf(pixbuf)
                     thumb_flag = True
 
-        # No thumbnail file found, so use a default icon file
+        # No thumbnail file found (or not loaded yet), so use a default icon
+        #   file
         if not thumb_flag:
 
             if not self.video_obj.block_flag:
@@ -40558,6 +41760,106 @@ class ScheduledDialogue(Gtk.Dialog):
         self.choice = model[tree_iter][0]
 
 
+class SearchDatabaseDialogue(Gtk.Dialog):
+
+    """Called by mainapp.TartubeApp.on_menu_search_db().
+
+    Python class handling a dialogue window that prompts the user for a
+    query, used to search every video in the database.
+
+    Args:
+
+        main_win_obj (mainwin.MainWin): The parent main window
+
+        query_text (str or None): The previous search query, if any
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, main_win_obj, query_text=None):
+
+        if DEBUG_FUNC_FLAG:
+            ttutils.debug_time('mwn 39660 __init__')
+
+        ignore_me = _(
+            'TRANSLATOR\'S NOTE: \'Search database\' dialogue starts here.' \
+            + ' In the main window\'s menu, select Media > Search' \
+            + ' database...'
+        )
+
+        # IV list - class objects
+        # -----------------------
+        # Tartube's main window
+        self.main_win_obj = main_win_obj
+
+
+        # IV list - Gtk widgets
+        # ---------------------
+        self.entry = None                       # Gtk.Entry
+
+
+        # Code
+        # ----
+
+        Gtk.Dialog.__init__(
+            self,
+            _('Search database'),
+            main_win_obj,
+            Gtk.DialogFlags.DESTROY_WITH_PARENT,
+            (
+                Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+                Gtk.STOCK_OK, Gtk.ResponseType.OK,
+            )
+        )
+
+        self.set_modal(False)
+        self.set_default_response(Gtk.ResponseType.OK)
+
+        # Set up the dialogue window
+        spacing_size = self.main_win_obj.spacing_size
+        label_length = self.main_win_obj.long_string_max_len
+
+        box = self.get_content_area()
+
+        grid = Gtk.Grid()
+        box.add(grid)
+        grid.set_border_width(spacing_size)
+        grid.set_row_spacing(spacing_size)
+
+        label = Gtk.Label(
+            ttutils.tidy_up_long_string(
+                _('Search for videos in every channel, playlist and folder'),
+                label_length,
+            ),
+        )
+        grid.attach(label, 0, 0, 1, 1)
+
+        # (Store various widgets as IVs, so the calling function can retrieve
+        #   their contents)
+        self.entry = Gtk.Entry()
+        grid.attach(self.entry, 0, 1, 1, 1)
+        self.entry.set_hexpand(True)
+        self.entry.set_activates_default(True)
+        if query_text is not None:
+            self.entry.set_text(query_text)
+
+        label2 = Gtk.Label()
+        grid.attach(label2, 0, 2, 1, 1)
+        label2.set_alignment(0, 0.5)
+        label2.set_markup(
+            '<i>' + _('Examples:') + '</i>\n' \
+            + 'cats name:kitten author:"john smith"\n' \
+            + 'upload:2020-01..2020-06 received:>=2024\n' \
+            + 'size:>100M duration:<10:00 downloaded:no',
+        )
+
+        # Display the dialogue window
+        self.show_all()
+
+
 class SetDestinationDialogue(Gtk.Dialog):
 
     """Called by MainWin.on_video_index_set_destination().
@@ -41708,6 +43010,7 @@ class TidyDialogue(Gtk.Dialog):
         self.checkbutton15 = None               # Gtk.CheckButton
         self.checkbutton16 = None               # Gtk.CheckButton
         self.checkbutton17 = None               # Gtk.CheckButton
+        self.checkbutton18 = None               # Gtk.CheckButton
 
 
         # Code
@@ -41848,9 +43151,21 @@ class TidyDialogue(Gtk.Dialog):
         grid.attach(self.checkbutton16, 1, 7, 1, 1)
         self.checkbutton16.set_label(_('Delete all annotation files'))
 
+        self.checkbutton18 = Gtk.CheckButton()
+        grid.attach(self.checkbutton18, 0, 8, 2, 1)
+        self.checkbutton18.set_label(
+            ttutils.tidy_up_long_string(
+                _(
+                'Find duplicate video files (compares the contents of files' \
+                + ' in every channel, playlist and folder)',
+                ),
+                label_length * 2,
+            ),
+        )
+
         # !!! DEBUG Git #472
         self.checkbutton17 = Gtk.CheckButton()
-        grid.attach(self.checkbutton17, 0, 8, 2, 1)
+        grid.attach(self.checkbutton17, 0, 9, 2, 1)
         self.checkbutton17.set_label(
             _(
             'EXPERIMENTAL: convert \'.unknown_video\' file extensions to .mp4'
@@ -41860,12 +43175,12 @@ class TidyDialogue(Gtk.Dialog):
         # Bottom strip
 
         button = Gtk.Button.new_with_label(_('Select all'))
-        grid.attach(button, 0, 9, 1, 1)
+        grid.attach(button, 0, 10, 1, 1)
         button.set_hexpand(False)
         # (Signal connect appears below)
 
         button2 = Gtk.Button.new_with_label(_('Select none'))
-        grid.attach(button2, 1, 9, 1, 1)
+        grid.attach(button2, 1, 10, 1, 1)
         button2.set_hexpand(False)
         # (Signal connect appears below)
 
@@ -42080,6 +43395,7 @@ class TidyDialogue(Gtk.Dialog):
 #        self.checkbutton15.set_active(False)
 #        self.checkbutton16.set_active(False)
         self.checkbutton17.set_active(True)
+        self.checkbutton18.set_active(True)
 
 
     def on_select_none_clicked(self, button):
@@ -42113,6 +43429,7 @@ class TidyDialogue(Gtk.Dialog):
         self.checkbutton15.set_active(False)
         self.checkbutton16.set_active(False)
         self.checkbutton17.set_active(False)
+        self.checkbutton18.set_active(False)
 
         if not mainapp.HAVE_MOVIEPY_FLAG \
         or self.main_win_obj.app_obj.refresh_moviepy_timeout == 0:
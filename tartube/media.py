@@ -41,6 +41,38 @@ import ttutils
 from mainapp import _
 
 
+# Globals
+# Functions called just before any media data object is modified (see
+#   notify_modify() ), each in the form func(media_data_obj, iv_name)
+modify_func_list = []
+
+
+# Functions
+
+
+def notify_modify(media_data_obj, iv_name):
+
+    """Called by GenericMedia.__setattr__(), and by any code that modifies a
+    list, dictionary or set stored in a media data object's IV (rather than
+    replacing it).
+
+    Tells each function in modify_func_list that the IV is about to be
+    modified. The function is called before the modification, so anything
+    that needs the old value can still copy it.
+
+    Args:
+
+        media_data_obj (media.Video, media.Channel, media.Playlist,
+            media.Folder): The media data object about to be modified
+
+        iv_name (str): The name of the IV about to be modified
+
+    """
+
+    for func in modify_func_list:
+        func(media_data_obj, iv_name)
+
+
 # Classes
 
 
@@ -50,6 +82,67 @@ class GenericMedia(object):
     media.Playlist and media.Folder."""
 
 
+    # Standard class methods
+
+
+    def __setattr__(self, name, value):
+
+        """Called whenever an IV is set.
+
+        Calls notify_modify() before the IV is set, so that code keeping a
+        copy of (or an index of) media data objects knows about the change.
+
+        Args:
+
+            name (str): The name of the IV
+
+            value (any): The new value
+
+        """
+
+        if modify_func_list:
+            notify_modify(self, name)
+
+        object.__setattr__(self, name, value)
+
+
+    def __getstate__(self):
+
+        """Called by pickle.dump() (for example, by
+        mainapp.TartubeApp.save_db() ).
+
+        The render cache is not saved in the database file.
+
+        Return values:
+
+            A dictionary of the IVs to save
+
+        """
+
+        state_dict = self.__dict__.copy()
+        state_dict.pop('render_cache_dict', None)
+
+        return state_dict
+
+
+    def __setstate__(self, state_dict):
+
+        """Called by pickle.load() (for example, by
+        mainapp.TartubeApp.load_db() ).
+
+        Restores the IVs saved in the database file, and creates an empty
+        render cache.
+
+        Args:
+
+            state_dict (dict): The IVs that were saved
+
+        """
+
+        self.__dict__.update(state_dict)
+        self.render_cache_dict = {}
+
+
     # Public class methods
 
 
@@ -116,6 +209,59 @@ class GenericMedia(object):
                 return _('Video')
 
 
+    def get_render_cache(self, name, signature):
+
+        """Can be called by anything.
+
+        Returns a value (usually text) stored by a previous call to
+        self.set_render_cache(), if this object has not been modified since
+        then, and if the other values used to generate it have not changed.
+
+        Args:
+
+            name (str): A name for the value, e.g. 'tooltip'
+
+            signature (tuple): Any other values (for example, settings) used
+                to generate the value
+
+        Return values:
+
+            The stored value, or None if there is no stored value (or if it
+                is out of date)
+
+        """
+
+        mini_list = self.render_cache_dict.get(name)
+        if mini_list is not None \
+        and mini_list[0] == self.render_version \
+        and mini_list[1] == signature:
+            return mini_list[2]
+        else:
+            return None
+
+
+    def set_render_cache(self, name, signature, value):
+
+        """Can be called by anything.
+
+        Stores a value (usually text) generated to display this object, so it
+        can be retrieved by self.get_render_cache() until this object is
+        modified.
+
+        Args:
+
+            name (str): A name for the value, e.g. 'tooltip'
+
+            signature (tuple): Any other values (for example, settings) used
+                to generate the value
+
+            value (any): The value to store
+
+        """
+
+        self.render_cache_dict[name] = [self.render_version, signature, value]
+
+
     # Set accessors
 
 
@@ -124,8 +270,11 @@ class GenericMedia(object):
         # The media.Folder object has no error/warning IVs (and shouldn't
         #   receive any error/warning messages)
         if not isinstance(self, Folder):
+            notify_modify(self, 'error_list')
             self.error_list.append(msg)
 
+        self.render_version += 1
+
 
     def reset_error_warning(self):
 
@@ -135,6 +284,8 @@ class GenericMedia(object):
             self.error_list = []
             self.warning_list = []
 
+        self.render_version += 1
+
 
     def set_fav_flag(self, flag):
 
@@ -143,6 +294,8 @@ class GenericMedia(object):
         else:
             self.fav_flag = False
 
+        self.render_version += 1
+
 
     def set_nickname(self, nickname):
 
@@ -152,21 +305,25 @@ class GenericMedia(object):
             self.nickname = nickname
 
         self.natname = self.get_natural_name(self.nickname)
+        self.render_version += 1
 
 
     def set_options_obj(self, options_obj):
 
         self.options_obj = options_obj
+        self.render_version += 1
 
 
     def reset_options_obj(self):
 
         self.options_obj = None
+        self.render_version += 1
 
 
     def set_parent_obj(self, parent_obj):
 
         self.parent_obj = parent_obj
+        self.render_version += 1
 
 
     def set_warning(self, msg):
@@ -174,8 +331,11 @@ class GenericMedia(object):
         # The media.Folder object has no error/warning IVs (and shouldn't
         #   receive any error/warning messages)
         if not isinstance(self, Folder):
+            notify_modify(self, 'warning_list')
             self.warning_list.append(msg)
 
+        self.render_version += 1
+
 
 class GenericContainer(GenericMedia):
 
@@ -186,6 +346,28 @@ class GenericContainer(GenericMedia):
     # Public class methods
 
 
+    def check_child(self, child_obj):
+
+        """Can be called by anything.
+
+        Checks whether a media data object is a child of this object, without
+        searching self.child_list. (This matters for the private folders, such
+        as 'All Videos', which may contain every video in the database.)
+
+        Args:
+
+            child_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The object to check
+
+        Return values:
+
+            True if the object is a child of this object, False if not
+
+        """
+
+        return child_obj.dbid in self.child_dbid_set
+
+
     def check_duplicate_video(self, source):
 
         """Can be called by anything.
@@ -313,7 +495,7 @@ class GenericContainer(GenericMedia):
     frequency_dict):
 
         """Can be called by anything, but mostly called by
-        config.GenericConfigWin.on_button_draw_graph_clicked().
+        stats.StatsManager (when the numpy module is not available).
 
         Compile a dictionary of download times for each video in the container
         (including those in sub-folders, channels and playlists).
@@ -380,7 +562,7 @@ class GenericContainer(GenericMedia):
     def compile_all_videos_by_size(self, frequency_dict):
 
         """Can be called by anything, but mostly called by
-        config.GenericConfigWin.on_button_draw_graph_clicked().
+        stats.StatsManager (when the numpy module is not available).
 
         This functions specifies a limited set of file sizes. The set has been
         chosen to produce aesthetic graphs.
@@ -407,8 +589,8 @@ class GenericContainer(GenericMedia):
 
                 # NB If these labels are changed, when the corresponding
                 #   literal values in
-                #   config.GenericConfigWin.on_button_draw_graph_clicked() must
-                #   be changed too
+                #   config.GenericConfigWin.on_button_draw_graph_clicked() and
+                #   stats.StatsSnapshot.count_by_range() must be changed too
                 if video_obj.file_size < 10_000_000:
                     label = '10MB'
                 elif video_obj.file_size < 25_000_000:
@@ -441,7 +623,7 @@ class GenericContainer(GenericMedia):
     def compile_all_videos_by_duration(self, frequency_dict):
 
         """Can be called by anything, but mostly called by
-        config.GenericConfigWin.on_button_draw_graph_clicked().
+        stats.StatsManager (when the numpy module is not available).
 
         This functions specifies a limited set of video durations (in seconds).
         The set has been chosen to produce aesthetic graphs.
@@ -468,8 +650,8 @@ class GenericContainer(GenericMedia):
 
                 # NB If these labels are changed, when the corresponding
                 #   literal values in
-                #   config.GenericConfigWin.on_button_draw_graph_clicked() must
-                #   be changed too
+                #   config.GenericConfigWin.on_button_draw_graph_clicked() and
+                #   stats.StatsSnapshot.count_by_range() must be changed too
                 if video_obj.duration < 10:
                     label = '10s'
                 elif video_obj.duration < 60:
@@ -560,11 +742,14 @@ class GenericContainer(GenericMedia):
         """
 
         # Check this is really one of our children
-        if not child_obj in self.child_list:
+        if not self.check_child(child_obj):
             return False
 
         else:
+            notify_modify(self, 'child_list')
             self.child_list.remove(child_obj)
+            self.child_dbid_set.discard(child_obj.dbid)
+            self.render_version += 1
 
             # Git #169, v2.2.026. A user reports that the counts can fall below
             #   0. The authors can't reproduce the problem, but we can still
@@ -637,6 +822,21 @@ class GenericContainer(GenericMedia):
 
         """
 
+        # The tooltip is rebuilt only when this object changes, or when any of
+        #   the values it depends on (outside of this object) are modified
+        signature = (
+            max_length,
+            show_error_flag,
+            app_obj.show_tooltips_extra_flag,
+            app_obj.downloads_dir,
+            app_obj.media_dir_cache_version,
+            self.dbid in app_obj.container_unavailable_dict,
+        )
+
+        text = self.get_render_cache('tooltip', signature)
+        if text is not None:
+            return text
+
         text = '#' + str(self.dbid) + ':   ' + self.name + '\n\n'
 
         if not isinstance(self, Folder):
@@ -696,6 +896,7 @@ class GenericContainer(GenericMedia):
         if max_length is not None:
             text = ttutils.tidy_up_long_descrip(text, max_length)
 
+        self.set_render_cache('tooltip', signature, text)
         return text
 
 
@@ -1145,6 +1346,8 @@ class GenericContainer(GenericMedia):
                 if child_obj.waiting_flag:
                     self.waiting_count += 1
 
+        self.render_version += 1
+
 
     def strip_video_name(self, name):
 
@@ -1270,11 +1473,13 @@ class GenericContainer(GenericMedia):
         self.missing_count = missing_count
         self.new_count = new_count
         self.waiting_count = waiting_count
+        self.render_version += 1
 
 
     def inc_bookmark_count(self):
 
         self.bookmark_count += 1
+        self.render_version += 1
 
 
     def dec_bookmark_count(self):
@@ -1283,10 +1488,13 @@ class GenericContainer(GenericMedia):
         if self.bookmark_count < 0:
             self.bookmark_count = 0
 
+        self.render_version += 1
+
 
     def inc_dl_count(self):
 
         self.dl_count += 1
+        self.render_version += 1
 
 
     def dec_dl_count(self):
@@ -1295,6 +1503,8 @@ class GenericContainer(GenericMedia):
         if self.dl_count < 0:
             self.dl_count = 0
 
+        self.render_version += 1
+
 
     def set_dl_disable_flag(self, flag):
 
@@ -1307,6 +1517,8 @@ class GenericContainer(GenericMedia):
         else:
             self.dl_disable_flag = False
 
+        self.render_version += 1
+
 
     def set_dl_no_db_flag(self, flag):
 
@@ -1319,6 +1531,8 @@ class GenericContainer(GenericMedia):
         else:
             self.dl_no_db_flag = False
 
+        self.render_version += 1
+
 
     def set_dl_sim_flag(self, flag):
 
@@ -1331,10 +1545,14 @@ class GenericContainer(GenericMedia):
         else:
             self.dl_sim_flag = False
 
+        self.render_version += 1
+
 
     def set_external_dir(self, app_obj, external_dir):
 
         self.external_dir = external_dir
+        self.render_version += 1
+        app_obj.reset_media_dir_cache()
         if external_dir is not None:
 
             # If the directory does not exist, try to create it
@@ -1357,6 +1575,7 @@ class GenericContainer(GenericMedia):
     def inc_fav_count(self):
 
         self.fav_count += 1
+        self.render_version += 1
 
 
     def dec_fav_count(self):
@@ -1365,10 +1584,13 @@ class GenericContainer(GenericMedia):
         if self.fav_count < 0:
             self.fav_count = 0
 
+        self.render_version += 1
+
 
     def inc_live_count(self):
 
         self.live_count += 1
+        self.render_version += 1
 
 
     def dec_live_count(self):
@@ -1377,6 +1599,8 @@ class GenericContainer(GenericMedia):
         if self.live_count < 0:
             self.live_count = 0
 
+        self.render_version += 1
+
 
     def set_master_dbid(self, app_obj, dbid):
 
@@ -1397,6 +1621,8 @@ class GenericContainer(GenericMedia):
 
             # Update this object's IV
             self.master_dbid = dbid
+            self.render_version += 1
+            app_obj.reset_media_dir_cache()
 
             if self.master_dbid != self.dbid:
 
@@ -1408,11 +1634,13 @@ class GenericContainer(GenericMedia):
     def reset_master_dbid(self):
 
         self.master_dbid = self.dbid
+        self.render_version += 1
 
 
     def inc_missing_count(self):
 
         self.missing_count += 1
+        self.render_version += 1
 
 
     def dec_missing_count(self):
@@ -1421,10 +1649,13 @@ class GenericContainer(GenericMedia):
         if self.missing_count < 0:
             self.missing_count = 0
 
+        self.render_version += 1
+
 
     def inc_new_count(self):
 
         self.new_count += 1
+        self.render_version += 1
 
 
     def dec_new_count(self):
@@ -1433,10 +1664,13 @@ class GenericContainer(GenericMedia):
         if self.new_count < 0:
             self.new_count = 0
 
+        self.render_version += 1
+
 
     def inc_waiting_count(self):
 
         self.waiting_count += 1
+        self.render_version += 1
 
 
     def dec_waiting_count(self):
@@ -1445,6 +1679,8 @@ class GenericContainer(GenericMedia):
         if self.waiting_count < 0:
             self.waiting_count = 0
 
+        self.render_version += 1
+
 
     def add_slave_dbid(self, dbid):
 
@@ -1458,6 +1694,7 @@ class GenericContainer(GenericMedia):
                 break
 
         if not match_flag:
+            notify_modify(self, 'slave_dbid_list')
             self.slave_dbid_list.append(dbid)
 
 
@@ -1483,6 +1720,7 @@ class GenericContainer(GenericMedia):
             self.nickname = name
 
         self.name = name
+        self.render_version += 1
 
 
     # Get accessors
@@ -1523,18 +1761,32 @@ class GenericContainer(GenericMedia):
 
         """
 
+        # This function is called very often, so the result is cached (see
+        #   mainapp.TartubeApp.reset_media_dir_cache() )
+        if new_name is None:
+
+            if app_obj.media_dir_cache_root != app_obj.downloads_dir:
+                app_obj.reset_media_dir_cache()
+            elif self.dbid in app_obj.media_dir_cache_dict:
+                return app_obj.media_dir_cache_dict[self.dbid]
+
         if self.external_dir is not None:
 
-            return self.external_dir
+            actual_dir = self.external_dir
 
         elif self.master_dbid != self.dbid:
 
             master_obj = app_obj.media_reg_dict[self.master_dbid]
-            return master_obj.get_default_dir(app_obj, new_name)
+            actual_dir = master_obj.get_default_dir(app_obj, new_name)
 
         else:
 
-            return self.get_default_dir(app_obj, new_name)
+            actual_dir = self.get_default_dir(app_obj, new_name)
+
+        if new_name is None:
+            app_obj.media_dir_cache_dict[self.dbid] = actual_dir
+
+        return actual_dir
 
 
     def get_default_dir(self, app_obj, new_name=None):
@@ -1695,15 +1947,19 @@ class GenericRemoteContainer(GenericContainer):
 
         # Only media.Video objects can be added to a channel or playlist as a
         #   child object. Also, check this is not already a child object
-        if isinstance(child_obj, Video) or child_obj in self.child_list:
+        if isinstance(child_obj, Video) or self.check_child(child_obj):
 
+            notify_modify(self, 'child_list')
             self.child_list.append(child_obj)
+            self.child_dbid_set.add(child_obj.dbid)
             if not no_sort_flag:
                 self.sort_children(app_obj)
 
             if isinstance(child_obj, Video):
                 self.vid_count += 1
 
+        self.render_version += 1
+
 
     def sort_children(self, app_obj):
 
@@ -1768,6 +2024,7 @@ class GenericRemoteContainer(GenericContainer):
 
         self.error_list = other_obj.error_list.copy()
         self.warning_list = other_obj.warning_list.copy()
+        self.render_version += 1
 
 
     def reset_rss(self):
@@ -1780,6 +2037,7 @@ class GenericRemoteContainer(GenericContainer):
         # (Don't overwrite an existing entry unless the existing name is blank)
         if not playlist_id in self.playlist_id_dict \
         or self.playlist_id_dict[playlist_id] is None:
+            notify_modify(self, 'playlist_id_dict')
             self.playlist_id_dict[playlist_id] = playlist_title
 
 
@@ -1819,6 +2077,7 @@ class GenericRemoteContainer(GenericContainer):
                 json_dict = app_obj.file_manager_obj.load_json(json_path)
                 if 'playlist_id' in json_dict:
 
+                    notify_modify(self, 'playlist_id_dict')
                     if 'playlist_title' in json_dict:
                         self.playlist_id_dict[json_dict['playlist_id']] \
                         = json_dict['playlist_title']
@@ -1832,6 +2091,7 @@ class GenericRemoteContainer(GenericContainer):
         self.source = source
         self.enhanced = ttutils.is_enhanced(source)
         self.update_rss_from_url(source)
+        self.render_version += 1
 
 
 class Video(GenericMedia):
@@ -2121,6 +2381,17 @@ class Video(GenericMedia):
         #   tries to re-download a channel/playlist and no new videos are
         #   found, the flag remains set to True
         self.dummy_dl_flag = False
+        # Counter incremented whenever this object is modified in a way that
+        #   might change the text (or icon) used to display it, for example in
+        #   a tooltip or in the Video Index (see self.get_render_cache() )
+        self.render_version = 0
+        # Cache of text (and icons) generated to display this object, so they
+        #   aren't generated again while the object is unmodified. The cache
+        #   is not saved in the database file. Dictionary in the form
+        #       render_cache_dict[name] = [render_version, signature, value]
+        #   ...where 'signature' is a tuple of any other values (for example,
+        #   settings) used to generate the value
+        self.render_cache_dict = {}
 
 
         # Code
@@ -2166,6 +2437,7 @@ class Video(GenericMedia):
             'dummy_dir': None,
             'dummy_path': None,
             'dummy_format': None,
+            'render_version': 0,
         }
 
 
@@ -2221,6 +2493,26 @@ class Video(GenericMedia):
 
         """
 
+        # The tooltip is rebuilt only when this object changes, or when any of
+        #   the values it depends on (outside of this object) are modified
+        if self.parent_obj:
+            parent_name = self.parent_obj.name
+        else:
+            parent_name = None
+
+        signature = (
+            max_length,
+            show_error_flag,
+            app_obj.show_tooltips_extra_flag,
+            app_obj.downloads_dir,
+            app_obj.media_dir_cache_version,
+            parent_name,
+        )
+
+        text = self.get_render_cache('tooltip', signature)
+        if text is not None:
+            return text
+
         if not self.dummy_flag:
 
             ignore_me = _(
@@ -2300,6 +2592,7 @@ class Video(GenericMedia):
         if max_length is not None:
             text = ttutils.tidy_up_long_descrip(text, max_length)
 
+        self.set_render_cache('tooltip', signature, text)
         return text
 
 
@@ -2628,6 +2921,8 @@ class Video(GenericMedia):
         else:
             self.archive_flag = False
 
+        self.render_version += 1
+
 
     def set_author(self, author):
 
@@ -2641,6 +2936,8 @@ class Video(GenericMedia):
         else:
             self.block_flag = False
 
+        self.render_version += 1
+
 
     def set_bookmark_flag(self, flag):
 
@@ -2649,6 +2946,8 @@ class Video(GenericMedia):
         else:
             self.bookmark_flag = False
 
+        self.render_version += 1
+
 
     def set_cloned_name(self, orig_obj):
 
@@ -2668,6 +2967,7 @@ class Video(GenericMedia):
         self.nickname = orig_obj.nickname
         self.descrip = orig_obj.descrip
         self.short = orig_obj.short
+        self.render_version += 1
 
 
     def set_dl_flag(self, flag=False):
@@ -2677,6 +2977,8 @@ class Video(GenericMedia):
         if self.receive_time is None:
             self.receive_time = int(time.time())
 
+        self.render_version += 1
+
 
     def set_dl_sim_flag(self, flag):
 
@@ -2685,6 +2987,8 @@ class Video(GenericMedia):
         else:
             self.dl_sim_flag = False
 
+        self.render_version += 1
+
 
     def set_dummy(self, url, dir_str, format_str):
 
@@ -2714,6 +3018,7 @@ class Video(GenericMedia):
         self.dummy_format = format_str
 
         self.source = url
+        self.render_version += 1
 
 
     def set_dummy_dl_flag(self, flag):
@@ -2723,10 +3028,13 @@ class Video(GenericMedia):
         else:
             self.dummy_dl_flag = False
 
+        self.render_version += 1
+
 
     def set_dummy_path(self, path):
 
         self.dummy_path = path
+        self.render_version += 1
 
 
     def set_dummy_sblock_flag(self, flag):
@@ -2753,11 +3061,13 @@ class Video(GenericMedia):
 
         self.file_name = filename
         self.file_ext = extension
+        self.render_version += 1
 
 
     def set_file_ext(self, extension):
 
         self.file_ext = extension
+        self.render_version += 1
 
 
     def set_file_from_path(self, path):
@@ -2766,6 +3076,7 @@ class Video(GenericMedia):
         filename, extension = os.path.splitext(this_file)
         self.file_name = filename
         self.file_ext = extension
+        self.render_version += 1
 
 
     def set_file_size(self, size=None):
@@ -2784,6 +3095,7 @@ class Video(GenericMedia):
     def set_live_mode(self, mode):
 
         self.live_mode = mode
+        self.render_version += 1
 
 
     def set_live_data(self, live_data_dict):
@@ -2813,6 +3125,8 @@ class Video(GenericMedia):
         else:
             self.missing_flag = False
 
+        self.render_version += 1
+
 
     def set_mkv(self):
 
@@ -2832,6 +3146,7 @@ class Video(GenericMedia):
     def set_name(self, name):
 
         self.name = name
+        self.render_version += 1
 
 
     def set_new_flag(self, flag):
@@ -2841,6 +3156,8 @@ class Video(GenericMedia):
         else:
             self.new_flag = False
 
+        self.render_version += 1
+
 
 #   def set_options_obj():      # Inherited from GenericMedia
 
@@ -2853,6 +3170,7 @@ class Video(GenericMedia):
     def set_parent_obj(self, parent_obj):
 
         self.parent_obj = parent_obj
+        self.render_version += 1
 
 
     def set_receive_time(self, other_video_obj=None):
@@ -2879,6 +3197,7 @@ class Video(GenericMedia):
     def set_source(self, source):
 
         self.source = source
+        self.render_version += 1
 
 
     def set_split_flag(self, flag):
@@ -2955,6 +3274,8 @@ class Video(GenericMedia):
         else:
             self.waiting_flag = False
 
+        self.render_version += 1
+
 
     def set_was_live_flag(self, flag):
 
@@ -2963,6 +3284,8 @@ class Video(GenericMedia):
         else:
             self.was_live_flag = False
 
+        self.render_version += 1
+
 
     # Get accessors
 
@@ -3112,6 +3435,9 @@ class Video(GenericMedia):
         checks to see whether the file exists in the '.thumbs' or '.data'
         sub-directory and, if so, returns the file path.
 
+        Both checks use cached directory listings (see
+        files.FileManager.get_dir_listing() ).
+
         Args:
 
             app_obj (mainapp.TartubeApp): The main application
@@ -3128,15 +3454,14 @@ class Video(GenericMedia):
         if not ext.find('.') == 0:
             ext = '.' + ext
 
+        actual_dir = self.parent_obj.get_actual_dir(app_obj)
+
         # Check the normal location
         main_path = os.path.abspath(
-            os.path.join(
-                self.parent_obj.get_actual_dir(app_obj),
-                self.file_name + ext,
-            ),
+            os.path.join(actual_dir, self.file_name + ext),
         )
 
-        if os.path.isfile(main_path):
+        if app_obj.file_manager_obj.check_path(main_path):
             return main_path
 
         # Check the sub-directory location
@@ -3144,7 +3469,7 @@ class Video(GenericMedia):
 
             subdir_path = os.path.abspath(
                 os.path.join(
-                    self.parent_obj.get_actual_dir(app_obj),
+                    actual_dir,
                     app_obj.thumbs_sub_dir,
                     self.file_name + ext,
                 ),
@@ -3154,13 +3479,13 @@ class Video(GenericMedia):
 
             subdir_path = os.path.abspath(
                 os.path.join(
-                    self.parent_obj.get_actual_dir(app_obj),
+                    actual_dir,
                     app_obj.metadata_sub_dir,
                     self.file_name + ext,
                 ),
             )
 
-        if os.path.isfile(subdir_path):
+        if app_obj.file_manager_obj.check_path(subdir_path):
             return subdir_path
         else:
             return None
@@ -3456,6 +3781,10 @@ class Channel(GenericRemoteContainer):
         self.parent_obj = parent_obj
         # List of media.Video objects for this channel
         self.child_list = []
+        # Set of the .dbids of every object in self.child_list, so that
+        #   membership can be checked without searching the list (see
+        #   self.check_child() )
+        self.child_dbid_set = set()
         # The options.OptionsManager object that specifies how this channel is
         #   downloaded (or None, if the parent's options.OptionsManager object
         #   should be used instead)
@@ -3561,6 +3890,17 @@ class Channel(GenericRemoteContainer):
         #   stored in the media.Video object
         self.error_list = []
         self.warning_list = []
+        # Counter incremented whenever this object is modified in a way that
+        #   might change the text (or icon) used to display it, for example in
+        #   a tooltip or in the Video Index (see self.get_render_cache() )
+        self.render_version = 0
+        # Cache of text (and icons) generated to display this object, so they
+        #   aren't generated again while the object is unmodified. The cache
+        #   is not saved in the database file. Dictionary in the form
+        #       render_cache_dict[name] = [render_version, signature, value]
+        #   ...where 'signature' is a tuple of any other values (for example,
+        #   settings) used to generate the value
+        self.render_cache_dict = {}
 
 
         # Code
@@ -3597,6 +3937,10 @@ class Channel(GenericRemoteContainer):
             'live_count': 0,
             'missing_count': 0,
             'waiting_count': 0,
+            'child_dbid_set': set(
+                child_obj.dbid for child_obj in self.child_list
+            ),
+            'render_version': 0,
         }
 
 
@@ -3606,6 +3950,9 @@ class Channel(GenericRemoteContainer):
 #   def add_child():                # Inherited from GenericRemoteContainer
 
 
+#   def check_child():              # Inherited from GenericContainer
+
+
 #   def check_duplicate_video():            # Inherited from GenericContainer
 
 
@@ -3802,6 +4149,10 @@ class Playlist(GenericRemoteContainer):
         self.parent_obj = parent_obj
         # List of media.Video objects for this playlist
         self.child_list = []
+        # Set of the .dbids of every object in self.child_list, so that
+        #   membership can be checked without searching the list (see
+        #   self.check_child() )
+        self.child_dbid_set = set()
         # The options.OptionsManager object that specifies how this playlist
         #   is downloaded (or None, if the parent's options.OptionsManager
         #   object should be used instead)
@@ -3909,6 +4260,17 @@ class Playlist(GenericRemoteContainer):
         #   stored in the media.Video object
         self.error_list = []
         self.warning_list = []
+        # Counter incremented whenever this object is modified in a way that
+        #   might change the text (or icon) used to display it, for example in
+        #   a tooltip or in the Video Index (see self.get_render_cache() )
+        self.render_version = 0
+        # Cache of text (and icons) generated to display this object, so they
+        #   aren't generated again while the object is unmodified. The cache
+        #   is not saved in the database file. Dictionary in the form
+        #       render_cache_dict[name] = [render_version, signature, value]
+        #   ...where 'signature' is a tuple of any other values (for example,
+        #   settings) used to generate the value
+        self.render_cache_dict = {}
 
 
         # Code
@@ -3945,6 +4307,10 @@ class Playlist(GenericRemoteContainer):
             'live_count': 0,
             'missing_count': 0,
             'waiting_count': 0,
+            'child_dbid_set': set(
+                child_obj.dbid for child_obj in self.child_list
+            ),
+            'render_version': 0,
         }
 
 
@@ -3954,6 +4320,9 @@ class Playlist(GenericRemoteContainer):
 #   def add_child():                # Inherited from GenericRemoteContainer
 
 
+#   def check_child():              # Inherited from GenericContainer
+
+
 #   def check_duplicate_video():            # Inherited from GenericContainer
 
 
@@ -4167,6 +4536,10 @@ class Folder(GenericContainer):
         # List of media.Video, media.Channel, media.Playlist and media.Folder
         #   objects for which this object is the parent
         self.child_list = []
+        # Set of the .dbids of every object in self.child_list, so that
+        #   membership can be checked without searching the list (see
+        #   self.check_child() )
+        self.child_dbid_set = set()
         # The options.OptionsManager object that specifies how this channel is
         #   downloaded (or None, if the parent's options.OptionsManager object
         #   should be used instead)
@@ -4270,6 +4643,17 @@ class Folder(GenericContainer):
         self.missing_count = 0
         self.new_count = 0
         self.waiting_count = 0
+        # Counter incremented whenever this object is modified in a way that
+        #   might change the text (or icon) used to display it, for example in
+        #   a tooltip or in the Video Index (see self.get_render_cache() )
+        self.render_version = 0
+        # Cache of text (and icons) generated to display this object, so they
+        #   aren't generated again while the object is unmodified. The cache
+        #   is not saved in the database file. Dictionary in the form
+        #       render_cache_dict[name] = [render_version, signature, value]
+        #   ...where 'signature' is a tuple of any other values (for example,
+        #   settings) used to generate the value
+        self.render_cache_dict = {}
 
 
         # Code
@@ -4314,6 +4698,10 @@ class Folder(GenericContainer):
             'live_count': 0,
             'missing_count': 0,
             'waiting_count': 0,
+            'child_dbid_set': set(
+                child_obj.dbid for child_obj in self.child_list
+            ),
+            'render_version': 0,
         }
 
 
@@ -4340,15 +4728,33 @@ class Folder(GenericContainer):
         """
 
         # Check this is not already a child object
-        if not child_obj in self.child_list:
+        if not self.check_child(child_obj):
 
-            self.child_list.append(child_obj)
-            if not no_sort_flag:
+            notify_modify(self, 'child_list')
+            self.child_dbid_set.add(child_obj.dbid)
+
+            if no_sort_flag:
+                self.child_list.append(child_obj)
+
+            elif self.priv_flag:
+
+                # Private folders like 'All Videos' can be very large, so
+                #   rather than re-sorting the whole list, insert the new child
+                #   into its sorted position
+                self.insert_child_sorted(app_obj, child_obj)
+
+            else:
+                self.child_list.append(child_obj)
                 self.sort_children(app_obj)
 
             if isinstance(child_obj, Video):
                 self.vid_count += 1
 
+        self.render_version += 1
+
+
+#   def check_child():              # Inherited from GenericContainer
+
 
 #   def check_duplicate_video():            # Inherited from GenericContainer
 
@@ -4359,6 +4765,42 @@ class Folder(GenericContainer):
 #   def del_child():                # Inherited from GenericContainer
 
 
+    def insert_child_sorted(self, app_obj, child_obj):
+
+        """Called by self.add_child().
+
+        Inserts a child object into self.child_list, using a binary search to
+        find its position, so that the list doesn't need to be re-sorted. (If
+        the list is not already sorted, the position is approximate; the list
+        is sorted again before it's displayed in the Video Catalogue.)
+
+        Args:
+
+            app_obj (mainapp.TartubeApp): The main application
+
+            child_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The child object
+
+        """
+
+        low = 0
+        high = len(self.child_list)
+        while low < high:
+
+            mid = (low + high) // 2
+            if app_obj.folder_child_compare(
+                child_obj,
+                self.child_list[mid],
+            ) < 0:
+                high = mid
+            else:
+                low = mid + 1
+
+        notify_modify(self, 'child_list')
+        self.child_list.insert(low, child_obj)
+        self.render_version += 1
+
+
     def sort_children(self, app_obj):
 
         """Can be called by anything. For example, called by self.add_child().
@@ -4397,6 +4839,8 @@ class Folder(GenericContainer):
         else:
             self.hidden_flag = False
 
+        self.render_version += 1
+
 
 #   def set_options_obj():          # Inherited from GenericMedia
 
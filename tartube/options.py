@@ -25,6 +25,7 @@
 
 
 # Import other modules
+import copy
 import os
 import re
 
@@ -1432,6 +1433,24 @@ class OptionsParser(object):
 #           OptionHolder('store_comments_in_db', '', False),
 #           OptionHolder('downloader_config', '', False),
         ]
+        # The names of options in self.option_holder_list that must be parsed
+        #   separately for each media data object (because their values, or
+        #   the way they are parsed, depend on that object or on the state of
+        #   the download operation)
+        self.per_item_list = ['proxy', 'limit_rate', 'trim_filenames']
+        # Download options compiled by self.compile_options(), so that they
+        #   don't have to be compiled again for every media data object (for
+        #   example, when checking many channels that share the same
+        #   options.OptionsManager). Dictionary in the form
+        #       template_dict[key] = [options_dict, app_tuple, template_dict]
+        #   ...where 'key' is a tuple in the form
+        #       (options_manager_uid, operation_type, kind, dummy_format)
+        #   ...'kind' is 'video' or 'container', 'options_dict' is a copy of
+        #   the options.OptionsManager's options when they were compiled,
+        #   'app_tuple' contains the main application settings that were
+        #   used, and 'template_dict' is the return value of
+        #   self.compile_options()
+        self.template_dict = {}
 
 
     # Public class methods
@@ -1447,6 +1466,11 @@ class OptionsParser(object):
         options.OptionsManager object into a list of youtube-dl command line
         options.
 
+        Most of the list doesn't depend on the media data object being
+        downloaded, so it is compiled once (see self.get_template() ), and
+        only the per-item options (the output path, rate limit, proxy and so
+        on) are added each time.
+
         Args:
 
             media_data_obj (media.Video, media.Channel, media.Playlist,
@@ -1469,9 +1493,6 @@ class OptionsParser(object):
 
         """
 
-        # Force youtube-dl's progress bar to be outputted as separate lines
-        options_list = ['--newline']
-
         # Create a copy of the dictionary
         copy_dict = options_manager_obj.options_dict.copy()
 
@@ -1482,125 +1503,153 @@ class OptionsParser(object):
             operation_type,
         )
 
-        # Modify various values in the copy. Set the 'video_format' and
-        #   'all_formats' options
-        self.build_video_format(media_data_obj, copy_dict, operation_type)
-        # Set the 'min_filesize' and 'max_filesize' options
-        self.build_file_sizes(copy_dict)
-        # Set the 'limit_rate' option
+        # Get the options that don't depend on this media data object
+        template_dict = self.get_template(
+            media_data_obj,
+            options_manager_obj,
+            operation_type,
+        )
+
+        # Modify various values in the copy. Set the 'limit_rate' option
         self.build_limit_rate(copy_dict, scheduled_obj)
         # Set the 'proxy' option
         self.build_proxy(copy_dict)
 
-        # Parse basic youtube-dl command line options
-        for option_holder_obj in self.option_holder_list:
+        # Add the compiled options, and parse the per-item options in their
+        #   proper place
+        options_list = []
+        for item in template_dict['head_list']:
+
+            if isinstance(item, OptionHolder):
+                self.parse_option_holder(
+                    item,
+                    copy_dict,
+                    dir_path,
+                    options_list,
+                )
+            else:
+                options_list.append(item)
 
-            # First deal with special cases...
-            if option_holder_obj.name == 'extract_audio':
-                if copy_dict['audio_format'] == '':
-                    value = copy_dict[option_holder_obj.name]
+        # Add the SponsorBlock option used in Classic Mode downloads
+        if (
+            operation_type == 'classic_sim' \
+            or operation_type == 'classic_real' \
+            or operation_type == 'classic_custom'
+        ) and media_data_obj.dummy_sblock_flag:
+            options_list.append('--sponsorblock-remove')
+            options_list.append('default')
 
-                    if value != option_holder_obj.default_value:
-                        options_list.append(option_holder_obj.switch)
+        # Build the --output and --paths options
+        options_list = self.build_paths(
+            media_data_obj,
+            dir_path,
+            copy_dict,
+            options_list,
+        )
 
-            elif option_holder_obj.name == 'audio_format':
-                value = copy_dict[option_holder_obj.name]
+        # Add the 'extra_cmd_string' and comment options
+        options_list.extend(template_dict['tail_list'])
 
-                if copy_dict['extract_audio'] \
-                and value != option_holder_obj.default_value:
-                    options_list.append('-x')
-                    options_list.append(option_holder_obj.switch)
-                    options_list.append(ttutils.to_string(value))
+        # Parse the 'downloader_config' option, so it overrules everything
+        #   else
+        if copy_dict['downloader_config']:
 
-                    # The '-x' / '--audio-quality' switch must precede the
-                    #   '--audio-quality' switch, if both are used
-                    # Therefore, if the current value of the 'audio_quality'
-                    #   option is not the default value ('5'), then insert the
-                    #   '--audio-quality' switch into the options list right
-                    #   now
-                    if copy_dict['audio_quality'] != '5':
-                        options_list.append('--audio-quality')
-                        options_list.append(
-                            ttutils.to_string(copy_dict['audio_quality']),
-                        )
-
-            elif option_holder_obj.name == 'audio_quality':
-                # If the '--audio-quality' switch was not added by the code
-                #   block just above, then follow the standard procedure
-                if option_holder_obj.switch not in options_list:
-                    if option_holder_obj.check_requirements(copy_dict):
-                        value = copy_dict[option_holder_obj.name]
-
-                        if value != option_holder_obj.default_value:
-                            options_list.append(option_holder_obj.switch)
-                            options_list.append(ttutils.to_string(value))
-
-            elif option_holder_obj.name == 'match_filter':
-                value = ttutils.to_string(copy_dict[option_holder_obj.name])
-                if self.app_obj.block_livestreams_flag:
-
-                    if value == '':
-                        value = '!is_live'
-                    else:
-                        value += r' & !is_live'
+            options_list.append('--config-location')
+            options_list.append(ttutils.get_dl_config_path(self.app_obj))
 
-                if value != '':
-                    options_list.append(option_holder_obj.switch)
-                    options_list.append(value)
+        # Filter out yt-dlp options, if required. A list of them is specified
+        #   in mainapp.TartubeApp.ytdlp_exclusive_options_dict
+        if self.app_obj.ytdlp_filter_options_flag \
+        and (
+            self.app_obj.ytdl_fork is None \
+            or self.app_obj.ytdl_fork != 'yt-dlp'
+        ):
+            filter_list = options_list.copy()
+            options_list = []
+
+            while filter_list:
+
+                item = filter_list.pop(0)
+                if item in self.app_obj.ytdlp_exclusive_options_dict:
+
+                    if self.app_obj.ytdlp_exclusive_options_dict[item]:
+                        # This option takes an argument
+                        filter_list.pop(0)
 
-            elif option_holder_obj.name == 'external_arg_string' \
-            or option_holder_obj.name == 'pp_args':
-                value = copy_dict[option_holder_obj.name]
-                if value != '':
-                    options_list.append(option_holder_obj.switch)
-                    options_list.append('"' + ttutils.to_string(value) + '"')
-
-            elif option_holder_obj.name == 'cookies_path':
-                cookies_path = copy_dict[option_holder_obj.name]
-                options_list.append('--cookies')
-                # If no path is specified, use a standard location for the
-                #   cookie jar (otherwise youtube-dl will write it to
-                #   ../tartube/tartube)
-                if cookies_path == '':
-                    options_list.append(
-                        os.path.abspath(
-                            os.path.join(
-                                self.app_obj.data_dir,
-                                self.app_obj.cookie_file_name,
-                            ),
-                        ),
-                    )
                 else:
-                    options_list.append(cookies_path)
-
-            elif option_holder_obj.name == 'trim_filenames':
-                length = copy_dict[option_holder_obj.name]
-                # The --trim-filenames option specifies a length that includes
-                #   the directory name. If the user has specified a length that
-                #   is shorter than the directory name, then ignore this
-                #   option
-                if length >= (len(dir_path) + 2):
-                    options_list.append('--trim-filenames')
-                    options_list.append(str(length))
-
-            # For all other options, just check the value is valid
-            elif option_holder_obj.check_requirements(copy_dict):
-                value = copy_dict[option_holder_obj.name]
+                    options_list.append(item)
 
-                if value != option_holder_obj.default_value:
-                    options_list.append(option_holder_obj.switch)
+        # Parsing complete
+        return options_list
 
-                    if not option_holder_obj.is_boolean():
-                        options_list.append(ttutils.to_string(value))
+
+    def compile_options(self, media_data_obj, options_manager_obj,
+    operation_type):
+
+        """Called by self.get_template().
+
+        Converts the download options that don't depend on the media data
+        object being downloaded into a list of youtube-dl command line options.
+
+        Args:
+
+            media_data_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The media data object being downloaded
+
+            options_manager_obj (options.OptionsManager): The object containing
+                the download options for this media data object
+
+            operation_type (str): 'sim', 'real', 'custom_sim', 'custom_real',
+                'classic_sim', 'classic_real', 'classic_custom' (matching
+                possible values of downloads.DownloadManager.operation_type)
+
+        Return values:
+
+            A dictionary in the form
+
+                template_dict['head_list'] = Options that precede the --output
+                    option. Options which must be parsed separately for each
+                    media data object are represented by their
+                    options.OptionHolder objects
+                template_dict['tail_list'] = Options that follow the --output
+                    and --paths options
+
+        """
+
+        # Force youtube-dl's progress bar to be outputted as separate lines
+        head_list = ['--newline']
+        tail_list = []
+
+        # Create a copy of the dictionary
+        copy_dict = options_manager_obj.options_dict.copy()
+
+        # Modify various values in the copy. Set the 'video_format' and
+        #   'all_formats' options
+        self.build_video_format(media_data_obj, copy_dict, operation_type)
+        # Set the 'min_filesize' and 'max_filesize' options
+        self.build_file_sizes(copy_dict)
+
+        # Parse basic youtube-dl command line options
+        for option_holder_obj in self.option_holder_list:
+
+            if option_holder_obj.name in self.per_item_list:
+                head_list.append(option_holder_obj)
+            else:
+                self.parse_option_holder(
+                    option_holder_obj,
+                    copy_dict,
+                    None,
+                    head_list,
+                )
 
         # Parse the 'match_title_list' and 'reject_title_list'
         for item in copy_dict['match_title_list']:
-            options_list.append('--match-title')
-            options_list.append(item)
+            head_list.append('--match-title')
+            head_list.append(item)
 
         for item in copy_dict['reject_title_list']:
-            options_list.append('--reject-title')
-            options_list.append(item)
+            head_list.append('--reject-title')
+            head_list.append(item)
 
         # Parse the 'subs_lang_list' option
         if copy_dict['write_subs'] \
@@ -1608,37 +1657,19 @@ class OptionsParser(object):
         and not copy_dict['write_all_subs'] \
         and copy_dict['subs_lang_list']:
 
-            options_list.append('--sub-lang')
-            options_list.append(','.join(copy_dict['subs_lang_list']))
+            head_list.append('--sub-lang')
+            head_list.append(','.join(copy_dict['subs_lang_list']))
 
         # Parse the 'extractor_args_list' option
         for item in copy_dict['extractor_args_list']:
-            options_list.append('--extractor-args')
-            options_list.append(item)
-
-        # Add the SponsorBlock option used in Classic Mode downloads
-        if (
-            operation_type == 'classic_sim' \
-            or operation_type == 'classic_real' \
-            or operation_type == 'classic_custom'
-        ) and media_data_obj.dummy_sblock_flag:
-            options_list.append('--sponsorblock-remove')
-            options_list.append('default')
-
-        # Build the --output and --paths options
-        options_list = self.build_paths(
-            media_data_obj,
-            dir_path,
-            copy_dict,
-            options_list,
-        )
+            head_list.append('--extractor-args')
+            head_list.append(item)
 
         # Parse the 'extra_cmd_string' option, so it overrules everything else.
         #   The option can contain arguments inside double quotes "..."
         #   (arguments that can therefore contain whitespace)
         parsed_list = ttutils.parse_options(copy_dict['extra_cmd_string'])
-        for item in parsed_list:
-            options_list.append(item)
+        tail_list.extend(parsed_list)
 
         # Parse the comment options
         if (
@@ -1657,44 +1688,218 @@ class OptionsParser(object):
                 or operation_type == 'classic_custom'
             )
         ):
-            options_list.append('--write-comments')
+            tail_list.append('--write-comments')
 
-        # Parse the 'downloader_config' option, so it overrules everything
-        #   else
-        if copy_dict['downloader_config']:
+        return {
+            'head_list': head_list,
+            'tail_list': tail_list,
+        }
 
-            options_list.append('--config-location')
-            options_list.append(ttutils.get_dl_config_path(self.app_obj))
 
-        # Filter out yt-dlp options, if required. A list of them is specified
-        #   in mainapp.TartubeApp.ytdlp_exclusive_options_dict
-        if self.app_obj.ytdlp_filter_options_flag \
-        and (
-            self.app_obj.ytdl_fork is None \
-            or self.app_obj.ytdl_fork != 'yt-dlp'
-        ):
-            filter_list = options_list.copy()
-            options_list = []
+    def get_template(self, media_data_obj, options_manager_obj,
+    operation_type):
 
-            while filter_list:
+        """Called by self.parse().
 
-                item = filter_list.pop(0)
-                if item in self.app_obj.ytdlp_exclusive_options_dict:
+        Returns the compiled download options that don't depend on the media
+        data object being downloaded, compiling them if necessary (see
+        self.compile_options() ).
 
-                    if self.app_obj.ytdlp_exclusive_options_dict[item]:
-                        # This option takes an argument
-                        filter_list.pop(0)
+        Compiled options are re-used for every media data object of the same
+        kind that uses the same options.OptionsManager, during the same kind of
+        operation. They are compiled again if the download options, or any of
+        the main application settings used to compile them, have changed.
 
-                else:
-                    options_list.append(item)
+        Args:
 
-        # Parsing complete
-        return options_list
+            media_data_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The media data object being downloaded
+
+            options_manager_obj (options.OptionsManager): The object containing
+                the download options for this media data object
+
+            operation_type (str): 'sim', 'real', 'custom_sim', 'custom_real',
+                'classic_sim', 'classic_real', 'classic_custom' (matching
+                possible values of downloads.DownloadManager.operation_type)
+
+        Return values:
+
+            The return value of self.compile_options()
+
+        """
+
+        # Only videos have formats applied to them. Videos in the Classic
+        #   Mode tab might also specify their own format
+        if not isinstance(media_data_obj, media.Video):
+            key = (options_manager_obj.uid, operation_type, 'container', None)
+        elif operation_type == 'classic_sim' \
+        or operation_type == 'classic_real' \
+        or operation_type == 'classic_custom':
+            key = (
+                options_manager_obj.uid,
+                operation_type,
+                'video',
+                media_data_obj.dummy_format,
+            )
+        else:
+            key = (options_manager_obj.uid, operation_type, 'video', None)
+
+        # Main application settings used by self.compile_options()
+        app_tuple = (
+            self.app_obj.block_livestreams_flag,
+            self.app_obj.data_dir,
+            self.app_obj.cookie_file_name,
+            self.app_obj.video_res_apply_flag,
+            self.app_obj.video_res_default,
+        )
+
+        if key in self.template_dict:
+
+            options_dict, this_tuple, template_dict = self.template_dict[key]
+            if options_dict == options_manager_obj.options_dict \
+            and this_tuple == app_tuple:
+                return template_dict
+
+        template_dict = self.compile_options(
+            media_data_obj,
+            options_manager_obj,
+            operation_type,
+        )
+
+        self.template_dict[key] = [
+            copy.deepcopy(options_manager_obj.options_dict),
+            app_tuple,
+            template_dict,
+        ]
+
+        return template_dict
+
+
+    def parse_option_holder(self, option_holder_obj, copy_dict, dir_path,
+    options_list):
+
+        """Called by self.parse() and self.compile_options().
+
+        Converts a single download option into youtube-dl command line
+        options, adding them directly to the options list.
+
+        Args:
+
+            option_holder_obj (options.OptionHolder): The option to convert
+
+            copy_dict (dict): Copy of the original options dictionary
+
+            dir_path (str or None): The directory into which files are to be
+                downloaded. Not required by self.compile_options(), which
+                doesn't parse the 'trim_filenames' option
+
+            options_list (list): List of download options compiled so far; this
+                function adds options directly to the list
+
+        """
+
+        # First deal with special cases...
+        if option_holder_obj.name == 'extract_audio':
+            if copy_dict['audio_format'] == '':
+                value = copy_dict[option_holder_obj.name]
+
+                if value != option_holder_obj.default_value:
+                    options_list.append(option_holder_obj.switch)
+
+        elif option_holder_obj.name == 'audio_format':
+            value = copy_dict[option_holder_obj.name]
+
+            if copy_dict['extract_audio'] \
+            and value != option_holder_obj.default_value:
+                options_list.append('-x')
+                options_list.append(option_holder_obj.switch)
+                options_list.append(ttutils.to_string(value))
+
+                # The '-x' / '--audio-quality' switch must precede the
+                #   '--audio-quality' switch, if both are used
+                # Therefore, if the current value of the 'audio_quality'
+                #   option is not the default value ('5'), then insert the
+                #   '--audio-quality' switch into the options list right
+                #   now
+                if copy_dict['audio_quality'] != '5':
+                    options_list.append('--audio-quality')
+                    options_list.append(
+                        ttutils.to_string(copy_dict['audio_quality']),
+                    )
+
+        elif option_holder_obj.name == 'audio_quality':
+            # If the '--audio-quality' switch was not added by the code
+            #   block just above, then follow the standard procedure
+            if option_holder_obj.switch not in options_list:
+                if option_holder_obj.check_requirements(copy_dict):
+                    value = copy_dict[option_holder_obj.name]
+
+                    if value != option_holder_obj.default_value:
+                        options_list.append(option_holder_obj.switch)
+                        options_list.append(ttutils.to_string(value))
+
+        elif option_holder_obj.name == 'match_filter':
+            value = ttutils.to_string(copy_dict[option_holder_obj.name])
+            if self.app_obj.block_livestreams_flag:
+
+                if value == '':
+                    value = '!is_live'
+                else:
+                    value += r' & !is_live'
+
+            if value != '':
+                options_list.append(option_holder_obj.switch)
+                options_list.append(value)
+
+        elif option_holder_obj.name == 'external_arg_string' \
+        or option_holder_obj.name == 'pp_args':
+            value = copy_dict[option_holder_obj.name]
+            if value != '':
+                options_list.append(option_holder_obj.switch)
+                options_list.append('"' + ttutils.to_string(value) + '"')
+
+        elif option_holder_obj.name == 'cookies_path':
+            cookies_path = copy_dict[option_holder_obj.name]
+            options_list.append('--cookies')
+            # If no path is specified, use a standard location for the
+            #   cookie jar (otherwise youtube-dl will write it to
+            #   ../tartube/tartube)
+            if cookies_path == '':
+                options_list.append(
+                    os.path.abspath(
+                        os.path.join(
+                            self.app_obj.data_dir,
+                            self.app_obj.cookie_file_name,
+                        ),
+                    ),
+                )
+            else:
+                options_list.append(cookies_path)
+
+        elif option_holder_obj.name == 'trim_filenames':
+            length = copy_dict[option_holder_obj.name]
+            # The --trim-filenames option specifies a length that includes
+            #   the directory name. If the user has specified a length that
+            #   is shorter than the directory name, then ignore this
+            #   option
+            if length >= (len(dir_path) + 2):
+                options_list.append('--trim-filenames')
+                options_list.append(str(length))
+
+        # For all other options, just check the value is valid
+        elif option_holder_obj.check_requirements(copy_dict):
+            value = copy_dict[option_holder_obj.name]
+
+            if value != option_holder_obj.default_value:
+                options_list.append(option_holder_obj.switch)
+
+                if not option_holder_obj.is_boolean():
+                    options_list.append(ttutils.to_string(value))
 
 
     def build_file_sizes(self, copy_dict):
 
-        """Called by self.parse().
+        """Called by self.compile_options().
 
         Build the value of the 'min_filesize' and 'max_filesize' options and
         store them in the options dictionary.
@@ -1924,7 +2129,7 @@ class OptionsParser(object):
 
     def build_video_format(self, media_data_obj, copy_dict, operation_type):
 
-        """Called by self.parse().
+        """Called by self.compile_options().
 
         Build the value of the 'video_format' and 'all_formats' options and
         store them in the options dictionary.
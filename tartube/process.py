@@ -26,10 +26,10 @@ from gi.repository import GObject
 
 
 # Import other modules
+import concurrent.futures
 import os
 import re
 import shutil
-import subprocess
 import threading
 import time
 
@@ -81,10 +81,11 @@ class ProcessManager(threading.Thread):
         # A list of media.Video objects to be processed with FFmpeg
         self.video_list = video_list
 
-        # The child process created by self.create_child_process(). Used only
-        #   by self.slice_video() to concatenate video clips; all other child
-        #   processes are handled by ffmpeg_tartube.FFmpegManager
-        self.child_process = None
+        # When several videos are processed at the same time, a pool of
+        #   worker threads (a concurrent.futures.ThreadPoolExecutor), each of
+        #   which runs one FFmpeg job at a time. None when videos are
+        #   processed one at a time
+        self.executor = None
 
         # IV list - other
         # ---------------
@@ -116,6 +117,15 @@ class ProcessManager(threading.Thread):
         # Flag set to True if a fatal error occurs
         self.fatal_error_flag = False
 
+        # The number of videos processed at the same time (each in its own
+        #   FFmpeg job), and the number of threads FFmpeg should use for each
+        #   job (None to let FFmpeg decide). Set below
+        self.worker_count = 1
+        self.thread_count = None
+        # The number of jobs that have finished (so far), when several videos
+        #   are processed at the same time
+        self.finish_count = 0
+
         # Dictionary of clip tiles used during this operation (i.e. when
         #   splitting a video into clips), used to re-name duplicates
         self.clip_title_dict = {}
@@ -128,6 +138,21 @@ class ProcessManager(threading.Thread):
         # Code
         # ----
 
+        # Splitting and slicing videos are performed one at a time; only
+        #   videos producing a single output file are processed at the same
+        #   time
+        self.worker_count = min(
+            app_obj.get_process_job_count(),
+            max(1, self.job_total),
+        )
+
+        if self.worker_count > 1:
+
+            self.thread_count = max(
+                1,
+                (os.cpu_count() or 1) // self.worker_count,
+            )
+
         # Let's get this party started!
         self.start()
 
@@ -140,7 +165,8 @@ class ProcessManager(threading.Thread):
         """Called as a result of self.__init__().
 
         Calls FFmpegManager.run_ffmpeg for every media.Video object in the
-        list.
+        list. If allowed, several videos are processed at the same time, using
+        a pool of worker threads.
 
         Then informs the main application that the process operation is
         complete.
@@ -152,20 +178,63 @@ class ProcessManager(threading.Thread):
             _('Starting process operation'),
         )
 
-        # Process each video in turn
+        if self.worker_count > 1:
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                _(
+                'Videos processed at the same time: {0} (threads per video:' \
+                + ' {1})',
+                ).format(str(self.worker_count), str(self.thread_count)),
+            )
+
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.worker_count,
+            )
+
+        # Process each video in turn (or several at a time)
         dest_dir_list = []
         check_dict = {}
-        while self.running_flag and self.video_list:
+        # Dictionary of FFmpeg jobs being performed by the workers, in the form
+        #   job_dict[future] = job_list
+        # ...where 'job_list' is the list returned by self.process_video_start()
+        job_dict = {}
+        while self.video_list or job_dict:
+
+            # Finish any jobs that are complete
+            if job_dict:
+                self.check_jobs(job_dict)
+
+            # After a fatal error (or when the operation has been halted), no
+            #   more jobs are started, but the ones already started are
+            #   allowed to finish
+            if not self.running_flag or self.fatal_error_flag:
+
+                if not job_dict:
+                    break
+                else:
+                    continue
+
+            if not self.video_list or len(job_dict) >= self.worker_count:
+                continue
 
             video_obj = self.video_list.pop(0)
             self.job_count += 1
 
-            # Update our progress in the Output tab
-            self.app_obj.main_win_obj.output_tab_write_stdout(
-                1,
-                _('Video') + ' ' + str(self.job_count) + '/' \
-                + str(self.job_total) + ': ' + video_obj.name,
-            )
+            # Update our progress in the Output tab. Videos processed by the
+            #   workers are shown when their jobs have finished instead, just
+            #   before the output of the job itself (see self.check_jobs() )
+            if not self.executor \
+            or video_obj.dbid in self.app_obj.temp_stamp_buffer_dict \
+            or video_obj.dbid in self.app_obj.temp_slice_buffer_dict \
+            or self.options_obj.options_dict['output_mode'] == 'split' \
+            or self.options_obj.options_dict['output_mode'] == 'slice':
+
+                self.app_obj.main_win_obj.output_tab_write_stdout(
+                    1,
+                    _('Video') + ' ' + str(self.job_count) + '/' \
+                    + str(self.job_total) + ': ' + video_obj.name,
+                )
 
             default_flag = False
             if video_obj.dbid in self.app_obj.temp_stamp_buffer_dict:
@@ -194,6 +263,34 @@ class ProcessManager(threading.Thread):
                 #   .slice_list specified by the media.Video object
                 dest_dir = self.slice_video(video_obj)
 
+            elif self.executor:
+
+                # Process the video with FFmpeg, using one of the workers. One
+                #   source video produces one output video
+                job_list = self.process_video_start(video_obj)
+                if job_list is not None:
+
+                    # Limit the number of threads used by each FFmpeg job, so
+                    #   that the jobs don't compete for the same CPUs (the
+                    #   option is added just before the output file)
+                    cmd_list = job_list[4]
+                    if not '-threads' in cmd_list \
+                    and cmd_list[-1] == job_list[3]:
+                        cmd_list.insert(-1, '-threads')
+                        cmd_list.insert(-1, str(self.thread_count))
+
+                    future_obj = self.executor.submit(
+                        self.app_obj.ffmpeg_manager_obj.run_ffmpeg_directly,
+                        video_obj,
+                        job_list[2],
+                        job_list[4],
+                    )
+
+                    job_dict[future_obj] = job_list
+
+                # (No pause; the workers are busy)
+                continue
+
             else:
 
                 # Process the video with FFmpeg. One source video produces one
@@ -204,8 +301,9 @@ class ProcessManager(threading.Thread):
             if not default_flag:
 
                 if self.fatal_error_flag:
-                    # This is a fatal error
-                    break
+                    # This is a fatal error (the loop continues only until any
+                    #   jobs already started have finished)
+                    continue
 
                 else:
                     # Add the returned destination directory to a list,
@@ -218,6 +316,10 @@ class ProcessManager(threading.Thread):
             #   to hog resources)
             time.sleep(self.sleep_time)
 
+        if self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
         # Operation complete. Set the stop time
         self.stop_time = int(time.time())
 
@@ -241,62 +343,77 @@ class ProcessManager(threading.Thread):
                 ttutils.open_file(self.app_obj, dest_dir)
 
 
-    def create_child_process(self, cmd_list):
-
-        """Called by self.slice_video() only, in order to concatenate video
-        clips into a single video file. All other child processes are handled
-        by ffmpeg_tartube.FFmpegManager.
+    def check_jobs(self, job_dict):
 
-        Based on YoutubeDLDownloader._create_process().
+        """Called by self.run().
 
-        Executes the system command, creating a new child process which
-        concatenates files.
+        Waits (briefly) for any FFmpeg job performed by the workers to finish.
+        For each job that has finished, updates the Output tab and the
+        progress bar, and then updates the media.Video object (which is never
+        done by the workers themselves).
 
         Args:
 
-            cmd_list (list): Python list that contains the command to execute.
+            job_dict (dict): Dictionary of jobs being performed by the
+                workers, in the form job_dict[future] = job_list. Finished jobs
+                are removed from the dictionary
 
         """
 
-        # Strip double quotes from arguments
-        # (Since we're sending the system command one argument at a time, we
-        #   don't need to retain the double quotes around any single argument
-        #   and, in fact, doing so would cause an error)
-        cmd_list = ttutils.strip_double_quotes(cmd_list)
+        done_set, not_done_set = concurrent.futures.wait(
+            list(job_dict.keys()),
+            timeout=self.sleep_time,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
 
-        # Create the child process
-        info = preexec = None
+        # (Finish jobs in the order in which they were started)
+        for future_obj in sorted(done_set, key=lambda x: job_dict[x][0]):
 
-        if os.name == 'nt':
-            # Hide the child process window that MS Windows helpfully creates
-            #   for us
-            info = subprocess.STARTUPINFO()
-            info.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        else:
-            # Make this child process the process group leader, so that we can
-            #   later kill the whole process group with os.killpg
-            preexec = os.setsid
+            job_num, video_obj, source_path, output_path, cmd_list \
+            = job_dict.pop(future_obj)
 
-        try:
-            self.child_process = subprocess.Popen(
-                cmd_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=preexec,
-                startupinfo=info,
+            try:
+                success_flag, msg = future_obj.result()
+            except Exception as e:
+                success_flag, msg = False, str(e)
+
+            self.finish_count += 1
+
+            GObject.timeout_add(
+                0,
+                self.app_obj.main_win_obj.update_progress_bar,
+                video_obj.name,
+                self.finish_count,
+                self.job_total,
             )
 
-        except (ValueError, OSError) as error:
-            pass
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                _('Video') + ' ' + str(job_num) + '/' + str(self.job_total) \
+                + ': ' + video_obj.name,
+            )
+
+            self.app_obj.main_win_obj.output_tab_write_system_cmd(
+                1,
+                ' '.join(cmd_list),
+            )
+
+            self.process_video_finish(
+                video_obj,
+                source_path,
+                output_path,
+                None,
+                success_flag,
+                msg,
+            )
 
 
     def create_temp_dir(self, orig_video_obj, parent_dir):
 
         """Called by self.slice_video().
 
-        Before splitting a video into clips, and then concatenating the clips,
-        create a temporary directory for the clips so we don't accidentally
-        overwrite anything.
+        Before removing slices from a video, create a temporary directory for
+        the output file so we don't accidentally overwrite anything.
 
         Args:
 
@@ -331,33 +448,13 @@ class ProcessManager(threading.Thread):
             return None
 
 
-    def is_child_process_alive(self):
-
-        """Called by self.split_video().
-
-        Based on YoutubeDLDownloader._proc_is_alive().
-
-        Called continuously during concatenation of video clips to check
-        whether the child process has finished or not.
-
-        Return values:
-
-            True if the child process is alive, otherwise returns False.
-
-        """
-
-        if self.child_process is None:
-            return False
-
-        return self.child_process.poll() is None
-
-
     def process_video(self, orig_video_obj, dest_dir=None, start_point=None, \
     stop_point=None, clip_title=None, override_output_mode=None):
 
         """Called by self.run(), .slice_video() and .split_video().
 
-        Sends a single video to FFmpeg for post-processing.
+        Sends a single video to FFmpeg for post-processing, and waits for the
+        result.
 
         Args:
 
@@ -391,6 +488,78 @@ class ProcessManager(threading.Thread):
 
         """
 
+        job_list = self.process_video_start(
+            orig_video_obj,
+            dest_dir,
+            start_point,
+            stop_point,
+            clip_title,
+            override_output_mode,
+        )
+
+        if job_list is None:
+            return False
+
+        job_num, orig_video_obj, source_path, output_path, cmd_list = job_list
+
+        # Update the main window's progress bar
+        GObject.timeout_add(
+            0,
+            self.app_obj.main_win_obj.update_progress_bar,
+            orig_video_obj.name,
+            self.job_count,
+            self.job_total,
+        )
+
+        # Update the Output tab again
+        self.app_obj.main_win_obj.output_tab_write_system_cmd(
+            1,
+            ' '.join(cmd_list),
+        )
+
+        # Process the video
+        success_flag, msg \
+        = self.app_obj.ffmpeg_manager_obj.run_ffmpeg_directly(
+            orig_video_obj,
+            source_path,
+            cmd_list,
+        )
+
+        return self.process_video_finish(
+            orig_video_obj,
+            source_path,
+            output_path,
+            start_point,
+            success_flag,
+            msg,
+        )
+
+
+    def process_video_start(self, orig_video_obj, dest_dir=None,
+    start_point=None, stop_point=None, clip_title=None,
+    override_output_mode=None):
+
+        """Called by self.run() and .process_video().
+
+        Prepares the FFmpeg system command for a single video.
+
+        Args:
+
+            orig_video_obj (media.Video): The video to be sent to FFmpeg
+
+            dest_dir, start_point, stop_point, clip_title,
+            override_output_mode: See the comments in self.process_video()
+
+        Return values:
+
+            On failure, returns None. On success, returns a list in the form
+                [job_num, orig_video_obj, source_path, output_path, cmd_list]
+            ...where 'job_num' is the video's position in the operation, and
+                'cmd_list' is the FFmpeg system command (including the source/
+                output files)
+
+        """
+
         # mainwin.MainWin.on_video_catalogue_process_ffmpeg_multi() should have
         #   filtered any media.Video objects whose .file_name is unknown, but
         #   just in case, check again
@@ -408,7 +577,7 @@ class ProcessManager(threading.Thread):
 
             self.fail_count += 1
 
-            return False
+            return None
 
         # Get the source/output files, ahd the full FFmpeg system command (as a
         #   list, and including the source/output files)
@@ -446,30 +615,44 @@ class ProcessManager(threading.Thread):
 
             self.fail_count += 1
 
-            return False
+            return None
 
-        # Update the main window's progress bar
-        GObject.timeout_add(
-            0,
-            self.app_obj.main_win_obj.update_progress_bar,
-            orig_video_obj.name,
+        return [
             self.job_count,
-            self.job_total,
-        )
-
-        # Update the Output tab again
-        self.app_obj.main_win_obj.output_tab_write_system_cmd(
-            1,
-            ' '.join(cmd_list),
-        )
-
-        # Process the video
-        success_flag, msg \
-        = self.app_obj.ffmpeg_manager_obj.run_ffmpeg_directly(
             orig_video_obj,
             source_path,
+            output_path,
             cmd_list,
-        )
+        ]
+
+
+    def process_video_finish(self, orig_video_obj, source_path, output_path,
+    start_point, success_flag, msg):
+
+        """Called by self.process_video() and .check_jobs().
+
+        After FFmpeg has processed a single video, updates the Output tab and
+        (if required) deletes the original file, renames the thumbnail, and
+        updates the media.Video object.
+
+        Args:
+
+            orig_video_obj (media.Video): The video sent to FFmpeg
+
+            source_path, output_path (str): The full paths to the source and
+                output files
+
+            start_point (str): When splitting a video or removing video slices,
+                the start of the clip; otherwise None
+
+            success_flag, msg: The values returned by
+                ffmpeg_tartube.FFmpegManager.run_ffmpeg_directly()
+
+        Return values:
+
+            True of success, False on failure
+
+        """
 
         if not success_flag:
 
@@ -575,6 +758,9 @@ class ProcessManager(threading.Thread):
                 # Also update its .name IV (but its .nickname)
                 if rename_flag:
                     orig_video_obj.set_name(new_name)
+                    self.app_obj.search_manager_obj.update_video(
+                        orig_video_obj,
+                    )
 
             return True
 
@@ -609,10 +795,8 @@ class ProcessManager(threading.Thread):
                 )
 
         # Import the correct slice list
-        override_output_mode = None
         if orig_video_obj.dbid in self.app_obj.temp_slice_buffer_dict:
 
-            override_output_mode = 'slice'
             temp_flag = True
 
             # Use the temporary buffer
@@ -676,14 +860,47 @@ class ProcessManager(threading.Thread):
             self.fatal_error_flag = True
             return None
 
-        # Extract the clips, one at a time. For each video clip, we use a
-        #   separate FFmpeg command
+        # Remove the slices with a single FFmpeg command, which reads the
+        #   original file once, and writes the output file once
+        output_path = os.path.abspath(
+            os.path.join(
+                temp_dir,
+                orig_video_obj.file_name + orig_video_obj.file_ext,
+            ),
+        )
+
+        try:
+            cmd_list \
+            = self.app_obj.ffmpeg_manager_obj.get_slice_removal_cmd(
+                orig_video_path,
+                output_path,
+                clip_list,
+                os.path.abspath(os.path.join(temp_dir, 'clips.txt')),
+                # Without forced keyframes, the clips can be copied without
+                #   re-encoding them (if FFmpeg supports the concat demuxer)
+                not self.app_obj.slice_video_force_keyframe_flag \
+                and self.app_obj.ffmpeg_manager_obj.has_demuxer('concat'),
+            )
+
+        except:
+            cmd_list = None
+
+        if cmd_list is None:
+
+            self.app_obj.main_win_obj.output_tab_write_stderr(
+                1,
+                _('FAILED: Can\'t write the list of clips'),
+            )
+
+            # (Delete the temporary directory after failure)
+            self.fail_count += 1
+            self.app_obj.remove_directory(temp_dir)
+            return None
+
         list_size = len(clip_list)
         for i in range(list_size):
 
-            mini_list = clip_list[i]
-            start_time = mini_list[0]
-            stop_time = mini_list[1]
+            start_time, stop_time = clip_list[i]
 
             # Update the Output tab
             if not stop_time:
@@ -702,96 +919,49 @@ class ProcessManager(threading.Thread):
                     + ': ' + str(start_time) + ' - ' + str(stop_time)
                 )
 
-            # Extract the clip
-            if not self.process_video(
-                orig_video_obj,
-                temp_dir,
-                start_time,
-                stop_time,
-                'clip_' + str(i + 1),       # Clip title
-                override_output_mode,
-            ):
-                # Don't continue creating more clips after an error
-                self.fatal_error_flag = True
-                # (Delete the temporary directory after failure)
-                self.app_obj.remove_directory(temp_dir)
-                return None
-
-        # If there is more than one clip, they must be concatenated to produce
-        #   a single video (like the original video, from which the video
-        #   slices have been removed)
-        if list_size == 1:
-            output_path = os.path.abspath(
-                os.path.join(temp_dir, 'clip_1' + orig_video_obj.file_ext),
-            )
-
-        else:
-            # For FFmpeg's benefit, write a text file listing every clip
-            line_list = []
-            clips_file = os.path.abspath(
-                os.path.join(temp_dir, 'clips.txt'),
-            )
+        # Update the main window's progress bar
+        GObject.timeout_add(
+            0,
+            self.app_obj.main_win_obj.update_progress_bar,
+            orig_video_obj.name,
+            self.job_count,
+            self.job_total,
+        )
 
-            for i in range(list_size):
-                line_list.append(
-                    'file \'' + os.path.abspath(
-                        os.path.join(
-                            temp_dir,
-                            'clip_' + str(i + 1) + orig_video_obj.file_ext,
-                        ),
-                    ),
-                )
+        # Update the Output tab again
+        self.app_obj.main_win_obj.output_tab_write_system_cmd(
+            1,
+            ' '.join(cmd_list),
+        )
 
-            with open(clips_file, 'w') as fh:
-                fh.write('\n'.join(line_list))
+        success_flag, msg \
+        = self.app_obj.ffmpeg_manager_obj.run_ffmpeg_directly(
+            orig_video_obj,
+            orig_video_path,
+            cmd_list,
+        )
 
-            # Prepare the FFmpeg command to concatenate the clips together
-            output_path = os.path.abspath(
-                os.path.join(
-                    temp_dir,
-                    orig_video_obj.file_name + orig_video_obj.file_ext,
-                ),
-            )
+        if not success_flag or not os.path.isfile(output_path):
 
-            cmd_list = [
-                self.app_obj.ffmpeg_manager_obj.get_executable(),
-                '-safe',
-                '0',
-                '-f',
-                'concat',
-                '-i',
-                clips_file,
-                '-c',
-                'copy',
-                output_path,
-            ]
+            if not success_flag:
+                self.app_obj.main_win_obj.output_tab_write_stderr(
+                    1,
+                    _('FAILED:') + ' ' + msg,
+                )
 
-            # Update the Output tab again
-            self.app_obj.main_win_obj.output_tab_write_system_cmd(
+            self.app_obj.main_win_obj.output_tab_write_stderr(
                 1,
-                ' '.join(cmd_list),
+                _('FAILED: Can\'t remove video slices'),
             )
 
-            # Create a new child process using the command
-            self.create_child_process(cmd_list)
-
-            # Wait for the concatenation to finish. We are not bothered
-            #   about reading the child process STDOUT/STDERR, since we can
-            #   just test for the existence of the output file
-            while self.is_child_process_alive():
-                time.sleep(self.sleep_time)
-
-            if not os.path.isfile(output_path):
-
-                self.app_obj.main_win_obj.output_tab_write_stderr(
-                    1,
-                    _('FAILED: Can\'t concatenate clips'),
-                )
+            # Don't continue after an error
+            self.fail_count += 1
+            self.fatal_error_flag = True
+            # (Delete the temporary directory after failure)
+            self.app_obj.remove_directory(temp_dir)
+            return None
 
-                # (Delete the temporary directory after failure)
-                self.fail_count += 1
-                self.app_obj.remove_directory(temp_dir)
-                return None
+        self.success_count += 1
 
         # Move the single video file back into the parent directory, replacing
         #   any file of the same name that's already there
@@ -904,7 +1074,9 @@ class ProcessManager(threading.Thread):
 
             # One source video is split into one or more video clips, using
             #   timestamps provided by the media.Video object itself
-            # Each video clip uses a separate FFmpeg command
+            # Compile a list of clips, in the form
+            #   [start_stamp, stop_stamp, clip_title]
+            clip_list = []
             list_size = len(stamp_list)
             for i in range(list_size):
 
@@ -927,54 +1099,69 @@ class ProcessManager(threading.Thread):
                 )
 
                 self.clip_title_dict[clip_title] = None
+                clip_list.append( [start_stamp, stop_stamp, clip_title] )
 
-                # Update the Output tab
-                if not stop_stamp:
+            # If possible, extract all the clips with a single FFmpeg command,
+            #   so the source file is only read once
+            source_path = None
+            if list_size > 1:
 
-                    self.app_obj.main_win_obj.output_tab_write_stdout(
-                        1,
-                        _('Video clip') + ' ' + str(i + 1) + '/' \
-                        + str(list_size) + ': ' + start_stamp + ' - ' \
-                        + _('End of video') + ': ' + clip_title
-                    )
-
-                else:
+                source_path, output_list, cmd_list \
+                = self.options_obj.get_split_system_cmd(
+                    self.app_obj,
+                    orig_video_obj,
+                    clip_list,
+                    dest_dir,
+                    # Without forced keyframes, the clips can be copied
+                    #   without re-encoding them
+                    not self.app_obj.split_video_force_keyframe_flag,
+                )
 
-                    self.app_obj.main_win_obj.output_tab_write_stdout(
-                        1,
-                        _('Video clip') + ' ' + str(i + 1) + '/' \
-                        + str(list_size) + ': ' + start_stamp + ' - ' \
-                        + stop_stamp + ': ' + clip_title
-                    )
+            if source_path is not None:
 
-                # Extract the clip
-                if not self.process_video(
+                if not self.split_video_multi(
                     orig_video_obj,
-                    dest_dir,
-                    start_stamp,
-                    stop_stamp,
-                    clip_title,
-                    override_output_mode,
+                    dest_obj,
+                    clip_list,
+                    source_path,
+                    output_list,
+                    cmd_list,
                 ):
-                    # Don't continue creating more clips after an error
+                    # Don't continue after an error
                     self.fatal_error_flag = True
                     return None
 
-                elif dest_obj \
-                and self.app_obj.split_video_add_db_flag:
+            else:
 
-                    new_video_obj = ttutils.clip_add_to_db(
-                        self.app_obj,
-                        dest_obj,
+                # Each video clip uses a separate FFmpeg command
+                for i in range(list_size):
+
+                    start_stamp, stop_stamp, clip_title = clip_list[i]
+
+                    # Update the Output tab
+                    self.split_video_show_clip(i, list_size, clip_list[i])
+
+                    # Extract the clip
+                    if not self.process_video(
                         orig_video_obj,
+                        dest_dir,
+                        start_stamp,
+                        stop_stamp,
                         clip_title,
-                    )
+                        override_output_mode,
+                    ):
+                        # Don't continue creating more clips after an error
+                        self.fatal_error_flag = True
+                        return None
 
-                    if new_video_obj:
+                    elif dest_obj \
+                    and self.app_obj.split_video_add_db_flag:
 
-                        # All done
-                        self.new_video_list.append(new_video_obj)
-                        self.split_success_flag = True
+                        self.split_video_add_clip(
+                            orig_video_obj,
+                            dest_obj,
+                            clip_title,
+                        )
 
         else:
 
@@ -1001,6 +1188,175 @@ class ProcessManager(threading.Thread):
         return dest_dir
 
 
+    def split_video_add_clip(self, orig_video_obj, dest_obj, clip_title):
+
+        """Called by self.split_video() and .split_video_multi().
+
+        Adds a video clip to the database.
+
+        Args:
+
+            orig_video_obj (media.Video): The video that was split
+
+            dest_obj (media.Folder): The folder into which the clip is added
+
+            clip_title (str): The clip's title
+
+        """
+
+        new_video_obj = ttutils.clip_add_to_db(
+            self.app_obj,
+            dest_obj,
+            orig_video_obj,
+            clip_title,
+        )
+
+        if new_video_obj:
+
+            # All done
+            self.new_video_list.append(new_video_obj)
+            self.split_success_flag = True
+
+
+    def split_video_multi(self, orig_video_obj, dest_obj, clip_list,
+    source_path, output_list, cmd_list):
+
+        """Called by self.split_video().
+
+        Extracts all video clips from a video with a single FFmpeg command,
+        then adds the clips to the database (if required).
+
+        Args:
+
+            orig_video_obj (media.Video): The video to be sent to FFmpeg
+
+            dest_obj (media.Folder or None): The folder into which the clips
+                are added, if any
+
+            clip_list (list): A list of clips, each one a list in the form
+                [start_stamp, stop_stamp, clip_title]
+
+            source_path (str): The full path to the source file
+
+            output_list (list): The full paths to the output files, one for
+                each clip
+
+            cmd_list (list): The FFmpeg system command
+
+        Return values:
+
+            True on success, False on failure
+
+        """
+
+        list_size = len(clip_list)
+        for i in range(list_size):
+            self.split_video_show_clip(i, list_size, clip_list[i])
+
+        # Update the main window's progress bar
+        GObject.timeout_add(
+            0,
+            self.app_obj.main_win_obj.update_progress_bar,
+            orig_video_obj.name,
+            self.job_count,
+            self.job_total,
+        )
+
+        # Update the Output tab again
+        self.app_obj.main_win_obj.output_tab_write_system_cmd(
+            1,
+            ' '.join(cmd_list),
+        )
+
+        # Extract the clips
+        success_flag, msg \
+        = self.app_obj.ffmpeg_manager_obj.run_ffmpeg_directly(
+            orig_video_obj,
+            source_path,
+            cmd_list,
+        )
+
+        if not success_flag:
+
+            self.fail_count += 1
+
+            self.app_obj.main_win_obj.output_tab_write_stderr(
+                1,
+                _('FAILED:') + ' ' + msg,
+            )
+
+            return False
+
+        for i in range(list_size):
+
+            output_path = output_list[i]
+            if not os.path.isfile(output_path):
+
+                self.fail_count += 1
+
+                self.app_obj.main_win_obj.output_tab_write_stderr(
+                    1,
+                    _('FAILED: File not found') + ': ' + output_path,
+                )
+
+                return False
+
+            self.success_count += 1
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                _('Output file:') + ' ' + output_path,
+            )
+
+            if dest_obj and self.app_obj.split_video_add_db_flag:
+
+                self.split_video_add_clip(
+                    orig_video_obj,
+                    dest_obj,
+                    clip_list[i][2],
+                )
+
+        return True
+
+
+    def split_video_show_clip(self, index, list_size, mini_list):
+
+        """Called by self.split_video() and .split_video_multi().
+
+        Shows a video clip's timestamps and title in the Output tab.
+
+        Args:
+
+            index (int): The clip's index in the list of clips
+
+            list_size (int): The number of clips
+
+            mini_list (list): A list in the form
+                [start_stamp, stop_stamp, clip_title]
+
+        """
+
+        start_stamp, stop_stamp, clip_title = mini_list
+
+        if not stop_stamp:
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                _('Video clip') + ' ' + str(index + 1) + '/' \
+                + str(list_size) + ': ' + start_stamp + ' - ' \
+                + _('End of video') + ': ' + clip_title
+            )
+
+        else:
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                _('Video clip') + ' ' + str(index + 1) + '/' \
+                + str(list_size) + ': ' + start_stamp + ' - ' \
+                + stop_stamp + ': ' + clip_title
+            )
+
+
     def stop_process_operation(self):
 
         """Called by mainapp.TartubeApp.do_shutdown(), .stop_continue(),
@@ -173,10 +173,18 @@ class RefreshManager(threading.Thread):
 
             obj = obj_list.pop(0)
 
-            if obj.external_dir is not None or obj.dbid != obj.master_dbid:
-                self.refresh_from_actual_destination(obj)
-            else:
-                self.refresh_from_default_destination(obj)
+            # Changes to the videos in this channel/playlist/folder are shown
+            #   in the Video Index and Video Catalogue as a single batch
+            self.app_obj.bulk_change_begin()
+            try:
+                if obj.external_dir is not None \
+                or obj.dbid != obj.master_dbid:
+                    self.refresh_from_actual_destination(obj)
+                else:
+                    self.refresh_from_default_destination(obj)
+
+            finally:
+                self.app_obj.bulk_change_commit()
 
             # Pause a moment, before the next iteration of the loop (don't want
             #   to hog resources)
@@ -467,6 +475,9 @@ class RefreshManager(threading.Thread):
                     ),
                 )
 
+                # Update any statistics snapshots containing this video
+                self.app_obj.stats_manager_obj.update_video(video_obj)
+
                 # If the video's JSON file has been downloaded, we can extract
                 #   video statistics from it
                 self.app_obj.update_video_from_json(video_obj)
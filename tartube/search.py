@@ -0,0 +1,1358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Search manager classes."""
+
+
+# Import Gtk modules
+#   ...
+
+
+# Import other modules
+import datetime
+import hashlib
+import operator
+import os
+import pickle
+import re
+import shlex
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+
+# Import our modules
+import media
+
+
+# Classes
+
+
+class SearchManager(object):
+
+    """Called by mainapp.TartubeApp.__init__().
+
+    Python class to manage an index of the words in each video's name,
+    author, description and comments, so that the Video Catalogue's filter
+    does not have to search the full text of every video.
+
+    The index records which videos contain each word (a run of letters,
+    digits and underscores, converted to lower case). Another index records
+    which words contain each trigram (sequence of three characters).
+
+    Any text containing the search text must also contain a word that
+    contains the longest word in the search text (or, for a regex, the
+    longest word in any text the regex requires). The index is used to find
+    those videos; the calling code then checks them in the usual way.
+
+    The index is saved alongside the database, so it doesn't need to be
+    rebuilt every time Tartube starts. When it is first used, each video's
+    indexed text is checked against the index (by comparing a hash of it; see
+    self.get_signature() ). After that, only the videos whose name, author,
+    description or comments have been modified are re-indexed (this class is
+    told about every modification by media.notify_modify() ).
+
+    The same index is used to search the whole database (see
+    self.search_db() ). The search query can contain words to find in any
+    field, words to find in a particular field (e.g. 'author:smith'), and
+    filters on other values (e.g. 'upload:2020-01..2020-06', 'size:>100M',
+    'duration:<10:00', 'downloaded:yes'). Filters are checked against each
+    video itself.
+
+    Args:
+
+        app_obj (mainapp.TartubeApp): The main application object
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, app_obj):
+
+        super(SearchManager, self).__init__()
+
+        # IV list - class objects
+        # -----------------------
+        # The main application
+        self.app_obj = app_obj
+
+
+        # IV list - other
+        # ---------------
+        # The version of the index file format. If the saved file uses a
+        #   different version, it is ignored (and the index is rebuilt)
+        self.index_version = 2
+        # The file from which the index was loaded (or to which it will be
+        #   saved); None if the file has not been checked yet
+        self.index_path = None
+        # Flag set to True when the index has been modified since it was
+        #   loaded or saved
+        self.modified_flag = False
+
+        # The fields that are indexed
+        self.field_list = ['name', 'author', 'descrip', 'comment']
+        # Dictionary of indexed videos, in the form
+        #   video_dict[dbid] = [signature, word_dict]
+        # ...where 'signature' is the value returned by self.get_signature()
+        #   when the video was indexed, and 'word_dict' is a dictionary in the
+        #   form
+        #       word_dict[field] = frozenset of words
+        # The list is replaced (not modified) when the video is re-indexed
+        self.video_dict = {}
+        # Dictionaries of videos containing each word, one for each field, in
+        #   the form
+        #       word_dict[field][word] = set of dbids
+        self.word_dict = {}
+        # Dictionary of words containing each trigram, in the form
+        #   trigram_dict[trigram] = set of words
+        self.trigram_dict = {}
+        # Dictionary of words in the index, showing the number of fields in
+        #   which they appear, in the form
+        #       word_count_dict[word] = number of fields
+        self.word_count_dict = {}
+
+        # Dictionary of keywords which limit a word in a database search query
+        #   to a single field (e.g. 'name:foo'), in the form
+        #       query_field_dict[keyword] = field
+        #   ...where 'field' is one of the values in self.field_list
+        self.query_field_dict = {
+            'name': 'name',
+            'title': 'name',
+            'author': 'author',
+            'channel': 'author',
+            'descrip': 'descrip',
+            'description': 'descrip',
+            'comment': 'comment',
+            'comments': 'comment',
+        }
+        # Dictionary of keywords which filter the results of a database search
+        #   query (e.g. 'size:>100M'), in the form
+        #       query_filter_dict[keyword] = [value_type, media.Video IV]
+        #   ...where 'value_type' is one of 'date', 'size', 'duration' or
+        #   'flag'
+        self.query_filter_dict = {
+            'upload': ['date', 'upload_time'],
+            'received': ['date', 'receive_time'],
+            'size': ['size', 'file_size'],
+            'duration': ['duration', 'duration'],
+            'downloaded': ['flag', 'dl_flag'],
+            'new': ['flag', 'new_flag'],
+            'fav': ['flag', 'fav_flag'],
+            'bookmark': ['flag', 'bookmark_flag'],
+            'waiting': ['flag', 'waiting_flag'],
+            'archived': ['flag', 'archive_flag'],
+            'missing': ['flag', 'missing_flag'],
+            'live': ['flag', 'live_mode'],
+        }
+        # Dictionary of the comparisons used by filters, in the form
+        #   compare_dict[operator_string] = function
+        self.compare_dict = {
+            '==': operator.eq,
+            '<': operator.lt,
+            '<=': operator.le,
+            '>': operator.gt,
+            '>=': operator.ge,
+        }
+        # When ranking the results of a database search, the score for each
+        #   word found in each field, in the form
+        #       field_weight_dict[field] = score
+        #   (The score is doubled when the word matches a whole word in the
+        #   field, rather than part of one)
+        self.field_weight_dict = {
+            'name': 8,
+            'author': 4,
+            'descrip': 2,
+            'comment': 1,
+        }
+
+        # The media.Video IVs whose text is indexed
+        self.watch_iv_set = set(['name', 'author', 'descrip', 'comment_list'])
+        # Set of media.Video objects whose indexed text might have been
+        #   modified since the last call to self.sync_db()
+        self.dirty_set = set()
+        # Flag set to True when every video in the database must be checked
+        #   by the next call to self.sync_db() (because the index has just
+        #   been loaded, and the database might have been modified since it
+        #   was saved)
+        self.check_all_flag = True
+
+        # Code
+        # ----
+        self.reset()
+        media.modify_func_list.append(self.notify_modify)
+
+
+    # Public class methods
+
+
+    def reset(self):
+
+        """Called by self.__init__(), mainapp.TartubeApp.load_db() and
+        .reset_db().
+
+        Discards the index (for example, when a different database is loaded).
+        The index is loaded again from file when it is next required.
+        """
+
+        self.index_path = None
+        self.modified_flag = False
+        self.video_dict = {}
+        self.word_dict = {}
+        for field in self.field_list:
+            self.word_dict[field] = {}
+
+        self.trigram_dict = {}
+        self.word_count_dict = {}
+
+        self.dirty_set = set()
+        self.check_all_flag = True
+
+
+    def check_video(self, video_obj):
+
+        """Called by self.sync_db().
+
+        Re-indexes a video, if its indexed text has changed since it was last
+        indexed.
+
+        Args:
+
+            video_obj (media.Video): The video to check
+
+        """
+
+        signature = self.get_signature(video_obj)
+        mini_list = self.video_dict.get(video_obj.dbid)
+
+        if mini_list is None or mini_list[0] != signature:
+            self.index_video(video_obj, signature)
+
+
+    def find_videos(self, search_text, regex_flag, field_list):
+
+        """Called by mainwin.MainWin.video_catalogue_apply_filter().
+
+        Finds videos which might match the search text, in any of the
+        specified fields. The calling code should first call self.sync_db()
+        to update the index.
+
+        Every matching video is returned, but videos that don't match might
+        also be returned, so the calling code must still check each video.
+
+        Args:
+
+            search_text (str): The text (or regex) to search for
+
+            regex_flag (bool): True if 'search_text' is a regex, False if it
+                is plain text
+
+            field_list (list): A list of fields to search; any of the values
+                in self.field_list
+
+        Return values:
+
+            A set of video .dbids, or None if the index can't be used for this
+                search text (in which case, the calling code should check
+                every video)
+
+        """
+
+        word = self.get_required_word(search_text, regex_flag)
+        if word is None:
+            return None
+
+        match_set = set()
+        for this_word in self.find_words(word):
+            for field in field_list:
+                dbid_set = self.word_dict[field].get(this_word)
+                if dbid_set:
+                    match_set.update(dbid_set)
+
+        return match_set
+
+
+    def search_db(self, query_text):
+
+        """Called by mainwin.MainWin.video_catalogue_search_db().
+
+        Searches every video in the database, returning the videos which
+        match the search query, with the best matches first.
+
+        Words in the query must all appear in each matching video (as a whole
+        word, or as part of a longer word). Words with a keyword, e.g.
+        'name:foo' or 'author:"john smith"', must appear in that field.
+        Other keywords filter the results, e.g. 'upload:2020-01-31',
+        'upload:2019..2020-06', 'size:>100M', 'duration:<=10:00',
+        'downloaded:no' (see self.query_filter_dict).
+
+        Videos are ranked by the fields in which each word appears (see
+        self.field_weight_dict); videos with the same score are sorted by
+        upload time, newest first.
+
+        Args:
+
+            query_text (str): The search query
+
+        Return values:
+
+            A list of media.Video objects (may be empty), or None if the query
+                is invalid
+
+        """
+
+        query_tuple = self.parse_query(query_text)
+        if query_tuple is None:
+            return None
+
+        term_list, filter_list = query_tuple
+
+        self.sync_db()
+
+        # Score every video containing all of the words in the query (if
+        #   there are no words, every video in the database is a candidate)
+        weight_list_list = []
+        for field, word in term_list:
+
+            if field is None:
+                field_list = self.field_list
+            else:
+                field_list = [field]
+
+            word_list = self.find_words(word)
+
+            weight_list = []
+            for this_field in field_list:
+
+                field_dict = self.word_dict[this_field]
+                for this_word in word_list:
+
+                    dbid_set = field_dict.get(this_word)
+                    if dbid_set:
+
+                        weight = self.field_weight_dict[this_field]
+                        if this_word == word:
+                            weight *= 2
+
+                        weight_list.append( (weight, dbid_set) )
+
+            if not weight_list:
+                return []
+
+            # Each video gets the highest weight for any field in which the
+            #   word appears
+            weight_list.sort(
+                key=lambda mini_tuple: mini_tuple[0],
+                reverse=True,
+            )
+
+            weight_list_list.append(weight_list)
+
+        # Start with the word that matches the fewest videos, so that the
+        #   number of candidates is reduced as quickly as possible. After that,
+        #   only the remaining candidates need to be checked
+        weight_list_list.sort(
+            key=lambda weight_list: sum(
+                len(mini_tuple[1]) for mini_tuple in weight_list
+            ),
+        )
+
+        score_dict = None
+        for weight_list in weight_list_list:
+
+            if score_dict is None:
+
+                # (Apply the highest weights last)
+                score_dict = {}
+                for weight, dbid_set in reversed(weight_list):
+                    score_dict.update(dict.fromkeys(dbid_set, weight))
+
+            else:
+
+                new_dict = {}
+                for dbid, score in score_dict.items():
+                    for weight, dbid_set in weight_list:
+                        if dbid in dbid_set:
+                            new_dict[dbid] = score + weight
+                            break
+
+                score_dict = new_dict
+
+            if not score_dict:
+                return []
+
+        # Filters are checked against each candidate video itself. (The
+        #   statistics snapshots are not used to narrow the candidates, because
+        #   a snapshot that is out of date would silently drop videos that
+        #   match)
+        media_reg_dict = self.app_obj.media_reg_dict
+        if score_dict is None:
+            candidate_list = [
+                [0, media_data_obj] \
+                for media_data_obj in media_reg_dict.values() \
+                if isinstance(media_data_obj, media.Video)
+            ]
+
+        else:
+            candidate_list = []
+            for dbid, score in score_dict.items():
+
+                # (Ignore videos that no longer exist)
+                media_data_obj = media_reg_dict.get(dbid)
+                if isinstance(media_data_obj, media.Video):
+                    candidate_list.append([score, media_data_obj])
+
+        if filter_list:
+            candidate_list = [
+                mini_list for mini_list in candidate_list \
+                if self.check_filters(mini_list[1], filter_list)
+            ]
+
+        # (A single number sorts much faster than a tuple. Upload times are
+        #   much smaller than the multiplier, so the score always comes first)
+        candidate_list.sort(
+            key=lambda mini_list: -(
+                (mini_list[0] * 10_000_000_000) \
+                + (mini_list[1].upload_time or 0)
+            ),
+        )
+
+        return [mini_list[1] for mini_list in candidate_list]
+
+
+    def load_index(self):
+
+        """Called by self.sync_db().
+
+        If the index has not been loaded from the data directory yet, loads
+        it. If the file doesn't exist, or can't be loaded, the index starts
+        empty.
+        """
+
+        path = os.path.abspath(
+            os.path.join(self.app_obj.data_dir, '.search_index'),
+        )
+
+        if self.index_path == path:
+            return
+
+        self.reset()
+        self.index_path = path
+
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(path, 'rb') as fh:
+                load_dict = pickle.load(fh)
+
+        except:
+            return
+
+        if not isinstance(load_dict, dict) \
+        or load_dict.get('index_version') != self.index_version:
+            return
+
+        for dbid, mini_list in load_dict['video_dict'].items():
+
+            # (Ignore videos that no longer exist)
+            if dbid in self.app_obj.media_reg_dict:
+
+                self.video_dict[dbid] = mini_list
+                for field, word_set in mini_list[1].items():
+                    self.add_words(dbid, field, word_set)
+
+
+    def prepare_save_index(self):
+
+        """Called by mainapp.TartubeApp.save_db().
+
+        If the index has been modified, takes a copy of it, so that it can be
+        saved alongside the database (perhaps by a background thread; see
+        self.save_index() ).
+
+        Return values:
+
+            A list in the form [path, video_dict], or None if the index
+                doesn't need to be saved
+
+        """
+
+        if self.index_path is None or not self.modified_flag:
+            return None
+
+        # (The index is saved only if the database is saved; if not, the index
+        #   is checked against the database when it is next loaded)
+        self.modified_flag = False
+
+        # (Lists in self.video_dict are replaced, not modified, so they can be
+        #   shared with the copy)
+        return [self.index_path, self.video_dict.copy()]
+
+
+    def save_index(self, index_list):
+
+        """Called by mainapp.TartubeApp.save_db_write(), often in a background
+        thread.
+
+        Saves a copy of the index, so that it doesn't need to be rebuilt when
+        Tartube next starts. Videos which have been deleted from the database
+        are not saved.
+
+        This function must not modify any IVs. Failure to save is not fatal,
+        as the index is simply rebuilt.
+
+        Args:
+
+            index_list (list): The value returned by self.prepare_save_index()
+
+        """
+
+        index_path, video_dict = index_list
+
+        media_reg_dict = self.app_obj.media_reg_dict
+        save_dict = {
+            'index_version': self.index_version,
+            'video_dict': {
+                dbid: mini_list for dbid, mini_list in video_dict.items() \
+                if dbid in media_reg_dict
+            },
+        }
+
+        temp_path = index_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as fh:
+                pickle.dump(save_dict, fh)
+
+            os.replace(temp_path, index_path)
+
+        except:
+            if os.path.isfile(temp_path):
+                try:
+                    os.remove(temp_path)
+                except:
+                    pass
+
+
+    def notify_modify(self, media_data_obj, iv_name):
+
+        """Called by media.notify_modify(), just before a media data object is
+        modified.
+
+        If a video's indexed text is about to be modified, marks the video so
+        that it's checked by the next call to self.sync_db().
+
+        Args:
+
+            media_data_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The media data object about to be modified
+
+            iv_name (str): The name of the IV about to be modified
+
+        """
+
+        if iv_name in self.watch_iv_set \
+        and isinstance(media_data_obj, media.Video):
+            self.dirty_set.add(media_data_obj)
+
+
+    def sync_db(self):
+
+        """Called by self.search_db() and
+        mainwin.MainWin.video_catalogue_apply_filter().
+
+        Makes sure that the index is up to date for every video in the
+        database.
+
+        When the index has just been loaded, every video is checked (see
+        self.check_video() ). After that, only the videos marked by calls to
+        self.notify_modify() and .update_video() are checked. New videos are
+        indexed; deleted videos are ignored by self.search_db(), and are not
+        saved with the index.
+        """
+
+        self.load_index()
+
+        media_reg_dict = self.app_obj.media_reg_dict
+
+        if self.check_all_flag:
+
+            self.check_all_flag = False
+            self.dirty_set = set()
+
+            for media_data_obj in media_reg_dict.values():
+                if isinstance(media_data_obj, media.Video):
+                    self.check_video(media_data_obj)
+
+        else:
+
+            dirty_set = self.dirty_set
+            self.dirty_set = set()
+
+            for video_obj in dirty_set:
+
+                # (Ignore videos that are not in the database, for example
+                #   those in the Classic Mode tab)
+                if media_reg_dict.get(video_obj.dbid) is video_obj:
+                    self.check_video(video_obj)
+
+
+    def update_video(self, video_obj):
+
+        """Can be called by anything, but mostly called by
+        mainapp.TartubeApp.update_video_when_file_found() and
+        .update_video_from_json().
+
+        When a video's name, author, description or comments might have
+        changed, marks the video so that it's checked by the next call to
+        self.sync_db(). (Any change to those IVs is reported by
+        self.notify_modify() anyway, but not a change to the contents of a
+        comment.)
+
+        Args:
+
+            video_obj (media.Video): The modified video
+
+        """
+
+        self.dirty_set.add(video_obj)
+
+
+    def index_video(self, video_obj, signature=None):
+
+        """Called by self.check_video().
+
+        Adds a video to the index, replacing any previous entry.
+
+        Args:
+
+            video_obj (media.Video): The video to index
+
+            signature (bytes or None): The value returned by
+                self.get_signature(), if already known
+
+        """
+
+        if signature is None:
+            signature = self.get_signature(video_obj)
+
+        self.unindex_video(video_obj.dbid)
+
+        comment_text = '\n'.join(
+            mini_dict['text'] for mini_dict in video_obj.comment_list
+        )
+
+        text_dict = {
+            'name': video_obj.name,
+            'author': video_obj.author,
+            'descrip': video_obj.descrip,
+            'comment': comment_text,
+        }
+
+        word_dict = {}
+        for field in self.field_list:
+            word_set = self.get_words(text_dict[field])
+            if word_set:
+                word_dict[field] = word_set
+                self.add_words(video_obj.dbid, field, word_set)
+
+        self.video_dict[video_obj.dbid] = [signature, word_dict]
+        self.modified_flag = True
+
+
+    def unindex_video(self, dbid):
+
+        """Called by self.index_video().
+
+        Removes a video from the index, if it is there.
+
+        Args:
+
+            dbid (int): The .dbid of the video to remove
+
+        """
+
+        mini_list = self.video_dict.pop(dbid, None)
+        if mini_list is None:
+            return
+
+        for field, word_set in mini_list[1].items():
+
+            field_dict = self.word_dict[field]
+            for word in word_set:
+
+                dbid_set = field_dict.get(word)
+                if dbid_set is None:
+                    continue
+
+                dbid_set.discard(dbid)
+                if not dbid_set:
+
+                    del field_dict[word]
+
+                    # If the word no longer appears in any field, remove it
+                    #   from the trigram index
+                    self.word_count_dict[word] -= 1
+                    if not self.word_count_dict[word]:
+
+                        del self.word_count_dict[word]
+                        for trigram in self.get_trigrams(word):
+                            trigram_set = self.trigram_dict.get(trigram)
+                            if trigram_set is not None:
+                                trigram_set.discard(word)
+                                if not trigram_set:
+                                    del self.trigram_dict[trigram]
+
+        self.modified_flag = True
+
+
+    def add_words(self, dbid, field, word_set):
+
+        """Called by self.load_index() and .index_video().
+
+        Adds a video's words to the word and trigram indexes.
+
+        Args:
+
+            dbid (int): The .dbid of the video
+
+            field (str): One of the values in self.field_list
+
+            word_set (frozenset): The words in that field
+
+        """
+
+        field_dict = self.word_dict[field]
+        for word in word_set:
+
+            dbid_set = field_dict.get(word)
+            if dbid_set is None:
+
+                dbid_set = field_dict[word] = set()
+
+                if word in self.word_count_dict:
+                    self.word_count_dict[word] += 1
+
+                else:
+                    self.word_count_dict[word] = 1
+                    for trigram in self.get_trigrams(word):
+                        self.trigram_dict.setdefault(trigram, set()).add(word)
+
+            dbid_set.add(dbid)
+
+
+    def check_filters(self, video_obj, filter_list):
+
+        """Called by self.search_db().
+
+        Checks whether a video matches all the filters in a database search
+        query.
+
+        Args:
+
+            video_obj (media.Video): The video to check
+
+            filter_list (list): A list of filters, as returned by
+                self.parse_query()
+
+        Return values:
+
+            True if the video matches every filter, False if not
+
+        """
+
+        for attrib, compare_list in filter_list:
+
+            value = getattr(video_obj, attrib)
+            for compare, limit in compare_list:
+
+                if compare == 'flag':
+                    if bool(value) != limit:
+                        return False
+
+                # (Videos whose value is not known never match)
+                elif value is None \
+                or not self.compare_dict[compare](value, limit):
+                    return False
+
+        return True
+
+
+    def find_words(self, word):
+
+        """Called by self.find_videos() and .search_db().
+
+        Finds every word in the index which contains the specified word.
+
+        Args:
+
+            word (str): The word to find
+
+        Return values:
+
+            A list of matching words (may be empty)
+
+        """
+
+        trigram_list = self.get_trigrams(word)
+        if not trigram_list:
+            # (Too short for the trigram index, so check every word)
+            return [this_word for this_word in self.word_count_dict \
+            if word in this_word]
+
+        # Start with the least common trigram
+        set_list = []
+        for trigram in trigram_list:
+            trigram_set = self.trigram_dict.get(trigram)
+            if not trigram_set:
+                return []
+            else:
+                set_list.append(trigram_set)
+
+        set_list.sort(key=len)
+        match_set = set_list[0].intersection(*set_list[1:])
+
+        return [this_word for this_word in match_set if word in this_word]
+
+
+    def fold_text(self, text):
+
+        """Called by self.get_words(), .get_required_word() and
+        .parse_query().
+
+        Converts text to the form used in the index. The conversion keeps
+        together any characters which str.lower() or the re.IGNORECASE flag
+        regard as the same.
+
+        Args:
+
+            text (str): The text to convert
+
+        Return values:
+
+            The converted text
+
+        """
+
+        # (The re module treats 'i' and the dotless 'i' as the same, but
+        #   str.casefold() does not)
+        return text.casefold().replace('ı', 'i')
+
+
+    def get_required_word(self, search_text, regex_flag):
+
+        """Called by self.find_videos().
+
+        Finds the longest word which must appear in any text matching the
+        search text.
+
+        Args:
+
+            search_text (str): The text (or regex) to search for
+
+            regex_flag (bool): True if 'search_text' is a regex, False if it
+                is plain text
+
+        Return values:
+
+            The word, or None if there isn't one
+
+        """
+
+        if not regex_flag:
+            text_list = [search_text]
+        else:
+            text_list = self.get_regex_literals(search_text)
+
+        word = None
+        for text in text_list:
+            for this_word in re.findall(r'\w+', self.fold_text(text)):
+                if word is None or len(this_word) > len(word):
+                    word = this_word
+
+        return word
+
+
+    def get_regex_literals(self, regex):
+
+        """Called by self.get_required_word().
+
+        Finds literal text which must appear in any text matching the regex.
+
+        Args:
+
+            regex (str): The regex to check
+
+        Return values:
+
+            A list of strings (may be empty)
+
+        """
+
+        try:
+            parsed = sre_parse.parse(regex, re.IGNORECASE)
+        except:
+            return []
+
+        literal_list = []
+        self.get_regex_literals_from_pattern(parsed, literal_list)
+
+        return literal_list
+
+
+    def get_regex_literals_from_pattern(self, parsed, literal_list):
+
+        """Called by self.get_regex_literals() and by this function
+        recursively.
+
+        Adds to a list any sequences of literal characters in a parsed regex
+        (or part of one) which must appear in any matching text. Only parts of
+        the regex that must match at least once are checked.
+
+        Args:
+
+            parsed (sre_parse.SubPattern): The parsed regex
+
+            literal_list (list): The list of literal strings found so far
+
+        """
+
+        current = ''
+        for op, av in parsed:
+
+            if op == sre_parse.LITERAL:
+                current += chr(av)
+                continue
+
+            if current:
+                literal_list.append(current)
+                current = ''
+
+            if op == sre_parse.SUBPATTERN:
+                self.get_regex_literals_from_pattern(av[-1], literal_list)
+
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) \
+            and av[0] >= 1:
+                self.get_regex_literals_from_pattern(av[2], literal_list)
+
+        if current:
+            literal_list.append(current)
+
+
+    def get_signature(self, video_obj):
+
+        """Called by self.check_video() and .index_video().
+
+        Returns a hash of the video's indexed text, which changes whenever the
+        text changes. (The hash is saved with the index, so the text itself
+        doesn't have to be.)
+
+        Args:
+
+            video_obj (media.Video): The video to check
+
+        Return values:
+
+            The hash, as a bytes object
+
+        """
+
+        hash_obj = hashlib.blake2b(digest_size=16)
+        for text in [video_obj.name, video_obj.author, video_obj.descrip]:
+
+            if text is not None:
+                hash_obj.update(text.encode('utf-8', 'surrogatepass'))
+
+            # (Separate the fields, so that moving text from one to another
+            #   changes the hash)
+            hash_obj.update(b'\0')
+
+        for mini_dict in video_obj.comment_list:
+            hash_obj.update(
+                mini_dict['text'].encode('utf-8', 'surrogatepass') + b'\0',
+            )
+
+        return hash_obj.digest()
+
+
+    def get_trigrams(self, word):
+
+        """Called by self.unindex_video(), .add_words() and .find_words().
+
+        Returns the trigrams (sequences of three characters) in a word.
+
+        Args:
+
+            word (str): The word to check
+
+        Return values:
+
+            A list of trigrams (empty if the word is shorter than three
+                characters)
+
+        """
+
+        return [word[i:i+3] for i in range(len(word) - 2)]
+
+
+    def get_words(self, text):
+
+        """Called by self.index_video().
+
+        Returns the words in some text.
+
+        Args:
+
+            text (str or None): The text to check
+
+        Return values:
+
+            A frozenset of words (may be empty)
+
+        """
+
+        if not text:
+            return frozenset()
+        else:
+            return frozenset(re.findall(r'\w+', self.fold_text(text)))
+
+
+    def parse_date(self, text):
+
+        """Called by self.parse_value().
+
+        Converts a date in a database search query, in the form YYYY, YYYY-MM
+        or YYYY-MM-DD, into the period of time it covers.
+
+        Args:
+
+            text (str): The date to convert
+
+        Return values:
+
+            A list in the form [start_time, stop_time], both values in epoch
+                time (the period includes 'start_time' but not 'stop_time'),
+                or None if the date is invalid
+
+        """
+
+        match = re.match(r'^(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?$', text)
+        if not match:
+            return None
+
+        year = int(match.group(1))
+        try:
+            if match.group(3) is not None:
+                start_date = datetime.date(
+                    year,
+                    int(match.group(2)),
+                    int(match.group(3)),
+                )
+                stop_date = start_date + datetime.timedelta(days=1)
+
+            elif match.group(2) is not None:
+                month = int(match.group(2))
+                start_date = datetime.date(year, month, 1)
+                if month == 12:
+                    stop_date = datetime.date(year + 1, 1, 1)
+                else:
+                    stop_date = datetime.date(year, month + 1, 1)
+
+            else:
+                start_date = datetime.date(year, 1, 1)
+                stop_date = datetime.date(year + 1, 1, 1)
+
+        except (ValueError, OverflowError):
+            return None
+
+        # (Use the start of each day in local time, as the Video Catalogue's
+        #   'Find date' button does)
+        return [
+            datetime.datetime.combine(start_date, datetime.time()).timestamp(),
+            datetime.datetime.combine(stop_date, datetime.time()).timestamp(),
+        ]
+
+
+    def parse_duration(self, text):
+
+        """Called by self.parse_value().
+
+        Converts a duration in a database search query into seconds. The
+        duration can be in seconds, e.g. '90', with a unit, e.g. '90s', '10m',
+        '2h', or in the form MM:SS or HH:MM:SS.
+
+        Args:
+
+            text (str): The duration to convert
+
+        Return values:
+
+            The duration in seconds, or None if the duration is invalid
+
+        """
+
+        if ':' in text:
+
+            seconds = 0
+            for item in text.split(':'):
+                if not item.isdigit():
+                    return None
+                seconds = (seconds * 60) + int(item)
+
+            return seconds
+
+        match = re.match(r'^(\d+(?:\.\d+)?)([smh]?)$', text.lower())
+        if not match:
+            return None
+
+        multiplier = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+        return float(match.group(1)) * multiplier[match.group(2)]
+
+
+    def parse_query(self, query_text):
+
+        """Called by self.search_db().
+
+        Converts a database search query into a list of words and a list of
+        filters. Words in quotes are kept together, so that a keyword can be
+        applied to all of them (e.g. 'author:"john smith"').
+
+        Args:
+
+            query_text (str): The search query
+
+        Return values:
+
+            A tuple in the form (term_list, filter_list), or None if the query
+                is invalid. 'term_list' is a list of tuples in the form
+                (field, word), where 'field' is one of the values in
+                self.field_list, or None for any field. 'filter_list' is a
+                list of tuples in the form (attrib, compare_list), where
+                'attrib' is a media.Video IV, and 'compare_list' is a list of
+                tuples in the form (compare, value) (see
+                self.parse_range() )
+
+        """
+
+        try:
+            token_list = shlex.split(query_text)
+        except ValueError:
+            # (e.g. an unmatched apostrophe)
+            token_list = query_text.split()
+
+        term_list = []
+        filter_list = []
+        for token in token_list:
+
+            keyword, sep, value = token.partition(':')
+            keyword = keyword.lower()
+
+            if sep and keyword in self.query_field_dict:
+
+                word_list = re.findall(r'\w+', self.fold_text(value))
+                if not word_list:
+                    return None
+
+                for word in word_list:
+                    term_list.append( (self.query_field_dict[keyword], word) )
+
+            elif sep and keyword in self.query_filter_dict:
+
+                value_type, attrib = self.query_filter_dict[keyword]
+                if value_type == 'flag':
+
+                    value = value.lower()
+                    if value in ('yes', 'y', 'true', '1'):
+                        compare_list = [ ('flag', True) ]
+                    elif value in ('no', 'n', 'false', '0'):
+                        compare_list = [ ('flag', False) ]
+                    else:
+                        return None
+
+                else:
+
+                    compare_list = self.parse_range(value, value_type)
+                    if compare_list is None:
+                        return None
+
+                filter_list.append( (attrib, compare_list) )
+
+            else:
+
+                # (Anything else, including text like 'http://...', is just
+                #   a list of words)
+                for word in re.findall(r'\w+', self.fold_text(token)):
+                    term_list.append( (None, word) )
+
+        if not term_list and not filter_list:
+            return None
+        else:
+            return term_list, filter_list
+
+
+    def parse_range(self, text, value_type):
+
+        """Called by self.parse_query().
+
+        Converts the value of a filter in a database search query into a
+        list of comparisons. The value can be a single value (e.g. '2020',
+        matching the whole of that year), a comparison (e.g. '>100M',
+        '<=10:00'), or a range (e.g. '2019..2020-06', '100M..', '..60').
+
+        Args:
+
+            text (str): The value to convert
+
+            value_type (str): 'date', 'size' or 'duration'
+
+        Return values:
+
+            A list of tuples in the form (compare, value), where 'compare' is
+                one of the keys in self.compare_dict, or None if the value is
+                invalid
+
+        """
+
+        if '..' in text:
+
+            low_text, high_text = text.split('..', 1)
+            compare_list = []
+
+            if low_text:
+                low_list = self.parse_value(low_text, value_type)
+                if low_list is None:
+                    return None
+
+                compare_list.append( ('>=', low_list[0]) )
+
+            if high_text:
+                high_list = self.parse_value(high_text, value_type)
+                if high_list is None:
+                    return None
+
+                if high_list[1] is None:
+                    compare_list.append( ('<=', high_list[0]) )
+                else:
+                    compare_list.append( ('<', high_list[1]) )
+
+            if not compare_list:
+                return None
+            else:
+                return compare_list
+
+        for compare in ('>=', '<=', '>', '<'):
+
+            if text.startswith(compare):
+
+                value_list = self.parse_value(text[len(compare):], value_type)
+                if value_list is None:
+                    return None
+
+                start, stop = value_list
+                if stop is None:
+                    return [ (compare, start) ]
+                elif compare == '>=':
+                    return [ ('>=', start) ]
+                elif compare == '>':
+                    return [ ('>=', stop) ]
+                elif compare == '<':
+                    return [ ('<', start) ]
+                else:
+                    return [ ('<', stop) ]
+
+        value_list = self.parse_value(text, value_type)
+        if value_list is None:
+            return None
+
+        start, stop = value_list
+        if stop is None:
+            return [ ('==', start) ]
+        else:
+            return [ ('>=', start), ('<', stop) ]
+
+
+    def parse_size(self, text):
+
+        """Called by self.parse_value().
+
+        Converts a file size in a database search query into bytes. The size
+        can be in bytes, e.g. '5000', or with a unit, e.g. '500K', '1.5G',
+        '100MiB'.
+
+        Args:
+
+            text (str): The file size to convert
+
+        Return values:
+
+            The size in bytes, or None if the size is invalid
+
+        """
+
+        match = re.match(r'^(\d+(?:\.\d+)?)([kmgt]?)(?:i?b)?$', text.lower())
+        if not match:
+            return None
+
+        multiplier = {
+            '': 1,
+            'k': 1024,
+            'm': 1024 ** 2,
+            'g': 1024 ** 3,
+            't': 1024 ** 4,
+        }
+
+        return int(float(match.group(1)) * multiplier[match.group(2)])
+
+
+    def parse_value(self, text, value_type):
+
+        """Called by self.parse_range().
+
+        Converts a single value in a database search query.
+
+        Args:
+
+            text (str): The value to convert
+
+            value_type (str): 'date', 'size' or 'duration'
+
+        Return values:
+
+            A list in the form [start, stop], or None if the value is invalid.
+                For dates, 'start' and 'stop' are the period covered by the
+                date, in epoch time ('stop' is not included in the period). For
+                sizes and durations, 'start' is the value, and 'stop' is None
+
+        """
+
+        if value_type == 'date':
+            return self.parse_date(text)
+
+        elif value_type == 'size':
+            value = self.parse_size(text)
+
+        else:
+            value = self.parse_duration(text)
+
+        if value is None:
+            return None
+        else:
+            return [value, None]
@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Statistics manager classes."""
+
+
+# Import Gtk modules
+#   ...
+
+
+# Import other modules
+import time
+
+
+# Import our modules
+import mainapp
+import media
+if mainapp.HAVE_NUMPY_FLAG:
+    import numpy
+
+
+# Classes
+
+
+class StatsManager(object):
+
+    """Called by mainapp.TartubeApp.__init__().
+
+    Python class to manage columnar snapshots of media.Video statistics
+    (upload time, receive time, file size and duration), so that graphs can
+    be drawn without walking every video in the database for every graph.
+
+    One snapshot is kept for the whole database, and one for each container
+    whose graph has been drawn. Snapshots are created on demand, and are
+    kept up to date by calls to self.update_video(). If the membership of the
+    database snapshot has changed since it was created (videos added or
+    deleted), it is synchronised the next time it is used. A container's
+    snapshot is discarded when the child list of that container (or of any
+    container inside it) is modified (see self.notify_modify() ), and is
+    rebuilt the next time it is used.
+
+    If the numpy module is not available, the calls are passed on to the
+    equivalent media.GenericContainer functions.
+
+    Args:
+
+        app_obj (mainapp.TartubeApp): The main application object
+
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self, app_obj):
+
+        super(StatsManager, self).__init__()
+
+        # IV list - class objects
+        # -----------------------
+        # The main application
+        self.app_obj = app_obj
+        # The stats.StatsSnapshot for the whole database (None until it is
+        #   required)
+        self.db_snapshot_obj = None
+
+
+        # IV list - other
+        # ---------------
+        # Dictionary of stats.StatsSnapshot objects for individual containers,
+        #   in the form
+        #       snapshot_dict[container_dbid] = snapshot_obj
+        self.snapshot_dict = {}
+
+
+        # Code
+        # ----
+        media.modify_func_list.append(self.notify_modify)
+
+
+    # Public class methods
+
+
+    def compile_by_frequency(self, container_obj, data_type, period,
+    frequency_dict):
+
+        """Called by config.GenericConfigWin.on_button_draw_graph_clicked().
+
+        Equivalent of media.GenericContainer.compile_all_videos_by_frequency(),
+        using a snapshot.
+
+        Args:
+
+            container_obj (media.Channel, media.Playlist, media.Folder or
+                None): The container whose videos should be counted, or None
+                to count every video in the database
+
+            data_type (str): 'receive' to compile video frequencies by
+                receive (download) time, 'upload' to compile by upload time
+
+            period (int): A time period, in seconds (e.g. 86400 for a day)
+
+            frequency_dict (dict): The dictionary compiled so far
+
+        Return values:
+
+            The modified frequency_dict
+
+        """
+
+        if not mainapp.HAVE_NUMPY_FLAG:
+
+            if container_obj is not None:
+                return container_obj.compile_all_videos_by_frequency(
+                    data_type,
+                    period,
+                    frequency_dict,
+                )
+
+            for this_obj in self.compile_top_containers():
+                this_obj.compile_all_videos_by_frequency(
+                    data_type,
+                    period,
+                    frequency_dict,
+                )
+
+            return frequency_dict
+
+        return self.get_snapshot(container_obj).count_by_frequency(
+            data_type,
+            period,
+            frequency_dict,
+        )
+
+
+    def compile_by_size(self, container_obj, frequency_dict):
+
+        """Called by config.GenericConfigWin.on_button_draw_graph_clicked().
+
+        Equivalent of media.GenericContainer.compile_all_videos_by_size(),
+        using a snapshot.
+
+        Args:
+
+            container_obj (media.Channel, media.Playlist, media.Folder or
+                None): The container whose videos should be counted, or None
+                to count every video in the database
+
+            frequency_dict (dict): The dictionary compiled so far
+
+        Return values:
+
+            The modified frequency_dict
+
+        """
+
+        if not mainapp.HAVE_NUMPY_FLAG:
+
+            if container_obj is not None:
+                return container_obj.compile_all_videos_by_size(frequency_dict)
+
+            for this_obj in self.compile_top_containers():
+                this_obj.compile_all_videos_by_size(frequency_dict)
+
+            return frequency_dict
+
+        return self.get_snapshot(container_obj).count_by_range(
+            'size',
+            frequency_dict,
+        )
+
+
+    def compile_by_duration(self, container_obj, frequency_dict):
+
+        """Called by config.GenericConfigWin.on_button_draw_graph_clicked().
+
+        Equivalent of media.GenericContainer.compile_all_videos_by_duration(),
+        using a snapshot.
+
+        Args:
+
+            container_obj (media.Channel, media.Playlist, media.Folder or
+                None): The container whose videos should be counted, or None
+                to count every video in the database
+
+            frequency_dict (dict): The dictionary compiled so far
+
+        Return values:
+
+            The modified frequency_dict
+
+        """
+
+        if not mainapp.HAVE_NUMPY_FLAG:
+
+            if container_obj is not None:
+                return container_obj.compile_all_videos_by_duration(
+                    frequency_dict,
+                )
+
+            for this_obj in self.compile_top_containers():
+                this_obj.compile_all_videos_by_duration(frequency_dict)
+
+            return frequency_dict
+
+        return self.get_snapshot(container_obj).count_by_range(
+            'duration',
+            frequency_dict,
+        )
+
+
+    def compile_top_containers(self):
+
+        """Called by self.compile_by_frequency(), .compile_by_size() and
+        .compile_by_duration().
+
+        Compiles a list of top-level containers whose videos, taken together,
+        include every video in the database exactly once (i.e. not including
+        private (system) folders, which contain videos also stored in public
+        folders).
+
+        Return values:
+
+            A list of media.Channel, media.Playlist and media.Folder objects
+
+        """
+
+        container_list = []
+        for dbid in self.app_obj.container_top_level_list:
+
+            if dbid in self.app_obj.media_reg_dict:
+
+                media_data_obj = self.app_obj.media_reg_dict[dbid]
+                if not isinstance(media_data_obj, media.Folder) \
+                or not media_data_obj.priv_flag:
+                    container_list.append(media_data_obj)
+
+        return container_list
+
+
+    def get_snapshot(self, container_obj=None):
+
+        """Called by self.compile_by_frequency(), .compile_by_size() and
+        .compile_by_duration().
+
+        Returns an up-to-date snapshot for the specified container (or for the
+        whole database), creating it if necessary.
+
+        Args:
+
+            container_obj (media.Channel, media.Playlist, media.Folder or
+                None): The container whose snapshot is required, or None for
+                the snapshot of the whole database
+
+        Return values:
+
+            A stats.StatsSnapshot object
+
+        """
+
+        if container_obj is None:
+
+            signature = (
+                self.app_obj.media_reg_count,
+                len(self.app_obj.media_reg_dict),
+            )
+
+            if self.db_snapshot_obj is None:
+
+                self.db_snapshot_obj = StatsSnapshot()
+                self.db_snapshot_obj.add_video_list(
+                    self.compile_db_videos(),
+                )
+
+            elif self.db_snapshot_obj.signature != signature:
+
+                # Videos have been added or deleted; synchronise the snapshot,
+                #   rather than building a new one
+                self.db_snapshot_obj.sync_video_list(
+                    self.compile_db_videos(),
+                )
+
+            self.db_snapshot_obj.signature = signature
+            return self.db_snapshot_obj
+
+        else:
+
+            # (A container's snapshot is discarded when its membership changes;
+            #   see self.notify_modify() )
+            if not container_obj.dbid in self.snapshot_dict:
+
+                snapshot_obj = StatsSnapshot()
+                snapshot_obj.add_video_list(
+                    container_obj.compile_all_videos( [] ),
+                )
+
+                self.snapshot_dict[container_obj.dbid] = snapshot_obj
+
+            return self.snapshot_dict[container_obj.dbid]
+
+
+    def compile_db_videos(self):
+
+        """Called by self.get_snapshot().
+
+        Returns a list of every media.Video object in the media data registry.
+
+        Return values:
+
+            The list described above
+
+        """
+
+        video_list = []
+        for media_data_obj in self.app_obj.media_reg_dict.values():
+
+            if isinstance(media_data_obj, media.Video):
+                video_list.append(media_data_obj)
+
+        return video_list
+
+
+    def notify_modify(self, media_data_obj, iv_name):
+
+        """Called by media.notify_modify(), just before a media data object is
+        modified.
+
+        When a container's child list is about to be modified, discards the
+        snapshots for that container and for every container above it (whose
+        snapshots include its videos).
+
+        Args:
+
+            media_data_obj (media.Video, media.Channel, media.Playlist,
+                media.Folder): The media data object about to be modified
+
+            iv_name (str): The name of the IV about to be modified
+
+        """
+
+        if iv_name != 'child_list' or not self.snapshot_dict:
+            return
+
+        while media_data_obj is not None:
+
+            self.snapshot_dict.pop(getattr(media_data_obj, 'dbid', None), None)
+            media_data_obj = getattr(media_data_obj, 'parent_obj', None)
+
+
+    def reset(self):
+
+        """Called by mainapp.TartubeApp.load_db() and .reset_db().
+
+        Discards all snapshots (for example, when a different database is
+        loaded).
+        """
+
+        self.db_snapshot_obj = None
+        self.snapshot_dict = {}
+
+
+    def update_video(self, video_obj):
+
+        """Can be called by anything, but mostly called by
+        mainapp.TartubeApp.update_video_when_file_found(),
+        .update_video_from_json(), .update_video_from_filesystem() and
+        .mark_video_downloaded().
+
+        When a video's upload time, receive time, file size or duration have
+        changed, updates the values in any snapshot containing the video.
+
+        Args:
+
+            video_obj (media.Video): The modified video
+
+        """
+
+        if not mainapp.HAVE_NUMPY_FLAG:
+            return
+
+        if self.db_snapshot_obj is not None:
+            self.db_snapshot_obj.update_video(video_obj)
+
+        for snapshot_obj in self.snapshot_dict.values():
+            snapshot_obj.update_video(video_obj)
+
+
+class StatsSnapshot(object):
+
+    """Called by StatsManager.get_snapshot().
+
+    Python class storing the statistics for a collection of media.Video
+    objects as numpy arrays (one array for each value, one row for each
+    video). Unknown values are stored as NaN.
+
+    Rows for deleted videos are not removed, but their values are set to NaN,
+    so they are ignored in all counts.
+    """
+
+
+    # Standard class methods
+
+
+    def __init__(self):
+
+        super(StatsSnapshot, self).__init__()
+
+        # IV list - other
+        # ---------------
+        # The signature of the database at the time the snapshot was built
+        #   (see StatsManager.get_snapshot() )
+        self.signature = None
+        # Dictionary of rows in the arrays, in the form
+        #   row_dict[video_dbid] = row_number
+        self.row_dict = {}
+        # The number of rows in use (the arrays themselves may be larger)
+        self.row_count = 0
+
+        # The arrays themselves
+        self.upload_array = numpy.full(0, numpy.nan)
+        self.receive_array = numpy.full(0, numpy.nan)
+        self.size_array = numpy.full(0, numpy.nan)
+        self.duration_array = numpy.full(0, numpy.nan)
+
+
+    # Public class methods
+
+
+    def add_video_list(self, video_list):
+
+        """Called by StatsManager.get_snapshot() and self.sync_video_list().
+
+        Adds a row for each video in the list.
+
+        Args:
+
+            video_list (list): A list of media.Video objects
+
+        """
+
+        self.grow(self.row_count + len(video_list))
+
+        for video_obj in video_list:
+
+            self.row_dict[video_obj.dbid] = self.row_count
+            self.set_row(self.row_count, video_obj)
+            self.row_count += 1
+
+
+    def sync_video_list(self, video_list):
+
+        """Called by StatsManager.get_snapshot().
+
+        Adds rows for any videos in the list that are not yet in the snapshot,
+        and blanks any rows for videos that are no longer in the list.
+
+        Args:
+
+            video_list (list): A list of media.Video objects
+
+        """
+
+        dbid_dict = {}
+        new_list = []
+        for video_obj in video_list:
+
+            dbid_dict[video_obj.dbid] = None
+            if not video_obj.dbid in self.row_dict:
+                new_list.append(video_obj)
+
+        for dbid in list(self.row_dict.keys()):
+
+            if not dbid in dbid_dict:
+
+                row = self.row_dict.pop(dbid)
+                self.upload_array[row] = numpy.nan
+                self.receive_array[row] = numpy.nan
+                self.size_array[row] = numpy.nan
+                self.duration_array[row] = numpy.nan
+
+        self.add_video_list(new_list)
+
+
+    def grow(self, size):
+
+        """Called by self.add_video_list().
+
+        Increases the size of the arrays, if necessary.
+
+        Args:
+
+            size (int): The minimum number of rows required
+
+        """
+
+        old_size = self.upload_array.size
+        if size <= old_size:
+            return
+
+        # Allow for some more videos to be added, before growing again
+        new_size = max(size, old_size * 2)
+        for name in (
+            'upload_array', 'receive_array', 'size_array', 'duration_array',
+        ):
+            new_array = numpy.full(new_size, numpy.nan)
+            new_array[:old_size] = getattr(self, name)
+            setattr(self, name, new_array)
+
+
+    def set_row(self, row, video_obj):
+
+        """Called by self.add_video_list() and .update_video().
+
+        Copies a video's values into the specified row.
+
+        Args:
+
+            row (int): The row to update
+
+            video_obj (media.Video): The video whose values are copied
+
+        """
+
+        for array, value in (
+            (self.upload_array, video_obj.upload_time),
+            (self.receive_array, video_obj.receive_time),
+            (self.size_array, video_obj.file_size),
+            (self.duration_array, video_obj.duration),
+        ):
+            if value is None:
+                array[row] = numpy.nan
+            else:
+                array[row] = value
+
+
+    def update_video(self, video_obj):
+
+        """Called by StatsManager.update_video().
+
+        Updates the row for the specified video, if there is one.
+
+        Args:
+
+            video_obj (media.Video): The modified video
+
+        """
+
+        if video_obj.dbid in self.row_dict:
+            self.set_row(self.row_dict[video_obj.dbid], video_obj)
+
+
+    def count_by_frequency(self, data_type, period, frequency_dict):
+
+        """Called by StatsManager.compile_by_frequency().
+
+        Vectorised equivalent of
+        media.GenericContainer.compile_all_videos_by_frequency().
+
+        Args:
+
+            data_type (str): 'receive' to compile video frequencies by
+                receive (download) time, 'upload' to compile by upload time
+
+            period (int): A time period, in seconds (e.g. 86400 for a day)
+
+            frequency_dict (dict): The dictionary compiled so far
+
+        Return values:
+
+            Dictionary in the form
+                frequency_dict[time_period_number] = number_of_videos
+
+        """
+
+        if data_type == 'receive':
+            array = self.receive_array[:self.row_count]
+        else:
+            array = self.upload_array[:self.row_count]
+
+        # (Ignore unknown values, and values of 0, as the original function
+        #   does)
+        array = array[~numpy.isnan(array) & (array != 0)]
+        if not array.size:
+            return frequency_dict
+
+        # (Conversion to int truncates towards zero, just like int() )
+        unit_array = ((time.time() - array) / period).astype(numpy.int64)
+        value_array, count_array = numpy.unique(unit_array, return_counts=True)
+
+        for time_units, count in zip(
+            value_array.tolist(),
+            count_array.tolist(),
+        ):
+            if time_units in frequency_dict:
+                frequency_dict[time_units] += count
+            else:
+                frequency_dict[time_units] = count
+
+        return frequency_dict
+
+
+    def count_by_range(self, data_type, frequency_dict):
+
+        """Called by StatsManager.compile_by_size() and
+        .compile_by_duration().
+
+        Vectorised equivalent of
+        media.GenericContainer.compile_all_videos_by_size() and
+        .compile_all_videos_by_duration().
+
+        Args:
+
+            data_type (str): 'size' or 'duration'
+
+            frequency_dict (dict): The dictionary compiled so far
+
+        Return values:
+
+            Dictionary in the form
+                frequency_dict[range_label] = number_of_videos
+
+        """
+
+        # NB If these labels are changed, when the corresponding literal
+        #   values in media.GenericContainer.compile_all_videos_by_size()
+        #   and .compile_all_videos_by_duration() (and in
+        #   config.GenericConfigWin.on_button_draw_graph_clicked() ) must be
+        #   changed too
+        if data_type == 'size':
+
+            array = self.size_array[:self.row_count]
+            limit_list = [
+                10_000_000, 25_000_000, 50_000_000, 100_000_000, 250_000_000,
+                500_000_000, 1000_000_000, 2000_000_000, 5000_000_000,
+            ]
+            label_list = [
+                '10MB', '25MB', '50MB', '100MB', '250MB',
+                '500MB', '1GB', '2GB', '5GB', '5GB+',
+            ]
+
+        else:
+
+            array = self.duration_array[:self.row_count]
+            limit_list = [10, 60, 300, 600, 1200, 1800, 3600, 7200, 18000]
+            label_list = [
+                '10s', '1m', '5m', '10m', '20m',
+                '30m', '1h', '2h', '5h', '5h+',
+            ]
+
+        array = array[~numpy.isnan(array)]
+        if not array.size:
+            return frequency_dict
+
+        # ('right' means that a value equal to a limit belongs to the next
+        #   range, as in the original function)
+        index_array = numpy.searchsorted(limit_list, array, side='right')
+        count_list = numpy.bincount(
+            index_array,
+            minlength=len(label_list),
+        ).tolist()
+
+        for i, label in enumerate(label_list):
+
+            if count_list[i]:
+                if label in frequency_dict:
+                    frequency_dict[label] += count_list[i]
+                else:
+                    frequency_dict[label] = count_list[i]
+
+        return frequency_dict
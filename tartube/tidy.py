@@ -31,6 +31,7 @@ try:
 except:
     pass
 
+import concurrent.futures
 import os
 import re
 import shutil
@@ -39,9 +40,9 @@ import time
 
 
 # Import our modules
+import files
 import formats
 import media
-import ttutils
 # Use same gettext translations
 from mainapp import _
 
@@ -118,6 +119,10 @@ class TidyManager(threading.Thread):
             convert_ext_flag: True if .unknown_video file extensions should be
                 converted to .mp4 (experimental; see Git #472)
 
+            find_dup_flag: True if downloaded video files with identical
+                contents (in any channel, playlist or folder) should be listed
+                in the Output tab (no files are deleted)
+
     """
 
 
@@ -139,6 +144,13 @@ class TidyManager(threading.Thread):
         self.init_obj = choices_dict['media_data_obj']
 
 
+        # The slow checks and conversions (checking videos for corruption, and
+        #   converting .webp thumbnails) are performed by a pool of worker
+        #   threads (a concurrent.futures.ThreadPoolExecutor), created when
+        #   the operation starts. The workers never modify the database
+        self.executor = None
+
+
         # IV list - other
         # ---------------
         # Flag set to False if self.stop_tidy_operation() is called, which
@@ -152,6 +164,16 @@ class TidyManager(threading.Thread):
         self.stop_time = None
         # The time (in seconds) between iterations of the loop in self.run()
         self.sleep_time = 0.25
+        # The number of worker threads in the pool
+        self.worker_count = app_obj.tidy_worker_count
+        # The number of .webp thumbnails converted by each worker thread at a
+        #   time
+        self.webp_batch_size = 50
+        # The maximum number of videos changed by self.apply_plan() before
+        #   they are redrawn in the Video Index and Video Catalogue (the
+        #   redraws are not postponed while the slow checks and conversions
+        #   are performed)
+        self.bulk_change_batch_size = 100
 
         # Flags specifying which actions should be applied
         # True if video files should be checked for corruption
@@ -197,6 +219,10 @@ class TidyManager(threading.Thread):
         # True if .unknown_video file extensions should be converted to .mp4
         #   (experimental; see Git #472)
         self.convert_ext_flag = choices_dict['convert_ext_flag']
+        # True if downloaded video files with identical contents (in any
+        #   channel, playlist or folder) should be listed in the Output tab
+        #   (no files are deleted)
+        self.find_dup_flag = choices_dict['find_dup_flag']
 
         # The number of media data objects whose directories have been tidied
         #   so far...
@@ -205,6 +231,33 @@ class TidyManager(threading.Thread):
         #   progress bar in the Videos tab)
         self.job_total = 0
 
+        # Each channel, playlist or folder is tidied in two stages. In the
+        #   first stage, every selected action is checked for every video,
+        #   in a single pass, and a list of file operations is compiled. In
+        #   the second stage, the file operations are performed together
+        # To avoid checking for each file separately, a snapshot of the
+        #   directories used by the channel/playlist/folder is taken, as
+        #   they are needed. During the first stage, the snapshot is updated
+        #   to show the files that will be deleted, moved and so on during the
+        #   second stage. Dictionary in the form
+        #       snapshot_dict[full_path_to_dir] = set_of_file_names
+        self.snapshot_dict = {}
+        # The list of file operations. Each item is a tuple whose first item
+        #   is one of the strings 'delete', 'move', 'mark', 'remove' and
+        #   'convert' (see self.apply_plan() for the other items)
+        self.plan_list = []
+        # During the first stage, the downloaded status of any video that
+        #   will be changed during the second stage. Dictionary in the form
+        #       dl_dict[video_obj.dbid] = True or False
+        self.dl_dict = {}
+        # The results of checking videos for corruption, obtained by the
+        #   workers before the first stage begins. Dictionary in the form
+        #       corrupt_dict[video_obj.dbid] = result
+        #   ...where 'result' is 'timeout' if moviepy froze (so the video is
+        #   probably corrupted), 'error' if moviepy could not read the file,
+        #   or None if the video is not corrupted
+        self.corrupt_dict = {}
+
         # Individual counts, updated as we go
         self.video_corrupt_count = 0
         self.video_corrupt_deleted_count = 0
@@ -224,6 +277,9 @@ class TidyManager(threading.Thread):
         self.json_deleted_count = 0
         self.xml_deleted_count = 0
         self.ext_converted_count = 0
+        self.dup_group_count = 0
+        self.dup_file_count = 0
+        self.thumb_cache_pruned_count = 0
 
 
         # Code
@@ -450,6 +506,16 @@ class TidyManager(threading.Thread):
             + ' ' + text,
         )
 
+        if self.find_dup_flag:
+            text = _('YES')
+        else:
+            text = _('NO')
+
+        self.app_obj.main_win_obj.output_tab_write_stdout(
+            1,
+            '   ' + _('Find duplicate video files:') + ' ' + text,
+        )
+
         # Compile a list of channels, playlists and folders to tidy up (each
         #   one has their own sub-directory inside Tartube's data directory)
         obj_list = []
@@ -468,16 +534,40 @@ class TidyManager(threading.Thread):
                     obj_list.append(obj)
 
         self.job_total = len(obj_list)
+        # (Duplicates are found after every channel/playlist/folder has been
+        #   tidied)
+        container_list = obj_list.copy()
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.worker_count,
+        )
 
         # Check each sub-directory in turn, updating the media data registry
         #   as we go
         while self.running_flag and obj_list:
+
+            # (Changes to videos are shown in the Video Index and Video
+            #   Catalogue in batches, by self.apply_plan() )
             self.tidy_directory(obj_list.pop(0))
 
             # Pause a moment, before the next iteration of the loop (don't want
             #   to hog resources)
             time.sleep(self.sleep_time)
 
+        if self.running_flag and self.find_dup_flag:
+            self.find_duplicates(container_list)
+
+        # When tidying the whole data directory, also remove any scaled
+        #   thumbnails that are no longer required from the persistent cache
+        #   (see files.FileManager.get_thumb_cache_path() )
+        if self.running_flag and not self.init_obj:
+            self.prune_thumb_cache()
+
+        # (Any moviepy threads that are still frozen are daemon threads, so
+        #   there's no need to wait for them)
+        self.executor.shutdown(wait=False)
+        self.executor = None
+
         # Operation complete. Set the stop time
         self.stop_time = int(time.time())
 
@@ -626,6 +716,28 @@ class TidyManager(threading.Thread):
                 + str(self.ext_converted_count),
             )
 
+        if self.find_dup_flag:
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                '   ' + _('Sets of duplicate video files found:') + ' ' \
+                + str(self.dup_group_count),
+            )
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                '   ' + _('Duplicate video files found:') + ' ' \
+                + str(self.dup_file_count),
+            )
+
+        if self.thumb_cache_pruned_count:
+
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                '   ' + _('Unused cached thumbnails removed:') + ' ' \
+                + str(self.thumb_cache_pruned_count),
+            )
+
         # Let the timer run for a few more seconds to prevent Gtk errors
         GObject.timeout_add(
             0,
@@ -639,6 +751,11 @@ class TidyManager(threading.Thread):
 
         Tidy up the directory of a single channel, playlist or folder.
 
+        Every selected action is checked for every video in a single pass,
+        producing a list of file operations, which are then performed
+        together. Slow checks and conversions are handed to the pool of
+        worker threads.
+
         Args:
 
             media_data_obj (media.Channel, media.Playlist or media.Folder):
@@ -663,515 +780,439 @@ class TidyManager(threading.Thread):
             _('Checking:') + ' \'' + media_data_obj.name + '\'',
         )
 
-        if self.convert_ext_flag:
-            self.convert_file_ext(media_data_obj)
+        self.snapshot_dict = {}
+        self.plan_list = []
+        self.dl_dict = {}
+        self.corrupt_dict = {}
 
-        if self.corrupt_flag:
-            self.check_video_corrupt(media_data_obj)
+        video_list = media_data_obj.compile_all_videos( [] )
+        protect_set = self.compile_protect_set(media_data_obj)
 
-        if self.exist_flag:
-            self.check_videos_exist(media_data_obj)
+        # (File extensions are converted first, so that the converted video
+        #   files can be found by the other actions, and checked for
+        #   corruption by the workers)
+        if self.convert_ext_flag:
+            self.plan_convert_file_ext(media_data_obj)
+            self.apply_plan()
 
-        if self.del_video_flag:
-            self.delete_video(media_data_obj)
+        if self.corrupt_flag and not self.check_corrupt_all(video_list):
+            return
 
-        if self.remove_no_url_flag:
-            self.remove_no_url(media_data_obj)
+        # Actions which might change each video's downloaded status are
+        #   planned first
+        for video_obj in video_list:
 
-        if self.remove_duplicate_flag:
-            self.remove_duplicate(media_data_obj)
+            # (If self.stop_tidy_operation() has been called, give up
+            #   immediately)
+            if not self.running_flag:
+                return
 
-        if self.del_archive_flag:
-            self.delete_archive(media_data_obj)
+            self.plan_video_status(video_obj, protect_set)
 
-        if self.move_thumb_flag:
-            self.move_thumb(media_data_obj)
+        if self.del_video_flag:
+            self.plan_delete_artefacts(media_data_obj)
 
-        if self.del_thumb_flag:
-            self.delete_thumb(media_data_obj)
+        # Then removals from the database (which depend on the downloaded
+        #   status). The remaining actions ignore videos that are going to be
+        #   removed, so their thumbnails and metadata files are not moved,
+        #   converted or deleted
+        remove_set = self.plan_remove(video_list)
 
-        if self.del_webp_flag:
-            self.delete_webp(media_data_obj)
+        for video_obj in video_list:
 
-        if self.convert_webp_flag:
-            self.convert_webp(media_data_obj)
+            if not self.running_flag:
+                return
 
-        if self.move_data_flag:
-            self.move_data(media_data_obj)
+            if not video_obj.dbid in remove_set:
+                self.plan_video_files(video_obj, protect_set)
 
-        if self.del_descrip_flag:
-            self.delete_descrip(media_data_obj)
+        if self.del_archive_flag:
+            self.plan_delete_archive(media_data_obj)
 
-        if self.del_json_flag:
-            self.delete_json(media_data_obj)
+        self.apply_plan()
 
-        if self.del_xml_flag:
-            self.delete_xml(media_data_obj)
 
+    def find_duplicates(self, container_list):
 
-    def convert_file_ext(self, media_data_obj):
+        """Called by self.run().
 
-        """Called by self.tidy_directory().
+        Finds downloaded video files with identical contents, and lists them in
+        the Output tab. No files are deleted.
 
-        Git #472: yt-dlp occasionally downloads .mp4 videos from VK (and
-        possibly other websites) whose file extension is mistakenly set to
-        .mp4. Convert any such files to .mp4.
+        When tidying the whole data directory, every video in the database
+        (and in the Classic Mode tab) is checked. Otherwise, only the videos
+        in the channels, playlists and folders that have been tidied are
+        checked.
 
-        This is an experimental/temporary feature.
+        Files are compared by size first; then by a partial hash of files of
+        the same size; and then by a hash of the whole file, for files with
+        the same partial hash. The hashes are stored in a files.HashCache.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            container_list (list): The media.Channel, media.Playlist and
+                media.Folder objects that have been tidied
 
         """
 
-        # Import the main window (for convenience)
-        main_win_obj = self.app_obj.main_win_obj
-
-        # Get a list of video files in the directory
-        container_path = media_data_obj.get_actual_dir(self.app_obj)
-        try:
-            init_list = os.listdir(container_path)
-        except:
-            # Can't read the directory
-            return
-
-        # Find all .unknown_video files
-        for relative_path in init_list:
-
-            # (If self.stop_tidy_operation() has been called, give up
-            #   immediately)
-            if not self.running_flag:
-                return
-
-            file_path = os.path.abspath(
-                os.path.join(container_path, relative_path),
-            )
-
-            if os.path.isfile(file_path):
-
-                filename, ext = os.path.splitext(relative_path)
-                if ext == '.unknown_video':
-                    mod_file_path = re.sub(
-                        r'\.unknown_video$',
-                        '.mp4',
-                        file_path,
-                    )
-                    self.app_obj.move_file_or_directory(
-                        file_path,
-                        mod_file_path,
-                    )
-                    self.ext_converted_count += 1
+        self.app_obj.main_win_obj.output_tab_write_stdout(
+            1,
+            _('Checking for duplicate video files...'),
+        )
 
+        # Compile a dictionary of video files, in the form
+        #   path_dict[full_path] = list_of_media.Video_objects
+        # (Several videos might share the same file, for example when a
+        #   channel has an alternative download destination)
+        path_dict = {}
 
-    def check_video_corrupt(self, media_data_obj):
+        video_list = []
+        if self.init_obj is None:
 
-        """Called by self.tidy_directory().
+            for media_data_obj in list(self.app_obj.media_reg_dict.values()):
+                if isinstance(media_data_obj, media.Video):
+                    video_list.append(media_data_obj)
 
-        Checks all child videos of the specified media data object. If the
-        video are corrupted, don't delete them (let the user do that manually).
+        else:
 
-        Args:
+            for container_obj in container_list:
+                for child_obj in container_obj.child_list:
+                    if isinstance(child_obj, media.Video):
+                        video_list.append(child_obj)
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+        for video_obj in video_list:
 
-        """
+            if video_obj.dl_flag and video_obj.file_name is not None:
 
-        # Import the main window (for convenience)
-        main_win_obj = self.app_obj.main_win_obj
+                full_path = video_obj.get_actual_path(self.app_obj)
+                path_dict.setdefault(full_path, []).append(video_obj)
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if self.init_obj is None:
 
-            if video_obj.file_name is not None \
-            and video_obj.dl_flag:
+            for dummy_obj in list(
+                self.app_obj.main_win_obj.classic_media_dict.values(),
+            ):
+                if dummy_obj.dl_flag and dummy_obj.dummy_path is not None:
+                    path_dict.setdefault(dummy_obj.dummy_path, []).append(
+                        dummy_obj,
+                    )
 
-                video_path = video_obj.get_actual_path(self.app_obj)
+        # Group the files by size. Hard links to the same file are not
+        #   duplicates, so only the first path to each file is used
+        size_dict = {}
+        inode_set = set()
+        stat_dict = {}
+        for full_path in sorted(path_dict.keys()):
 
-                if os.path.isfile(video_path):
-
-                    # Code copied from
-                    #   mainapp.TartubeApp.update_video_from_filesystem()
-                    # When the video file is corrupted, moviepy freezes
-                    #   indefinitely
-                    # Instead, let's try placing the procedure inside a thread
-                    #   (unlike the original function, this one is never called
-                    #   if .refresh_moviepy_timeout is 0)
-                    this_thread = threading.Thread(
-                        target=self.call_moviepy,
-                        args=(video_obj, video_path,),
-                    )
+            try:
+                stat_obj = os.stat(full_path)
+            except:
+                continue
 
-                    this_thread.daemon = True
-                    this_thread.start()
-                    this_thread.join(self.app_obj.refresh_moviepy_timeout)
-                    if this_thread.is_alive():
-
-                        # moviepy timed out, so assume the video is corrupted
-                        self.video_corrupt_count += 1
-
-                        if self.del_corrupt_flag \
-                        and os.path.isfile(video_path):
-
-                            # Delete the corrupted file
-                            if self.app_obj.remove_file(video_path):
-                                self.video_corrupt_deleted_count += 1
-
-                                main_win_obj.output_tab_write_stdout(
-                                    1,
-                                    '   ' + _(
-                                    'Deleted (possibly) corrupted video file:',
-                                    ) + ' \'' + video_obj.name + '\'',
-                                )
-
-                                self.app_obj.mark_video_downloaded(
-                                    video_obj,
-                                    False,
-                                )
-
-                            else:
-                                main_win_obj.output_tab_write_stderr(
-                                    1,
-                                    '   ' + _(
-                                        'Failed to delete (possibly)' \
-                                        + ' corrupted video file:',
-                                    ) + ' \'' + video_obj.name + '\'',
-                                )
-
-                        else:
-
-                            # Don't delete it
-                            self.app_obj.main_win_obj.output_tab_write_stdout(
-                                1,
-                                '   ' + _(
-                                    'Video file might be corrupt:',
-                                ) + ' \'' + video_obj.name + '\'',
-                            )
+            inode = (stat_obj.st_dev, stat_obj.st_ino)
+            if stat_obj.st_size and not inode in inode_set:
 
+                inode_set.add(inode)
+                stat_dict[full_path] = stat_obj
+                size_dict.setdefault(stat_obj.st_size, []).append(full_path)
 
-    def check_videos_exist(self, media_data_obj):
+        hash_cache_obj = files.HashCache(
+            os.path.abspath(
+                os.path.join(self.app_obj.data_dir, '.hash_cache'),
+            ),
+        )
 
-        """Called by self.tidy_directory().
+        hash_cache_obj.load()
 
-        Checks all child videos of the specified media data object. If the
-        video should exist, but doesn't (or vice-versa), modify the media.Video
-        object's IVs accordingly.
+        # Files with a unique size can't be duplicates. For the others,
+        #   compare partial hashes, and then full hashes
+        group_list = [
+            path_list for path_list in size_dict.values() \
+            if len(path_list) > 1
+        ]
 
-        Args:
+        for full_flag in (False, True):
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            group_list = self.find_duplicates_by_hash(
+                hash_cache_obj,
+                group_list,
+                stat_dict,
+                full_flag,
+            )
 
-        """
+            if group_list is None:
+                # Operation halted
+                hash_cache_obj.save()
+                return
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        # When tidying the whole data directory, forget about any files which
+        #   no longer exist
+        if self.init_obj is None:
+            hash_cache_obj.prune(set(stat_dict.keys()))
 
-            if video_obj.file_name is not None:
+        hash_cache_obj.save()
 
-                video_path = video_obj.get_actual_path(self.app_obj)
+        for path_list in sorted(group_list):
 
-                if not video_obj.dl_flag \
-                and os.path.isfile(video_path):
+            self.dup_group_count += 1
+            self.dup_file_count += len(path_list) - 1
 
-                    # File exists, but is marked as not downloaded
-                    self.app_obj.mark_video_downloaded(
-                        video_obj,
-                        True,       # Video is downloaded
-                        True,       # ...but don't mark it as new
-                    )
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                '   ' + _('Duplicate video files:'),
+            )
 
-                    self.video_exist_count += 1
+            for full_path in path_list:
+                for video_obj in path_dict[full_path]:
 
                     self.app_obj.main_win_obj.output_tab_write_stdout(
                         1,
-                        '   ' + _(
-                            'Video file exists:',
-                        ) + ' \'' + video_obj.name + '\'',
+                        '      \'' + video_obj.name + '\': ' + full_path,
                     )
 
-                elif video_obj.dl_flag \
-                and not os.path.isfile(video_path):
 
-                    # File doesn't exist, but is marked as downloaded
-                    self.app_obj.mark_video_downloaded(
-                        video_obj,
-                        False,      # Video is not downloaded
-                    )
+    def find_duplicates_by_hash(self, hash_cache_obj, group_list, stat_dict,
+    full_flag):
 
-                    self.video_no_exist_count += 1
+        """Called by self.find_duplicates().
 
-                    self.app_obj.main_win_obj.output_tab_write_stdout(
-                        1,
-                        '   ' + _(
-                            'Video file doesn\'t exist:',
-                        ) + ' \'' + video_obj.name + '\'',
-                    )
+        Hashes each file in each group (using the pool of worker threads), and
+        then divides each group into smaller groups of files with the same
+        hash.
 
+        Args:
 
-    def delete_video(self, media_data_obj):
+            hash_cache_obj (files.HashCache): The cache of hashes
 
-        """Called by self.tidy_directory().
+            group_list (list): A list of groups, each of which is a list of
+                full paths to files that might be duplicates
 
-        Checks all child videos of the specified media data object. If the
-        video exists, delete it.
+            stat_dict (dict): Dictionary of os.stat() results, in the form
+                stat_dict[full_path] = stat_object
 
-        Args:
+            full_flag (bool): True to compare hashes of whole files, False to
+                compare partial hashes
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+        Return values:
+
+            A list of smaller groups (each containing at least two files), or
+                None if the operation was halted
 
         """
 
-        ext_list = formats.VIDEO_FORMAT_LIST.copy()
-        ext_list.extend(formats.AUDIO_FORMAT_LIST)
+        future_list = []
+        for path_list in group_list:
+
+            for full_path in path_list:
+
+                stat_obj = stat_dict[full_path]
+                future_list.append(
+                    (
+                        full_path,
+                        self.executor.submit(
+                            hash_cache_obj.get_hash,
+                            full_path,
+                            stat_obj.st_size,
+                            stat_obj.st_mtime,
+                            full_flag,
+                        ),
+                    ),
+                )
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        hash_dict = {}
+        for full_path, future_obj in future_list:
 
-            video_path = None
-            if video_obj.file_name is not None:
+            # (If self.stop_tidy_operation() has been called, give up
+            #   immediately)
+            if not self.running_flag:
 
-                video_path = video_obj.get_actual_path(self.app_obj)
+                for other_path, other_future_obj in future_list:
+                    other_future_obj.cancel()
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                video_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    video_path,
-                )
+                return None
 
-            if video_path is not None:
+            hash_str = future_obj.result()
+            if hash_str is not None:
+                hash_dict[full_path] = hash_str
 
-                if video_obj.dl_flag \
-                and os.path.isfile(video_path):
+        new_list = []
+        for path_list in group_list:
 
-                    # Delete the downloaded video file
-                    if self.app_obj.remove_file(video_path):
+            match_dict = {}
+            for full_path in path_list:
+                if full_path in hash_dict:
+                    match_dict.setdefault(hash_dict[full_path], []).append(
+                        full_path,
+                    )
 
-                        # Mark the video as not downloaded
-                        self.app_obj.mark_video_downloaded(video_obj, False)
-                        self.video_deleted_count += 1
+            for match_list in match_dict.values():
+                if len(match_list) > 1:
+                    new_list.append(match_list)
 
-                if self.del_others_flag:
+        return new_list
 
-                    # Also delete all video/audio files with the same name
-                    # There might be thousands of files in the directory, so
-                    #   using os.walk() or something like that might be too
-                    #   expensive
-                    # Also, post-processing might create various artefacts, all
-                    #   of which must be deleted
-                    for ext in ext_list:
 
-                        other_path = video_obj.get_actual_path_by_ext(
-                            self.app_obj,
-                            ext,
-                        )
+    def prune_thumb_cache(self):
 
-                        if os.path.isfile(other_path) \
-                        and self.app_obj.remove_file(other_path):
-                            self.other_deleted_count += 1
-
-        # For an encore, delete all post-processing artefacts in the form
-        #   VIDEO_NAME.fNNN.ext, where NNN is an integer and .ext is one of
-        #   the video extensions specified by formats.VIDEO_FORMAT_LIST
-        #   (.mkv, etc)
-        # (The previous code won't pick them up, but we can delete them all
-        #   now.)
-        # (The alternative download destination, if set, is not affected.)
-        check_list = []
-        search_path = media_data_obj.get_default_dir(self.app_obj)
+        """Called by self.run().
 
-        for (dir_path, dir_name_list, file_name_list) in os.walk(search_path):
-            check_list.extend(file_name_list)
+        Removes scaled thumbnails from the persistent cache, if their original
+        thumbnails no longer exist (or have been replaced).
+        """
 
-        char = '|'
-        regex = r'\.f\d+\.(' + char.join(formats.VIDEO_FORMAT_LIST) + ')$'
-        for check_path in check_list:
-            if re.search(regex, check_path):
+        video_list = []
+        for media_data_obj in list(self.app_obj.media_reg_dict.values()):
+            if isinstance(media_data_obj, media.Video):
+                video_list.append(media_data_obj)
 
-                full_path = os.path.abspath(
-                    os.path.join(search_path, check_path),
-                )
+        # (Videos in the Classic Mode tab have thumbnails too)
+        video_list.extend(
+            list(self.app_obj.main_win_obj.classic_media_dict.values()),
+        )
 
-                if os.path.isfile(full_path) \
-                and self.app_obj.remove_file(full_path):
-                    self.other_deleted_count += 1
+        self.thumb_cache_pruned_count \
+        = self.app_obj.file_manager_obj.prune_thumb_cache(
+            self.app_obj,
+            video_list,
+        )
 
 
-    def remove_no_url(self, media_data_obj):
+    def plan_video_status(self, video_obj, protect_set):
 
         """Called by self.tidy_directory().
 
-        Checks all child videos of the specified media data object. If the
-        video has no URL, remove it from the database (but don't delete any
-        files).
+        Checks the selected actions which might change a single video's
+        downloaded status (checking for corruption, checking that the video
+        exists, and deleting the video), adding any file operations to the
+        plan.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
+
+            protect_set (set): The set returned by self.compile_protect_set()
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if self.corrupt_flag:
+            self.plan_check_corrupt(video_obj)
 
-            if video_obj.source is None:
-                GObject.timeout_add(
-                    0,
-                    self.app_obj.delete_video,
-                    video_obj,
-                )
+        if self.exist_flag:
+            self.plan_check_exist(video_obj)
 
-                self.remove_no_url_count += 1
+        if self.del_video_flag:
+            self.plan_delete_video(video_obj, protect_set)
 
 
-    def remove_duplicate(self, media_data_obj):
+    def plan_remove(self, video_list):
 
-        """Called by self.tidy_directory().
+        """Called by self.tidy_directory(), after self.plan_video_status() has
+        been called for every video.
 
-        Checks all child videos of the specified media data object. If the
-        video is not marked as downloaded, and has the same URL as another
-        child video (of the same specified media data object) which IS marked
-        as downloaded, remove the undownloaded one from the database (but
-        don't delete any files).
+        Plans the removal of videos from the database.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_list (list): The media.Video objects being tidied up
 
-        """
+        Return values:
 
-        # Compile dictionaries of downloaded and undownloaded URLs
-        dl_dict = {}
-        not_dl_dict = {}
+            A set of .dbids for the videos that are going to be removed (may
+                be an empty set)
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        """
 
-            if video_obj.source is not None:
-                if video_obj.dl_flag:
-                    dl_dict[video_obj.source] = video_obj.dbid
-                else:
-                    not_dl_dict[video_obj.source] = video_obj.dbid
+        remove_set = set()
 
-        # Check undownloaded videos, looking for a matching downloaded video
-        for url in not_dl_dict.keys():
+        if self.remove_no_url_flag:
 
-            if url in dl_dict:
+            for video_obj in video_list:
 
-                # Duplicate found
-                dbid = not_dl_dict[url]
-                if dbid in self.app_obj.media_reg_dict:
+                if video_obj.source is None:
 
-                    duplicate_obj = self.app_obj.media_reg_dict[dbid]
-                    GObject.timeout_add(
-                        0,
-                        self.app_obj.delete_video,
-                        duplicate_obj,
+                    self.plan_list.append(
+                        ('remove', video_obj, 'remove_no_url_count'),
                     )
 
-                    self.remove_duplicate_count += 1
-
-
-    def delete_archive(self, media_data_obj):
-
-        """Called by self.tidy_directory().
-
-        Checks the specified media data object's directory. If a youtube-dl
-        archive file is found there, delete it.
-
-        Args:
-
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
-
-        """
+                    remove_set.add(video_obj.dbid)
 
-        archive_path = os.path.abspath(
-            os.path.join(
-                media_data_obj.get_default_dir(self.app_obj),
-                self.app_obj.ytdl_archive_name,
-            ),
-        )
+        if self.remove_duplicate_flag:
+            remove_set.update(self.plan_remove_duplicate(video_list))
 
-        # Delete the archive file
-        if os.path.isfile(archive_path) \
-        and self.app_obj.remove_file(archive_path):
-            self.archive_deleted_count += 1
+        return remove_set
 
 
-    def move_thumb(self, media_data_obj):
+    def plan_video_files(self, video_obj, protect_set):
 
-        """Called by self.tidy_directory().
+        """Called by self.tidy_directory(), after self.plan_remove() has been
+        called.
 
-        Checks all child videos of the specified media data object. If the
-        associated thumbnail file exists, moves it into its own sub-directory.
+        Checks the selected actions which apply to a single video's
+        thumbnails and metadata files, adding any file operations to the plan.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
+
+            protect_set (set): The set returned by self.compile_protect_set()
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        # All of these actions apply to files with the same name as the video
+        if video_obj.file_name is None:
+            return
 
-            if video_obj.file_name is not None:
+        if self.move_thumb_flag:
+            self.plan_move_thumb(video_obj)
 
-                # Thumbnails might be in one of four locations. If the
-                #   thumbnail has already been moved into /.thumbs, then of
-                #   course we don't move it again (and this function returns an
-                #   empty list)
-                path_list = ttutils.find_thumbnail_restricted(
-                    self.app_obj,
-                    video_obj,
-                )
+        if self.del_thumb_flag:
+            self.plan_delete_thumb(video_obj, protect_set)
 
-                if path_list:
+        if self.del_webp_flag:
+            self.plan_delete_webp(video_obj, protect_set)
 
-                    main_path = os.path.abspath(
-                        os.path.join(
-                            path_list[0], path_list[1],
-                        ),
-                    )
+        if self.convert_webp_flag:
+            self.plan_convert_webp(video_obj, protect_set)
 
-                    subdir = os.path.abspath(
-                        os.path.join(
-                            path_list[0], self.app_obj.thumbs_sub_dir,
-                        ),
-                    )
+        if self.move_data_flag:
 
-                    subdir_path = os.path.abspath(
-                        os.path.join(
-                            path_list[0],
-                            self.app_obj.thumbs_sub_dir,
-                            path_list[1],
-                        ),
-                    )
+            for ext in ['.description', '.info.json', '.annotations.xml']:
+                self.plan_move_data(video_obj, ext)
 
-                    if os.path.isfile(main_path) \
-                    and not os.path.isfile(subdir_path):
+        if self.del_descrip_flag:
+            self.plan_delete_data(
+                video_obj,
+                '.description',
+                'descrip_deleted_count',
+                protect_set,
+            )
 
-                        if not os.path.isdir(subdir):
-                            self.app_obj.make_directory(subdir)
+        if self.del_json_flag:
+            self.plan_delete_data(
+                video_obj,
+                '.info.json',
+                'json_deleted_count',
+                protect_set,
+            )
 
-                        if self.app_obj.move_file_or_directory(
-                            main_path,
-                            subdir_path,
-                        ):
-                            self.thumb_moved_count += 1
+        if self.del_xml_flag:
+            self.plan_delete_data(
+                video_obj,
+                '.annotations.xml',
+                'xml_deleted_count',
+                protect_set,
+            )
 
 
-    def delete_thumb(self, media_data_obj):
+    def plan_convert_file_ext(self, media_data_obj):
 
         """Called by self.tidy_directory().
 
-        Checks all child videos of the specified media data object. If the
-        associated thumbnail file exists, delete it.
+        Git #472: yt-dlp occasionally downloads .mp4 videos from VK (and
+        possibly other websites) whose file extension is mistakenly set to
+        .mp4. Convert any such files to .mp4.
+
+        This is an experimental/temporary feature.
 
         Args:
 
@@ -1180,138 +1221,185 @@ class TidyManager(threading.Thread):
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
-
-            if video_obj.file_name is not None:
+        container_path = media_data_obj.get_actual_dir(self.app_obj)
 
-                # Thumbnails might be in one of four locations
-                thumb_path = ttutils.find_thumbnail(self.app_obj, video_obj)
+        # Find all .unknown_video files
+        for relative_path in sorted(self.get_snapshot(container_path)):
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                if thumb_path is not None:
+            filename, ext = os.path.splitext(relative_path)
+            if ext == '.unknown_video':
 
-                    thumb_path = self.check_video_in_actual_dir(
-                        media_data_obj,
-                        video_obj,
-                        thumb_path,
-                    )
+                file_path = os.path.abspath(
+                    os.path.join(container_path, relative_path),
+                )
 
-                # Delete the thumbnail file
-                if thumb_path is not None \
-                and os.path.isfile(thumb_path) \
-                and self.app_obj.remove_file(thumb_path):
-                    self.thumb_deleted_count += 1
+                self.plan_move(
+                    file_path,
+                    re.sub(r'\.unknown_video$', '.mp4', file_path),
+                    'ext_converted_count',
+                )
 
 
-    def delete_webp(self, media_data_obj):
+    def plan_check_corrupt(self, video_obj):
 
-        """Called by self.tidy_directory().
+        """Called by self.plan_video_status().
 
-        Checks all child videos of the specified media data object. If the
-        associated .webp thumbnail file exists, delete it.
+        Uses the result obtained by self.check_corrupt_all() to decide whether
+        a downloaded video is corrupted. Corrupted videos are deleted only if
+        the user has asked for that; otherwise the user can delete them
+        manually.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if video_obj.file_name is None or not self.check_dl(video_obj):
+            return
+
+        result = self.corrupt_dict.get(video_obj.dbid)
+        if result == 'timeout':
 
-            if video_obj.file_name is not None:
+            # moviepy timed out, so assume the video is corrupted
+            self.video_corrupt_count += 1
 
-                # Thumbnails might be in one of two locations
-                webp_path = ttutils.find_thumbnail_webp_strict(
-                    self.app_obj,
-                    video_obj
+            if self.del_corrupt_flag:
+
+                # Delete the corrupted file
+                self.plan_delete(
+                    video_obj.get_actual_path(self.app_obj),
+                    'video_corrupt_deleted_count',
+                    video_obj,
+                    (
+                        _('Deleted (possibly) corrupted video file:'),
+                        _('Failed to delete (possibly) corrupted video file:'),
+                    ),
                 )
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                if webp_path is not None:
+            else:
 
-                    webp_path = self.check_video_in_actual_dir(
-                        media_data_obj,
-                        video_obj,
-                        webp_path,
-                    )
+                # Don't delete it
+                self.app_obj.main_win_obj.output_tab_write_stdout(
+                    1,
+                    '   ' + _(
+                        'Video file might be corrupt:',
+                    ) + ' \'' + video_obj.name + '\'',
+                )
+
+        elif result == 'error':
+
+            # moviepy couldn't read the file, but didn't freeze
+            self.video_corrupt_count += 1
 
-                # Delete the thumbnail file
-                if webp_path is not None \
-                and os.path.isfile(webp_path) \
-                and self.app_obj.remove_file(webp_path):
-                    self.webp_deleted_count += 1
+            self.app_obj.main_win_obj.output_tab_write_stdout(
+                1,
+                '   ' + _('Video file might be corrupt:') + ' \'' \
+                + video_obj.name + '\'',
+            )
 
 
-    def convert_webp(self, media_data_obj):
+    def plan_check_exist(self, video_obj):
 
-        """Called by self.tidy_directory().
+        """Called by self.plan_video_status().
 
-        Checks all child videos of the specified media data object. If the
-        associated thumbnail file in a .webp or malformed .jpg format exists,
-        convert it to .jpg.
+        If the video should exist, but doesn't (or vice-versa), plans a change
+        to the media.Video object's IVs.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if video_obj.file_name is None:
+            return
 
-            if video_obj.file_name is not None:
+        dl_flag = self.check_dl(video_obj)
+        exist_flag = self.check_snapshot(
+            video_obj.get_actual_path(self.app_obj),
+        )
 
-                # Thumbnails might be in one of four locations
-                thumb_path = ttutils.find_thumbnail_webp_intact_or_broken(
-                    self.app_obj,
+        if not dl_flag and exist_flag:
+
+            # File exists, but is marked as not downloaded
+            self.plan_list.append(
+                (
+                    'mark',
                     video_obj,
-                )
+                    True,
+                    'video_exist_count',
+                    _('Video file exists:'),
+                ),
+            )
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                if thumb_path is not None:
+            self.dl_dict[video_obj.dbid] = True
 
-                    thumb_path = self.check_video_in_actual_dir(
-                        media_data_obj,
-                        video_obj,
-                        thumb_path,
-                    )
+        elif dl_flag and not exist_flag:
 
-                if thumb_path is not None \
-                and os.path.isfile(thumb_path):
+            # File doesn't exist, but is marked as downloaded
+            self.plan_list.append(
+                (
+                    'mark',
+                    video_obj,
+                    False,
+                    'video_no_exist_count',
+                    _('Video file doesn\'t exist:'),
+                ),
+            )
 
-                    # Convert to .jpg
-                    if not self.app_obj.ffmpeg_manager_obj.convert_webp(
-                        thumb_path
-                    ):
-                        # FFmpeg is probably not installed; don't try any more
-                        #   conversions
-                        self.convert_webp_flag = False
-                        self.app_obj.set_ffmpeg_fail_flag(True)
+            self.dl_dict[video_obj.dbid] = False
 
-                    else:
 
-                        self.webp_converted_count += 1
+    def plan_delete_video(self, video_obj, protect_set):
+
+        """Called by self.plan_video_status().
+
+        If the video's file exists, plans its deletion (and, if required, the
+        deletion of other video/audio files with the same name).
+
+        Args:
+
+            video_obj (media.Video): The video to check
+
+            protect_set (set): The set returned by self.compile_protect_set()
+
+        """
+
+        if video_obj.file_name is None or video_obj.file_name in protect_set:
+            return
+
+        video_path = video_obj.get_actual_path(self.app_obj)
+        if self.check_dl(video_obj) and self.check_snapshot(video_path):
+
+            # Delete the downloaded video file, and mark the video as not
+            #   downloaded
+            self.plan_delete(video_path, 'video_deleted_count', video_obj)
+
+        if self.del_others_flag:
+
+            # Also delete all video/audio files with the same name (which
+            #   post-processing might have created)
+            for ext in formats.VIDEO_FORMAT_LIST + formats.AUDIO_FORMAT_LIST:
+
+                other_path = video_obj.get_actual_path_by_ext(
+                    self.app_obj,
+                    ext,
+                )
+
+                if self.check_snapshot(other_path):
+                    self.plan_delete(other_path, 'other_deleted_count')
 
 
-    def move_data(self, media_data_obj):
+    def plan_delete_artefacts(self, media_data_obj):
 
         """Called by self.tidy_directory().
 
-        Checks all child videos of the specified media data object. If the
-        associated thumbnail file exists, moves it into its own sub-directory.
+        Plans the deletion of all post-processing artefacts in the form
+        VIDEO_NAME.fNNN.ext, where NNN is an integer and .ext is one of the
+        video extensions specified by formats.VIDEO_FORMAT_LIST (.mkv, etc).
+
+        (The alternative download destination, if set, is not affected.)
 
         Args:
 
@@ -1320,54 +1408,72 @@ class TidyManager(threading.Thread):
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        search_path = media_data_obj.get_default_dir(self.app_obj)
 
-            if video_obj.file_name is not None:
+        char = '|'
+        regex = r'\.f\d+\.(' + char.join(formats.VIDEO_FORMAT_LIST) + ')$'
+        for check_path in sorted(self.get_snapshot(search_path)):
+            if re.search(regex, check_path):
 
-                # Description/JSON/annotations files might be in one of four
-                #   locations. If the file has already been moved into /.data,
-                #   then of course we don't move it again
-                for ext in ['.description', '.info.json', '.annotations.xml']:
+                self.plan_delete(
+                    os.path.abspath(os.path.join(search_path, check_path)),
+                    'other_deleted_count',
+                )
 
-                    main_path = video_obj.get_actual_path_by_ext(
-                        self.app_obj,
-                        ext,
-                    )
 
-                    subdir = os.path.abspath(
-                        os.path.join(
-                            video_obj.parent_obj.get_actual_dir(self.app_obj),
-                            self.app_obj.metadata_sub_dir,
-                        ),
-                    )
+    def plan_remove_duplicate(self, video_list):
 
-                    subdir_path \
-                    = video_obj.get_actual_path_in_subdirectory_by_ext(
-                        self.app_obj,
-                        ext,
-                    )
+        """Called by self.plan_remove().
+
+        If a video is not marked as downloaded, and has the same URL as another
+        video in the list which IS marked as downloaded, plans the removal of
+        the undownloaded one from the database (but no files are deleted).
+
+        Args:
+
+            video_list (list): The media.Video objects being tidied up
+
+        Return values:
+
+            A set of .dbids for the videos that are going to be removed (may
+                be an empty set)
+
+        """
+
+        # Compile dictionaries of downloaded and undownloaded URLs
+        dl_dict = {}
+        not_dl_dict = {}
+
+        for video_obj in video_list:
+
+            if video_obj.source is not None:
+                if self.check_dl(video_obj):
+                    dl_dict[video_obj.source] = video_obj
+                else:
+                    not_dl_dict[video_obj.source] = video_obj
 
-                    if os.path.isfile(main_path) \
-                    and not os.path.isfile(subdir_path):
+        # Check undownloaded videos, looking for a matching downloaded video
+        remove_set = set()
+        for url, video_obj in not_dl_dict.items():
 
-                        if not os.path.isdir(subdir):
-                            self.app_obj.make_directory(subdir)
+            if url in dl_dict:
+
+                # Duplicate found
+                self.plan_list.append(
+                    ('remove', video_obj, 'remove_duplicate_count'),
+                )
 
-                        # (os.rename sometimes fails on external hard drives;
-                        #   this is safer)
-                        if self.app_obj.move_file_or_directory(
-                            main_path,
-                            subdir_path,
-                        ):
-                            self.data_moved_count += 1
+                remove_set.add(video_obj.dbid)
 
+        return remove_set
 
-    def delete_descrip(self, media_data_obj):
+
+    def plan_delete_archive(self, media_data_obj):
 
         """Called by self.tidy_directory().
 
-        Checks all child videos of the specified media data object. If the
-        associated description file exists, delete it.
+        If a youtube-dl archive file is found in the specified media data
+        object's directory, plans its deletion.
 
         Args:
 
@@ -1376,226 +1482,657 @@ class TidyManager(threading.Thread):
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        archive_path = os.path.abspath(
+            os.path.join(
+                media_data_obj.get_default_dir(self.app_obj),
+                self.app_obj.ytdl_archive_name,
+            ),
+        )
+
+        if self.check_snapshot(archive_path):
+            self.plan_delete(archive_path, 'archive_deleted_count')
 
-            if video_obj.file_name is not None:
 
-                main_path = video_obj.get_actual_path_by_ext(
-                    self.app_obj,
-                    '.description',
-                )
+    def plan_move_thumb(self, video_obj):
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                main_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    main_path,
-                )
+        """Called by self.plan_video_files().
 
-                # Delete the description file
-                if main_path is not None \
-                and os.path.isfile(main_path) \
-                and self.app_obj.remove_file(main_path):
-                    self.descrip_deleted_count += 1
+        If the video's thumbnail is in the same directory as the video, plans
+        moving it into its own sub-directory.
 
-                # (Repeat for a file that might be in the sub-directory
-                #   '.data')
-                subdir_path = video_obj.get_actual_path_in_subdirectory_by_ext(
-                    self.app_obj,
-                    '.description',
-                )
+        Args:
 
-                subdir_path = self.check_video_in_actual_dir(
-                    subdir_path,
-                    video_obj,
-                    subdir_path,
+            video_obj (media.Video): The video to check
+
+        """
+
+        actual_dir = video_obj.parent_obj.get_actual_dir(self.app_obj)
+        name_set = self.get_snapshot(actual_dir)
+
+        for ext in formats.IMAGE_FORMAT_LIST:
+
+            thumb_name = video_obj.file_name + ext
+            if thumb_name in name_set:
+
+                subdir_path = os.path.abspath(
+                    os.path.join(
+                        actual_dir,
+                        self.app_obj.thumbs_sub_dir,
+                        thumb_name,
+                    ),
                 )
 
-                if subdir_path is not None \
-                and os.path.isfile(subdir_path) \
-                and self.app_obj.remove_file(subdir_path):
-                    self.descrip_deleted_count += 1
+                # (If the thumbnail has already been moved into the
+                #   sub-directory, of course we don't move it again)
+                if not self.check_snapshot(subdir_path):
 
+                    self.plan_move(
+                        os.path.abspath(os.path.join(actual_dir, thumb_name)),
+                        subdir_path,
+                        'thumb_moved_count',
+                    )
 
-    def delete_json(self, media_data_obj):
+                return
 
-        """Called by self.tidy_directory().
 
-        Checks all child videos of the specified media data object. If the
-        associated metadata (JSON) file exists, delete it.
+    def plan_delete_thumb(self, video_obj, protect_set):
+
+        """Called by self.plan_video_files().
+
+        If the video's thumbnail exists, plans its deletion.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
+
+            protect_set (set): The set returned by self.compile_protect_set()
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if video_obj.file_name in protect_set:
+            return
 
-            if video_obj.file_name is not None:
+        # Thumbnails might be in one of four locations (code adapted from
+        #   ttutils.find_thumbnail() )
+        for ext in formats.IMAGE_FORMAT_LIST:
 
-                main_path = video_obj.get_actual_path_by_ext(
-                    self.app_obj,
-                    '.info.json',
-                )
+            for thumb_path in self.get_sidecar_path_list(video_obj, ext):
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                main_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    main_path,
-                )
+                if self.check_snapshot(thumb_path):
+                    self.plan_delete(thumb_path, 'thumb_deleted_count')
+                    return
 
-                # Delete the metadata file
-                if main_path is not None \
-                and os.path.isfile(main_path) \
-                and self.app_obj.remove_file(main_path):
-                    self.json_deleted_count += 1
+        # Catch YouTube .jpg thumbnails, in the form .jpg?...
+        match_list = self.find_snapshot_prefix(
+            video_obj.get_actual_path_by_ext(self.app_obj, '.jpg'),
+        )
 
-                # (Repeat for a file that might be in the sub-directory
-                #   '.data')
-                subdir_path = video_obj.get_actual_path_in_subdirectory_by_ext(
-                    self.app_obj,
-                    '.info.json',
-                )
+        if match_list:
+            self.plan_delete(match_list[0], 'thumb_deleted_count')
 
-                subdir_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    subdir_path,
-                )
 
-                if subdir_path is not None \
-                and os.path.isfile(subdir_path) \
-                and self.app_obj.remove_file(subdir_path):
-                    self.json_deleted_count += 1
+    def plan_delete_webp(self, video_obj, protect_set):
 
+        """Called by self.plan_video_files().
 
-    def delete_xml(self, media_data_obj):
+        If the video's .webp thumbnail exists, plans its deletion.
 
-        """Called by self.tidy_directory().
+        Args:
+
+            video_obj (media.Video): The video to check
 
-        Checks all child videos of the specified media data object. If the
-        associated annotation file exists, delete it.
+            protect_set (set): The set returned by self.compile_protect_set()
+
+        """
+
+        if video_obj.file_name in protect_set:
+            return
+
+        # Thumbnails might be in one of two locations
+        for webp_path in self.get_sidecar_path_list(video_obj, '.webp'):
+
+            if self.check_snapshot(webp_path):
+                self.plan_delete(webp_path, 'webp_deleted_count')
+                return
+
+
+    def plan_convert_webp(self, video_obj, protect_set):
+
+        """Called by self.plan_video_files().
+
+        If the video's thumbnail is in a .webp or malformed .jpg format, plans
+        converting it to .jpg.
 
         Args:
 
-            media_data_obj (media.Channel, media.Playlist or media.Folder):
-                The media data object whose directory must be tidied up
+            video_obj (media.Video): The video to check
+
+            protect_set (set): The set returned by self.compile_protect_set()
 
         """
 
-        for video_obj in media_data_obj.compile_all_videos( [] ):
+        if video_obj.file_name in protect_set:
+            return
 
-            if video_obj.file_name is not None:
+        ffmpeg_manager_obj = self.app_obj.ffmpeg_manager_obj
 
-                main_path = video_obj.get_actual_path_by_ext(
-                    self.app_obj,
-                    '.annotations.xml',
-                )
+        # Thumbnails might be in one of four locations (code adapted from
+        #   ttutils.find_thumbnail_webp_intact_or_broken() )
+        for ext in ('.webp', '.jpg'):
 
-                # If the video's parent container has an alternative download
-                #   destination set, we must check the corresponding media
-                #   data object. If the latter also has a media.Video object
-                #   matching this video, then this function returns None and
-                #   nothing is deleted
-                main_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    main_path,
-                )
+            for thumb_path in self.get_sidecar_path_list(video_obj, ext):
 
-                # Delete the annotation file
-                if main_path is not None \
-                and os.path.isfile(main_path) \
-                and self.app_obj.remove_file(main_path):
-                    self.xml_deleted_count += 1
+                if self.check_snapshot(thumb_path) \
+                and (
+                    ffmpeg_manager_obj.is_webp(thumb_path) \
+                    or ffmpeg_manager_obj.is_mislabelled_webp(thumb_path)
+                ):
+                    self.plan_list.append( ('convert', thumb_path) )
+                    return
 
-                # (Repeat for a file that might be in the sub-directory
-                #   '.data')
-                subdir_path = video_obj.get_actual_path_in_subdirectory_by_ext(
-                    self.app_obj,
-                    '.annotations.xml',
-                )
+                # The extension may be followed by additional characters,
+                #   e.g. .jpg?sqp=-XXX
+                for match_path in self.find_snapshot_prefix(thumb_path):
 
-                subdir_path = self.check_video_in_actual_dir(
-                    media_data_obj,
-                    video_obj,
-                    subdir_path,
-                )
+                    if ffmpeg_manager_obj.is_webp(match_path):
+                        self.plan_list.append( ('convert', match_path) )
+                        return
 
-                if subdir_path is not None \
-                and os.path.isfile(subdir_path) \
-                and self.app_obj.remove_file(subdir_path):
-                    self.xml_deleted_count += 1
 
+    def plan_move_data(self, video_obj, ext):
 
-    def call_moviepy(self, video_obj, video_path):
+        """Called by self.plan_video_files().
 
-        """Called by thread inside self.check_video_corrupt().
+        If the video's description, metadata (JSON) or annotations file is in
+        the same directory as the video, plans moving it into its own
+        sub-directory.
 
-        When we call moviepy.editor.VideoFileClip() on a corrupted video file,
-        moviepy freezes indefinitely.
+        Args:
+
+            video_obj (media.Video): The video to check
+
+            ext (str): The file extension, e.g. '.description'
+
+        """
+
+        main_path, subdir_path = self.get_sidecar_path_list(video_obj, ext)
+
+        # (If the file has already been moved into the sub-directory, of
+        #   course we don't move it again)
+        if self.check_snapshot(main_path) \
+        and not self.check_snapshot(subdir_path):
+            self.plan_move(main_path, subdir_path, 'data_moved_count')
 
-        This function is called inside a thread, so a timeout of (by default)
-        ten seconds can be applied.
+
+    def plan_delete_data(self, video_obj, ext, count_name, protect_set):
+
+        """Called by self.plan_video_files().
+
+        If the video's description, metadata (JSON) or annotations file exists
+        (in the same directory as the video, or in its sub-directory), plans
+        its deletion.
 
         Args:
 
-            video_obj (media.Video): The video object being updated
+            video_obj (media.Video): The video to check
 
-            video_path (str): The path to the video file itself
+            ext (str): The file extension, e.g. '.description'
+
+            count_name (str): The IV to increment, when a file is deleted
+
+            protect_set (set): The set returned by self.compile_protect_set()
 
         """
 
+        if video_obj.file_name in protect_set:
+            return
+
+        for data_path in self.get_sidecar_path_list(video_obj, ext):
+
+            if self.check_snapshot(data_path):
+                self.plan_delete(data_path, count_name)
+
+
+    def plan_delete(self, full_path, count_name, video_obj=None,
+    msg_tuple=None):
+
+        """Can be called by any of the planning functions.
+
+        Adds the deletion of a file to the plan, and updates the snapshot.
+
+        Args:
+
+            full_path (str): The full path to the file to delete
+
+            count_name (str): The IV to increment, if the file is deleted
+
+            video_obj (media.Video or None): If specified, the video is marked
+                as not downloaded, when the file is deleted
+
+            msg_tuple (tuple or None): If specified, a tuple in the form
+                (success_msg, failure_msg), one of which is displayed in the
+                Output tab after trying to delete the file
+
+        """
+
+        self.plan_list.append(
+            ('delete', full_path, count_name, video_obj, msg_tuple),
+        )
+
+        dir_path, file_name = os.path.split(full_path)
+        self.get_snapshot(dir_path).discard(file_name)
+
+        if video_obj is not None:
+            self.dl_dict[video_obj.dbid] = False
+
+
+    def plan_move(self, source_path, dest_path, count_name):
+
+        """Can be called by any of the planning functions.
+
+        Adds the moving of a file to the plan, and updates the snapshot.
+
+        Args:
+
+            source_path (str): The full path to the file to move
+
+            dest_path (str): The file's new full path
+
+            count_name (str): The IV to increment, if the file is moved
+
+        """
+
+        self.plan_list.append( ('move', source_path, dest_path, count_name) )
+
+        dir_path, file_name = os.path.split(source_path)
+        self.get_snapshot(dir_path).discard(file_name)
+        dir_path, file_name = os.path.split(dest_path)
+        self.get_snapshot(dir_path).add(file_name)
+
+
+    def apply_plan(self):
+
+        """Called by self.tidy_directory().
+
+        Performs the file operations compiled by the planning functions, and
+        then updates the counts and the main window.
+        """
+
+        main_win_obj = self.app_obj.main_win_obj
+
+        # Directories whose cached listings must be discarded, when the file
+        #   operations are complete
+        modify_set = set()
+        # Sub-directories that already exist
+        dir_set = set()
+        # Thumbnails to convert, after all other file operations are complete
+        convert_list = []
+
+        # Changes to videos are shown in the Video Index and Video Catalogue
+        #   in batches. The number of videos changed in the current batch
+        change_count = 0
+
+        self.app_obj.bulk_change_begin()
         try:
-            clip = moviepy.editor.VideoFileClip(video_path)
+            for plan_tuple in self.plan_list:
 
-        except:
-            self.video_corrupt_count += 1
+                # (If self.stop_tidy_operation() has been called, give up
+                #   immediately)
+                if not self.running_flag:
+                    break
 
-            self.app_obj.main_win_obj.output_tab_write_stdout(
-                1,
-                '   ' + _('Video file might be corrupt:') + ' \'' \
-                + video_obj.name + '\'',
+                # (Redraw the videos changed so far, and start a new batch)
+                if change_count >= self.bulk_change_batch_size:
+
+                    self.app_obj.bulk_change_commit()
+                    self.app_obj.bulk_change_begin()
+                    change_count = 0
+
+                action = plan_tuple[0]
+
+                if action == 'delete':
+
+                    full_path, count_name, video_obj, msg_tuple \
+                    = plan_tuple[1:]
+
+                    try:
+                        os.remove(full_path)
+                        success_flag = True
+
+                    except:
+                        success_flag = False
+                        self.app_obj.system_error(
+                            108,
+                            'Failed to remove file \'' + full_path + '\'',
+                        )
+
+                    modify_set.add(os.path.dirname(full_path))
+
+                    if success_flag:
+
+                        setattr(
+                            self,
+                            count_name,
+                            getattr(self, count_name) + 1,
+                        )
+
+                        if video_obj is not None:
+                            self.app_obj.mark_video_downloaded(
+                                video_obj,
+                                False,
+                            )
+
+                            change_count += 1
+
+                        if msg_tuple is not None:
+                            main_win_obj.output_tab_write_stdout(
+                                1,
+                                '   ' + msg_tuple[0] + ' \'' + video_obj.name \
+                                + '\'',
+                            )
+
+                    elif msg_tuple is not None:
+
+                        main_win_obj.output_tab_write_stderr(
+                            1,
+                            '   ' + msg_tuple[1] + ' \'' + video_obj.name \
+                            + '\'',
+                        )
+
+                elif action == 'move':
+
+                    source_path, dest_path, count_name = plan_tuple[1:]
+
+                    dest_dir = os.path.dirname(dest_path)
+                    if not dest_dir in dir_set:
+
+                        if not os.path.isdir(dest_dir):
+                            self.app_obj.make_directory(dest_dir)
+
+                        dir_set.add(dest_dir)
+
+                    # (os.rename sometimes fails on external hard drives; this
+                    #   is safer)
+                    try:
+                        shutil.move(source_path, dest_path)
+                        setattr(
+                            self,
+                            count_name,
+                            getattr(self, count_name) + 1,
+                        )
+
+                    except:
+                        self.app_obj.system_error(
+                            109,
+                            'Failed to move file/directory \'' + source_path \
+                            + '\' to \'' + dest_path + '\'',
+                        )
+
+                    modify_set.add(os.path.dirname(source_path))
+                    modify_set.add(dest_dir)
+
+                elif action == 'mark':
+
+                    video_obj, dl_flag, count_name, msg = plan_tuple[1:]
+
+                    if dl_flag:
+                        self.app_obj.mark_video_downloaded(
+                            video_obj,
+                            True,       # Video is downloaded
+                            True,       # ...but don't mark it as new
+                        )
+
+                    else:
+                        self.app_obj.mark_video_downloaded(
+                            video_obj,
+                            False,      # Video is not downloaded
+                        )
+
+                    setattr(self, count_name, getattr(self, count_name) + 1)
+                    change_count += 1
+
+                    main_win_obj.output_tab_write_stdout(
+                        1,
+                        '   ' + msg + ' \'' + video_obj.name + '\'',
+                    )
+
+                elif action == 'remove':
+
+                    video_obj, count_name = plan_tuple[1:]
+
+                    GObject.timeout_add(
+                        0,
+                        self.app_obj.delete_video,
+                        video_obj,
+                    )
+
+                    setattr(self, count_name, getattr(self, count_name) + 1)
+
+                elif action == 'convert':
+
+                    convert_list.append(plan_tuple[1])
+
+        finally:
+            # (Even if something went wrong, the transaction must end)
+            self.app_obj.bulk_change_commit()
+
+        if self.running_flag and self.convert_webp_flag and convert_list:
+            self.convert_webp_all(convert_list, modify_set)
+
+        for dir_path in modify_set:
+            self.app_obj.file_manager_obj.reset_dir_listing(dir_path)
+
+        self.plan_list = []
+        self.snapshot_dict = {}
+        self.dl_dict = {}
+
+
+    def check_corrupt_all(self, video_list):
+
+        """Called by self.tidy_directory().
+
+        Before the first stage begins, each downloaded video is checked for
+        corruption by the pool of worker threads. The results are stored in
+        self.corrupt_dict.
+
+        Args:
+
+            video_list (list): The media.Video objects being tidied up
+
+        Return values:
+
+            False if the operation was halted while the checks were running,
+                True otherwise
+
+        """
+
+        # Code adapted from mainapp.TartubeApp.update_video_from_filesystem()
+        future_list = []
+        for video_obj in video_list:
+
+            if video_obj.file_name is not None and self.check_dl(video_obj):
+
+                video_path = video_obj.get_actual_path(self.app_obj)
+                if self.check_snapshot(video_path):
+
+                    future_list.append(
+                        (
+                            video_obj,
+                            self.executor.submit(
+                                self.check_corrupt_worker,
+                                video_path,
+                            ),
+                        ),
+                    )
+
+        for video_obj, future_obj in future_list:
+
+            # (If self.stop_tidy_operation() has been called, give up
+            #   immediately)
+            if not self.running_flag:
+
+                for other_obj, other_future_obj in future_list:
+                    other_future_obj.cancel()
+
+                return False
+
+            self.corrupt_dict[video_obj.dbid] = future_obj.result()
+
+        return True
+
+
+    def check_corrupt_worker(self, video_path):
+
+        """Called by self.check_corrupt_all(), in a worker thread.
+
+        When the video file is corrupted, moviepy freezes indefinitely. Instead
+        of calling it directly, place the procedure inside another thread, so a
+        timeout of (by default) ten seconds can be applied.
+
+        Args:
+
+            video_path (str): The path to the video file
+
+        Return values:
+
+            'timeout' if moviepy froze, 'error' if moviepy could not read the
+                file, None otherwise
+
+        """
+
+        error_list = []
+
+        this_thread = threading.Thread(
+            target=self.call_moviepy,
+            args=(video_path, error_list,),
+        )
+
+        this_thread.daemon = True
+        this_thread.start()
+        this_thread.join(self.app_obj.refresh_moviepy_timeout)
+        if this_thread.is_alive():
+            return 'timeout'
+        elif error_list:
+            return 'error'
+        else:
+            return None
+
+
+    def convert_webp_all(self, convert_list, modify_set):
+
+        """Called by self.apply_plan().
+
+        Converts thumbnails from .webp to .jpg, using the pool of worker
+        threads. Thumbnails are divided into batches, so that each worker
+        converts many thumbnails at a time (see
+        ffmpeg_tartube.FFmpegManager.convert_webp_batch() ).
+
+        Args:
+
+            convert_list (list): Full paths to the thumbnails to convert
+
+            modify_set (set): Directories whose cached listings must be
+                discarded; updated by this function
+
+        """
+
+        ffmpeg_manager_obj = self.app_obj.ffmpeg_manager_obj
+
+        future_list = []
+        for i in range(0, len(convert_list), self.webp_batch_size):
+
+            batch_list = convert_list[i:i + self.webp_batch_size]
+            future_list.append(
+                (
+                    batch_list,
+                    self.executor.submit(
+                        ffmpeg_manager_obj.convert_webp_batch,
+                        batch_list,
+                    ),
+                ),
             )
 
+        for batch_list, future_obj in future_list:
+
+            if not self.running_flag or not self.convert_webp_flag:
+                future_obj.cancel()
+                continue
+
+            result_list = future_obj.result()
+            for j in range(len(batch_list)):
+
+                if not result_list[j]:
+
+                    # FFmpeg is probably not installed; don't try any more
+                    #   conversions
+                    self.convert_webp_flag = False
+                    self.app_obj.set_ffmpeg_fail_flag(True)
+
+                else:
 
-    def check_video_in_actual_dir(self, container_obj, video_obj, delete_path):
+                    self.webp_converted_count += 1
+                    modify_set.add(os.path.dirname(batch_list[j]))
 
-        """Called by self.delete_video(), .delete_descrip(), .delete_json(),
-        .delete_xml() and .delete_thumb().
 
-        If the video's parent container has an alternative download destination
-        set, we must check the corresponding media data object. If the latter
-        also has a media.Video object matching this video, then this function
-        returns None and nothing is deleted. Otherwise, the specified
-        delete_path is returned, so it can be deleted.
+    def check_dl(self, video_obj):
+
+        """Can be called by any of the planning functions.
+
+        Returns the video's downloaded status, taking into account any changes
+        already planned.
 
         Args:
 
-            container_obj (media.Channel, media.Playlist, media.Folder): A
-                channel, playlist or folder
+            video_obj (media.Video): The video to check
+
+        Return values:
+
+            True if the video is (or will be) marked as downloaded, False if
+                not
+
+        """
+
+        return self.dl_dict.get(video_obj.dbid, video_obj.dl_flag)
+
+
+    def check_snapshot(self, full_path):
 
-            video_obj (media.Video): A video contained in that channel,
-                playlist or folder
+        """Can be called by any of the planning functions.
+
+        Equivalent to os.path.isfile(), but uses the snapshot (so files whose
+        deletion has already been planned don't exist, and so on).
+
+        Args:
 
-            delete_path (str): The path to a file which the calling function
-                wants to delete
+            full_path (str): The full path to the file
 
         Return values:
 
-            The specified delete_path if it can be deleted, or None if it
-                should not be deleted
+            True if the file exists, False if not
+
+        """
+
+        dir_path, file_name = os.path.split(full_path)
+        return file_name in self.get_snapshot(dir_path)
+
+
+    def compile_protect_set(self, container_obj):
+
+        """Called by self.tidy_directory().
+
+        If the channel, playlist or folder has an alternative download
+        destination set, then files belonging to the videos in the
+        corresponding media data object must not be deleted.
+
+        Args:
+
+            container_obj (media.Channel, media.Playlist, media.Folder): The
+                channel, playlist or folder being tidied up
+
+        Return values:
+
+            A set of file names (without extensions) that must not be deleted
+                (may be an empty set)
 
         """
 
@@ -1603,26 +2140,136 @@ class TidyManager(threading.Thread):
         or container_obj.dbid == container_obj.master_dbid:
 
             # No alternative download destination to check
-            return delete_path
+            return set()
 
-        else:
+        # Get the channel/playlist/folder acting as container_obj's
+        #   alternative download destination
+        master_obj = self.app_obj.media_reg_dict[container_obj.master_dbid]
+
+        protect_set = set()
+        for child_obj in master_obj.child_list:
+
+            if child_obj.file_name is not None:
+                protect_set.add(child_obj.file_name)
+
+        return protect_set
+
+
+    def find_snapshot_prefix(self, full_path):
+
+        """Can be called by any of the planning functions.
+
+        Equivalent to files.FileManager.find_path_by_prefix(), but uses the
+        snapshot.
+
+        Args:
+
+            full_path (str): The full path to the file, without the characters
+                which may follow it
+
+        Return values:
+
+            A sorted list of full paths to matching files (may be an empty
+                list)
+
+        """
+
+        dir_path, prefix = os.path.split(full_path)
 
-            # Get the channel/playlist/folder acting as container_obj's
-            #   alternative download destination
-            master_obj = self.app_obj.media_reg_dict[container_obj.master_dbid]
+        match_list = []
+        for file_name in self.get_snapshot(dir_path):
+            if file_name.startswith(prefix):
+                match_list.append(os.path.join(dir_path, file_name))
 
-            # Check its videos. Are there any videos with the same name?
-            for child_obj in master_obj.child_list:
+        match_list.sort()
+        return match_list
 
-                if child_obj.file_name is not None \
-                and child_obj.file_name == video_obj.file_name:
 
-                    # Don't delete the file associated with this video
-                    return None
+    def get_sidecar_path_list(self, video_obj, ext):
 
-            # There are no videos with the same name, so the file can be
-            #   deleted
-            return delete_path
+        """Can be called by any of the planning functions.
+
+        Files with the same name as the video (thumbnails, descriptions and so
+        on) might be stored in the same directory as the video, or in the
+        sub-directory '.thumbs' (for thumbnails) or '.data' (for everything
+        else).
+
+        Args:
+
+            video_obj (media.Video): The video whose file is needed
+
+            ext (str): The file extension, e.g. '.jpg'
+
+        Return values:
+
+            A list containing the full paths to both possible locations
+
+        """
+
+        return [
+            video_obj.get_actual_path_by_ext(self.app_obj, ext),
+            video_obj.get_actual_path_in_subdirectory_by_ext(
+                self.app_obj,
+                ext,
+            ),
+        ]
+
+
+    def get_snapshot(self, dir_path):
+
+        """Can be called by any of the planning functions.
+
+        Returns the snapshot of the specified directory, taking the snapshot
+        if this is the first time the directory has been needed.
+
+        Args:
+
+            dir_path (str): The full path to the directory
+
+        Return values:
+
+            A set of file names (an empty set if the directory doesn't exist
+                or can't be read)
+
+        """
+
+        name_set = self.snapshot_dict.get(dir_path)
+        if name_set is None:
+
+            # (The file manager's own set is shared, so it must be copied)
+            name_set = set(
+                self.app_obj.file_manager_obj.get_dir_listing(dir_path),
+            )
+
+            self.snapshot_dict[dir_path] = name_set
+
+        return name_set
+
+
+    def call_moviepy(self, video_path, error_list):
+
+        """Called by thread inside self.check_corrupt_worker().
+
+        When we call moviepy.editor.VideoFileClip() on a corrupted video file,
+        moviepy freezes indefinitely.
+
+        This function is called inside a thread, so a timeout of (by default)
+        ten seconds can be applied.
+
+        Args:
+
+            video_path (str): The path to the video file itself
+
+            error_list (list): If moviepy can't read the file, an item is
+                added to this list
+
+        """
+
+        try:
+            clip = moviepy.editor.VideoFileClip(video_path)
+
+        except:
+            error_list.append(video_path)
 
 
     def stop_tidy_operation(self):
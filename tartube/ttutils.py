@@ -21,12 +21,11 @@
 
 
 # Import Gtk modules
-from gi.repository import Gtk, Gdk, GObject
+from gi.repository import Gtk, Gdk
 
 
 # Import other modules
 import datetime
-import glob
 import hashlib
 import locale
 import math
@@ -40,6 +39,12 @@ import sys
 import time
 from urllib.parse import urlparse, urljoin
 
+try:
+    import fcntl
+    HAVE_FCNTL_FLAG = True
+except:
+    HAVE_FCNTL_FLAG = False
+
 
 # Import our modules
 import classes
@@ -50,6 +55,12 @@ import media
 from mainapp import _
 
 
+# Constants (used by link_file)
+# The ioctl request that asks Linux to make a reflink (a copy-on-write copy)
+#   of a file, on filesystems that support it (such as Btrfs and XFS)
+FICLONE = 0x40049409
+
+
 # Functions
 
 
@@ -420,6 +431,8 @@ clip_path=None):
         # Specifying the original video clones its .receive_time
         new_video_obj.set_receive_time(orig_video_obj)
         new_video_obj.set_upload_time(orig_video_obj.upload_time)
+        # Update any statistics snapshots containing the new video
+        app_obj.stats_manager_obj.update_video(new_video_obj)
 
         # (The video length and file size is set elsewhere)
 
@@ -455,11 +468,7 @@ clip_path=None):
         # If the clips' parent media data object (a channel, playlist or
         #   folder) is selected in the Video Index, update the Video Catalogue
         #   for the clip
-        GObject.timeout_add(
-            0,
-            app_obj.main_win_obj.video_catalogue_update_video,
-            new_video_obj,
-        )
+        app_obj.schedule_catalogue_video(new_video_obj)
 
         return new_video_obj
 
@@ -2489,6 +2498,9 @@ def find_thumbnail(app_obj, video_obj, temp_dir_flag=False):
     thumbnails, so look for the most common ones, and return the path to the
     thumbnail file if one is found.
 
+    Uses cached directory listings (see files.FileManager.get_dir_listing() ),
+    rather than checking for each possible file separately.
+
     Args:
 
         app_obj (mainapp.TartubeApp): The main application
@@ -2516,7 +2528,7 @@ def find_thumbnail(app_obj, video_obj, temp_dir_flag=False):
         for this_ext in formats.IMAGE_FORMAT_EXT_LIST:
 
             thumb_path = file_name + this_ext
-            if os.path.isfile(thumb_path):
+            if app_obj.file_manager_obj.check_path(thumb_path):
                 return thumb_path
 
         # No matching thumbnail found
@@ -2539,31 +2551,27 @@ def find_thumbnail(app_obj, video_obj, temp_dir_flag=False):
 
                 temp_path = video_obj.get_actual_path_by_ext(app_obj, ext)
                 temp_path = app_obj.temp_dl_dir + temp_path[data_dir_len:]
-                if os.path.isfile(temp_path):
+                if app_obj.file_manager_obj.check_path(temp_path):
                     return temp_path
 
         # Catch YouTube .jpg thumbnails, in the form .jpg?...
-        # v2.2.005 The glob.glob() call crashes on certain videos. I'm not sure
-        #   why, but we can circumvent the crash with try...except
-        normal_path = video_obj.get_actual_path_by_ext(app_obj, '.jpg*')
-        try:
-            for glob_path in glob.glob(normal_path):
-                if os.path.isfile(glob_path):
-                    return glob_path
-        except:
-            pass
+        # (The directory listing is used, rather than glob.glob(), which used
+        #   to crash on certain videos, and which misinterprets file names
+        #   containing characters like '[')
+        normal_path = video_obj.get_actual_path_by_ext(app_obj, '.jpg')
+        match_list = app_obj.file_manager_obj.find_path_by_prefix(normal_path)
+        if match_list:
+            return match_list[0]
 
         if temp_dir_flag:
 
-            temp_path = video_obj.get_actual_path_by_ext(app_obj, '.jpg*')
-            temp_path = app_obj.temp_dl_dir + temp_path[data_dir_len:]
+            temp_path = app_obj.temp_dl_dir + normal_path[data_dir_len:]
+            match_list = app_obj.file_manager_obj.find_path_by_prefix(
+                temp_path,
+            )
 
-            try:
-                for glob_path in glob.glob(temp_path):
-                    if os.path.isfile(glob_path):
-                        return glob_path
-            except:
-                pass
+            if match_list:
+                return match_list[0]
 
         # No matching thumbnail found
         return None
@@ -2602,7 +2610,7 @@ def find_thumbnail_from_filename(app_obj, dir_path, filename):
             os.path.join(dir_path, filename + this_ext),
         )
 
-        if os.path.isfile(thumb_path):
+        if app_obj.file_manager_obj.check_path(thumb_path):
             return thumb_path
 
     # No matching thumbnail found
@@ -2633,17 +2641,13 @@ def find_thumbnail_restricted(app_obj, video_obj):
 
     """
 
-    for ext in formats.IMAGE_FORMAT_LIST:
+    actual_dir = video_obj.parent_obj.get_actual_dir(app_obj)
 
-        actual_dir = video_obj.parent_obj.get_actual_dir(app_obj)
-        test_path = os.path.abspath(
-            os.path.join(
-                actual_dir,
-                video_obj.file_name + ext,
-            ),
-        )
+    for ext in formats.IMAGE_FORMAT_LIST:
 
-        if os.path.isfile(test_path):
+        if app_obj.file_manager_obj.check_path(
+            os.path.join(actual_dir, video_obj.file_name + ext),
+        ):
             return [ actual_dir, video_obj.file_name + ext ]
 
     # No matching thumbnail found
@@ -2673,10 +2677,12 @@ def find_thumbnail_webp_intact_or_broken(app_obj, video_obj):
 
     """
 
+    file_manager_obj = app_obj.file_manager_obj
+
     for ext in ('.webp', '.jpg'):
 
         main_path = video_obj.get_actual_path_by_ext(app_obj, ext)
-        if os.path.isfile(main_path) \
+        if file_manager_obj.check_path(main_path) \
         and (
             app_obj.ffmpeg_manager_obj.is_webp(main_path) \
             or app_obj.ffmpeg_manager_obj.is_mislabelled_webp(main_path)
@@ -2685,35 +2691,27 @@ def find_thumbnail_webp_intact_or_broken(app_obj, video_obj):
 
         # The extension may be followed by additional characters, e.g.
         #   .jpg?sqp=-XXX (as well as several other patterns)
-        # v2.2.005 The glob.glob() call crashes on certain videos. I'm not
-        #   sure why, but we can circumvent the crash with try...except
-        try:
-            for actual_path in glob.glob(main_path + '*'):
-                if os.path.isfile(actual_path) \
-                and app_obj.ffmpeg_manager_obj.is_webp(actual_path):
-                    return actual_path
-        except:
-            pass
+        # (The directory listing is used, rather than glob.glob(), which used
+        #   to crash on certain videos)
+        for actual_path in file_manager_obj.find_path_by_prefix(main_path):
+            if app_obj.ffmpeg_manager_obj.is_webp(actual_path):
+                return actual_path
 
         subdir_path = video_obj.get_actual_path_in_subdirectory_by_ext(
             app_obj,
             ext,
         )
 
-        if os.path.isfile(subdir_path) \
+        if file_manager_obj.check_path(subdir_path) \
         and (
             app_obj.ffmpeg_manager_obj.is_webp(subdir_path) \
             or app_obj.ffmpeg_manager_obj.is_mislabelled_webp(subdir_path)
         ):
             return subdir_path
 
-        try:
-            for actual_path in glob.glob(subdir_path + '*'):
-                if os.path.isfile(actual_path) \
-                and app_obj.ffmpeg_manager_obj.is_webp(actual_path):
-                    return actual_path
-        except:
-            pass
+        for actual_path in file_manager_obj.find_path_by_prefix(subdir_path):
+            if app_obj.ffmpeg_manager_obj.is_webp(actual_path):
+                return actual_path
 
     # No webp thumbnail found
     return None
@@ -2742,14 +2740,14 @@ def find_thumbnail_webp_strict(app_obj, video_obj):
     ext = '.webp'
 
     main_path = video_obj.get_actual_path_by_ext(app_obj, ext)
-    if os.path.isfile(main_path):
+    if app_obj.file_manager_obj.check_path(main_path):
         return main_path
 
     subdir_path = video_obj.get_actual_path_in_subdirectory_by_ext(
         app_obj,
         ext,
     )
-    if os.path.isfile(subdir_path):
+    if app_obj.file_manager_obj.check_path(subdir_path):
         return subdir_path
 
     # No webp thumbnail found
@@ -3940,6 +3938,78 @@ def is_video_enhanced(video_obj):
         return is_enhanced(video_obj.parent_obj.source)
 
 
+def link_file(source_path, dest_path):
+
+    """Called by mainapp.TartubeApp.save_db_write(), often in a background
+    thread (so this function must not interact with the main window).
+
+    Makes a second copy of a file, without writing its contents again: first
+    by trying a hard link, and then (on Linux) a reflink. Any existing file at
+    the destination is replaced.
+
+    Because the copy shares its data with the original, the original must
+    only ever be replaced (for example, with os.replace() ), never modified.
+
+    Args:
+
+        source_path (str): Full path to the file to copy
+
+        dest_path (str): Full path to the copy
+
+    Return values:
+
+        True on success, False if the filesystem supports neither hard links
+            nor reflinks (in which case the calling code should rename or copy
+            the file instead)
+
+    """
+
+    # (os.link() fails, if the destination already exists)
+    temp_path = dest_path + '.tmp'
+    if os.path.isfile(temp_path):
+        try:
+            os.remove(temp_path)
+        except:
+            return False
+
+    link_flag = False
+    try:
+        os.link(source_path, temp_path)
+        link_flag = True
+
+    except:
+        pass
+
+    if not link_flag and HAVE_FCNTL_FLAG:
+
+        try:
+            with open(source_path, 'rb') as source_fh:
+                with open(temp_path, 'wb') as dest_fh:
+                    fcntl.ioctl(dest_fh.fileno(), FICLONE, source_fh.fileno())
+
+            link_flag = True
+
+        except:
+            pass
+
+    if link_flag:
+
+        try:
+            os.replace(temp_path, dest_path)
+            return True
+
+        except:
+            pass
+
+    if os.path.isfile(temp_path):
+        try:
+            os.remove(temp_path)
+        except:
+            pass
+
+    return False
+
+
 def match_subs(custom_dl_obj, subs_list):
 
     """Called by downloads.DownloadList.create_item() and
@@ -4269,6 +4339,9 @@ def rename_file(app_obj, old_path, new_path):
         # (os.rename sometimes fails on external hard drives; this is safer)
         shutil.move(old_path, new_path)
 
+        app_obj.file_manager_obj.reset_dir_listing(old_path)
+        app_obj.file_manager_obj.reset_dir_listing(new_path)
+
     except:
 
         app_obj.system_error(
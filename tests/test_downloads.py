@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Tests for downloads.py."""
+
+
+# Import other modules
+import os
+import sys
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import downloads
+
+
+# Functions
+
+
+def make_clip_cmd(clip_title, delay, exit_code):
+
+    """Returns a system command for a child process which behaves like FFmpeg
+    downloading a clip: after 'delay' seconds, it announces the clip's file,
+    and then exits with 'exit_code'.
+    """
+
+    return [
+        sys.executable,
+        '-c',
+        'import sys, time; time.sleep(' + str(delay) + '); ' \
+        + 'print("[ffmpeg] Destination: ' + clip_title + '.mp4"); ' \
+        + 'sys.stdout.flush(); sys.exit(' + str(exit_code) + ')',
+    ]
+
+
+# Classes
+
+
+class TestClipDownloaderMulti(unittest.TestCase):
+
+
+    def setUp(self):
+
+        app_obj = types.SimpleNamespace(
+            main_win_obj=types.SimpleNamespace(
+                output_tab_write_stdout=lambda worker_id, msg: None,
+                output_tab_write_stderr=lambda worker_id, msg: None,
+                output_tab_write_system_cmd=lambda worker_id, msg: None,
+            ),
+            ytdl_log_system_cmd_flag=False,
+            ytdl_output_stderr_flag=False,
+            ytdl_output_stdout_flag=False,
+            ytdl_output_system_cmd_flag=False,
+            ytdl_write_stderr_flag=False,
+            ytdl_write_stdout_flag=False,
+            ytdl_write_system_cmd_flag=False,
+        )
+
+        # (Called when each clip's child process starts, in the form
+        #   [clip_num, clip_num...] )
+        self.start_list = []
+        # (Clips confirmed by ClipDownloader.confirm_video_clip(), in the form
+        #   [(clip_title, clip_path), ...] )
+        self.confirm_list = []
+        # The maximum number of child processes running at the same time
+        self.max_running = 0
+
+        self.downloader_obj = downloads.ClipDownloader(
+            types.SimpleNamespace(app_obj=app_obj, custom_dl_obj=None),
+            types.SimpleNamespace(
+                data_callback=self.data_callback,
+                options_list=[],
+                worker_id=1,
+            ),
+            types.SimpleNamespace(operation_classic_flag=False),
+        )
+
+        self.downloader_obj.dl_type = 'ffmpeg'
+        self.downloader_obj.sleep_time = 0.01
+        self.downloader_obj.confirm_video_clip = self.confirm_video_clip
+        self.downloader_obj.finish_clips_with_ffmpeg \
+        = lambda orig_video_obj, dest_dir: None
+
+        # Dictionary of system commands for each clip, in the form
+        #   cmd_dict[clip_title] = cmd_list
+        self.cmd_dict = {}
+        # When a clip with this number starts, self.stop_soon() is called
+        self.stop_soon_num = None
+
+
+    def tearDown(self):
+
+        # (Shuts down the ClipDownloader's own PipeReader threads)
+        self.downloader_obj.close()
+
+
+    def data_callback(self, dl_stat_dict):
+
+        self.start_list.append(dl_stat_dict['playlist_index'])
+        self.max_running = max(
+            self.max_running,
+            len(self.downloader_obj.job_list),
+        )
+
+        if dl_stat_dict['playlist_index'] == self.stop_soon_num:
+            self.downloader_obj.stop_soon()
+
+
+    def confirm_video_clip(self, dest_obj, dest_dir, orig_video_obj,
+    clip_title, clip_path=None):
+
+        self.confirm_list.append( (clip_title, clip_path) )
+
+
+    def download(self, clip_list, job_count):
+
+        """Downloads clips, each one described by a tuple in the form
+        (clip_title, delay, exit_code).
+        """
+
+        stamp_list = []
+        for clip_title, delay, exit_code in clip_list:
+
+            stamp_list.append( [ '0', '1', clip_title ] )
+            self.cmd_dict[clip_title] \
+            = make_clip_cmd(clip_title, delay, exit_code)
+
+        with unittest.mock.patch.object(
+            downloads.__main__,
+            '__packagename__',
+            'tartube',
+            create=True,
+        ), unittest.mock.patch.object(
+            downloads.ttutils,
+            'clip_prepare_title',
+            lambda app_obj, video_obj, title_dict, clip_title, num, total: \
+            clip_title,
+        ), unittest.mock.patch.object(
+            downloads.ttutils,
+            'generate_ffmpeg_split_system_cmd',
+            lambda app_obj, video_obj, options_list, dest_dir, clip_title, \
+            *args: self.cmd_dict[clip_title],
+        ):
+            return self.downloader_obj.do_download_clips_with_ffmpeg_multi(
+                None,
+                stamp_list,
+                None,
+                'clips',
+                job_count,
+            )
+
+
+    def test_confirm_order(self):
+
+        # Clips are confirmed in their original order, even though they
+        #   finish in a different order
+        return_code = self.download(
+            [ ('one', 0.4, 0), ('two', 0.1, 0), ('three', 0.2, 0) ],
+            3,
+        )
+
+        self.assertEqual(return_code, downloads.ClipDownloader.OK)
+        self.assertEqual(
+            self.confirm_list,
+            [
+                ('one', 'one.mp4'),
+                ('two', 'two.mp4'),
+                ('three', 'three.mp4'),
+            ],
+        )
+
+        self.assertEqual(self.downloader_obj.job_list, [])
+
+
+    def test_job_count(self):
+
+        return_code = self.download(
+            [ (str(i), 0.1, 0) for i in range(5) ],
+            2,
+        )
+
+        self.assertEqual(return_code, downloads.ClipDownloader.OK)
+        self.assertEqual(self.start_list, [ 1, 2, 3, 4, 5 ])
+        self.assertEqual(self.max_running, 2)
+        self.assertEqual(len(self.confirm_list), 5)
+
+
+    def test_error(self):
+
+        # Clip 3 finishes before clip 2 fails, and so is still waiting to be
+        #   confirmed; clip 4 is still running, and is not confirmed
+        return_code = self.download(
+            [
+                ('one', 0.1, 0),
+                ('two', 0.5, 1),
+                ('three', 0.1, 0),
+                ('four', 5, 0),
+            ],
+            4,
+        )
+
+        self.assertEqual(return_code, downloads.ClipDownloader.ERROR)
+        self.assertEqual(
+            self.confirm_list,
+            [ ('one', 'one.mp4'), ('three', 'three.mp4') ],
+        )
+
+        self.assertEqual(self.downloader_obj.job_list, [])
+
+
+    def test_error_same_pass(self):
+
+        # Clips which finish in the same pass as the failed clip are confirmed
+        self.downloader_obj.sleep_time = 1
+        return_code = self.download(
+            [ ('one', 0.1, 0), ('two', 0.1, 1), ('three', 0.1, 0) ],
+            3,
+        )
+
+        self.assertEqual(return_code, downloads.ClipDownloader.ERROR)
+        self.assertEqual(
+            self.confirm_list,
+            [ ('one', 'one.mp4'), ('three', 'three.mp4') ],
+        )
+
+
+    def test_stop_soon(self):
+
+        # Clips already running are allowed to finish, and are confirmed; no
+        #   more clips are started
+        self.stop_soon_num = 2
+        return_code = self.download(
+            [ (str(i), 0.3, 0) for i in range(4) ],
+            2,
+        )
+
+        self.assertEqual(return_code, downloads.ClipDownloader.STOPPED)
+        self.assertEqual(self.start_list, [ 1, 2 ])
+        self.assertEqual(self.confirm_list, [ ('0', '0.mp4'), ('1', '1.mp4') ])
+
+
+if __name__ == '__main__':
+    unittest.main()
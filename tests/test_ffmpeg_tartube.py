@@ -0,0 +1,746 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Tests for ffmpeg_tartube.py."""
+
+
+# Import other modules
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import ffmpeg_tartube
+import files
+
+
+# Captured output of 'ffmpeg -hide_banner -encoders' (etc), shortened
+PROBE_OUTPUT_DICT = {
+    '-encoders': b'''Encoders:
+ V..... = Video
+ A..... = Audio
+ S..... = Subtitle
+ .F.... = Frame-level multithreading
+ ..S... = Slice-level multithreading
+ ...X.. = Codec is experimental
+ ....B. = Supports draw_horiz_band
+ .....D = Supports direct rendering method 1
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC (codec h264)
+ V....D h264_vaapi           H.264/AVC (VAAPI) (codec h264)
+ V....D libx265              libx265 H.265 / HEVC (codec hevc)
+ A....D aac                  AAC (Advanced Audio Coding)
+''',
+    '-demuxers': b'''File formats:
+ D. = Demuxing supported
+ .E = Muxing supported
+ --
+ D  concat          Virtual concatenation script
+ D  matroska,webm   Matroska / WebM
+ D  mov,mp4,m4a,3gp,3g2,mj2 QuickTime / MOV
+''',
+    '-muxers': b'''File formats:
+ D. = Demuxing supported
+ .E = Muxing supported
+ --
+  E matroska        Matroska
+  E mp4             MP4 (MPEG-4 Part 14)
+''',
+    '-hwaccels': b'''Hardware acceleration methods:
+vdpau
+vaapi
+
+''',
+}
+
+
+# Functions
+
+
+def make_app(ffmpeg_path='/usr/bin/ffmpeg'):
+
+    """Returns an object with the mainapp.TartubeApp IVs used by
+    ffmpeg_tartube.FFmpegManager and ffmpeg_tartube.FFmpegOptionsManager.
+    """
+
+    app_obj = types.SimpleNamespace(
+        ffmpeg_path=ffmpeg_path,
+        file_manager_obj=files.FileManager(),
+        simple_ffmpeg_options_flag=False,
+        split_video_generic_title='Video',
+    )
+
+    app_obj.ffmpeg_manager_obj = ffmpeg_tartube.FFmpegManager(app_obj)
+
+    return app_obj
+
+
+def make_webp(dir_path, name, mtime):
+
+    """Creates a (fake) .webp file with the specified modification time, and
+    returns its full path.
+    """
+
+    path = os.path.join(dir_path, name + '.webp')
+    with open(path, 'wb') as fh:
+        fh.write(b'RIFF\x00\x00\x00\x00WEBPVP8 ')
+
+    os.utime(path, (mtime, mtime))
+
+    return path
+
+
+def write_jpg(path):
+
+    """Writes a (fake) .jpg file, as FFmpeg, Pillow or GdkPixbuf would."""
+
+    with open(path, 'wb') as fh:
+        fh.write(b'\xff\xd8\xff\xe0')
+
+
+# Classes
+
+
+class FakeConvertPopen(object):
+
+    """Stands in for subprocess.Popen, in tests of
+    ffmpeg_tartube.FFmpegManager.convert_webp_batch().
+
+    Writes every output file in the FFmpeg command, unless the command
+    includes an input file in the 'fail_set'.
+    """
+
+    # (Every FFmpeg command, in the order they were run)
+    cmd_list_list = []
+    # (Input files which FFmpeg can't convert)
+    fail_set = set()
+
+
+    def __init__(self, cmd_list, **kwargs):
+
+        self.cmd_list = cmd_list
+        self.returncode = None
+        self.cmd_list_list.append(cmd_list)
+
+
+    def communicate(self):
+
+        input_list = [
+            self.cmd_list[i + 1][len('file:'):] \
+            for i in range(len(self.cmd_list)) if self.cmd_list[i] == '-i'
+        ]
+
+        if self.fail_set.intersection(input_list):
+            self.returncode = 1
+
+        else:
+            self.returncode = 0
+            for i in range(len(self.cmd_list)):
+                if self.cmd_list[i] == 'mjpeg2jpeg':
+                    write_jpg(self.cmd_list[i + 1][len('file:'):])
+
+        return b'', b''
+
+
+class FakePopen(object):
+
+    """Stands in for subprocess.Popen, in tests of
+    ffmpeg_tartube.FFmpegManager.probe_capabilities().
+    """
+
+    # (Set to a non-zero value to simulate an FFmpeg error)
+    fail_returncode = 0
+
+
+    def __init__(self, cmd_list, **kwargs):
+
+        self.option = cmd_list[-1]
+        self.returncode = None
+
+
+    def communicate(self):
+
+        self.returncode = self.fail_returncode
+        return PROBE_OUTPUT_DICT[self.option], b''
+
+
+class TestProbeCapabilities(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.ffmpeg_manager_obj = make_app().ffmpeg_manager_obj
+
+
+    def probe(self, popen_obj=FakePopen):
+
+        with unittest.mock.patch.object(
+            ffmpeg_tartube.subprocess,
+            'Popen',
+            popen_obj,
+        ):
+            return self.ffmpeg_manager_obj.probe_capabilities(
+                '/usr/bin/ffmpeg',
+            )
+
+
+    def test_parse(self):
+
+        self.assertEqual(
+            self.probe(),
+            {
+                'encoder_set': { 'libx264', 'h264_vaapi', 'libx265', 'aac' },
+                'demuxer_set': {
+                    'concat', 'matroska', 'webm', 'mov', 'mp4', 'm4a', '3gp',
+                    '3g2', 'mj2',
+                },
+                'muxer_set': { 'matroska', 'mp4' },
+                'hwaccel_set': { 'vdpau', 'vaapi' },
+            },
+        )
+
+
+    def test_legend_ignored(self):
+
+        # The legend above the line of hyphens doesn't list any encoders
+        encoder_set = self.probe()['encoder_set']
+        self.assertNotIn('=', encoder_set)
+        self.assertNotIn('Video', encoder_set)
+
+
+    def test_error(self):
+
+        class FailPopen(FakePopen):
+            fail_returncode = 1
+
+        self.assertIsNone(self.probe(FailPopen))
+
+
+    def test_missing_binary(self):
+
+        def raise_error(cmd_list, **kwargs):
+            raise FileNotFoundError(cmd_list[0])
+
+        self.assertIsNone(self.probe(raise_error))
+
+
+    def test_has_encoder(self):
+
+        with unittest.mock.patch.object(
+            self.ffmpeg_manager_obj,
+            'get_capabilities',
+            self.probe,
+        ):
+            self.assertTrue(self.ffmpeg_manager_obj.has_encoder('libx264'))
+            self.assertFalse(
+                self.ffmpeg_manager_obj.has_encoder('h264_nvenc'),
+            )
+            self.assertTrue(self.ffmpeg_manager_obj.has_demuxer('concat'))
+            self.assertTrue(self.ffmpeg_manager_obj.has_hwaccel('vaapi'))
+            self.assertFalse(self.ffmpeg_manager_obj.has_hwaccel('cuda'))
+            # ('auto' is always supported)
+            self.assertTrue(self.ffmpeg_manager_obj.has_hwaccel('auto'))
+
+
+class TestGetSliceRemovalCmd(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.ffmpeg_manager_obj = make_app().ffmpeg_manager_obj
+        self.temp_dir = tempfile.mkdtemp()
+        self.list_path = os.path.join(self.temp_dir, 'list.txt')
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def test_copy(self):
+
+        cmd_list = self.ffmpeg_manager_obj.get_slice_removal_cmd(
+            '/videos/source.mp4',
+            '/videos/output.mp4',
+            [ [0, 10.5], [20, None] ],
+            self.list_path,
+            True,
+        )
+
+        self.assertEqual(
+            cmd_list,
+            [
+                '/usr/bin/ffmpeg', '-safe', '0', '-f', 'concat',
+                '-i', self.list_path, '-map', '0', '-c', 'copy',
+                '/videos/output.mp4',
+            ],
+        )
+
+        with open(self.list_path) as fh:
+            self.assertEqual(
+                fh.read(),
+                'file \'/videos/source.mp4\'\n' \
+                + 'inpoint 0\n' \
+                + 'outpoint 10.5\n' \
+                + 'file \'/videos/source.mp4\'\n' \
+                + 'inpoint 20\n',
+            )
+
+
+    def test_copy_quoted_path(self):
+
+        # In the list file, single quotes in the path must be escaped
+        self.ffmpeg_manager_obj.get_slice_removal_cmd(
+            '/videos/It\'s here.mp4',
+            '/videos/output.mp4',
+            [ [5, 15] ],
+            self.list_path,
+            True,
+        )
+
+        with open(self.list_path) as fh:
+            self.assertEqual(
+                fh.readline(),
+                'file \'/videos/It\'\\\'\'s here.mp4\'\n',
+            )
+
+
+    def test_reencode(self):
+
+        cmd_list = self.ffmpeg_manager_obj.get_slice_removal_cmd(
+            '/videos/source.mp4',
+            '/videos/output.mp4',
+            [ [0, 10.5], [20, 30], [45, None] ],
+            self.list_path,
+            False,
+        )
+
+        expr = 'between(t,0,10.5)+between(t,20,30)+gte(t,45)'
+        self.assertEqual(
+            cmd_list,
+            [
+                '/usr/bin/ffmpeg', '-i', '/videos/source.mp4',
+                '-vf', 'select=\'' + expr + '\',setpts=N/FRAME_RATE/TB',
+                '-af', 'aselect=\'' + expr + '\',asetpts=N/SR/TB',
+                '/videos/output.mp4',
+            ],
+        )
+
+        # No list file is needed
+        self.assertFalse(os.path.exists(self.list_path))
+
+
+class TestCompileOptions(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.options_obj = ffmpeg_tartube.FFmpegOptionsManager(1, 'test')
+        self.options_dict = self.options_obj.options_dict
+        self.options_dict['limit_flag'] = True
+        self.options_dict['limit_mbps'] = 2
+        self.options_dict['limit_buffer'] = 3
+
+
+    def test_h264_limit(self):
+
+        self.options_dict['output_mode'] = 'h264'
+        h264_list \
+        = self.options_obj.compile_options(self.options_dict)['h264_list']
+
+        index = h264_list.index('-maxrate')
+        self.assertEqual(
+            h264_list[index:index + 4],
+            [ '-maxrate', '2M', '-bufsize', '6M' ],
+        )
+
+
+    def test_other_modes(self):
+
+        # The H.264 options are not compiled in other output modes
+        for output_mode in ['gif', 'merge', 'split', 'slice', 'thumb']:
+
+            self.options_dict['output_mode'] = output_mode
+            self.assertEqual(
+                self.options_obj.compile_options(self.options_dict),
+                {
+                    'extra_cmd_list': [],
+                    'h264_list': [],
+                },
+            )
+
+
+    def test_system_cmd(self):
+
+        # The limit is applied to the H.264 command, but not to others
+        app_obj = make_app()
+        self.options_dict['output_mode'] = 'h264'
+        cmd_list = self.options_obj.get_system_cmd(app_obj)[2]
+        self.assertIn('-bufsize', cmd_list)
+
+        self.options_dict['output_mode'] = 'gif'
+        cmd_list = self.options_obj.get_system_cmd(app_obj)[2]
+        self.assertNotIn('-bufsize', cmd_list)
+
+
+class TestGetSplitSystemCmd(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = make_app()
+        self.temp_dir = tempfile.mkdtemp()
+        self.clip_dir = os.path.join(self.temp_dir, 'clips')
+
+        # (A 'dummy' media.Video, as used in the Classic Mode tab, so that no
+        #   media data directory is required)
+        self.source_path = os.path.join(self.temp_dir, 'source.mp4')
+        with open(self.source_path, 'wb') as fh:
+            fh.write(b'\x00')
+
+        self.video_obj = types.SimpleNamespace(
+            dummy_flag=True,
+            dummy_path=self.source_path,
+            dl_flag=True,
+        )
+
+        self.options_obj = ffmpeg_tartube.FFmpegOptionsManager(1, 'test')
+        self.options_obj.options_dict['output_mode'] = 'split'
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def get_clip_path(self, clip_title):
+
+        return os.path.abspath(
+            os.path.join(self.clip_dir, clip_title + '.mp4'),
+        )
+
+
+    def test_single_command(self):
+
+        source_path, output_list, cmd_list \
+        = self.options_obj.get_split_system_cmd(
+            self.app_obj,
+            self.video_obj,
+            [ ['0:00', '1:30', 'First'], ['1:30', None, 'Second'] ],
+            self.clip_dir,
+        )
+
+        first_path = self.get_clip_path('First')
+        second_path = self.get_clip_path('Second')
+
+        self.assertEqual(source_path, self.source_path)
+        self.assertEqual(output_list, [first_path, second_path])
+        self.assertEqual(
+            cmd_list,
+            [
+                '/usr/bin/ffmpeg', '-i', self.source_path,
+                '-ss', '0:00', '-to', '1:30', first_path,
+                '-ss', '1:30', second_path,
+            ],
+        )
+
+
+    def test_matches_single_clip_commands(self):
+
+        clip_list = [ ['0', '10', 'First'], ['10', '20', 'Second'] ]
+
+        source_path, output_list, cmd_list \
+        = self.options_obj.get_split_system_cmd(
+            self.app_obj,
+            self.video_obj,
+            clip_list,
+            self.clip_dir,
+        )
+
+        # Each clip's options are the same as those in the command that
+        #   extracts the clip on its own
+        index = 3
+        for start_point, stop_point, clip_title in clip_list:
+
+            this_source_path, output_path, this_cmd_list \
+            = self.options_obj.get_system_cmd(
+                self.app_obj,
+                self.video_obj,
+                start_point,
+                stop_point,
+                clip_title,
+                self.clip_dir,
+            )
+
+            self.assertEqual(this_cmd_list[0:3], cmd_list[0:3])
+
+            clip_cmd_list = this_cmd_list[3:]
+            self.assertEqual(
+                cmd_list[index:index + len(clip_cmd_list)],
+                clip_cmd_list,
+            )
+
+            index += len(clip_cmd_list)
+
+        self.assertEqual(index, len(cmd_list))
+
+
+    def test_copy_flag(self):
+
+        source_path, output_list, cmd_list \
+        = self.options_obj.get_split_system_cmd(
+            self.app_obj,
+            self.video_obj,
+            [ ['0', '10', 'First'], ['10', None, 'Second'] ],
+            self.clip_dir,
+            True,
+        )
+
+        self.assertEqual(
+            cmd_list[3:],
+            [
+                '-ss', '0', '-to', '10', '-c', 'copy',
+                self.get_clip_path('First'),
+                '-ss', '10', '-c', 'copy',
+                self.get_clip_path('Second'),
+            ],
+        )
+
+
+    def test_extra_override(self):
+
+        # A command using only the options specified by 'extra_cmd_string'
+        #   can't be combined
+        self.options_obj.options_dict['extra_override_flag'] = True
+        self.options_obj.options_dict['extra_cmd_string'] = '-c copy'
+
+        self.assertEqual(
+            self.options_obj.get_split_system_cmd(
+                self.app_obj,
+                self.video_obj,
+                [ ['0', '10', 'First'], ['10', None, 'Second'] ],
+                self.clip_dir,
+            ),
+            (None, None, []),
+        )
+
+
+    def test_missing_source(self):
+
+        os.remove(self.source_path)
+
+        self.assertEqual(
+            self.options_obj.get_split_system_cmd(
+                self.app_obj,
+                self.video_obj,
+                [ ['0', '10', 'First'] ],
+                self.clip_dir,
+            ),
+            (None, None, []),
+        )
+
+
+class TestConvertWebpBatch(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = make_app()
+        self.app_obj.ffmpeg_fail_flag = False
+        self.app_obj.ffmpeg_convert_webp_flag = False
+        self.app_obj.ffmpeg_retain_webp_flag = False
+        self.app_obj.remove_file = os.remove
+
+        self.ffmpeg_manager_obj = self.app_obj.ffmpeg_manager_obj
+        self.ffmpeg_manager_obj.pixbuf_webp_flag = False
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.mtime = 1600000000
+
+        FakeConvertPopen.cmd_list_list = []
+        FakeConvertPopen.fail_set = set()
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def convert(self, thumbnail_list, pil_module=None, retain_flag=False):
+
+        # (The PIL module isn't necessarily installed)
+        with unittest.mock.patch.object(
+            ffmpeg_tartube,
+            'HAVE_PIL_FLAG',
+            pil_module is not None,
+        ), unittest.mock.patch.object(
+            ffmpeg_tartube,
+            'PIL',
+            pil_module,
+            create=True,
+        ), unittest.mock.patch.object(
+            ffmpeg_tartube.subprocess,
+            'Popen',
+            FakeConvertPopen,
+        ):
+            return self.ffmpeg_manager_obj.convert_webp_batch(
+                thumbnail_list,
+                retain_flag,
+            )
+
+
+    def assert_converted(self, webp_path, retain_flag=False):
+
+        jpg_path = os.path.splitext(webp_path)[0] + '.jpg'
+
+        self.assertTrue(os.path.isfile(jpg_path))
+        self.assertEqual(os.stat(jpg_path).st_mtime, self.mtime)
+        self.assertEqual(os.path.isfile(webp_path), retain_flag)
+
+
+    def test_pillow(self):
+
+        def save(path, file_format, quality):
+            write_jpg(path)
+
+        image = unittest.mock.MagicMock()
+        image.__enter__.return_value.convert.return_value.save.side_effect \
+        = save
+
+        pil_module = unittest.mock.MagicMock()
+        pil_module.Image.open.return_value = image
+
+        webp_path = make_webp(self.temp_dir, 'first', self.mtime)
+
+        self.assertEqual(self.convert([ webp_path ], pil_module), [ True ])
+        self.assert_converted(webp_path)
+        self.assertEqual(FakeConvertPopen.cmd_list_list, [])
+
+
+    def test_gdkpixbuf(self):
+
+        def savev(path, file_format, key_list, value_list):
+            write_jpg(path)
+
+        self.ffmpeg_manager_obj.pixbuf_webp_flag = True
+        webp_list = [
+            make_webp(self.temp_dir, 'first', self.mtime),
+            make_webp(self.temp_dir, 'second', self.mtime),
+        ]
+
+        with unittest.mock.patch.object(ffmpeg_tartube, 'GdkPixbuf') \
+        as gdkpixbuf:
+
+            gdkpixbuf.Pixbuf.new_from_file.return_value.savev.side_effect \
+            = savev
+
+            self.assertEqual(
+                self.convert(webp_list, retain_flag=True),
+                [ True, True ],
+            )
+
+        for webp_path in webp_list:
+            self.assert_converted(webp_path, True)
+
+        self.assertEqual(FakeConvertPopen.cmd_list_list, [])
+
+
+    def test_multi_output_command(self):
+
+        webp_list = [
+            make_webp(self.temp_dir, 'first', self.mtime),
+            make_webp(self.temp_dir, '50%', self.mtime),
+            make_webp(self.temp_dir, 'third', self.mtime),
+        ]
+
+        self.assertEqual(self.convert(webp_list), [ True, True, True ])
+
+        # (% characters are replaced while FFmpeg is running)
+        escaped_list = [
+            os.path.splitext(webp_path.replace('%', '#'))[0] \
+            for webp_path in webp_list
+        ]
+
+        self.assertEqual(
+            FakeConvertPopen.cmd_list_list,
+            [
+                [
+                    '/usr/bin/ffmpeg', '-y', '-loglevel', 'repeat+info',
+                    '-i', 'file:' + escaped_list[0] + '.webp',
+                    '-i', 'file:' + escaped_list[1] + '.webp',
+                    '-i', 'file:' + escaped_list[2] + '.webp',
+                    '-map', '0', '-bsf:v', 'mjpeg2jpeg',
+                    'file:' + escaped_list[0] + '.jpg',
+                    '-map', '1', '-bsf:v', 'mjpeg2jpeg',
+                    'file:' + escaped_list[1] + '.jpg',
+                    '-map', '2', '-bsf:v', 'mjpeg2jpeg',
+                    'file:' + escaped_list[2] + '.jpg',
+                ],
+            ],
+        )
+
+        for webp_path in webp_list:
+            self.assert_converted(webp_path)
+
+
+    def test_per_file_fallback(self):
+
+        # One broken thumbnail causes the single FFmpeg command to fail; then
+        #   each thumbnail is converted separately
+        webp_list = [
+            make_webp(self.temp_dir, 'first', self.mtime),
+            make_webp(self.temp_dir, 'broken', self.mtime),
+            make_webp(self.temp_dir, 'third', self.mtime),
+        ]
+
+        FakeConvertPopen.fail_set.add(webp_list[1])
+
+        self.assertEqual(self.convert(webp_list), [ True, False, True ])
+        self.assertEqual(
+            [
+                cmd_list.count('-i') \
+                for cmd_list in FakeConvertPopen.cmd_list_list
+            ],
+            [ 3, 1, 1, 1 ],
+        )
+
+        self.assert_converted(webp_list[0])
+        self.assert_converted(webp_list[2])
+
+        # (The broken thumbnail is restored, and no partial output is left
+        #   behind)
+        self.assertTrue(os.path.isfile(webp_list[1]))
+        self.assertFalse(
+            os.path.exists(os.path.join(self.temp_dir, 'broken.jpg')),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
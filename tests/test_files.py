@@ -0,0 +1,798 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for files.py."""
+
+
+# Import other modules
+import io
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import files
+
+
+# Globals
+# Functions called by MediaThing.__setattr__()
+notify_func_list = []
+
+
+# Functions
+
+
+def make_file(dir_path, file_name, data=b''):
+
+    """Creates a file, and returns its full path."""
+
+    full_path = os.path.join(dir_path, file_name)
+    with open(full_path, 'wb') as fh:
+        fh.write(data)
+
+    return full_path
+
+
+def set_mtime(path, mtime):
+
+    """Sets the modification time of a file or directory (in seconds since
+    the epoch).
+    """
+
+    os.utime(path, (mtime, mtime))
+
+
+# Classes
+
+
+class Thing(object):
+
+    """Stands in for an options object, in tests of files.DatabaseSnapshot.
+    """
+
+    def __init__(self, name):
+
+        self.name = name
+        self.child_list = []
+        self.tag_dict = {}
+        self.parent_obj = None
+
+
+class MediaThing(Thing):
+
+    """Stands in for a media data object, in tests of files.DatabaseSnapshot.
+    Like media.GenericMedia, calls each function in notify_func_list just
+    before an IV is set.
+    """
+
+    def __setattr__(self, name, value):
+
+        for func in notify_func_list:
+            func(self, name)
+
+        object.__setattr__(self, name, value)
+
+
+class FakePixbuf(object):
+
+    """Stands in for a GdkPixbuf.Pixbuf, in tests of the thumbnail caches."""
+
+    def __init__(self, width, height):
+
+        self.width = width
+        self.height = height
+
+    def get_height(self):
+
+        return self.height
+
+    def get_rowstride(self):
+
+        return self.width * 4
+
+    def savev(self, path, file_type, key_list, value_list):
+
+        with open(path, 'wb') as fh:
+            fh.write(b'png')
+
+
+class TestFileManagerDirListing(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.file_manager_obj = files.FileManager()
+        self.cache_obj = self.file_manager_obj.dir_listing_obj
+        self.temp_dir = tempfile.mkdtemp()
+        # (Listings of recently-modified directories are always listed again
+        #   when they are checked, so make the directory look older)
+        self.old_time = time.time() - 3600
+
+        make_file(self.temp_dir, 'video.mp4')
+        make_file(self.temp_dir, 'video.jpg')
+        os.mkdir(os.path.join(self.temp_dir, 'subdir'))
+        set_mtime(self.temp_dir, self.old_time)
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def test_listing_contains_files_only(self):
+
+        self.assertEqual(
+            self.file_manager_obj.get_dir_listing(self.temp_dir),
+            {'video.mp4', 'video.jpg'},
+        )
+
+
+    def test_missing_directory(self):
+
+        self.assertEqual(
+            self.file_manager_obj.get_dir_listing(
+                os.path.join(self.temp_dir, 'missing'),
+            ),
+            set(),
+        )
+
+
+    def test_listing_is_cached(self):
+
+        self.file_manager_obj.get_dir_listing(self.temp_dir)
+
+        # A new file, but the directory's modification time is unchanged, so
+        #   the cached listing is still used
+        self.cache_obj.check_interval = 0
+        make_file(self.temp_dir, 'video.webp')
+        set_mtime(self.temp_dir, self.old_time)
+
+        self.assertEqual(
+            self.file_manager_obj.get_dir_listing(self.temp_dir),
+            {'video.mp4', 'video.jpg'},
+        )
+
+
+    def test_no_stat_during_check_interval(self):
+
+        self.file_manager_obj.get_dir_listing(self.temp_dir)
+
+        with unittest.mock.patch.object(os, 'stat') as mock_obj:
+            self.file_manager_obj.check_path(
+                os.path.join(self.temp_dir, 'video.jpg'),
+            )
+
+            self.assertEqual(mock_obj.call_count, 0)
+
+
+    def test_mtime_invalidates_listing(self):
+
+        self.file_manager_obj.get_dir_listing(self.temp_dir)
+
+        self.cache_obj.check_interval = 0
+        make_file(self.temp_dir, 'video.webp')
+        set_mtime(self.temp_dir, self.old_time + 60)
+
+        self.assertEqual(
+            self.file_manager_obj.get_dir_listing(self.temp_dir),
+            {'video.mp4', 'video.jpg', 'video.webp'},
+        )
+
+
+    def test_recent_directory_listed_again(self):
+
+        make_file(self.temp_dir, 'video.webp')
+        self.file_manager_obj.get_dir_listing(self.temp_dir)
+
+        # The listing of a recently-modified directory is cached...
+        self.assertIn(self.temp_dir, self.cache_obj.listing_dict)
+
+        # ...but when it is checked, it is listed again, even if the
+        #   directory's modification time hasn't changed
+        self.cache_obj.check_interval = 0
+        mtime = os.stat(self.temp_dir).st_mtime
+        make_file(self.temp_dir, 'video.png')
+        set_mtime(self.temp_dir, mtime)
+
+        self.assertIn(
+            'video.png',
+            self.file_manager_obj.get_dir_listing(self.temp_dir),
+        )
+
+
+    def test_reset_dir_listing(self):
+
+        self.file_manager_obj.get_dir_listing(self.temp_dir)
+
+        make_file(self.temp_dir, 'video.webp')
+        set_mtime(self.temp_dir, self.old_time)
+        self.file_manager_obj.reset_dir_listing(
+            os.path.join(self.temp_dir, 'video.webp'),
+        )
+
+        self.assertIn(
+            'video.webp',
+            self.file_manager_obj.get_dir_listing(self.temp_dir),
+        )
+
+
+    def test_check_path(self):
+
+        self.assertTrue(
+            self.file_manager_obj.check_path(
+                os.path.join(self.temp_dir, 'video.jpg'),
+            ),
+        )
+
+        self.assertFalse(
+            self.file_manager_obj.check_path(
+                os.path.join(self.temp_dir, 'video.png'),
+            ),
+        )
+
+        # (Directories are not files)
+        self.assertFalse(
+            self.file_manager_obj.check_path(
+                os.path.join(self.temp_dir, 'subdir'),
+            ),
+        )
+
+
+    def test_check_path_case(self):
+
+        # A name that differs only in case is found if, and only if, the
+        #   filesystem says so
+        path = os.path.join(self.temp_dir, 'VIDEO.JPG')
+        self.assertEqual(
+            self.file_manager_obj.check_path(path),
+            os.path.isfile(path),
+        )
+
+
+    def test_find_path_by_prefix(self):
+
+        make_file(self.temp_dir, 'video.jpg.1')
+        set_mtime(self.temp_dir, self.old_time + 60)
+
+        self.assertEqual(
+            self.file_manager_obj.find_path_by_prefix(
+                os.path.join(self.temp_dir, 'video.jpg'),
+            ),
+            [
+                os.path.join(self.temp_dir, 'video.jpg'),
+                os.path.join(self.temp_dir, 'video.jpg.1'),
+            ],
+        )
+
+
+class TestFileManagerThumbCache(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.thumb_path = make_file(self.temp_dir, 'video.jpg', b'jpg')
+        self.mtime = os.stat(self.thumb_path).st_mtime_ns
+
+        self.file_manager_obj = files.FileManager()
+        self.file_manager_obj.set_thumb_cache_dir(
+            os.path.join(self.temp_dir, 'cache'),
+        )
+
+        # (Thumbnails are 'loaded' by the fake GdkPixbuf module, and the
+        #   worker threads' results are passed back at once, rather than via
+        #   the Gtk main loop)
+        self.gdkpixbuf = unittest.mock.MagicMock()
+        self.gdkpixbuf.Pixbuf.new_from_file_at_scale.side_effect \
+        = lambda path, width, height, ratio_flag: FakePixbuf(width, height)
+        self.gdkpixbuf.Pixbuf.new_from_file.side_effect \
+        = lambda path: FakePixbuf(0, 0)
+
+        gobject = unittest.mock.MagicMock()
+        gobject.timeout_add.side_effect \
+        = lambda delay, func, *args: func(*args)
+
+        patch_list = [
+            unittest.mock.patch.object(files, 'GdkPixbuf', self.gdkpixbuf),
+            unittest.mock.patch.object(files, 'GObject', gobject),
+            unittest.mock.patch.object(
+                files.ttutils,
+                'find_thumbnail',
+                lambda app_obj, video_obj, webp_flag: video_obj.thumb_path,
+            ),
+        ]
+
+        for patch_obj in patch_list:
+            patch_obj.start()
+            self.addCleanup(patch_obj.stop)
+
+
+    def tearDown(self):
+
+        for executor in (
+            self.file_manager_obj.pixbuf_executor,
+            self.file_manager_obj.thumb_cache_executor,
+        ):
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def wait(self):
+
+        """Waits for the jobs already submitted to the worker threads (the
+        pools are created again, when next required).
+        """
+
+        for name in ('pixbuf_executor', 'thumb_cache_executor'):
+
+            executor = getattr(self.file_manager_obj, name)
+            if executor is not None:
+                executor.shutdown(wait=True)
+                setattr(self.file_manager_obj, name, None)
+
+
+    def get_cache_path(self, width, height):
+
+        return self.file_manager_obj.get_thumb_cache_path(
+            self.thumb_path,
+            width,
+            height,
+        )
+
+
+    def test_load_async(self):
+
+        result_list = []
+        callback = lambda pixbuf, *args: result_list.append((pixbuf, args))
+
+        self.assertIsNone(
+            self.file_manager_obj.load_to_pixbuf_async(
+                self.thumb_path,
+                40,
+                30,
+                callback,
+                'arg',
+            ),
+        )
+
+        self.wait()
+        self.assertEqual(len(result_list), 1)
+        pixbuf, args = result_list[0]
+        self.assertEqual((pixbuf.width, pixbuf.height), (40, 30))
+        self.assertEqual(args, ('arg',))
+
+        # The pixbuf is now in the memory cache, and a copy has been saved to
+        #   the persistent cache
+        self.assertIs(
+            self.file_manager_obj.load_to_pixbuf_async(
+                self.thumb_path,
+                40,
+                30,
+                callback,
+            ),
+            pixbuf,
+        )
+
+        self.assertEqual(
+            os.stat(self.get_cache_path(40, 30)).st_mtime_ns,
+            self.mtime,
+        )
+
+
+    def test_load_async_pending(self):
+
+        # Both requests are made before the thumbnail has been loaded, so it
+        #   is loaded only once
+        event = threading.Event()
+        self.gdkpixbuf.Pixbuf.new_from_file_at_scale.side_effect \
+        = lambda path, width, height, ratio_flag: \
+        event.wait() and FakePixbuf(width, height)
+
+        result_list = []
+        for arg in ('first', 'second'):
+            self.file_manager_obj.load_to_pixbuf_async(
+                self.thumb_path,
+                40,
+                30,
+                lambda pixbuf, arg: result_list.append(arg),
+                arg,
+            )
+
+        event.set()
+        self.wait()
+
+        self.assertEqual(result_list, ['first', 'second'])
+        self.assertEqual(
+            self.gdkpixbuf.Pixbuf.new_from_file_at_scale.call_count,
+            1,
+        )
+
+
+    def test_load_async_persistent_cache(self):
+
+        # An up-to-date scaled copy is loaded instead of the original
+        cache_path = self.get_cache_path(40, 30)
+        os.makedirs(os.path.dirname(cache_path))
+        make_file(os.path.dirname(cache_path), os.path.basename(cache_path))
+        os.utime(cache_path, ns=(self.mtime, self.mtime))
+
+        self.file_manager_obj.load_to_pixbuf_async(
+            self.thumb_path,
+            40,
+            30,
+            lambda pixbuf: None,
+        )
+
+        self.wait()
+        self.gdkpixbuf.Pixbuf.new_from_file.assert_called_once_with(
+            cache_path,
+        )
+        self.assertEqual(
+            self.gdkpixbuf.Pixbuf.new_from_file_at_scale.call_count,
+            0,
+        )
+
+
+    def test_memory_cache_limit(self):
+
+        self.file_manager_obj.pixbuf_cache_max_size = 2000
+        for width in (10, 11, 12):
+            self.file_manager_obj.load_to_pixbuf_finished(
+                ('path', 0, width, 20),
+                FakePixbuf(width, 20),
+            )
+
+        # (The least recently-used pixbuf is discarded first)
+        self.assertEqual(
+            [key[2] for key in self.file_manager_obj.pixbuf_cache_dict],
+            [11, 12],
+        )
+
+        self.assertEqual(self.file_manager_obj.pixbuf_cache_size, 880 + 960)
+
+
+    def test_fill_thumb_cache(self):
+
+        video_list = [
+            types.SimpleNamespace(dbid=1, thumb_path=self.thumb_path),
+            types.SimpleNamespace(dbid=2, thumb_path=None),
+        ]
+
+        self.file_manager_obj.fill_thumb_cache(None, video_list, [[40, 30]])
+        self.wait()
+
+        # (Scaled in the same way as by self.load_to_pixbuf_worker() )
+        self.gdkpixbuf.Pixbuf.new_from_file_at_scale.assert_called_once_with(
+            self.thumb_path,
+            40,
+            30,
+            False,
+        )
+
+        self.assertEqual(self.gdkpixbuf.Pixbuf.new_from_file.call_count, 0)
+        self.assertEqual(
+            os.stat(self.get_cache_path(40, 30)).st_mtime_ns,
+            self.mtime,
+        )
+
+
+    def test_fill_thumb_cache_not_repeated(self):
+
+        video_list = [
+            types.SimpleNamespace(dbid=1, thumb_path=self.thumb_path),
+            types.SimpleNamespace(dbid=2, thumb_path=None),
+        ]
+
+        self.file_manager_obj.fill_thumb_cache(None, video_list, [[40, 30]])
+        job_id = self.file_manager_obj.thumb_cache_job_id
+
+        # The same videos (in any order) and sizes: no new job
+        self.file_manager_obj.fill_thumb_cache(
+            None,
+            list(reversed(video_list)),
+            [[40, 30]],
+        )
+
+        self.assertEqual(self.file_manager_obj.thumb_cache_job_id, job_id)
+
+        # A different size: a new job
+        self.file_manager_obj.fill_thumb_cache(None, video_list, [[80, 60]])
+        self.assertEqual(self.file_manager_obj.thumb_cache_job_id, job_id + 1)
+
+        # Changing the cache directory abandons the job, so it can be started
+        #   again
+        self.file_manager_obj.set_thumb_cache_dir(
+            os.path.join(self.temp_dir, 'cache2'),
+        )
+
+        self.file_manager_obj.fill_thumb_cache(None, video_list, [[80, 60]])
+        self.assertEqual(self.file_manager_obj.thumb_cache_job_id, job_id + 3)
+
+
+class TestDatabaseSnapshot(unittest.TestCase):
+
+
+    def tearDown(self):
+
+        notify_func_list.clear()
+
+
+    def make_db(self):
+
+        folder_obj = MediaThing('folder')
+        video_obj = MediaThing('video')
+        video_obj.parent_obj = folder_obj
+        video_obj.tag_dict['size'] = 100
+        folder_obj.child_list.append(video_obj)
+
+        options_obj = Thing('options')
+        options_obj.tag_dict['match_list'] = ['foo']
+        video_obj.tag_dict['options'] = options_obj
+
+        save_dict = {
+            'script_name': 'tartube',
+            'media_reg_dict': {1: folder_obj, 2: video_obj},
+            'container_top_level_list': [1],
+            'profile_dict': {'profile': [1, 2]},
+            'options_obj': options_obj,
+        }
+
+        return save_dict, [folder_obj, video_obj, options_obj]
+
+
+    def make_snapshot(self, save_dict, obj_list):
+
+        snapshot_obj = files.DatabaseSnapshot(
+            save_dict,
+            [obj for obj in obj_list if not isinstance(obj, MediaThing)],
+            [MediaThing],
+        )
+
+        notify_func_list.append(snapshot_obj.notify_modify)
+        return snapshot_obj
+
+
+    def write(self, snapshot_obj):
+
+        fh = io.BytesIO()
+        snapshot_obj.write(fh)
+        return fh.getvalue()
+
+
+    def test_same_as_pickle(self):
+
+        save_dict, obj_list = self.make_db()
+        snapshot_obj = self.make_snapshot(save_dict, obj_list)
+
+        self.assertEqual(
+            self.write(snapshot_obj),
+            pickle.dumps(save_dict, pickle.DEFAULT_PROTOCOL),
+        )
+
+
+    def test_media_not_copied(self):
+
+        save_dict, obj_list = self.make_db()
+        snapshot_obj = self.make_snapshot(save_dict, obj_list)
+
+        # Only the options object is copied when the snapshot is taken
+        self.assertEqual(len(snapshot_obj.state_dict), 1)
+
+        # Modifying a media data object copies it, once
+        folder_obj = obj_list[0]
+        folder_obj.name = 'renamed'
+        folder_obj.name = 'renamed again'
+        self.assertEqual(len(snapshot_obj.state_dict), 2)
+
+
+    def test_later_changes_not_saved(self):
+
+        save_dict, obj_list = self.make_db()
+        expect_data = pickle.dumps(save_dict, pickle.DEFAULT_PROTOCOL)
+
+        snapshot_obj = self.make_snapshot(save_dict, obj_list)
+
+        # Modify the database after the snapshot has been taken
+        folder_obj, video_obj, options_obj = obj_list
+        folder_obj.name = 'renamed'
+        folder_obj.child_list = folder_obj.child_list + [MediaThing('new')]
+        video_obj.tag_dict = {'size': 200}
+        options_obj.tag_dict['match_list'].append('bar')
+        save_dict['media_reg_dict'][3] = MediaThing('another video')
+        save_dict['container_top_level_list'].append(3)
+        save_dict['profile_dict']['profile'].append(3)
+
+        self.assertEqual(self.write(snapshot_obj), expect_data)
+
+
+    def test_changes_after_write(self):
+
+        save_dict, obj_list = self.make_db()
+        snapshot_obj = self.make_snapshot(save_dict, obj_list)
+
+        self.write(snapshot_obj)
+        self.assertTrue(snapshot_obj.finish_flag)
+
+        # Modifications after the snapshot has been written are ignored
+        obj_list[0].name = 'renamed'
+        self.assertEqual(snapshot_obj.state_dict, {})
+
+
+    def test_shared_objects_load(self):
+
+        save_dict, obj_list = self.make_db()
+        snapshot_obj = self.make_snapshot(save_dict, obj_list)
+
+        load_dict = pickle.loads(self.write(snapshot_obj))
+        folder_obj = load_dict['media_reg_dict'][1]
+        video_obj = load_dict['media_reg_dict'][2]
+
+        self.assertIs(video_obj.parent_obj, folder_obj)
+        self.assertIs(folder_obj.child_list[0], video_obj)
+        self.assertIs(video_obj.tag_dict['options'], load_dict['options_obj'])
+        self.assertEqual(video_obj.tag_dict['size'], 100)
+
+
+class TestHashCache(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.hash_cache_obj = files.HashCache(
+            os.path.join(self.temp_dir, '.hash_cache'),
+        )
+
+        # (Use small blocks, so that small test files get a partial hash)
+        self.hash_cache_obj.block_size = 16
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def get_hash(self, full_path, full_flag=False, hash_cache_obj=None):
+
+        if hash_cache_obj is None:
+            hash_cache_obj = self.hash_cache_obj
+
+        stat = os.stat(full_path)
+        return hash_cache_obj.get_hash(
+            full_path,
+            stat.st_size,
+            stat.st_mtime,
+            full_flag,
+        )
+
+
+    def test_identical_files(self):
+
+        path = make_file(self.temp_dir, 'a.mp4', b'x' * 100)
+        path2 = make_file(self.temp_dir, 'b.mp4', b'x' * 100)
+
+        self.assertEqual(self.get_hash(path), self.get_hash(path2))
+        self.assertEqual(
+            self.get_hash(path, True),
+            self.get_hash(path2, True),
+        )
+
+
+    def test_partial_hash_ignores_middle(self):
+
+        # Same size, beginning and end; different in the middle
+        path = make_file(self.temp_dir, 'a.mp4', b'a' * 40 + b'1' + b'z' * 40)
+        path2 = make_file(self.temp_dir, 'b.mp4', b'a' * 40 + b'2' + b'z' * 40)
+
+        self.assertEqual(self.get_hash(path), self.get_hash(path2))
+        self.assertNotEqual(
+            self.get_hash(path, True),
+            self.get_hash(path2, True),
+        )
+
+
+    def test_different_sizes(self):
+
+        path = make_file(self.temp_dir, 'a.mp4', b'x' * 100)
+        path2 = make_file(self.temp_dir, 'b.mp4', b'x' * 101)
+
+        self.assertNotEqual(self.get_hash(path), self.get_hash(path2))
+
+
+    def test_small_file(self):
+
+        # For small files, the partial hash is the hash of the whole file
+        path = make_file(self.temp_dir, 'a.mp4', b'small')
+        self.assertEqual(self.get_hash(path), self.get_hash(path, True))
+
+
+    def test_hash_is_cached(self):
+
+        path = make_file(self.temp_dir, 'a.mp4', b'x' * 100)
+        hash_str = self.get_hash(path, True)
+
+        # Change the contents, but not the size or modification time
+        stat = os.stat(path)
+        make_file(self.temp_dir, 'a.mp4', b'y' * 100)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(self.get_hash(path, True), hash_str)
+
+
+    def test_modified_file(self):
+
+        path = make_file(self.temp_dir, 'a.mp4', b'x' * 100)
+        hash_str = self.get_hash(path, True)
+
+        make_file(self.temp_dir, 'a.mp4', b'y' * 100)
+        set_mtime(path, os.stat(path).st_mtime + 60)
+
+        self.assertNotEqual(self.get_hash(path, True), hash_str)
+
+
+    def test_missing_file(self):
+
+        self.assertIsNone(
+            self.hash_cache_obj.get_hash(
+                os.path.join(self.temp_dir, 'missing.mp4'),
+                100,
+                0,
+            ),
+        )
+
+
+    def test_save_load_prune(self):
+
+        path = make_file(self.temp_dir, 'a.mp4', b'x' * 100)
+        path2 = make_file(self.temp_dir, 'b.mp4', b'y' * 100)
+        hash_str = self.get_hash(path, True)
+        self.get_hash(path2, True)
+
+        self.hash_cache_obj.prune(set([path]))
+        self.hash_cache_obj.save()
+        self.assertFalse(self.hash_cache_obj.modified_flag)
+
+        new_obj = files.HashCache(self.hash_cache_obj.path)
+        new_obj.block_size = 16
+        new_obj.load()
+
+        self.assertEqual(list(new_obj.cache_dict.keys()), [path])
+        self.assertEqual(
+            self.get_hash(path, True, new_obj),
+            hash_str,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
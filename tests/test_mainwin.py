@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for mainwin.py."""
+
+
+# Import other modules
+import os
+import sys
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import mainwin
+import media
+
+
+# Classes
+
+
+class TestVideoCatalogueGetVideoSignature(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = types.SimpleNamespace(
+            container_unavailable_dict={},
+            media_reg_auto_alarm_dict={},
+            media_reg_auto_dl_start_dict={},
+            media_reg_auto_dl_stop_dict={},
+            media_reg_auto_notify_dict={},
+            media_reg_auto_open_dict={},
+            catalogue_mode_type='complex',
+            catalogue_sort_mode='default',
+            catalogue_show_nickname_flag=True,
+            show_pretty_dates_flag=True,
+            show_tooltips_flag=True,
+        )
+
+        self.main_win_obj = types.SimpleNamespace(app_obj=self.app_obj)
+
+        # (Only the IVs used by the function are set)
+        video_obj = media.Video.__new__(media.Video)
+        for iv in [
+            'name', 'nickname', 'source', 'descrip', 'short', 'duration',
+            'file_size', 'upload_time', 'receive_time', 'live_msg',
+            'options_obj', 'parent_obj', 'orig_parent_obj',
+        ]:
+            setattr(video_obj, iv, None)
+
+        for iv in [
+            'dl_flag', 'dl_sim_flag', 'archive_flag', 'block_flag',
+            'bookmark_flag', 'fav_flag', 'missing_flag', 'new_flag',
+            'waiting_flag', 'split_flag', 'live_debut_flag', 'was_live_flag',
+        ]:
+            setattr(video_obj, iv, False)
+
+        for iv in [
+            'comment_list', 'error_list', 'warning_list', 'slice_list',
+            'stamp_list', 'subs_list',
+        ]:
+            setattr(video_obj, iv, [])
+
+        video_obj.dbid = 1
+        video_obj.file_name = 'video'
+        video_obj.live_mode = 0
+        self.video_obj = video_obj
+
+        # The path to the video's thumbnail, returned by the patched
+        #   ttutils.find_thumbnail()
+        self.thumb_path = None
+        patch_obj = unittest.mock.patch.object(
+            mainwin.ttutils,
+            'find_thumbnail',
+            lambda app_obj, video_obj, temp_dir_flag=False: self.thumb_path,
+        )
+
+        patch_obj.start()
+        self.addCleanup(patch_obj.stop)
+
+
+    def get_signature(self):
+
+        return mainwin.MainWin.video_catalogue_get_video_signature(
+            self.main_win_obj,
+            self.video_obj,
+        )
+
+
+    def test_unchanged(self):
+
+        self.assertEqual(self.get_signature(), self.get_signature())
+
+
+    def test_thumbnail_found(self):
+
+        signature = self.get_signature()
+
+        # The thumbnail is downloaded, but the video itself has not changed
+        self.thumb_path = '/path/to/video.jpg'
+        self.assertNotEqual(self.get_signature(), signature)
+
+        signature = self.get_signature()
+        self.thumb_path = '/path/to/video.webp'
+        self.assertNotEqual(self.get_signature(), signature)
+
+
+    def test_thumbnail_not_shown(self):
+
+        # (In simple mode, thumbnails are not visible)
+        self.app_obj.catalogue_mode_type = 'simple'
+        signature = self.get_signature()
+
+        self.thumb_path = '/path/to/video.jpg'
+        self.assertEqual(self.get_signature(), signature)
+
+
+if __name__ == '__main__':
+    unittest.main()
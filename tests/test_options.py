@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Tests for options.py."""
+
+
+# Import other modules
+import os
+import sys
+import types
+import unittest
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import media
+import options
+import ttutils
+
+
+# Functions
+
+
+def make_app():
+
+    """Returns an object with the mainapp.TartubeApp IVs used by
+    options.OptionsParser.
+    """
+
+    return types.SimpleNamespace(
+        alt_bandwidth=1000,
+        alt_bandwidth_apply_flag=False,
+        alt_num_worker=2,
+        bandwidth_apply_flag=True,
+        bandwidth_default=500,
+        block_livestreams_flag=False,
+        cookie_file_name='cookies.txt',
+        data_dir=os.path.abspath(os.path.join('data', 'tartube')),
+        download_manager_obj=None,
+        get_fixed_folder=lambda name: None,
+        get_proxy=lambda: None,
+        num_worker_default=2,
+        temp_output_override_dict={},
+        video_res_apply_flag=False,
+        video_res_default='720',
+        ytdl_fork='yt-dlp',
+        ytdlp_exclusive_options_dict={},
+        ytdlp_filter_options_flag=True,
+    )
+
+
+def make_container(dbid, dir_path):
+
+    """Returns an object with the media.Channel IVs used by
+    options.OptionsParser.
+    """
+
+    return types.SimpleNamespace(
+        dbid=dbid,
+        get_actual_dir=lambda app_obj: dir_path,
+    )
+
+
+def make_video(dbid, dir_path, dummy_format=None):
+
+    """Returns a media.Video with the IVs used by options.OptionsParser. If
+    'dummy_format' is specified, the video is a 'dummy' video, as used in the
+    Classic Mode tab.
+    """
+
+    video_obj = media.Video.__new__(media.Video)
+    video_obj.dbid = dbid
+    video_obj.parent_obj = make_container(dbid + 1000, dir_path)
+    video_obj.dummy_dir = dir_path
+    video_obj.dummy_format = dummy_format
+    video_obj.dummy_sblock_flag = False
+
+    return video_obj
+
+
+def parse_uncached(parser_obj, media_data_obj, options_manager_obj,
+operation_type='real', scheduled_obj=None):
+
+    """Returns the list of download options that options.OptionsParser.parse()
+    should return, parsing every option in a single pass (without using the
+    compiled templates).
+    """
+
+    options_list = ['--newline']
+
+    copy_dict = options_manager_obj.options_dict.copy()
+    dir_path = parser_obj.build_dir(media_data_obj, copy_dict, operation_type)
+
+    parser_obj.build_video_format(media_data_obj, copy_dict, operation_type)
+    parser_obj.build_file_sizes(copy_dict)
+    parser_obj.build_limit_rate(copy_dict, scheduled_obj)
+    parser_obj.build_proxy(copy_dict)
+
+    for option_holder_obj in parser_obj.option_holder_list:
+        parser_obj.parse_option_holder(
+            option_holder_obj,
+            copy_dict,
+            dir_path,
+            options_list,
+        )
+
+    for item in copy_dict['match_title_list']:
+        options_list.extend(['--match-title', item])
+
+    for item in copy_dict['reject_title_list']:
+        options_list.extend(['--reject-title', item])
+
+    if copy_dict['write_subs'] \
+    and not copy_dict['write_auto_subs'] \
+    and not copy_dict['write_all_subs'] \
+    and copy_dict['subs_lang_list']:
+        options_list.extend(
+            ['--sub-lang', ','.join(copy_dict['subs_lang_list'])],
+        )
+
+    for item in copy_dict['extractor_args_list']:
+        options_list.extend(['--extractor-args', item])
+
+    if operation_type.startswith('classic_') \
+    and media_data_obj.dummy_sblock_flag:
+        options_list.extend(['--sponsorblock-remove', 'default'])
+
+    options_list = parser_obj.build_paths(
+        media_data_obj,
+        dir_path,
+        copy_dict,
+        options_list,
+    )
+
+    options_list.extend(ttutils.parse_options(copy_dict['extra_cmd_string']))
+
+    if (
+        copy_dict['check_fetch_comments'] \
+        and operation_type in ['sim', 'custom_sim', 'classic_sim']
+    ) or (
+        copy_dict['dl_fetch_comments'] \
+        and operation_type in [
+            'real', 'custom_real', 'classic_real', 'classic_custom',
+        ]
+    ):
+        options_list.append('--write-comments')
+
+    return options_list
+
+
+# Classes
+
+
+class TestOptionsParserTemplate(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = make_app()
+        self.parser_obj = options.OptionsParser(self.app_obj)
+
+        # Set some options that are compiled into the template, and some that
+        #   are parsed separately for each media data object
+        self.options_obj = options.OptionsManager(1, 'test')
+        options_dict = self.options_obj.options_dict
+        options_dict['ignore_errors'] = True
+        options_dict['extract_audio'] = True
+        options_dict['audio_format'] = 'mp3'
+        options_dict['audio_quality'] = '2'
+        options_dict['write_subs'] = True
+        options_dict['subs_lang_list'] = [ 'en', 'fr' ]
+        options_dict['match_title_list'] = [ 'foo' ]
+        options_dict['extra_cmd_string'] = '--foo "bar baz"'
+        options_dict['dl_fetch_comments'] = True
+        options_dict['proxy'] = 'socks5://127.0.0.1:1080'
+        options_dict['trim_filenames'] = 40
+
+        self.short_dir = os.path.abspath('short')
+        self.long_dir = os.path.abspath(os.path.join('long', 'x' * 40))
+
+
+    def check_parse(self, media_data_obj, operation_type):
+
+        # (Parse twice, so that the compiled template is used the second time)
+        for i in range(2):
+
+            self.assertEqual(
+                self.parser_obj.parse(
+                    media_data_obj,
+                    self.options_obj,
+                    operation_type,
+                ),
+                parse_uncached(
+                    self.parser_obj,
+                    media_data_obj,
+                    self.options_obj,
+                    operation_type,
+                ),
+            )
+
+
+    def test_video(self):
+
+        self.check_parse(make_video(1, self.short_dir), 'real')
+        self.check_parse(make_video(2, self.long_dir), 'real')
+        # (Both videos use the same template)
+        self.assertEqual(len(self.parser_obj.template_dict), 1)
+
+
+    def test_container(self):
+
+        self.check_parse(make_container(1, self.short_dir), 'sim')
+        self.check_parse(make_container(2, self.long_dir), 'sim')
+        self.assertEqual(len(self.parser_obj.template_dict), 1)
+
+
+    def test_video_and_container(self):
+
+        # Videos and containers use different templates
+        self.check_parse(make_video(1, self.short_dir), 'real')
+        self.check_parse(make_container(2, self.short_dir), 'real')
+        self.assertEqual(len(self.parser_obj.template_dict), 2)
+
+
+    def test_classic_dummy_format(self):
+
+        for dummy_format in [
+            None, 'mp4', '720p', 'mp4_720p', 'convert_mp4', 'convert_mp4_720p',
+        ]:
+            self.check_parse(
+                make_video(1, self.short_dir, dummy_format),
+                'classic_real',
+            )
+
+        # Each format uses its own template
+        self.assertEqual(len(self.parser_obj.template_dict), 6)
+
+
+    def test_classic_sponsorblock(self):
+
+        video_obj = make_video(1, self.short_dir, 'mp4')
+        video_obj.dummy_sblock_flag = True
+
+        self.check_parse(video_obj, 'classic_real')
+
+
+    def test_options_changed(self):
+
+        video_obj = make_video(1, self.short_dir)
+        self.check_parse(video_obj, 'real')
+
+        # The template is compiled again when the options change...
+        self.options_obj.options_dict['match_title_list'] = [ 'bar' ]
+        self.options_obj.options_dict['ignore_errors'] = False
+        self.check_parse(video_obj, 'real')
+
+        # ...or when the main application settings used by it change
+        self.app_obj.block_livestreams_flag = True
+        self.check_parse(video_obj, 'real')
+
+        self.assertIn(
+            '!is_live',
+            self.parser_obj.parse(video_obj, self.options_obj, 'real'),
+        )
+
+
+    def test_per_item_options(self):
+
+        video_obj = make_video(1, self.short_dir)
+        self.check_parse(video_obj, 'real')
+
+        # The bandwidth limit and the proxy aren't part of the template, so
+        #   changes are applied even though the template is re-used
+        self.app_obj.bandwidth_default = 1000
+        self.options_obj.options_dict['proxy'] = ''
+        self.app_obj.get_proxy = lambda: 'http://10.0.0.1:3128'
+        self.check_parse(video_obj, 'real')
+
+        options_list = self.parser_obj.parse(video_obj, self.options_obj)
+        self.assertEqual(options_list[options_list.index('-r') + 1], '500K')
+        self.assertEqual(
+            options_list[options_list.index('--proxy') + 1],
+            'http://10.0.0.1:3128',
+        )
+
+
+    def test_trim_filenames(self):
+
+        # --trim-filenames is ignored when the download directory is too long
+        options_list = self.parser_obj.parse(
+            make_video(1, self.short_dir),
+            self.options_obj,
+        )
+        self.assertIn('--trim-filenames', options_list)
+
+        options_list = self.parser_obj.parse(
+            make_video(2, self.long_dir),
+            self.options_obj,
+        )
+        self.assertNotIn('--trim-filenames', options_list)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Tests for process.py."""
+
+
+# Import other modules
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import process
+
+
+# Functions
+
+
+def make_app(job_count, run_func):
+
+    """Returns an object with the mainapp.TartubeApp IVs used by
+    process.ProcessManager, when dispatching FFmpeg jobs.
+
+    'job_count' is the value returned by
+    mainapp.TartubeApp.get_process_job_count(), and 'run_func' replaces
+    ffmpeg_tartube.FFmpegManager.run_ffmpeg_directly().
+    """
+
+    return types.SimpleNamespace(
+        ffmpeg_manager_obj=types.SimpleNamespace(
+            run_ffmpeg_directly=run_func,
+        ),
+        get_process_job_count=lambda: job_count,
+        main_win_obj=types.SimpleNamespace(
+            output_tab_write_stdout=lambda page_num, msg: None,
+            output_tab_write_stderr=lambda page_num, msg: None,
+            output_tab_write_system_cmd=lambda page_num, msg: None,
+            update_progress_bar=lambda name, count, total: None,
+        ),
+        process_manager_halt_timer=lambda: None,
+        temp_slice_buffer_dict={},
+        temp_stamp_buffer_dict={},
+    )
+
+
+def make_options():
+
+    """Returns an object with the ffmpeg_tartube.FFmpegOptionsManager IVs used
+    by process.ProcessManager, producing one output file for each video.
+    """
+
+    def get_system_cmd(app_obj, video_obj, *args):
+
+        source_path = '/videos/' + video_obj.name + '.mkv'
+        output_path = '/videos/' + video_obj.name + '.mp4'
+
+        return (
+            source_path,
+            output_path,
+            [ 'ffmpeg', '-i', source_path, output_path ],
+        )
+
+    return types.SimpleNamespace(
+        get_system_cmd=get_system_cmd,
+        options_dict={ 'output_mode': 'default' },
+    )
+
+
+def make_video_list(count):
+
+    video_list = []
+    for i in range(count):
+        video_list.append(
+            types.SimpleNamespace(
+                dbid=i,
+                name='video' + str(i),
+                file_name='video' + str(i),
+                dummy_flag=False,
+            ),
+        )
+
+    return video_list
+
+
+def make_process(app_obj, video_list):
+
+    """Returns a process.ProcessManager, without starting the thread."""
+
+    with unittest.mock.patch.object(process.ProcessManager, 'start'):
+        process_obj = process.ProcessManager(
+            app_obj,
+            make_options(),
+            video_list,
+        )
+
+    process_obj.sleep_time = 0.01
+
+    return process_obj
+
+
+def run_process(process_obj):
+
+    """Runs the process operation in this thread. Returns a list of calls to
+    process.ProcessManager.process_video_finish(), in the form
+    (video_obj.name, success_flag, msg).
+    """
+
+    finish_list = []
+    def process_video_finish(video_obj, source_path, output_path,
+    start_point, success_flag, msg):
+        finish_list.append( (video_obj.name, success_flag, msg) )
+
+    with unittest.mock.patch.object(process, 'GObject'), \
+    unittest.mock.patch.object(
+        process_obj,
+        'process_video_finish',
+        side_effect=process_video_finish,
+    ):
+        process_obj.run()
+
+    return finish_list
+
+
+# Classes
+
+
+class TestProcessManagerJobs(unittest.TestCase):
+
+
+    def setUp(self):
+
+        # The FFmpeg commands run, and the number of them running at the same
+        #   time
+        self.cmd_list = []
+        self.running_count = 0
+        self.running_max = 0
+        self.lock = threading.Lock()
+
+
+    def run_ffmpeg_directly(self, video_obj, source_path, cmd_list):
+
+        with self.lock:
+            self.cmd_list.append(cmd_list)
+            self.running_count += 1
+            self.running_max = max(self.running_max, self.running_count)
+
+        time.sleep(0.05)
+
+        with self.lock:
+            self.running_count -= 1
+
+        return True, ''
+
+
+    def test_worker_count(self):
+
+        # There are never more workers than videos
+        process_obj = make_process(
+            make_app(4, self.run_ffmpeg_directly),
+            make_video_list(2),
+        )
+
+        self.assertEqual(process_obj.worker_count, 2)
+        self.assertEqual(
+            process_obj.thread_count,
+            max(1, (os.cpu_count() or 1) // 2),
+        )
+
+        process_obj = make_process(
+            make_app(1, self.run_ffmpeg_directly),
+            make_video_list(2),
+        )
+
+        self.assertEqual(process_obj.worker_count, 1)
+        self.assertIsNone(process_obj.thread_count)
+
+
+    def test_one_at_a_time(self):
+
+        process_obj = make_process(
+            make_app(1, self.run_ffmpeg_directly),
+            make_video_list(3),
+        )
+
+        finish_list = run_process(process_obj)
+
+        self.assertIsNone(process_obj.executor)
+        self.assertEqual(self.running_max, 1)
+        self.assertEqual(
+            [ name for name, success_flag, msg in finish_list ],
+            [ 'video0', 'video1', 'video2' ],
+        )
+
+        for cmd_list in self.cmd_list:
+            self.assertNotIn('-threads', cmd_list)
+
+
+    def test_workers(self):
+
+        process_obj = make_process(
+            make_app(3, self.run_ffmpeg_directly),
+            make_video_list(7),
+        )
+
+        finish_list = run_process(process_obj)
+
+        self.assertIsNone(process_obj.executor)
+        self.assertGreater(self.running_max, 1)
+        self.assertLessEqual(self.running_max, 3)
+        self.assertEqual(process_obj.finish_count, 7)
+        self.assertEqual(
+            sorted(name for name, success_flag, msg in finish_list),
+            [ 'video' + str(i) for i in range(7) ],
+        )
+
+        # The number of threads is added just before the output file
+        for cmd_list in self.cmd_list:
+            self.assertEqual(
+                cmd_list[-3:-1],
+                [ '-threads', str(process_obj.thread_count) ],
+            )
+
+
+    def test_workers_halted(self):
+
+        # When the operation is halted, jobs already started are allowed to
+        #   finish, but no more are started
+        def run_ffmpeg_directly(video_obj, source_path, cmd_list):
+            process_obj.stop_process_operation()
+            return self.run_ffmpeg_directly(video_obj, source_path, cmd_list)
+
+        process_obj = make_process(
+            make_app(2, run_ffmpeg_directly),
+            make_video_list(10),
+        )
+
+        finish_list = run_process(process_obj)
+
+        self.assertEqual(len(finish_list), len(self.cmd_list))
+        self.assertLess(len(finish_list), 10)
+
+
+    def test_workers_exception(self):
+
+        def run_ffmpeg_directly(video_obj, source_path, cmd_list):
+            raise OSError('ffmpeg not found')
+
+        process_obj = make_process(
+            make_app(2, run_ffmpeg_directly),
+            make_video_list(2),
+        )
+
+        finish_list = run_process(process_obj)
+
+        self.assertEqual(
+            sorted(finish_list),
+            [
+                ('video0', False, 'ffmpeg not found'),
+                ('video1', False, 'ffmpeg not found'),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for search.py."""
+
+
+# Import other modules
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+import pickle
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import media
+import search
+
+
+# Classes
+
+
+class TestSearchManagerRegex(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.search_manager_obj = search.SearchManager(None)
+
+
+    def test_plain_text(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals('hello world'),
+            ['hello world'],
+        )
+
+
+    def test_literals_around_wildcards(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'foo.*bar\d+baz'),
+            ['foo', 'bar', 'baz'],
+        )
+
+
+    def test_groups(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'(abc)+xyz'),
+            ['abc', 'xyz'],
+        )
+
+
+    def test_optional_parts_ignored(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'colou?r(ful)?'),
+            ['colo', 'r'],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'(maybe)*never'),
+            ['never'],
+        )
+
+
+    def test_alternatives_ignored(self):
+
+        # (Neither alternative must appear)
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'cat|dog'),
+            [],
+        )
+
+
+    def test_invalid_regex(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_regex_literals(r'foo(bar'),
+            [],
+        )
+
+
+    def test_required_word(self):
+
+        self.assertEqual(
+            self.search_manager_obj.get_required_word(r'a.*Longest\s+b', True),
+            'longest',
+        )
+
+        self.assertIsNone(
+            self.search_manager_obj.get_required_word(r'.*', True),
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.get_required_word('Two Words', False),
+            'words',
+        )
+
+
+class TestSearchManagerQuery(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.search_manager_obj = search.SearchManager(None)
+
+
+    def get_time(self, year, month, day):
+
+        # (Dates in queries are the start of the day, in local time)
+        return datetime.datetime(year, month, day).timestamp()
+
+
+    def test_words(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_query('Hello, World!'),
+            ([ (None, 'hello'), (None, 'world') ], []),
+        )
+
+
+    def test_field_keywords(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_query(
+                'title:foo author:"John Smith" bar',
+            ),
+            (
+                [
+                    ('name', 'foo'),
+                    ('author', 'john'),
+                    ('author', 'smith'),
+                    (None, 'bar'),
+                ],
+                [],
+            ),
+        )
+
+
+    def test_unknown_keyword_is_text(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_query('http://example.com'),
+            ([ (None, 'http'), (None, 'example'), (None, 'com') ], []),
+        )
+
+
+    def test_unmatched_quote(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_query('don\'t stop'),
+            ([ (None, 'don'), (None, 't'), (None, 'stop') ], []),
+        )
+
+
+    def test_filters(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_query(
+                'size:>100M downloaded:no fav:yes',
+            ),
+            (
+                [],
+                [
+                    ('file_size', [ ('>', 100 * 1024 * 1024) ]),
+                    ('dl_flag', [ ('flag', False) ]),
+                    ('fav_flag', [ ('flag', True) ]),
+                ],
+            ),
+        )
+
+
+    def test_invalid_queries(self):
+
+        for query_text in (
+            '',
+            '   ',
+            'name:',
+            'name:!!!',
+            'downloaded:maybe',
+            'size:big',
+            'upload:2020-13',
+            'duration:..',
+        ):
+            self.assertIsNone(
+                self.search_manager_obj.parse_query(query_text),
+                query_text,
+            )
+
+
+    def test_range_single_value(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('90', 'duration'),
+            [ ('==', 90) ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('2020-02', 'date'),
+            [
+                ('>=', self.get_time(2020, 2, 1)),
+                ('<', self.get_time(2020, 3, 1)),
+            ],
+        )
+
+
+    def test_range_comparisons(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('<=10:00', 'duration'),
+            [ ('<=', 600) ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('>1.5G', 'size'),
+            [ ('>', int(1.5 * 1024 ** 3)) ],
+        )
+
+        # For dates, a comparison applies to the whole period
+        self.assertEqual(
+            self.search_manager_obj.parse_range('>2020', 'date'),
+            [ ('>=', self.get_time(2021, 1, 1)) ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('<=2020-12', 'date'),
+            [ ('<', self.get_time(2021, 1, 1)) ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('<2020-12-31', 'date'),
+            [ ('<', self.get_time(2020, 12, 31)) ],
+        )
+
+
+    def test_range_bounds(self):
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('2019..2020-06', 'date'),
+            [
+                ('>=', self.get_time(2019, 1, 1)),
+                ('<', self.get_time(2020, 7, 1)),
+            ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('100M..', 'size'),
+            [ ('>=', 100 * 1024 * 1024) ],
+        )
+
+        self.assertEqual(
+            self.search_manager_obj.parse_range('..2h', 'duration'),
+            [ ('<=', 7200) ],
+        )
+
+
+    def test_range_invalid(self):
+
+        for text, value_type in (
+            ('..', 'size'),
+            ('abc..', 'size'),
+            ('..1:xx', 'duration'),
+            ('>', 'size'),
+            ('2020-02-30', 'date'),
+            ('20', 'date'),
+        ):
+            self.assertIsNone(
+                self.search_manager_obj.parse_range(text, value_type),
+                text,
+            )
+
+
+class TestSearchManagerSearchDb(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.app_obj = types.SimpleNamespace(
+            data_dir=self.temp_dir,
+            media_reg_dict={},
+        )
+
+        self.search_manager_obj = search.SearchManager(self.app_obj)
+
+
+    def tearDown(self):
+
+        media.modify_func_list.remove(self.search_manager_obj.notify_modify)
+        shutil.rmtree(self.temp_dir)
+
+
+    def add_video(self, dbid, name, descrip=None, duration=None):
+
+        # (Only the IVs used by the search manager are set)
+        video_obj = media.Video.__new__(media.Video)
+        video_obj.dbid = dbid
+        video_obj.name = name
+        video_obj.author = None
+        video_obj.descrip = descrip
+        video_obj.comment_list = []
+        video_obj.upload_time = dbid
+        video_obj.duration = duration
+        video_obj.dl_flag = False
+
+        self.app_obj.media_reg_dict[dbid] = video_obj
+        return video_obj
+
+
+    def search(self, query_text):
+
+        return [
+            video_obj.dbid for video_obj \
+            in self.search_manager_obj.search_db(query_text)
+        ]
+
+
+    def test_ranking(self):
+
+        self.add_video(1, 'Some video', 'about cats')
+        self.add_video(2, 'Cats', 'a video')
+        self.add_video(3, 'Another video', 'about dogs')
+        self.add_video(4, 'Cats again', 'about cats')
+
+        # (Matches in the name beat matches in the description; then the
+        #   newest video comes first)
+        self.assertEqual(self.search('cats'), [4, 2, 1])
+        self.assertEqual(self.search('descrip:cats'), [4, 1])
+        self.assertEqual(self.search('about video'), [3, 1])
+        self.assertEqual(self.search('fish'), [])
+
+
+    def test_partial_words(self):
+
+        self.add_video(1, 'Watching television')
+        self.assertEqual(self.search('vision'), [1])
+
+
+    def test_changed_video_reindexed(self):
+
+        video_obj = self.add_video(1, 'Some video', 'about cats')
+        self.assertEqual(self.search('dogs'), [])
+
+        # (The search manager is told about the change by
+        #   media.notify_modify() )
+        video_obj.descrip = 'about dogs'
+        self.assertEqual(self.search('dogs'), [1])
+        self.assertEqual(self.search('cats'), [])
+
+
+    def test_edited_comment_reindexed(self):
+
+        video_obj = self.add_video(1, 'Some video')
+        video_obj.comment_list = [{'text': 'about cats'}]
+        self.assertEqual(self.search('comment:cats'), [1])
+
+        # (The number of comments doesn't change)
+        video_obj.comment_list[0]['text'] = 'about dogs'
+        self.search_manager_obj.update_video(video_obj)
+        self.assertEqual(self.search('comment:dogs'), [1])
+        self.assertEqual(self.search('comment:cats'), [])
+
+
+    def test_only_modified_videos_checked(self):
+
+        for dbid in range(1, 11):
+            self.add_video(dbid, 'Video ' + str(dbid))
+
+        self.assertEqual(self.search('video'), list(range(10, 0, -1)))
+
+        video_obj = self.app_obj.media_reg_dict[5]
+        with unittest.mock.patch.object(
+            self.search_manager_obj,
+            'check_video',
+            wraps=self.search_manager_obj.check_video,
+        ) as mock_obj:
+
+            self.assertEqual(self.search('cats'), [])
+            self.assertEqual(mock_obj.call_count, 0)
+
+            video_obj.name = 'Cats'
+            self.assertEqual(self.search('cats'), [5])
+            mock_obj.assert_called_once_with(video_obj)
+
+
+    def test_save_and_load_index(self):
+
+        self.add_video(1, 'Cats', 'about cats')
+        self.add_video(2, 'Dogs')
+        self.search('cats')
+
+        self.app_obj.media_reg_dict[3] = 'not a video'
+        del self.app_obj.media_reg_dict[2]
+
+        index_list = self.search_manager_obj.prepare_save_index()
+        self.search_manager_obj.save_index(index_list)
+        self.assertIsNone(self.search_manager_obj.prepare_save_index())
+
+        # (Deleted videos are not saved, and neither is the indexed text)
+        with open(index_list[0], 'rb') as fh:
+            load_dict = pickle.load(fh)
+
+        self.assertEqual(list(load_dict['video_dict'].keys()), [1])
+        self.assertIsInstance(load_dict['video_dict'][1][0], bytes)
+
+        # A new search manager uses the saved index, rather than re-indexing
+        #   the video
+        media.modify_func_list.remove(self.search_manager_obj.notify_modify)
+        self.search_manager_obj = search.SearchManager(self.app_obj)
+        with unittest.mock.patch.object(
+            self.search_manager_obj,
+            'index_video',
+        ) as mock_obj:
+
+            self.assertEqual(self.search('cats'), [1])
+            self.assertEqual(mock_obj.call_count, 0)
+
+
+    def test_new_and_deleted_videos(self):
+
+        self.add_video(1, 'Cats')
+        self.assertEqual(self.search('cats'), [1])
+
+        del self.app_obj.media_reg_dict[1]
+        self.add_video(2, 'More cats')
+        self.assertEqual(self.search('cats'), [2])
+
+
+    def test_filters(self):
+
+        self.add_video(1, 'Short', duration=30)
+        video_obj = self.add_video(2, 'Long', duration=3000)
+        self.add_video(3, 'Unknown')
+
+        self.assertEqual(self.search('duration:>1m'), [2])
+        self.assertEqual(self.search('duration:<1m'), [1])
+
+        video_obj.duration = 10
+        self.assertEqual(self.search('duration:<1m'), [2, 1])
+        self.assertEqual(self.search('long downloaded:no'), [2])
+        self.assertEqual(self.search('long downloaded:yes'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for stats.py."""
+
+
+# Import other modules
+import os
+import sys
+import types
+import unittest
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import mainapp
+import media
+import stats
+
+
+# Functions
+
+
+def make_video(dbid, file_size=None, duration=None):
+
+    """Returns an object with the media.Video IVs used by
+    stats.StatsSnapshot.
+    """
+
+    return types.SimpleNamespace(
+        dbid=dbid,
+        upload_time=None,
+        receive_time=None,
+        file_size=file_size,
+        duration=duration,
+    )
+
+
+# Classes
+
+
+@unittest.skipUnless(mainapp.HAVE_NUMPY_FLAG, 'numpy is not available')
+class TestStatsSnapshotCountByRange(unittest.TestCase):
+
+
+    def make_snapshot(self, video_list):
+
+        snapshot_obj = stats.StatsSnapshot()
+        snapshot_obj.add_video_list(video_list)
+        return snapshot_obj
+
+
+    def test_size_ranges(self):
+
+        snapshot_obj = self.make_snapshot([
+            make_video(1, file_size=0),
+            make_video(2, file_size=9_999_999),
+            make_video(3, file_size=10_000_000),
+            make_video(4, file_size=99_000_000),
+            make_video(5, file_size=5000_000_000),
+            make_video(6, file_size=8000_000_000),
+            make_video(7),
+        ])
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('size', {}),
+            {'10MB': 2, '25MB': 1, '100MB': 1, '5GB+': 2},
+        )
+
+
+    def test_duration_ranges(self):
+
+        snapshot_obj = self.make_snapshot([
+            make_video(1, duration=9.5),
+            make_video(2, duration=10),
+            make_video(3, duration=59),
+            make_video(4, duration=3600),
+            make_video(5, duration=20000),
+            make_video(6),
+        ])
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('duration', {}),
+            {'10s': 1, '1m': 2, '2h': 1, '5h+': 1},
+        )
+
+
+    def test_existing_counts_are_added_to(self):
+
+        snapshot_obj = self.make_snapshot([
+            make_video(1, duration=5),
+            make_video(2, duration=500),
+        ])
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('duration', {'10s': 3, '1h': 1}),
+            {'10s': 4, '10m': 1, '1h': 1},
+        )
+
+
+    def test_no_known_values(self):
+
+        snapshot_obj = self.make_snapshot([make_video(1), make_video(2)])
+        self.assertEqual(snapshot_obj.count_by_range('size', {}), {})
+
+
+    def test_deleted_and_updated_videos(self):
+
+        video_list = [
+            make_video(1, file_size=1_000),
+            make_video(2, file_size=1_000),
+            make_video(3, file_size=1_000),
+        ]
+
+        snapshot_obj = self.make_snapshot(video_list)
+
+        # Video #2 is deleted, video #3 changes size, video #4 is added
+        video_list[2].file_size = 30_000_000
+        snapshot_obj.update_video(video_list[2])
+        snapshot_obj.sync_video_list(
+            [ video_list[0], video_list[2], make_video(4, file_size=1_000) ],
+        )
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('size', {}),
+            {'10MB': 2, '50MB': 1},
+        )
+
+
+    def test_matches_container_function(self):
+
+        # The same counts as media.GenericContainer.compile_all_videos_by_size()
+        #   and .compile_all_videos_by_duration()
+        video_list = []
+        for i in range(200):
+            video_list.append(
+                make_video(i, file_size=i * 37_000_000, duration=i * 97),
+            )
+
+        container_obj = types.SimpleNamespace(
+            compile_all_videos=lambda mini_list: video_list,
+        )
+
+        snapshot_obj = self.make_snapshot(video_list)
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('size', {}),
+            media.GenericContainer.compile_all_videos_by_size(
+                container_obj,
+                {},
+            ),
+        )
+
+        self.assertEqual(
+            snapshot_obj.count_by_range('duration', {}),
+            media.GenericContainer.compile_all_videos_by_duration(
+                container_obj,
+                {},
+            ),
+        )
+
+
+@unittest.skipUnless(mainapp.HAVE_NUMPY_FLAG, 'numpy is not available')
+class TestStatsManagerSnapshots(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.stats_manager_obj = stats.StatsManager(types.SimpleNamespace())
+
+        # (Only the IVs used by the statistics manager are set)
+        self.outer_obj = self.make_media(media.Folder, 1, None)
+        self.inner_obj = self.make_media(media.Folder, 2, self.outer_obj)
+        self.other_obj = self.make_media(media.Folder, 3, None)
+        self.add_video(self.inner_obj, 4)
+
+
+    def tearDown(self):
+
+        media.modify_func_list.remove(self.stats_manager_obj.notify_modify)
+
+
+    def make_media(self, media_type, dbid, parent_obj):
+
+        media_data_obj = media_type.__new__(media_type)
+        media_data_obj.dbid = dbid
+        media_data_obj.parent_obj = parent_obj
+        media_data_obj.child_list = []
+        if parent_obj is not None:
+            parent_obj.child_list = parent_obj.child_list + [media_data_obj]
+
+        return media_data_obj
+
+
+    def add_video(self, parent_obj, dbid):
+
+        video_obj = self.make_media(media.Video, dbid, parent_obj)
+        video_obj.upload_time = None
+        video_obj.receive_time = None
+        video_obj.file_size = 1_000
+        video_obj.duration = None
+
+        return video_obj
+
+
+    def test_snapshot_reused(self):
+
+        snapshot_obj = self.stats_manager_obj.get_snapshot(self.outer_obj)
+        self.assertIs(
+            self.stats_manager_obj.get_snapshot(self.outer_obj),
+            snapshot_obj,
+        )
+
+
+    def test_child_list_modified(self):
+
+        self.assertEqual(
+            self.stats_manager_obj.compile_by_size(self.outer_obj, {}),
+            {'10MB': 1},
+        )
+
+        other_snapshot_obj \
+        = self.stats_manager_obj.get_snapshot(self.other_obj)
+
+        # Adding a video to the inner folder discards the snapshots of both
+        #   folders, but not the snapshot of an unrelated folder
+        self.add_video(self.inner_obj, 5)
+        self.assertNotIn(1, self.stats_manager_obj.snapshot_dict)
+        self.assertIs(
+            self.stats_manager_obj.get_snapshot(self.other_obj),
+            other_snapshot_obj,
+        )
+
+        self.assertEqual(
+            self.stats_manager_obj.compile_by_size(self.outer_obj, {}),
+            {'10MB': 2},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
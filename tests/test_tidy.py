@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Tests for tidy.py."""
+
+
+# Import other modules
+import concurrent.futures
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+import unittest.mock
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import files
+import media
+import tidy
+
+
+# Functions
+
+
+def make_app():
+
+    """Returns an object with the mainapp.TartubeApp IVs used by
+    tidy.TidyManager, when planning and performing file operations.
+    """
+
+    app_obj = types.SimpleNamespace(
+        # (The number of calls to mainapp.TartubeApp.bulk_change_begin() not
+        #   yet matched by a call to .bulk_change_commit(), and the number of
+        #   calls to .bulk_change_commit() )
+        bulk_change_level=0,
+        bulk_change_commit_count=0,
+        file_manager_obj=files.FileManager(),
+        ffmpeg_fail_flag=True,
+        metadata_sub_dir='.data',
+        thumbs_sub_dir='.thumbs',
+        tidy_worker_count=1,
+        # (Calls to mainapp.TartubeApp.mark_video_downloaded(), in the form
+        #   (video_obj, dl_flag) )
+        mark_list=[],
+        main_win_obj=types.SimpleNamespace(
+            output_tab_write_stdout=lambda page_num, msg: None,
+            output_tab_write_stderr=lambda page_num, msg: None,
+        ),
+    )
+
+    def mark_video_downloaded(video_obj, dl_flag, not_new_flag=False):
+        app_obj.mark_list.append( (video_obj, dl_flag) )
+
+    def bulk_change_begin():
+        app_obj.bulk_change_level += 1
+
+    def bulk_change_commit():
+        app_obj.bulk_change_level -= 1
+        app_obj.bulk_change_commit_count += 1
+
+    app_obj.bulk_change_begin = bulk_change_begin
+    app_obj.bulk_change_commit = bulk_change_commit
+    app_obj.delete_video = lambda video_obj: None
+    app_obj.make_directory = os.makedirs
+    app_obj.mark_video_downloaded = mark_video_downloaded
+    app_obj.system_error = lambda error_code, msg: None
+
+    return app_obj
+
+
+def make_tidy(app_obj, **kwargs):
+
+    """Returns a tidy.TidyManager applying the actions specified by the
+    keyword arguments (e.g. del_thumb_flag=True), without starting the
+    thread.
+    """
+
+    choices_dict = {
+        'media_data_obj': None,
+        'corrupt_flag': False,
+        'del_corrupt_flag': False,
+        'exist_flag': False,
+        'del_video_flag': False,
+        'del_others_flag': False,
+        'remove_no_url_flag': False,
+        'remove_duplicate_flag': False,
+        'del_archive_flag': False,
+        'move_thumb_flag': False,
+        'del_thumb_flag': False,
+        'del_webp_flag': False,
+        'convert_webp_flag': False,
+        'move_data_flag': False,
+        'del_descrip_flag': False,
+        'del_json_flag': False,
+        'del_xml_flag': False,
+        'convert_ext_flag': False,
+        'find_dup_flag': False,
+    }
+
+    choices_dict.update(kwargs)
+
+    with unittest.mock.patch.object(tidy.TidyManager, 'start'):
+        return tidy.TidyManager(app_obj, choices_dict)
+
+
+# Classes
+
+
+class TestTidyManagerPlan(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = make_app()
+        self.temp_dir = tempfile.mkdtemp()
+
+        parent_obj = types.SimpleNamespace(
+            get_actual_dir=lambda app_obj: self.temp_dir,
+        )
+
+        self.video_obj = media.Video.__new__(media.Video)
+        self.video_obj.dbid = 1
+        self.video_obj.name = 'video'
+        self.video_obj.source = 'https://example.com/video'
+        self.video_obj.parent_obj = parent_obj
+        self.video_obj.file_name = 'video'
+        self.video_obj.file_ext = '.mp4'
+        self.video_obj.dl_flag = True
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def make_file(self, *args):
+
+        path = os.path.join(self.temp_dir, *args)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as fh:
+            fh.write(b'\x00')
+
+        return path
+
+
+    def path(self, *args):
+
+        return os.path.abspath(os.path.join(self.temp_dir, *args))
+
+
+    def run_plan(self, tidy_obj, protect_set=None, video_list=None):
+
+        # (Plans the actions in the same order as
+        #   tidy.TidyManager.tidy_directory() )
+        if protect_set is None:
+            protect_set = set()
+
+        if video_list is None:
+            video_list = [ self.video_obj ]
+
+        for video_obj in video_list:
+            tidy_obj.plan_video_status(video_obj, protect_set)
+
+        remove_set = tidy_obj.plan_remove(video_list)
+
+        for video_obj in video_list:
+            if not video_obj.dbid in remove_set:
+                tidy_obj.plan_video_files(video_obj, protect_set)
+
+        plan_list = tidy_obj.plan_list.copy()
+        with unittest.mock.patch.object(tidy, 'GObject'):
+            tidy_obj.apply_plan()
+
+        return plan_list
+
+
+    def test_move_and_delete_thumb(self):
+
+        # The thumbnail is moved into the sub-directory, and then deleted from
+        #   there, in a single pass
+        self.make_file('video.jpg')
+        tidy_obj = make_tidy(
+            self.app_obj,
+            move_thumb_flag=True,
+            del_thumb_flag=True,
+        )
+
+        plan_list = self.run_plan(tidy_obj)
+
+        self.assertEqual(
+            plan_list,
+            [
+                (
+                    'move',
+                    self.path('video.jpg'),
+                    self.path('.thumbs', 'video.jpg'),
+                    'thumb_moved_count',
+                ),
+                (
+                    'delete',
+                    self.path('.thumbs', 'video.jpg'),
+                    'thumb_deleted_count',
+                    None,
+                    None,
+                ),
+            ],
+        )
+
+        self.assertFalse(os.path.exists(self.path('video.jpg')))
+        self.assertFalse(os.path.exists(self.path('.thumbs', 'video.jpg')))
+        self.assertEqual(tidy_obj.thumb_moved_count, 1)
+        self.assertEqual(tidy_obj.thumb_deleted_count, 1)
+
+
+    def test_move_data(self):
+
+        self.make_file('video.description')
+        self.make_file('video.info.json')
+        # (Already in the sub-directory, so not moved again)
+        self.make_file('video.annotations.xml')
+        self.make_file('.data', 'video.annotations.xml')
+
+        tidy_obj = make_tidy(self.app_obj, move_data_flag=True)
+        self.run_plan(tidy_obj)
+
+        for file_name in ['video.description', 'video.info.json']:
+            self.assertFalse(os.path.exists(self.path(file_name)))
+            self.assertTrue(os.path.isfile(self.path('.data', file_name)))
+
+        self.assertTrue(os.path.isfile(self.path('video.annotations.xml')))
+        self.assertEqual(tidy_obj.data_moved_count, 2)
+
+
+    def test_delete_video(self):
+
+        video_path = self.make_file('video.mp4')
+        other_path = self.make_file('video.mkv')
+
+        # (The video is marked as downloaded, and its file exists, so the
+        #   existence check changes nothing; only the deletion marks the
+        #   video as not downloaded)
+        tidy_obj = make_tidy(
+            self.app_obj,
+            exist_flag=True,
+            del_video_flag=True,
+            del_others_flag=True,
+        )
+
+        self.run_plan(tidy_obj)
+
+        self.assertFalse(os.path.exists(video_path))
+        self.assertFalse(os.path.exists(other_path))
+        self.assertEqual(tidy_obj.video_deleted_count, 1)
+        self.assertEqual(tidy_obj.other_deleted_count, 1)
+        self.assertEqual(tidy_obj.video_no_exist_count, 0)
+        self.assertEqual(self.app_obj.mark_list, [ (self.video_obj, False) ])
+
+
+    def test_check_exist(self):
+
+        self.make_file('video.mp4')
+        self.video_obj.dl_flag = False
+
+        tidy_obj = make_tidy(self.app_obj, exist_flag=True)
+        self.run_plan(tidy_obj)
+
+        self.assertEqual(tidy_obj.video_exist_count, 1)
+        self.assertEqual(self.app_obj.mark_list, [ (self.video_obj, True) ])
+
+
+    def test_protect_set(self):
+
+        thumb_path = self.make_file('video.jpg')
+        descrip_path = self.make_file('.data', 'video.description')
+
+        tidy_obj = make_tidy(
+            self.app_obj,
+            del_thumb_flag=True,
+            del_descrip_flag=True,
+        )
+
+        self.assertEqual(self.run_plan(tidy_obj, { 'video' }), [])
+        self.assertTrue(os.path.isfile(thumb_path))
+        self.assertTrue(os.path.isfile(descrip_path))
+
+
+    def test_remove_no_url(self):
+
+        # A video that is removed from the database has no other actions
+        #   planned for it
+        thumb_path = self.make_file('video.jpg')
+        self.video_obj.source = None
+
+        tidy_obj = make_tidy(
+            self.app_obj,
+            remove_no_url_flag=True,
+            move_thumb_flag=True,
+        )
+
+        self.assertEqual(
+            self.run_plan(tidy_obj),
+            [ ('remove', self.video_obj, 'remove_no_url_count') ],
+        )
+
+        self.assertTrue(os.path.isfile(thumb_path))
+        self.assertEqual(tidy_obj.remove_no_url_count, 1)
+        self.assertEqual(tidy_obj.thumb_moved_count, 0)
+
+
+    def test_remove_duplicate(self):
+
+        # The video file doesn't exist, so the existence check marks the video
+        #   as not downloaded, making it a duplicate of another video with the
+        #   same URL; its metadata file is not moved
+        descrip_path = self.make_file('video.description')
+
+        other_obj = media.Video.__new__(media.Video)
+        other_obj.dbid = 2
+        other_obj.name = 'other'
+        other_obj.source = self.video_obj.source
+        other_obj.parent_obj = self.video_obj.parent_obj
+        other_obj.file_name = None
+        other_obj.file_ext = None
+        other_obj.dl_flag = True
+
+        tidy_obj = make_tidy(
+            self.app_obj,
+            exist_flag=True,
+            remove_duplicate_flag=True,
+            move_data_flag=True,
+        )
+
+        # (The other video has no file name, so its file is not checked)
+        plan_list = self.run_plan(
+            tidy_obj,
+            video_list=[ self.video_obj, other_obj ],
+        )
+
+        self.assertEqual(
+            plan_list[1:],
+            [ ('remove', self.video_obj, 'remove_duplicate_count') ],
+        )
+
+        self.assertTrue(os.path.isfile(descrip_path))
+        self.assertEqual(tidy_obj.video_no_exist_count, 1)
+        self.assertEqual(tidy_obj.remove_duplicate_count, 1)
+        self.assertEqual(tidy_obj.data_moved_count, 0)
+
+
+    def test_dir_listing_reset(self):
+
+        self.make_file('video.jpg')
+        file_manager_obj = self.app_obj.file_manager_obj
+        self.assertIn('video.jpg', file_manager_obj.get_dir_listing(
+            self.temp_dir,
+        ))
+
+        tidy_obj = make_tidy(self.app_obj, del_thumb_flag=True)
+        self.run_plan(tidy_obj)
+
+        self.assertNotIn('video.jpg', file_manager_obj.get_dir_listing(
+            self.temp_dir,
+        ))
+        self.assertEqual(tidy_obj.plan_list, [])
+        self.assertEqual(tidy_obj.snapshot_dict, {})
+
+
+    def test_bulk_change_batches(self):
+
+        # Changes to videos are redrawn in batches, and the transaction is
+        #   always ended
+        tidy_obj = make_tidy(self.app_obj)
+        tidy_obj.bulk_change_batch_size = 2
+
+        for i in range(5):
+            tidy_obj.plan_list.append(
+                ('mark', self.video_obj, True, 'video_exist_count', 'Exists'),
+            )
+
+        tidy_obj.apply_plan()
+
+        self.assertEqual(tidy_obj.video_exist_count, 5)
+        self.assertEqual(len(self.app_obj.mark_list), 5)
+        self.assertEqual(self.app_obj.bulk_change_commit_count, 3)
+        self.assertEqual(self.app_obj.bulk_change_level, 0)
+
+
+class TestTidyManagerWorkers(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.app_obj = make_app()
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.tidy_obj = make_tidy(self.app_obj)
+        self.tidy_obj.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2,
+        )
+
+
+    def tearDown(self):
+
+        self.tidy_obj.executor.shutdown()
+        shutil.rmtree(self.temp_dir)
+
+
+    def make_video(self, dbid, file_name):
+
+        parent_obj = types.SimpleNamespace(
+            get_actual_dir=lambda app_obj: self.temp_dir,
+        )
+
+        video_obj = media.Video.__new__(media.Video)
+        video_obj.dbid = dbid
+        video_obj.name = 'video' + str(dbid)
+        video_obj.parent_obj = parent_obj
+        video_obj.file_name = file_name
+        video_obj.file_ext = '.mp4'
+        video_obj.dl_flag = True
+
+        if file_name is not None:
+            with open(os.path.join(self.temp_dir, file_name + '.mp4'), 'wb') \
+            as fh:
+                fh.write(b'\x00')
+
+        return video_obj
+
+
+    def test_check_corrupt_all(self):
+
+        video_list = [
+            self.make_video(1, 'good'),
+            self.make_video(2, 'bad'),
+            # (No file, so not checked)
+            self.make_video(3, None),
+        ]
+
+        path_list = []
+        def check_corrupt_worker(video_path):
+            path_list.append(video_path)
+            if os.path.basename(video_path) == 'bad.mp4':
+                return 'error'
+
+        with unittest.mock.patch.object(
+            self.tidy_obj,
+            'check_corrupt_worker',
+            side_effect=check_corrupt_worker,
+        ):
+            self.assertTrue(self.tidy_obj.check_corrupt_all(video_list))
+
+        self.assertEqual(len(path_list), 2)
+        self.assertEqual(self.tidy_obj.corrupt_dict, { 1: None, 2: 'error' })
+
+
+    def test_check_corrupt_all_halted(self):
+
+        video_list = [ self.make_video(1, 'good') ]
+
+        self.tidy_obj.running_flag = False
+        with unittest.mock.patch.object(
+            self.tidy_obj,
+            'check_corrupt_worker',
+            return_value=None,
+        ):
+            self.assertFalse(self.tidy_obj.check_corrupt_all(video_list))
+
+        self.assertEqual(self.tidy_obj.corrupt_dict, {})
+
+
+    def test_convert_webp_all(self):
+
+        batch_list = []
+        def convert_webp_batch(path_list):
+            batch_list.append(path_list)
+            return [ True ] * len(path_list)
+
+        self.app_obj.ffmpeg_manager_obj = types.SimpleNamespace(
+            convert_webp_batch=convert_webp_batch,
+        )
+
+        self.tidy_obj.convert_webp_flag = True
+        self.tidy_obj.webp_batch_size = 2
+
+        convert_list = [
+            os.path.join(self.temp_dir, 'dir' + str(i % 2), str(i) + '.webp') \
+            for i in range(5)
+        ]
+
+        modify_set = set()
+        self.tidy_obj.convert_webp_all(convert_list, modify_set)
+
+        self.assertEqual(
+            batch_list,
+            [ convert_list[0:2], convert_list[2:4], convert_list[4:] ],
+        )
+
+        self.assertEqual(self.tidy_obj.webp_converted_count, 5)
+        self.assertEqual(
+            modify_set,
+            {
+                os.path.join(self.temp_dir, 'dir0'),
+                os.path.join(self.temp_dir, 'dir1'),
+            },
+        )
+
+
+    def test_convert_webp_all_fail(self):
+
+        # When a conversion fails, no more results are used
+        fail_list = []
+        self.app_obj.set_ffmpeg_fail_flag = fail_list.append
+        self.app_obj.ffmpeg_manager_obj = types.SimpleNamespace(
+            convert_webp_batch=lambda path_list: [ False ] * len(path_list),
+        )
+
+        self.tidy_obj.convert_webp_flag = True
+        self.tidy_obj.webp_batch_size = 1
+
+        convert_list = [
+            os.path.join(self.temp_dir, str(i) + '.webp') for i in range(3)
+        ]
+
+        modify_set = set()
+        self.tidy_obj.convert_webp_all(convert_list, modify_set)
+
+        self.assertFalse(self.tidy_obj.convert_webp_flag)
+        self.assertEqual(fail_list, [ True ])
+        self.assertEqual(self.tidy_obj.webp_converted_count, 0)
+        self.assertEqual(modify_set, set())
+
+
+    def test_find_duplicates_whole_directory(self):
+
+        # When tidying the whole data directory, every video in the database
+        #   is checked, even if it's not in the list of containers
+        video_list = [
+            self.make_video(1, 'first'),
+            self.make_video(2, 'second'),
+            self.make_video(3, 'third'),
+        ]
+
+        with open(os.path.join(self.temp_dir, 'third.mp4'), 'wb') as fh:
+            fh.write(b'\x01')
+
+        self.app_obj.data_dir = self.temp_dir
+        self.app_obj.media_reg_dict = {
+            video_obj.dbid: video_obj for video_obj in video_list
+        }
+        self.app_obj.main_win_obj.classic_media_dict = {}
+
+        self.tidy_obj.find_duplicates([])
+
+        self.assertEqual(self.tidy_obj.dup_group_count, 1)
+        self.assertEqual(self.tidy_obj.dup_file_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019-2026 A S Lewis
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Tests for ttutils.py."""
+
+
+# Import other modules
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+
+# Import our modules
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tartube')),
+)
+
+import ttutils
+
+
+# Functions
+
+
+def read_file(full_path):
+
+    """Returns the contents of a file."""
+
+    with open(full_path, 'rb') as fh:
+        return fh.read()
+
+
+def write_file(full_path, data):
+
+    """Writes a file."""
+
+    with open(full_path, 'wb') as fh:
+        fh.write(data)
+
+
+# Classes
+
+
+class TestLinkFile(unittest.TestCase):
+
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.temp_dir, 'tartube.db')
+        self.dest_path = os.path.join(self.temp_dir, 'tartube_BU.db')
+        write_file(self.source_path, b'old database')
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temp_dir)
+
+
+    def test_copy(self):
+
+        if not ttutils.link_file(self.source_path, self.dest_path):
+            self.skipTest('Filesystem supports neither hard links nor reflinks')
+
+        self.assertEqual(read_file(self.dest_path), b'old database')
+        self.assertEqual(read_file(self.source_path), b'old database')
+        # (No temporary file is left behind)
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir)),
+            ['tartube.db', 'tartube_BU.db'],
+        )
+
+
+    def test_existing_copy_replaced(self):
+
+        write_file(self.dest_path, b'older database')
+        write_file(self.dest_path + '.tmp', b'left over')
+
+        if not ttutils.link_file(self.source_path, self.dest_path):
+            self.skipTest('Filesystem supports neither hard links nor reflinks')
+
+        self.assertEqual(read_file(self.dest_path), b'old database')
+        self.assertFalse(os.path.exists(self.dest_path + '.tmp'))
+
+
+    def test_copy_survives_replacement(self):
+
+        if not ttutils.link_file(self.source_path, self.dest_path):
+            self.skipTest('Filesystem supports neither hard links nor reflinks')
+
+        # This is how mainapp.TartubeApp.save_db_write() replaces the original
+        #   file
+        new_path = os.path.join(self.temp_dir, 'tartube.db.new')
+        write_file(new_path, b'new database')
+        os.replace(new_path, self.source_path)
+
+        self.assertEqual(read_file(self.source_path), b'new database')
+        self.assertEqual(read_file(self.dest_path), b'old database')
+
+
+    def test_missing_source(self):
+
+        self.assertFalse(
+            ttutils.link_file(
+                os.path.join(self.temp_dir, 'missing.db'),
+                self.dest_path,
+            ),
+        )
+
+        self.assertFalse(os.path.exists(self.dest_path))
+        self.assertFalse(os.path.exists(self.dest_path + '.tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()